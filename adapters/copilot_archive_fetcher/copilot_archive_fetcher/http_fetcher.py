@@ -1,16 +1,43 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Copilot-for-Consensus contributors
 
-"""HTTP archive fetcher implementation."""
+"""HTTP archive fetcher implementation.
 
+Repeated fetches of the same URL avoid re-downloading unchanged data:
+
+- The response's ETag and Last-Modified validators are stored in a state file
+  next to the downloaded archive and sent back as conditional request headers,
+  so an unchanged archive costs a single 304 response.
+- Downloads go to a ``.part`` file first. An interrupted download is resumed
+  with a Range request guarded by If-Range, so it continues only if the
+  resource is still the same. A .part file that already holds the whole
+  resource (416 with a matching size) is moved into place; one that does not
+  match is discarded and the archive downloaded from scratch.
+- An mbox that was downloaded before is refreshed with a Range request
+  starting slightly before its current end. If the overlapping bytes still
+  match, only the appended data is written to the local file.
+"""
+
+import json
 import logging
 import os
+import re
+from typing import Any
 
 from .base import ArchiveFetcher
 from .models import SourceConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Bytes re-requested before the end of a local mbox to check that the remote
+# file only grew (rather than being rewritten) before appending to it
+APPEND_OVERLAP_BYTES = 4096
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-\d+/(?:\d+|\*)")
+_UNSATISFIED_RANGE_RE = re.compile(r"bytes \*/(\d+)")
+
 
 class HTTPFetcher(ArchiveFetcher):
     """Fetcher for HTTP sources."""
@@ -27,13 +54,15 @@ class HTTPFetcher(ArchiveFetcher):
         """
         return cls(config)
 
-    def __init__(self, source: SourceConfig):
+    def __init__(self, source: SourceConfig, chunk_size: int = DEFAULT_CHUNK_SIZE):
         """Initialize HTTP fetcher.
 
         Args:
             source: Source configuration
+            chunk_size: Number of bytes read from the response at a time
         """
         self.source = source
+        self.chunk_size = chunk_size
 
     def fetch(self, output_dir: str) -> tuple[bool, list | None, str | None]:
         """Fetch archive via HTTP.
@@ -55,17 +84,23 @@ class HTTPFetcher(ArchiveFetcher):
                 filename = f"{self.source.name}.mbox"
 
             file_path = os.path.join(output_dir, filename)
+            part_path = f"{file_path}.part"
+            state_path = os.path.join(output_dir, f".{filename}.http.json")
 
-            logger.info(f"Downloading {self.source.url} to {file_path}")
+            state = self._load_state(state_path)
+            if_range = _if_range_validator(state)
 
-            response = requests.get(self.source.url, timeout=3600, stream=True)
-            response.raise_for_status()
+            if state and not state.get("complete") and if_range and os.path.exists(part_path):
+                if not self._resume(requests, file_path, part_path, state_path, state, if_range):
+                    self._download_full(requests, file_path, part_path, state_path)
 
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            elif state and state.get("complete") and os.path.exists(file_path):
+                if not self._refresh(requests, file_path, state_path, state):
+                    self._download_full(requests, file_path, part_path, state_path)
+
+            else:
+                self._download_full(requests, file_path, part_path, state_path)
 
-            logger.info(f"Downloaded {file_path}")
             return True, [file_path], None
 
         except ImportError:
@@ -76,3 +111,210 @@ class HTTPFetcher(ArchiveFetcher):
             error_msg = f"HTTP fetch failed: {str(e)}"
             logger.error(error_msg)
             return False, None, error_msg
+
+    def _download_full(self, requests: Any, file_path: str, part_path: str, state_path: str) -> None:
+        """Download the whole archive."""
+        logger.info(f"Downloading {self.source.url} to {file_path}")
+        response = requests.get(self.source.url, timeout=3600, stream=True)
+        try:
+            response.raise_for_status()
+            self._download(response, file_path, part_path, state_path, append=False)
+        finally:
+            response.close()
+
+    def _resume(
+        self, requests: Any, file_path: str, part_path: str, state_path: str, state: dict[str, Any], if_range: str
+    ) -> bool:
+        """Continue an interrupted download from the end of the .part file.
+
+        Args:
+            requests: The requests module
+            file_path: Final path of the archive
+            part_path: Partially downloaded archive
+            state_path: Path of the validator state file
+            state: Stored validators of the partial download
+            if_range: Validator guarding the Range request
+
+        Returns:
+            True if the archive is complete, False if it must be downloaded from scratch
+        """
+        offset = os.path.getsize(part_path)
+        logger.info(f"Resuming download of {self.source.url} at byte {offset}")
+        response = requests.get(
+            self.source.url,
+            headers={"Range": f"bytes={offset}-", "If-Range": if_range},
+            timeout=3600,
+            stream=True,
+        )
+        try:
+            if response.status_code == 416:
+                # Nothing left after the .part file: it is complete if the remote size matches
+                match = _UNSATISFIED_RANGE_RE.match(response.headers.get("Content-Range", ""))
+                if match and int(match.group(1)) == offset:
+                    os.replace(part_path, file_path)
+                    self._save_state(state_path, {**state, "complete": True})
+                    logger.info(f"Downloaded {file_path}")
+                    return True
+                logger.info(f"Partial download of {self.source.url} does not match the remote file; starting over")
+                for path in (part_path, state_path):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                return False
+            response.raise_for_status()
+            # 206 continues the partial file; 200 means the resource changed, so start over
+            self._download(response, file_path, part_path, state_path, append=response.status_code == 206)
+            return True
+        finally:
+            response.close()
+
+    def _download(self, response: Any, file_path: str, part_path: str, state_path: str, append: bool) -> None:
+        """Stream a response body into the .part file and move it into place.
+
+        The response validators are recorded before streaming so that an
+        interrupted download can be resumed by the next fetch.
+        """
+        validators = _validators(response)
+        self._save_state(state_path, {"url": self.source.url, **validators, "complete": False})
+
+        with open(part_path, "ab" if append else "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    f.write(chunk)
+
+        os.replace(part_path, file_path)
+        self._save_state(state_path, {"url": self.source.url, **validators, "complete": True})
+        logger.info(f"Downloaded {file_path}")
+
+    def _refresh(self, requests: Any, file_path: str, state_path: str, state: dict[str, Any]) -> bool:
+        """Bring a previously downloaded archive up to date without a full download.
+
+        Args:
+            requests: The requests module
+            file_path: Local copy of the archive
+            state_path: Path of the validator state file
+            state: Stored validators of the local copy
+
+        Returns:
+            True if the local copy is up to date, False if a full download is needed
+        """
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        size = os.path.getsize(file_path)
+        overlap = min(size, APPEND_OVERLAP_BYTES)
+        append = _is_mbox(file_path)
+        if append:
+            headers["Range"] = f"bytes={size - overlap}-"
+
+        response = requests.get(self.source.url, headers=headers, timeout=3600, stream=True)
+        try:
+            if response.status_code == 304:
+                logger.info(f"{self.source.url} not modified since last fetch")
+                return True
+            if append and response.status_code == 416:
+                # Range starts beyond the remote end: the remote file shrank
+                return False
+            response.raise_for_status()
+            if response.status_code != 206:
+                # Changed and served in full (no Range, or Range ignored by the server)
+                self._download(response, file_path, f"{file_path}.part", state_path, append=False)
+                return True
+
+            match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+            if not match or int(match.group(1)) != size - overlap:
+                return False
+            return self._append(response, file_path, state_path, size, overlap)
+        finally:
+            response.close()
+
+    def _append(self, response: Any, file_path: str, state_path: str, size: int, overlap: int) -> bool:
+        """Append the data after the overlap to the local mbox if the overlap still matches.
+
+        Returns:
+            True if the local copy is up to date, False if the remote file was rewritten
+        """
+        with open(file_path, "rb") as f:
+            f.seek(size - overlap)
+            local_tail = f.read(overlap)
+
+        chunks = response.iter_content(chunk_size=self.chunk_size)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= overlap:
+                break
+        if head[:overlap] != local_tail:
+            logger.info(f"{self.source.url} was rewritten; downloading it in full")
+            return False
+
+        appended = 0
+        with open(file_path, "ab") as f:
+            try:
+                f.write(head[overlap:])
+                appended += len(head) - overlap
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+                        appended += len(chunk)
+            except BaseException:
+                # Leave the local copy as it was so the next fetch starts from a consistent file
+                f.truncate(size)
+                raise
+
+        self._save_state(state_path, {"url": self.source.url, **_validators(response), "complete": True})
+        logger.info(f"Appended {appended} bytes from {self.source.url} to {file_path}")
+        return True
+
+    def _load_state(self, state_path: str) -> dict[str, Any] | None:
+        """Load stored validators, ignoring state recorded for another URL."""
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP state file {state_path}: {e}")
+            return None
+        if not isinstance(state, dict) or state.get("url") != self.source.url:
+            return None
+        return state
+
+    @staticmethod
+    def _save_state(state_path: str, state: dict[str, Any]) -> None:
+        """Atomically write the validator state."""
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+
+def _validators(response: Any) -> dict[str, str | None]:
+    """Extract cache validators from a response."""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def _if_range_validator(state: dict[str, Any] | None) -> str | None:
+    """Pick the If-Range validator for resuming a download.
+
+    If-Range requires a strong ETag; weak ETags fall back to Last-Modified.
+    """
+    if not state:
+        return None
+    etag = state.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return state.get("last_modified")
+
+
+def _is_mbox(file_path: str) -> bool:
+    """Check whether a file is an uncompressed mbox, which only ever grows by appending."""
+    with open(file_path, "rb") as f:
+        return f.read(5) == b"From "
@@ -1,18 +1,50 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Copilot-for-Consensus contributors
 
-"""IMAP archive fetcher implementation."""
+"""IMAP archive fetcher implementation.
 
+The fetcher keeps one append-only mbox per source folder. Next to it, a small
+state file records the folder's UIDVALIDITY, the highest UID already written
+and the mbox size at that point, so each run only fetches messages with newer
+UIDs and appends them to the mbox.
+"""
+
+import json
 import logging
-import mailbox as mbox_module
 import os
-from typing import cast
+import time
+from typing import Any
 
 from .base import ArchiveFetcher
 from .models import SourceConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FETCH_BATCH_SIZE = 500
+
+
+def _mbox_entry(raw: bytes) -> bytes:
+    """Format a raw RFC 822 message as an mbox entry.
+
+    Uses the same conventions as the standard library mailbox.mbox: a
+    MAILER-DAEMON "From " separator line, LF line endings, ">From " quoting of
+    body lines starting with "From " and a blank line after the message.
+
+    Args:
+        raw: Raw message bytes as returned by the IMAP server
+
+    Returns:
+        Bytes to append to the mbox file
+    """
+    body = raw.replace(b"\r\n", b"\n")
+    if body.startswith(b"From "):
+        body = b">" + body
+    body = body.replace(b"\nFrom ", b"\n>From ")
+    if not body.endswith(b"\n"):
+        body += b"\n"
+    separator = f"From MAILER-DAEMON {time.asctime(time.gmtime())}\n".encode("ascii")
+    return separator + body + b"\n"
+
 
 class IMAPFetcher(ArchiveFetcher):
     """Fetcher for IMAP sources."""
@@ -29,16 +61,27 @@ class IMAPFetcher(ArchiveFetcher):
         """
         return cls(config)
 
-    def __init__(self, source: SourceConfig):
+    def __init__(self, source: SourceConfig, batch_size: int = DEFAULT_FETCH_BATCH_SIZE):
         """Initialize IMAP fetcher.
 
         Args:
             source: Source configuration
+            batch_size: Number of messages requested per FETCH command
+
+        Raises:
+            ValueError: If batch_size is not positive
         """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self.source = source
+        self.batch_size = batch_size
 
     def fetch(self, output_dir: str) -> tuple[bool, list | None, str | None]:
-        """Fetch emails via IMAP.
+        """Fetch new emails via IMAP and append them to the source's mbox.
+
+        Only messages with a UID above the recorded high-water mark are
+        fetched. If the folder's UIDVALIDITY changed, or the mbox no longer
+        matches the recorded state, the mbox is rebuilt from scratch.
 
         Args:
             output_dir: Directory to store the fetched mbox file
@@ -65,49 +108,114 @@ class IMAPFetcher(ArchiveFetcher):
                 logger.error(error_msg)
                 return False, None, error_msg
 
+            filename = f"{self.source.name}_{folder.replace('/', '_')}.mbox"
+            file_path = os.path.join(output_dir, filename)
+            state_path = os.path.join(output_dir, f".{filename}.state.json")
+
             logger.info(f"Connecting to IMAP {host}:{port}")
 
             # Connect to IMAP server
             client = imapclient.IMAPClient(host, port=port, ssl=True)
-            client.login(username, password)
+            try:
+                client.login(username, password)
+                return self._sync_folder(client, folder, file_path, state_path)
+            finally:
+                try:
+                    client.logout()
+                except Exception as logout_error:
+                    logger.debug(f"IMAP logout failed: {logout_error}")
 
-            # Select folder
-            client.select_folder(folder)
+        except ImportError as e:
+            error_msg = f"Required library not installed: {e}"
+            logger.error(error_msg)
+            return False, None, error_msg
+        except Exception as e:
+            error_msg = f"IMAP fetch failed: {str(e)}"
+            logger.error(error_msg)
+            return False, None, error_msg
 
-            # Get all message IDs
-            msg_ids = client.search()
-            logger.info(f"Found {len(msg_ids)} messages in {folder}")
+    def _sync_folder(
+        self, client: Any, folder: str, file_path: str, state_path: str
+    ) -> tuple[bool, list | None, str | None]:
+        """Append messages newer than the recorded high-water mark to the mbox.
 
-            # Create mbox file
-            filename = f"{self.source.name}_{folder.replace('/', '_')}.mbox"
-            file_path = os.path.join(output_dir, filename)
+        Args:
+            client: Logged-in IMAPClient
+            folder: Folder to synchronize
+            file_path: Path of the append-only mbox
+            state_path: Path of the synchronization state file
 
-            mbox = mbox_module.mbox(file_path)
+        Returns:
+            Tuple of (success, list_of_file_paths, error_message)
+        """
+        select_info = client.select_folder(folder) or {}
+        uidvalidity = select_info.get(b"UIDVALIDITY")
+
+        mbox_existed = os.path.exists(file_path)
+        state = self._load_state(state_path)
+        current_size = os.path.getsize(file_path) if mbox_existed else 0
+
+        # UIDs are only comparable within one UIDVALIDITY; an mbox shorter than
+        # recorded was modified outside the fetcher. Either way, start over.
+        if (
+            state is None
+            or uidvalidity is None
+            or state.get("uidvalidity") != uidvalidity
+            or current_size < state.get("mbox_size", 0)
+        ):
+            if state is not None or mbox_existed:
+                logger.info(f"Rebuilding mbox for {folder} from scratch")
+            state = {"uidvalidity": uidvalidity, "last_uid": 0, "mbox_size": 0}
+
+        last_uid = int(state["last_uid"])
+        committed_size = int(state["mbox_size"])
 
-            # Fetch all messages
-            failed_msg_ids = []
-            for msg_id in msg_ids:
+        # "N:*" always matches the highest UID, even when it is below N
+        uids = sorted(uid for uid in client.search(["UID", f"{last_uid + 1}:*"]) if uid > last_uid)
+        logger.info(f"Found {len(uids)} new messages in {folder} (after UID {last_uid})")
+
+        failed_uids: list[int] = []
+        fetched = 0
+        with open(file_path, "ab") as mbox_file:
+            # Drop anything written after the last committed batch (e.g. an interrupted run)
+            mbox_file.truncate(committed_size)
+
+            for start in range(0, len(uids), self.batch_size):
+                batch = uids[start : start + self.batch_size]
                 try:
-                    msg_data = client.fetch([msg_id], ["RFC822"])
-                    if msg_id in msg_data:
-                        raw = msg_data[msg_id].get(b"RFC822")
-                        if isinstance(raw, (bytes, bytearray)):
-                            msg_bytes = cast(bytes, raw)
-                            mbox.add(msg_bytes)
-                        else:
-                            failed_msg_ids.append(msg_id)
-                    else:
-                        failed_msg_ids.append(msg_id)
+                    response = client.fetch(batch, ["RFC822"])
                 except Exception as e:
-                    logger.warning(f"Failed to fetch message {msg_id}: {e}")
-                    failed_msg_ids.append(msg_id)
+                    logger.warning(f"Failed to fetch UIDs {batch[0]}-{batch[-1]}: {e}")
+                    failed_uids.extend(batch)
+                    break
 
-            mbox.close()
-            client.logout()
+                entries = []
+                for uid in batch:
+                    raw = response.get(uid, {}).get(b"RFC822")
+                    if isinstance(raw, (bytes, bytearray)):
+                        entries.append(_mbox_entry(bytes(raw)))
+                    else:
+                        failed_uids.append(uid)
+                if failed_uids:
+                    break
 
-            if failed_msg_ids:
-                error_msg = f"Failed to fetch {len(failed_msg_ids)} messages from {folder}: " f"{failed_msg_ids}"
-                logger.error(error_msg)
+                mbox_file.write(b"".join(entries))
+                mbox_file.flush()
+                os.fsync(mbox_file.fileno())
+
+                fetched += len(batch)
+                committed_size = mbox_file.tell()
+                state = {"uidvalidity": uidvalidity, "last_uid": batch[-1], "mbox_size": committed_size}
+                self._save_state(state_path, state)
+
+            if failed_uids:
+                # Keep the mbox consistent with the saved state so the next run resumes cleanly
+                mbox_file.truncate(committed_size)
+
+        if failed_uids:
+            error_msg = f"Failed to fetch {len(failed_uids)} messages from {folder}: " f"{failed_uids}"
+            logger.error(error_msg)
+            if not mbox_existed and committed_size == 0:
                 try:
                     os.remove(file_path)
                 except Exception as cleanup_error:
@@ -116,16 +224,34 @@ class IMAPFetcher(ArchiveFetcher):
                         str(cleanup_error),
                         file_path,
                     )
-                return False, None, error_msg
+            return False, None, error_msg
 
-            logger.info(f"Saved {len(msg_ids)} messages to {file_path}")
-            return True, [file_path], None
+        if not fetched:
+            # Record the state even without new messages so the next run can skip the resync
+            self._save_state(state_path, state)
 
-        except ImportError as e:
-            error_msg = f"Required library not installed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+        logger.info(f"Appended {fetched} messages to {file_path}")
+        return True, [file_path], None
+
+    @staticmethod
+    def _load_state(state_path: str) -> dict[str, Any] | None:
+        """Load the synchronization state, or None if missing or unreadable."""
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            error_msg = f"IMAP fetch failed: {str(e)}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.warning(f"Ignoring unreadable IMAP state file {state_path}: {e}")
+            return None
+        if not isinstance(state, dict) or not isinstance(state.get("last_uid"), int):
+            return None
+        return state
+
+    @staticmethod
+    def _save_state(state_path: str, state: dict[str, Any]) -> None:
+        """Atomically write the synchronization state."""
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
@@ -3,12 +3,73 @@
 
 """Tests for HTTP fetcher."""
 
+import json
+import sys
 import tempfile
+import types
 
 import pytest
 from copilot_archive_fetcher import ArchiveFetcher, HTTPFetcher, SourceConfig
 
 
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None, fail_after=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self._fail_after = fail_after
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self._body), 4):
+            if self._fail_after is not None and start >= self._fail_after:
+                raise ConnectionError("connection reset")
+            yield self._body[start : start + 4]
+
+    def close(self):
+        pass
+
+
+class _FakeServer:
+    """Serves one resource with ETag, conditional and Range support."""
+
+    def __init__(self, body, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+        self.fail_next_after = None
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        headers = headers or {}
+        self.requests.append(headers)
+        validators = {"ETag": self.etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        if headers.get("If-None-Match") == self.etag:
+            return _FakeResponse(304, headers=validators)
+        fail_after, self.fail_next_after = self.fail_next_after, None
+        range_header = headers.get("Range")
+        if range_header and headers.get("If-Range", self.etag) == self.etag:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(self.body):
+                return _FakeResponse(416, headers={"Content-Range": f"bytes */{len(self.body)}"})
+            content_range = f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+            return _FakeResponse(
+                206, self.body[start:], {**validators, "Content-Range": content_range}, fail_after=fail_after
+            )
+        return _FakeResponse(200, self.body, validators, fail_after=fail_after)
+
+
+def _install(monkeypatch, server):
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(get=server.get))
+    return HTTPFetcher(SourceConfig(name="http-test", source_type="http", url="https://example.com/list.mbox"))
+
+
+_MBOX = b"From a@example.com Mon Jan  1 00:00:00 2024\nSubject: One\n\nFirst\n"
+_MBOX_MORE = b"From b@example.com Tue Jan  2 00:00:00 2024\nSubject: Two\n\nSecond\n"
+
+
 class TestHTTPFetcher:
     """Tests for HTTPFetcher - basic validation tests."""
 
@@ -43,3 +104,119 @@ class TestHTTPFetcher:
                 assert len(files) > 0
             else:
                 assert error is not None
+
+
+class TestHTTPFetcherIncremental:
+    """Tests for conditional, resumable and append fetching."""
+
+    def test_unchanged_archive_uses_conditional_get(self, monkeypatch, tmp_path):
+        """Test that a second fetch of an unchanged archive gets a 304 and keeps the file."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+
+        assert fetcher.fetch(str(tmp_path))[0] is True
+        success, files, _ = fetcher.fetch(str(tmp_path))
+
+        assert success is True
+        assert server.requests[1]["If-None-Match"] == '"v1"'
+        with open(files[0], "rb") as f:
+            assert f.read() == _MBOX
+
+    def test_grown_mbox_fetches_only_appended_range(self, monkeypatch, tmp_path):
+        """Test that an mbox that only grew is updated with a Range request."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+        fetcher.fetch(str(tmp_path))
+
+        server.body = _MBOX + _MBOX_MORE
+        server.etag = '"v2"'
+        success, files, _ = fetcher.fetch(str(tmp_path))
+
+        assert success is True
+        assert server.requests[1]["Range"] == f"bytes={len(_MBOX) - min(len(_MBOX), 4096)}-"
+        assert len(server.requests) == 2
+        with open(files[0], "rb") as f:
+            assert f.read() == _MBOX + _MBOX_MORE
+
+    def test_rewritten_mbox_is_downloaded_in_full(self, monkeypatch, tmp_path):
+        """Test that a changed prefix falls back to a full download."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+        fetcher.fetch(str(tmp_path))
+
+        rewritten = _MBOX.replace(b"First", b"Edits") + _MBOX_MORE
+        server.body = rewritten
+        server.etag = '"v2"'
+        success, files, _ = fetcher.fetch(str(tmp_path))
+
+        assert success is True
+        assert "Range" not in server.requests[-1]
+        with open(files[0], "rb") as f:
+            assert f.read() == rewritten
+
+    def test_interrupted_download_is_resumed(self, monkeypatch, tmp_path):
+        """Test that a failed download continues from the partial file on the next fetch."""
+        server = _FakeServer(_MBOX)
+        server.fail_next_after = 8
+        fetcher = _install(monkeypatch, server)
+
+        success, _, error = fetcher.fetch(str(tmp_path))
+        assert success is False
+        assert "connection reset" in error
+        assert (tmp_path / "list.mbox.part").stat().st_size == 8
+
+        success, files, _ = fetcher.fetch(str(tmp_path))
+        assert success is True
+        assert server.requests[1] == {"Range": "bytes=8-", "If-Range": '"v1"'}
+        with open(files[0], "rb") as f:
+            assert f.read() == _MBOX
+        assert not (tmp_path / "list.mbox.part").exists()
+
+    def _write_incomplete_state(self, tmp_path, part_content):
+        (tmp_path / "list.mbox.part").write_bytes(part_content)
+        state = {"url": "https://example.com/list.mbox", "etag": '"v1"', "last_modified": None, "complete": False}
+        (tmp_path / ".list.mbox.http.json").write_text(json.dumps(state))
+
+    def test_complete_part_file_is_finalized(self, monkeypatch, tmp_path):
+        """Test that a fully downloaded .part file left marked incomplete is moved into place on a 416."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+        self._write_incomplete_state(tmp_path, _MBOX)
+
+        success, _, _ = fetcher.fetch(str(tmp_path))
+
+        assert success is True
+        assert server.requests == [{"Range": f"bytes={len(_MBOX)}-", "If-Range": '"v1"'}]
+        assert (tmp_path / "list.mbox").read_bytes() == _MBOX
+        assert not (tmp_path / "list.mbox.part").exists()
+        assert json.loads((tmp_path / ".list.mbox.http.json").read_text())["complete"] is True
+
+        # The next fetch is a plain conditional request again
+        assert fetcher.fetch(str(tmp_path))[0] is True
+        assert server.requests[1]["If-None-Match"] == '"v1"'
+
+    def test_oversized_part_file_is_discarded(self, monkeypatch, tmp_path):
+        """Test that a .part file larger than the remote resource is replaced by a fresh download."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+        self._write_incomplete_state(tmp_path, _MBOX + b"garbage")
+
+        success, _, _ = fetcher.fetch(str(tmp_path))
+
+        assert success is True
+        assert server.requests[1] == {}
+        assert (tmp_path / "list.mbox").read_bytes() == _MBOX
+        assert not (tmp_path / "list.mbox.part").exists()
+
+    def test_failed_append_leaves_local_copy_intact(self, monkeypatch, tmp_path):
+        """Test that an interrupted append does not leave a half-written mbox."""
+        server = _FakeServer(_MBOX)
+        fetcher = _install(monkeypatch, server)
+        fetcher.fetch(str(tmp_path))
+
+        server.body = _MBOX + _MBOX_MORE
+        server.etag = '"v2"'
+        server.fail_next_after = len(_MBOX) + 8
+        assert fetcher.fetch(str(tmp_path))[0] is False
+
+        assert (tmp_path / "list.mbox").read_bytes() == _MBOX
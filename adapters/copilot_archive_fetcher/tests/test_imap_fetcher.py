@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Copilot-for-Consensus contributors
 
-"""Tests for IMAP fetcher failure handling."""
+"""Tests for IMAP fetcher failure handling and incremental sync."""
 
+import mailbox
 import sys
 import types
 
+import pytest
 from copilot_archive_fetcher import IMAPFetcher, SourceConfig
 
 
@@ -21,8 +23,9 @@ class _FakeIMAPClient:
 
     def select_folder(self, folder):
         self.folder = folder
+        return {b"UIDVALIDITY": 1}
 
-    def search(self):
+    def search(self, criteria="ALL"):
         return [1, 2]
 
     def fetch(self, msg_ids, fields):
@@ -33,11 +36,40 @@ class _FakeIMAPClient:
         pass
 
 
-def test_imap_fetcher_fails_on_partial_fetch(monkeypatch, tmp_path):
-    fake_module = types.SimpleNamespace(IMAPClient=_FakeIMAPClient)
-    monkeypatch.setitem(sys.modules, "imapclient", fake_module)
+class _FakeMailbox:
+    """In-memory IMAP folder shared by the clients of one test."""
+
+    def __init__(self, uidvalidity=1):
+        self.uidvalidity = uidvalidity
+        self.messages: dict[int, bytes] = {}
+        self.fetch_calls: list[list[int]] = []
+
+    def add(self, uid, subject, body="Hello"):
+        self.messages[uid] = f"Subject: {subject}\r\nFrom: a@example.com\r\n\r\n{body}\r\n".encode()
+
+    def client_class(self):
+        folder = self
+
+        class _Client(_FakeIMAPClient):
+            def select_folder(self, name):
+                return {b"UIDVALIDITY": folder.uidvalidity}
 
-    source = SourceConfig(
+            def search(self, criteria="ALL"):
+                assert criteria[0] == "UID"
+                low = int(criteria[1].split(":")[0])
+                uids = sorted(folder.messages)
+                # Like real servers, "N:*" also matches the highest UID when it is below N
+                return [uid for uid in uids if uid >= low] or uids[-1:]
+
+            def fetch(self, msg_ids, fields):
+                folder.fetch_calls.append(list(msg_ids))
+                return {uid: {b"SEQ": uid, b"RFC822": folder.messages[uid]} for uid in msg_ids}
+
+        return _Client
+
+
+def _source():
+    return SourceConfig(
         name="imap-test",
         source_type="imap",
         url="imap.example.com",
@@ -45,7 +77,16 @@ def test_imap_fetcher_fails_on_partial_fetch(monkeypatch, tmp_path):
         password="pass",
     )
 
-    fetcher = IMAPFetcher(source)
+
+def _subjects(path):
+    return [message["Subject"] for message in mailbox.mbox(path)]
+
+
+def test_imap_fetcher_fails_on_partial_fetch(monkeypatch, tmp_path):
+    fake_module = types.SimpleNamespace(IMAPClient=_FakeIMAPClient)
+    monkeypatch.setitem(sys.modules, "imapclient", fake_module)
+
+    fetcher = IMAPFetcher(_source())
     success, files, error = fetcher.fetch(str(tmp_path))
 
     assert success is False
@@ -55,3 +96,79 @@ def test_imap_fetcher_fails_on_partial_fetch(monkeypatch, tmp_path):
 
     # Partial mbox should not be left behind
     assert not any(tmp_path.iterdir())
+
+
+def test_imap_fetcher_appends_only_new_uids_in_batches(monkeypatch, tmp_path):
+    folder = _FakeMailbox()
+    for uid in range(1, 6):
+        folder.add(uid, f"m{uid}")
+    monkeypatch.setitem(sys.modules, "imapclient", types.SimpleNamespace(IMAPClient=folder.client_class()))
+    fetcher = IMAPFetcher(_source(), batch_size=2)
+
+    success, files, error = fetcher.fetch(str(tmp_path))
+    assert success is True, error
+    assert folder.fetch_calls == [[1, 2], [3, 4], [5]]
+    first_size = (tmp_path / "imap-test_INBOX.mbox").stat().st_size
+
+    # No new mail: nothing is fetched and the mbox is untouched
+    folder.fetch_calls.clear()
+    assert fetcher.fetch(str(tmp_path))[0] is True
+    assert folder.fetch_calls == []
+    assert (tmp_path / "imap-test_INBOX.mbox").stat().st_size == first_size
+
+    folder.add(6, "m6", body="From the start of a line")
+    assert fetcher.fetch(str(tmp_path))[0] is True
+    assert folder.fetch_calls == [[6]]
+    assert _subjects(files[0]) == ["m1", "m2", "m3", "m4", "m5", "m6"]
+    # Existing content is kept byte for byte, so the mbox is append-only
+    with open(files[0], "rb") as f:
+        content = f.read()
+    assert content[first_size:].startswith(b"From MAILER-DAEMON ")
+    assert b"\n>From the start of a line\n" in content
+
+
+def test_imap_fetcher_rebuilds_on_uidvalidity_change(monkeypatch, tmp_path):
+    folder = _FakeMailbox(uidvalidity=1)
+    folder.add(1, "old")
+    monkeypatch.setitem(sys.modules, "imapclient", types.SimpleNamespace(IMAPClient=folder.client_class()))
+    fetcher = IMAPFetcher(_source())
+    fetcher.fetch(str(tmp_path))
+
+    folder.uidvalidity = 2
+    folder.messages.clear()
+    folder.add(1, "renumbered")
+    success, files, _ = fetcher.fetch(str(tmp_path))
+
+    assert success is True
+    assert _subjects(files[0]) == ["renumbered"]
+
+
+def test_imap_fetcher_failed_batch_keeps_committed_messages(monkeypatch, tmp_path):
+    folder = _FakeMailbox()
+    folder.add(1, "m1")
+    folder.add(2, "m2")
+    client_class = folder.client_class()
+
+    class _FlakyClient(client_class):
+        def fetch(self, msg_ids, fields):
+            if 2 in msg_ids:
+                raise Exception("connection reset")
+            return super().fetch(msg_ids, fields)
+
+    monkeypatch.setitem(sys.modules, "imapclient", types.SimpleNamespace(IMAPClient=_FlakyClient))
+    success, _, error = IMAPFetcher(_source(), batch_size=1).fetch(str(tmp_path))
+    assert success is False
+    assert "Failed to fetch 1 messages" in error
+
+    # The next run resumes after the last committed UID
+    folder.fetch_calls.clear()
+    monkeypatch.setitem(sys.modules, "imapclient", types.SimpleNamespace(IMAPClient=client_class))
+    success, files, _ = IMAPFetcher(_source(), batch_size=1).fetch(str(tmp_path))
+    assert success is True
+    assert folder.fetch_calls == [[2]]
+    assert _subjects(files[0]) == ["m1", "m2"]
+
+
+def test_imap_fetcher_rejects_non_positive_batch_size():
+    with pytest.raises(ValueError):
+        IMAPFetcher(_source(), batch_size=0)
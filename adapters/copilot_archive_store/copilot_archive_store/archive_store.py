@@ -3,8 +3,9 @@
 
 """Abstract archive store interface for archive storage backends."""
 
+import io
 from abc import ABC, abstractmethod
-from typing import Any, TypeAlias
+from typing import Any, BinaryIO, TypeAlias
 
 from copilot_config.adapter_factory import create_adapter
 from copilot_config.generated.adapters.archive_store import (
@@ -96,6 +97,30 @@ class ArchiveStore(ABC):
         """
         pass
 
+    def open_archive_stream(self, archive_id: str) -> BinaryIO | None:
+        """Open archive content as a readable binary stream.
+
+        Unlike get_archive(), callers can consume the archive incrementally
+        without materializing the whole file in memory. Backends that can
+        stream natively (local files, blob downloads) override this; the
+        default implementation wraps get_archive() in an in-memory buffer.
+
+        The caller is responsible for closing the returned stream.
+
+        Args:
+            archive_id: Unique archive identifier
+
+        Returns:
+            Readable binary file-like object, or None if not found
+
+        Raises:
+            ArchiveStoreError: If retrieval operation fails
+        """
+        content = self.get_archive(archive_id)
+        if content is None:
+            return None
+        return io.BytesIO(content)
+
     @abstractmethod
     def get_archive_by_hash(self, content_hash: str) -> str | None:
         """Retrieve archive ID by content hash for deduplication.
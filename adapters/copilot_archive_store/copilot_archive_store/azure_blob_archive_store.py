@@ -4,12 +4,13 @@
 """Azure Blob Storage-based archive store implementation."""
 
 import hashlib
+import io
 import json
 import logging
 import os
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO
 
 from azure.core.exceptions import AzureError, ResourceExistsError, ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient, ContainerClient
@@ -29,6 +30,36 @@ from .archive_store import (
 
 logger = logging.getLogger(__name__)
 
+INDEX_MODE_SINGLE = "single"
+INDEX_MODE_SHARDED = "sharded"
+_INDEX_MODES = (INDEX_MODE_SINGLE, INDEX_MODE_SHARDED)
+
+
+class _BlobChunkStream(io.RawIOBase):
+    """Read-only file-like adapter over a blob download's chunk iterator.
+
+    Lets callers consume a blob incrementally (e.g. line by line through
+    io.BufferedReader) while only holding one download chunk in memory.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:  # type: ignore[override]
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
 
 class AzureBlobArchiveStore(ArchiveStore):
     """Azure Blob Storage-based archive storage.
@@ -48,14 +79,21 @@ class AzureBlobArchiveStore(ArchiveStore):
     - Content-addressable IDs enable deduplication at the metadata level
     - Same content stored multiple times reuses the same archive_id but creates
       separate blobs to maintain source/filename context
-    - A central JSON metadata blob provides efficient listing and querying
-
-    Performance Considerations:
-    - Metadata index is loaded into memory on initialization for fast access
-    - Hash index provides O(1) content hash lookups
-    - For very large deployments (millions of archives), consider using
-      Azure Table Storage or Cosmos DB for metadata indexing
-    - ETag-based optimistic concurrency prevents lost updates in multi-instance deployments
+    - Archive metadata is indexed in one of two layouts (index_mode)
+
+    Index Modes:
+    - "single" (default): one JSON metadata blob holds the whole index. It is
+      loaded into memory on initialization, so lookups are in-memory, and it is
+      re-uploaded on every write with ETag-based optimistic concurrency to
+      prevent lost updates in multi-instance deployments.
+    - "sharded": every archive gets its own small index blobs, so lookups are
+      single blob reads and writers never touch a shared blob:
+        metadata/archives/<archive_id>.json           full metadata record
+        metadata/sources/<source_name>/<archive_id>   empty blob whose blob metadata
+                                                      is the record, listed per source
+        metadata/hashes/<hash[:2]>/<content_hash>     archive_id, for deduplication
+      An existing single index blob is migrated on startup and kept as
+      archives_index.json.migrated.
     """
 
     def __init__(
@@ -66,6 +104,7 @@ class AzureBlobArchiveStore(ArchiveStore):
         container_name: str | None = None,
         prefix: str | None = None,
         connection_string: str | None = None,
+        index_mode: str = INDEX_MODE_SINGLE,
     ):
         """Initialize Azure Blob archive store.
 
@@ -85,6 +124,7 @@ class AzureBlobArchiveStore(ArchiveStore):
                       Incompatible with connection_string and account_key.
             container_name: Container name for archives (default: "raw-archives").
             prefix: Optional path prefix for organizing blobs (default: empty string).
+            index_mode: Metadata index layout, "single" or "sharded" (see class docstring).
 
         Raises:
             ValueError: If configuration is inconsistent or incomplete
@@ -96,6 +136,10 @@ class AzureBlobArchiveStore(ArchiveStore):
         self.container_name = container_name or "raw-archives"
         self.prefix = prefix or ""
         self.connection_string = connection_string
+        self.index_mode = index_mode
+
+        if self.index_mode not in _INDEX_MODES:
+            raise ValueError(f"index_mode must be one of {', '.join(_INDEX_MODES)}, got {index_mode!r}")
 
         # Ensure prefix ends with / if provided
         if self.prefix and not self.prefix.endswith("/"):
@@ -193,7 +237,10 @@ class AzureBlobArchiveStore(ArchiveStore):
         self._metadata: dict[str, dict[str, Any]] = {}
         self._metadata_etag: str | None = None
         self._hash_index: dict[str, str] = {}  # content_hash -> archive_id mapping
-        self._load_metadata()
+        if self.index_mode == INDEX_MODE_SHARDED:
+            self._migrate_single_index()
+        else:
+            self._load_metadata()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_ArchiveStore_Azureblob) -> "AzureBlobArchiveStore":
@@ -202,7 +249,7 @@ class AzureBlobArchiveStore(ArchiveStore):
         Args:
             driver_config: DriverConfig object containing archive store configuration
                           Expected keys: connection_string OR account_name, plus optional
-                          account_key, sas_token, container_name, prefix
+                          account_key, sas_token, container_name, prefix, index_mode
 
         Returns:
             AzureBlobArchiveStore instance
@@ -212,12 +259,14 @@ class AzureBlobArchiveStore(ArchiveStore):
         """
         container_name = driver_config.azureblob_container_name or "archives"
         prefix = driver_config.azureblob_prefix or ""
+        index_mode = driver_config.azureblob_index_mode or INDEX_MODE_SINGLE
 
         if isinstance(driver_config, DriverConfig_ArchiveStore_Azureblob_ConnectionString):
             return cls(
                 connection_string=driver_config.azureblob_connection_string,
                 container_name=container_name,
                 prefix=prefix,
+                index_mode=index_mode,
             )
 
         if isinstance(driver_config, DriverConfig_ArchiveStore_Azureblob_AccountKey):
@@ -226,6 +275,7 @@ class AzureBlobArchiveStore(ArchiveStore):
                 account_key=driver_config.azureblob_account_key,
                 container_name=container_name,
                 prefix=prefix,
+                index_mode=index_mode,
             )
 
         if isinstance(driver_config, DriverConfig_ArchiveStore_Azureblob_SasToken):
@@ -234,6 +284,7 @@ class AzureBlobArchiveStore(ArchiveStore):
                 sas_token=driver_config.azureblob_sas_token,
                 container_name=container_name,
                 prefix=prefix,
+                index_mode=index_mode,
             )
 
         if isinstance(driver_config, DriverConfig_ArchiveStore_Azureblob_ManagedIdentity):
@@ -241,6 +292,7 @@ class AzureBlobArchiveStore(ArchiveStore):
                 account_name=driver_config.azureblob_account_name,
                 container_name=container_name,
                 prefix=prefix,
+                index_mode=index_mode,
             )
 
         raise ValueError(f"Unsupported azureblob driver config type: {type(driver_config)}")
@@ -334,6 +386,102 @@ class AzureBlobArchiveStore(ArchiveStore):
         except Exception as e:
             raise ArchiveStoreError(f"Failed to save metadata: {e}") from e
 
+    def _record_blob_name(self, archive_id: str) -> str:
+        """Blob holding an archive's metadata record (sharded index mode)."""
+        return f"{self.prefix}metadata/archives/{archive_id}.json"
+
+    def _source_entries_prefix(self, source_name: str) -> str:
+        """Blob name prefix of a source's manifest entries (sharded index mode)."""
+        return f"{self.prefix}metadata/sources/{source_name}/"
+
+    def _hash_blob_name(self, content_hash: str) -> str:
+        """Blob mapping a content hash to its archive_id (sharded index mode)."""
+        return f"{self.prefix}metadata/hashes/{content_hash[:2]}/{content_hash}"
+
+    def _download_index_blob(self, blob_name: str) -> bytes | None:
+        """Download a small index blob, or return None if it does not exist."""
+        try:
+            return self.container_client.get_blob_client(blob_name).download_blob().readall()
+        except ResourceNotFoundError:
+            return None
+
+    def _delete_index_blob(self, blob_name: str) -> None:
+        """Delete an index blob, ignoring blobs that are already gone."""
+        try:
+            self.container_client.get_blob_client(blob_name).delete_blob()
+        except ResourceNotFoundError:
+            pass
+
+    def _write_index_blobs(self, metadata: dict[str, Any]) -> None:
+        """Write an archive's sharded index blobs.
+
+        Each blob belongs to a single archive, so concurrent writers never
+        update the same blob and need no concurrency control. The hash lookup
+        is written last so deduplication only finds archives whose record exists.
+        """
+        archive_id = metadata["archive_id"]
+        self.container_client.get_blob_client(self._record_blob_name(archive_id)).upload_blob(
+            json.dumps(metadata).encode("utf-8"), overwrite=True
+        )
+        entry_name = f"{self._source_entries_prefix(metadata['source_name'])}{archive_id}"
+        self.container_client.get_blob_client(entry_name).upload_blob(
+            b"", overwrite=True, metadata={key: str(value) for key, value in metadata.items()}
+        )
+        self.container_client.get_blob_client(self._hash_blob_name(metadata["content_hash"])).upload_blob(
+            archive_id.encode("ascii"), overwrite=True
+        )
+
+    def _migrate_single_index(self) -> None:
+        """Copy entries of an existing single index blob into the sharded index.
+
+        The single index blob is renamed to archives_index.json.migrated once
+        all entries are written. Failures are logged and the migration is
+        retried on the next start; it is idempotent, so replicas starting at
+        the same time may both run it.
+        """
+        blob_client = self.container_client.get_blob_client(self.metadata_blob_name)
+        try:
+            data = blob_client.download_blob().readall()
+        except ResourceNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Failed to read metadata index for migration: %s", e)
+            return
+
+        try:
+            entries = json.loads(data.decode("utf-8"))
+            for metadata in entries.values():
+                self._write_index_blobs(metadata)
+            self.container_client.get_blob_client(f"{self.metadata_blob_name}.migrated").upload_blob(
+                data, overwrite=True
+            )
+            self._delete_index_blob(self.metadata_blob_name)
+            logger.info("Migrated %d metadata index entries to the sharded index", len(entries))
+        except Exception as e:
+            logger.warning("Failed to migrate metadata index to the sharded index: %s", e)
+
+    def _lookup_metadata(self, archive_id: str) -> dict[str, Any] | None:
+        """Find an archive's metadata record.
+
+        Args:
+            archive_id: Unique archive identifier
+
+        Returns:
+            Metadata record, or None if the archive is not indexed
+        """
+        if self.index_mode == INDEX_MODE_SHARDED:
+            data = self._download_index_blob(self._record_blob_name(archive_id))
+            return json.loads(data.decode("utf-8")) if data is not None else None
+
+        metadata = self._metadata.get(archive_id)
+        if not metadata:
+            # Metadata is cached in-memory and can become stale in long-lived
+            # services (e.g., Azure Container Apps) where ingestion updates the
+            # metadata index after this instance started. Reload on miss.
+            self._load_metadata()
+            metadata = self._metadata.get(archive_id)
+        return metadata or None
+
     def _calculate_hash(self, content: bytes) -> str:
         """Calculate SHA256 hash of content."""
         return hashlib.sha256(content).hexdigest()
@@ -379,8 +527,7 @@ class AzureBlobArchiveStore(ArchiveStore):
 
             blob_client.upload_blob(content, overwrite=True, metadata=blob_metadata)
 
-            # Update metadata index and hash index
-            self._metadata[archive_id] = {
+            metadata = {
                 "archive_id": archive_id,
                 "source_name": source_name,
                 "blob_name": blob_name,
@@ -389,8 +536,19 @@ class AzureBlobArchiveStore(ArchiveStore):
                 "size_bytes": len(content),
                 "stored_at": datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z"),
             }
-            self._hash_index[content_hash] = archive_id
-            self._save_metadata()
+
+            if self.index_mode == INDEX_MODE_SHARDED:
+                # Same content stored again under another source moves the archive
+                # to that source, as in the single index
+                previous = self._lookup_metadata(archive_id)
+                if previous and previous["source_name"] != source_name:
+                    self._delete_index_blob(f"{self._source_entries_prefix(previous['source_name'])}{archive_id}")
+                self._write_index_blobs(metadata)
+            else:
+                # Update metadata index and hash index
+                self._metadata[archive_id] = metadata
+                self._hash_index[content_hash] = archive_id
+                self._save_metadata()
 
             logger.info("Stored archive %s for %s", archive_id, source_name)
             return archive_id
@@ -413,15 +571,9 @@ class AzureBlobArchiveStore(ArchiveStore):
             ArchiveStoreError: If retrieval operation fails
         """
         try:
-            metadata = self._metadata.get(archive_id)
+            metadata = self._lookup_metadata(archive_id)
             if not metadata:
-                # Metadata is cached in-memory and can become stale in long-lived
-                # services (e.g., Azure Container Apps) where ingestion updates the
-                # metadata index after this instance started. Reload on miss.
-                self._load_metadata()
-                metadata = self._metadata.get(archive_id)
-                if not metadata:
-                    return None
+                return None
 
             blob_name = metadata["blob_name"]
             blob_client = self.container_client.get_blob_client(blob_name)
@@ -441,10 +593,47 @@ class AzureBlobArchiveStore(ArchiveStore):
         except Exception as e:
             raise ArchiveStoreError(f"Failed to retrieve archive: {e}") from e
 
+    def open_archive_stream(self, archive_id: str) -> BinaryIO | None:
+        """Open archive blob for streaming reads.
+
+        The blob is downloaded chunk by chunk as the stream is consumed, so
+        memory use is bounded by the SDK's download chunk size rather than
+        the archive size.
+
+        Args:
+            archive_id: Unique archive identifier
+
+        Returns:
+            Buffered binary stream over the blob content, or None if not found
+
+        Raises:
+            ArchiveStoreError: If retrieval operation fails
+        """
+        try:
+            metadata = self._lookup_metadata(archive_id)
+            if not metadata:
+                return None
+
+            blob_client = self.container_client.get_blob_client(metadata["blob_name"])
+
+            try:
+                download_stream = blob_client.download_blob()
+            except ResourceNotFoundError:
+                logger.warning("Archive %s metadata exists but blob not found", archive_id)
+                return None
+
+            return io.BufferedReader(_BlobChunkStream(download_stream.chunks()))
+
+        except AzureError as e:
+            raise ArchiveStoreError(f"Failed to open archive stream from Azure: {e}") from e
+        except Exception as e:
+            raise ArchiveStoreError(f"Failed to open archive stream: {e}") from e
+
     def get_archive_by_hash(self, content_hash: str) -> str | None:
         """Retrieve archive ID by content hash for deduplication.
 
-        Uses an in-memory hash index for O(1) lookup performance.
+        Uses the in-memory hash index, or a single hash lookup blob read in
+        sharded index mode.
 
         Args:
             content_hash: SHA256 hash of the archive content
@@ -455,6 +644,13 @@ class AzureBlobArchiveStore(ArchiveStore):
         Raises:
             ArchiveStoreError: If query operation fails
         """
+        if self.index_mode == INDEX_MODE_SHARDED:
+            try:
+                data = self._download_index_blob(self._hash_blob_name(content_hash))
+            except AzureError as e:
+                raise ArchiveStoreError(f"Failed to look up archive hash in Azure: {e}") from e
+            return data.decode("ascii") if data is not None else None
+
         archive_id = self._hash_index.get(content_hash)
         if archive_id is not None:
             return archive_id
@@ -476,13 +672,9 @@ class AzureBlobArchiveStore(ArchiveStore):
             ArchiveStoreError: If check operation fails
         """
         try:
-            metadata = self._metadata.get(archive_id)
+            metadata = self._lookup_metadata(archive_id)
             if not metadata:
-                # Reload once in case metadata was updated by another instance.
-                self._load_metadata()
-                metadata = self._metadata.get(archive_id)
-                if not metadata:
-                    return False
+                return False
 
             blob_name = metadata["blob_name"]
             blob_client = self.container_client.get_blob_client(blob_name)
@@ -508,7 +700,10 @@ class AzureBlobArchiveStore(ArchiveStore):
             ArchiveStoreError: If deletion operation fails
         """
         try:
-            metadata = self._metadata.get(archive_id)
+            if self.index_mode == INDEX_MODE_SHARDED:
+                metadata = self._lookup_metadata(archive_id)
+            else:
+                metadata = self._metadata.get(archive_id)
             if not metadata:
                 return False
 
@@ -522,6 +717,13 @@ class AzureBlobArchiveStore(ArchiveStore):
             except ResourceNotFoundError:
                 logger.warning("Archive blob %s not found during deletion", archive_id)
 
+            if self.index_mode == INDEX_MODE_SHARDED:
+                # The record goes last so a failed delete can be retried
+                self._delete_index_blob(self._hash_blob_name(metadata["content_hash"]))
+                self._delete_index_blob(f"{self._source_entries_prefix(metadata['source_name'])}{archive_id}")
+                self._delete_index_blob(self._record_blob_name(archive_id))
+                return True
+
             # Remove from metadata and hash index
             content_hash = self._metadata[archive_id].get("content_hash")
             del self._metadata[archive_id]
@@ -548,6 +750,9 @@ class AzureBlobArchiveStore(ArchiveStore):
         Raises:
             ArchiveStoreError: If list operation fails
         """
+        if self.index_mode == INDEX_MODE_SHARDED:
+            return self._list_source_entries(source_name)
+
         return [
             {
                 "archive_id": metadata["archive_id"],
@@ -560,3 +765,35 @@ class AzureBlobArchiveStore(ArchiveStore):
             for metadata in self._metadata.values()
             if metadata.get("source_name") == source_name
         ]
+
+    def _list_source_entries(self, source_name: str) -> list[dict[str, Any]]:
+        """List a source's archives from its manifest entries (sharded index mode).
+
+        The records are read from the listing's blob metadata, so listing costs
+        one request per page of entries rather than one per archive.
+        """
+        entries_prefix = self._source_entries_prefix(source_name)
+        try:
+            blobs = list(self.container_client.list_blobs(name_starts_with=entries_prefix, include=["metadata"]))
+        except AzureError as e:
+            raise ArchiveStoreError(f"Failed to list archives in Azure: {e}") from e
+
+        archives = []
+        for blob in blobs:
+            if "/" in blob.name[len(entries_prefix) :]:
+                # Entry of another source whose name starts with "<source_name>/"
+                continue
+            metadata = blob.metadata or {}
+            archives.append(
+                {
+                    "archive_id": metadata["archive_id"],
+                    "source_name": metadata["source_name"],
+                    "file_path": metadata["original_path"],
+                    "content_hash": metadata["content_hash"],
+                    "size_bytes": int(metadata["size_bytes"]),
+                    "stored_at": metadata["stored_at"],
+                }
+            )
+        # Listings are ordered by name (archive_id); return archives in storage order
+        archives.sort(key=lambda archive: archive["stored_at"])
+        return archives
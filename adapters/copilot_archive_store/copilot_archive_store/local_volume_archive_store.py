@@ -7,9 +7,11 @@ import errno
 import hashlib
 import json
 import logging
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from copilot_config.generated.adapters.archive_store import DriverConfig_ArchiveStore_Local
 
@@ -18,6 +20,24 @@ from .archive_store import (
     ArchiveStoreError,
 )
 
+_METADATA_COLUMNS = (
+    "archive_id",
+    "source_name",
+    "file_path",
+    "original_path",
+    "content_hash",
+    "size_bytes",
+    "stored_at",
+)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS archives ("
+    "archive_id TEXT PRIMARY KEY, source_name TEXT NOT NULL, file_path TEXT NOT NULL, "
+    "original_path TEXT, content_hash TEXT NOT NULL, size_bytes INTEGER NOT NULL, stored_at TEXT)",
+    "CREATE INDEX IF NOT EXISTS archives_content_hash ON archives (content_hash)",
+    "CREATE INDEX IF NOT EXISTS archives_source_name ON archives (source_name)",
+)
+
 
 class LocalVolumeArchiveStore(ArchiveStore):
     """Local filesystem-based archive storage.
@@ -25,7 +45,11 @@ class LocalVolumeArchiveStore(ArchiveStore):
     This implementation maintains the current behavior of storing archives
     in a local directory structure: {base_path}/{source_name}/{filename}
 
-    Metadata is stored in a separate JSON file for efficient querying.
+    Metadata is kept in an SQLite database (metadata/archives.sqlite3, WAL
+    mode) indexed by content hash and source name. The ingestion and parsing
+    containers share the volume, so every query reads the database rather
+    than an in-process copy. A metadata/archives.json index written by
+    earlier versions is imported once and renamed to archives.json.migrated.
     """
 
     def __init__(self, base_path: str | None = None):
@@ -40,6 +64,7 @@ class LocalVolumeArchiveStore(ArchiveStore):
 
         self.base_path = Path(base_path)
         self.metadata_path = self.base_path / "metadata" / "archives.json"
+        self.db_path = self.base_path / "metadata" / "archives.sqlite3"
         self._read_only = False
 
         # Initialize logger instance for structured logging
@@ -59,9 +84,9 @@ class LocalVolumeArchiveStore(ArchiveStore):
                 # Other error (disk space, invalid path, etc.): re-raise
                 raise
 
-        # Load metadata index
-        self._metadata: dict[str, dict[str, Any]] = {}
-        self._load_metadata()
+        # The connection is shared between threads; the lock serializes access
+        self._lock = threading.Lock()
+        self._conn = self._open_connection()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_ArchiveStore_Local) -> "LocalVolumeArchiveStore":
@@ -80,27 +105,106 @@ class LocalVolumeArchiveStore(ArchiveStore):
 
         return cls(base_path=base_path)
 
-    def _load_metadata(self) -> None:
-        """Load metadata index from disk."""
-        if self.metadata_path.exists():
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the metadata database.
+
+        Writable stores create the database and migrate the legacy JSON index.
+        Read-only stores open the database read-only; before a writer has
+        created it, the legacy JSON index (if any) is served from an
+        in-memory database instead.
+        """
+        if not self._read_only:
             try:
-                with open(self.metadata_path) as f:
-                    self._metadata = json.load(f)
-            except Exception as e:
-                # Start with empty metadata if load fails
-                self._metadata = {}
-                # Log warning but don't fail initialization
-                self.logger.warning(f"Failed to load archive metadata: {e}")
-
-    def _save_metadata(self) -> None:
-        """Save metadata index to disk."""
-        if self._read_only:
-            raise ArchiveStoreError("Cannot save metadata: ArchiveStore is in read-only mode")
+                conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                with conn:
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+            except sqlite3.Error as e:
+                raise ArchiveStoreError(f"Failed to open archive metadata database: {e}")
+            self._migrate_json_metadata(conn)
+            return conn
+
+        if self.db_path.exists():
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30, check_same_thread=False)
+            try:
+                conn.execute("SELECT 1 FROM archives LIMIT 1")
+                return conn
+            except sqlite3.OperationalError as e:
+                # A WAL database on a read-only mount cannot be opened normally
+                # while no writer keeps its -wal/-shm files around
+                conn.close()
+                self.logger.info(f"Opening archive metadata database as immutable: {e}")
+                return sqlite3.connect(
+                    f"file:{self.db_path}?immutable=1", uri=True, timeout=30, check_same_thread=False
+                )
+
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            for metadata in self._read_json_metadata():
+                conn.execute(self._insert_sql("INSERT OR IGNORE"), self._row(metadata))
+        return conn
+
+    def _read_json_metadata(self) -> list[dict[str, Any]]:
+        """Read metadata entries from the legacy archives.json index."""
+        if not self.metadata_path.exists():
+            return []
         try:
-            with open(self.metadata_path, "w") as f:
-                json.dump(self._metadata, f, indent=2)
+            with open(self.metadata_path) as f:
+                legacy = json.load(f)
+            return [metadata for metadata in legacy.values() if isinstance(metadata, dict)]
         except Exception as e:
-            raise ArchiveStoreError(f"Failed to save metadata: {e}")
+            # Log warning but don't fail initialization
+            self.logger.warning(f"Failed to load archive metadata: {e}")
+            return []
+
+    def _migrate_json_metadata(self, conn: sqlite3.Connection) -> None:
+        """Import the legacy archives.json index into the database, once."""
+        if not self.metadata_path.exists():
+            return
+        entries = self._read_json_metadata()
+        try:
+            with conn:
+                conn.executemany(self._insert_sql("INSERT OR IGNORE"), [self._row(m) for m in entries])
+            self.metadata_path.rename(self.metadata_path.with_name("archives.json.migrated"))
+            self.logger.info(f"Migrated {len(entries)} archive metadata entries from {self.metadata_path}")
+        except Exception as e:
+            # The import is idempotent, so a failed migration is retried on the next start
+            self.logger.warning(f"Failed to migrate archive metadata from {self.metadata_path}: {e}")
+
+    @staticmethod
+    def _insert_sql(verb: str) -> str:
+        """Build an INSERT statement (verb is "INSERT OR IGNORE" or "INSERT OR REPLACE")."""
+        placeholders = ", ".join("?" * len(_METADATA_COLUMNS))
+        return f"{verb} INTO archives ({', '.join(_METADATA_COLUMNS)}) VALUES ({placeholders})"
+
+    @staticmethod
+    def _row(metadata: dict[str, Any]) -> tuple[Any, ...]:
+        """Convert a metadata dictionary to a row in column order."""
+        return tuple(metadata.get(column) for column in _METADATA_COLUMNS)
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        """Run a metadata query and return rows as metadata dictionaries."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise ArchiveStoreError(f"Failed to query archive metadata: {e}")
+        return [dict(zip(_METADATA_COLUMNS, row)) for row in rows]
+
+    def _get_metadata(self, archive_id: str) -> dict[str, Any] | None:
+        """Look up the metadata of one archive."""
+        sql = f"SELECT {', '.join(_METADATA_COLUMNS)} FROM archives WHERE archive_id = ?"
+        rows = self._query(sql, (archive_id,))
+        if not rows and self._read_only:
+            # Reopen in case the writer created the database or it was opened as an immutable snapshot
+            with self._lock:
+                self._conn.close()
+                self._conn = self._open_connection()
+            rows = self._query(sql, (archive_id,))
+        return rows[0] if rows else None
 
     def _calculate_hash(self, content: bytes) -> str:
         """Calculate SHA256 hash of content."""
@@ -138,7 +242,7 @@ class LocalVolumeArchiveStore(ArchiveStore):
                 f.write(content)
 
             # Update metadata
-            self._metadata[archive_id] = {
+            metadata = {
                 "archive_id": archive_id,
                 "source_name": source_name,
                 "file_path": str(target_path),
@@ -147,7 +251,8 @@ class LocalVolumeArchiveStore(ArchiveStore):
                 "size_bytes": len(content),
                 "stored_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             }
-            self._save_metadata()
+            with self._lock, self._conn:
+                self._conn.execute(self._insert_sql("INSERT OR REPLACE"), self._row(metadata))
 
             return archive_id
 
@@ -164,13 +269,9 @@ class LocalVolumeArchiveStore(ArchiveStore):
             Archive content as bytes, or None if not found
         """
         try:
-            metadata = self._metadata.get(archive_id)
+            metadata = self._get_metadata(archive_id)
             if not metadata:
-                # Metadata not in cache - reload from disk in case another service added it
-                self._load_metadata()
-                metadata = self._metadata.get(archive_id)
-                if not metadata:
-                    return None
+                return None
 
             file_path = Path(metadata["file_path"])
             if not file_path.exists():
@@ -183,6 +284,31 @@ class LocalVolumeArchiveStore(ArchiveStore):
         except Exception as e:
             raise ArchiveStoreError(f"Failed to retrieve archive: {e}")
 
+    def open_archive_stream(self, archive_id: str) -> BinaryIO | None:
+        """Open archive file for streaming reads.
+
+        Args:
+            archive_id: Unique archive identifier
+
+        Returns:
+            Binary file handle positioned at the start of the archive,
+            or None if not found
+        """
+        try:
+            metadata = self._get_metadata(archive_id)
+            if not metadata:
+                return None
+
+            file_path = Path(metadata["file_path"])
+            if not file_path.exists():
+                # Metadata exists but file is missing
+                return None
+
+            return open(file_path, "rb")
+
+        except Exception as e:
+            raise ArchiveStoreError(f"Failed to open archive: {e}")
+
     def get_archive_by_hash(self, content_hash: str) -> str | None:
         """Retrieve archive ID by content hash.
 
@@ -192,10 +318,10 @@ class LocalVolumeArchiveStore(ArchiveStore):
         Returns:
             Archive ID if found, None otherwise
         """
-        for archive_id, metadata in self._metadata.items():
-            if metadata.get("content_hash") == content_hash:
-                return archive_id
-        return None
+        rows = self._query(
+            f"SELECT {', '.join(_METADATA_COLUMNS)} FROM archives WHERE content_hash = ? LIMIT 1", (content_hash,)
+        )
+        return rows[0]["archive_id"] if rows else None
 
     def archive_exists(self, archive_id: str) -> bool:
         """Check if archive exists.
@@ -206,13 +332,9 @@ class LocalVolumeArchiveStore(ArchiveStore):
         Returns:
             True if archive exists (both metadata and file), False otherwise
         """
-        metadata = self._metadata.get(archive_id)
+        metadata = self._get_metadata(archive_id)
         if not metadata:
-            # Metadata not in cache - reload from disk in case another service added it
-            self._load_metadata()
-            metadata = self._metadata.get(archive_id)
-            if not metadata:
-                return False
+            return False
 
         file_path = Path(metadata["file_path"])
         return file_path.exists()
@@ -230,7 +352,7 @@ class LocalVolumeArchiveStore(ArchiveStore):
             raise ArchiveStoreError("Cannot delete archive: ArchiveStore is in read-only mode")
 
         try:
-            metadata = self._metadata.get(archive_id)
+            metadata = self._get_metadata(archive_id)
             if not metadata:
                 return False
 
@@ -240,8 +362,8 @@ class LocalVolumeArchiveStore(ArchiveStore):
                 file_path.unlink()
 
             # Remove from metadata
-            del self._metadata[archive_id]
-            self._save_metadata()
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM archives WHERE archive_id = ?", (archive_id,))
 
             return True
 
@@ -257,4 +379,7 @@ class LocalVolumeArchiveStore(ArchiveStore):
         Returns:
             List of archive metadata dictionaries
         """
-        return [metadata for metadata in self._metadata.values() if metadata.get("source_name") == source_name]
+        return self._query(
+            f"SELECT {', '.join(_METADATA_COLUMNS)} FROM archives WHERE source_name = ? ORDER BY rowid",
+            (source_name,),
+        )
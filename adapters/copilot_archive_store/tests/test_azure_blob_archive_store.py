@@ -3,6 +3,8 @@
 
 """Unit tests for AzureBlobArchiveStore with mocked Azure SDK."""
 
+import hashlib
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -615,6 +617,62 @@ class TestAzureBlobArchiveStore:
         retrieved = store.get_archive(archive_id)
         assert retrieved == content
 
+    def test_open_archive_stream(self, store, mock_blob_service_client):
+        """Test streaming an archive reads blob chunks lazily."""
+        _, _, mock_container = mock_blob_service_client
+
+        content = b"From a@example.com\nSubject: one\n\nbody\n"
+
+        mock_archive_blob = MagicMock()
+        mock_metadata_blob = MagicMock()
+        mock_metadata_props = MagicMock()
+        mock_metadata_props.etag = "etag"
+        mock_metadata_blob.get_blob_properties.return_value = mock_metadata_props
+
+        def get_blob_client_side_effect(blob_name):
+            if "metadata" in blob_name:
+                return mock_metadata_blob
+            else:
+                return mock_archive_blob
+
+        mock_container.get_blob_client.side_effect = get_blob_client_side_effect
+
+        archive_id = store.store_archive(source_name="test-source", file_path="test.mbox", content=content)
+
+        # Serve the blob in small chunks to exercise chunk boundaries
+        mock_download_stream = MagicMock()
+        mock_download_stream.chunks.return_value = iter([content[i : i + 7] for i in range(0, len(content), 7)])
+        mock_archive_blob.download_blob.return_value = mock_download_stream
+
+        stream = store.open_archive_stream(archive_id)
+        assert stream is not None
+        assert stream.readline() == b"From a@example.com\n"
+        assert stream.read() == content[len(b"From a@example.com\n") :]
+        mock_download_stream.readall.assert_not_called()
+
+    def test_open_archive_stream_blob_missing(self, store, mock_blob_service_client):
+        """Test streaming returns None when blob is missing but metadata exists."""
+        _, _, mock_container = mock_blob_service_client
+
+        mock_archive_blob = MagicMock()
+        mock_metadata_blob = MagicMock()
+        mock_metadata_props = MagicMock()
+        mock_metadata_props.etag = "etag"
+        mock_metadata_blob.get_blob_properties.return_value = mock_metadata_props
+
+        def get_blob_client_side_effect(blob_name):
+            if "metadata" in blob_name:
+                return mock_metadata_blob
+            else:
+                return mock_archive_blob
+
+        mock_container.get_blob_client.side_effect = get_blob_client_side_effect
+
+        archive_id = store.store_archive(source_name="test-source", file_path="test.mbox", content=b"x")
+        mock_archive_blob.download_blob.side_effect = ResourceNotFoundError()
+
+        assert store.open_archive_stream(archive_id) is None
+
     def test_get_archive_not_found(self, store):
         """Test retrieving non-existent archive returns None."""
         result = store.get_archive("nonexistent_id")
@@ -897,3 +955,142 @@ class TestAzureBlobArchiveStore:
 
         with pytest.raises(ValueError, match="Authentication configuration required"):
             AzureBlobArchiveStore()
+
+
+class _FakeBlob:
+    """In-memory stand-in for a BlobClient, backed by a _FakeContainer."""
+
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+
+    def upload_blob(self, data, overwrite=False, metadata=None, **kwargs):
+        self.container.uploads.append((self.name, kwargs))
+        self.container.blobs[self.name] = (bytes(data), dict(metadata or {}))
+
+    def download_blob(self):
+        if self.name not in self.container.blobs:
+            raise ResourceNotFoundError("Not found")
+        download = MagicMock()
+        download.readall.return_value = self.container.blobs[self.name][0]
+        return download
+
+    def delete_blob(self):
+        if self.container.blobs.pop(self.name, None) is None:
+            raise ResourceNotFoundError("Not found")
+
+    def exists(self):
+        return self.name in self.container.blobs
+
+
+class _FakeContainer:
+    """In-memory stand-in for a ContainerClient."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.uploads = []
+
+    def create_container(self):
+        return None
+
+    def get_blob_client(self, name):
+        return _FakeBlob(self, name)
+
+    def list_blobs(self, name_starts_with="", include=None):
+        for name in sorted(self.blobs):
+            if name.startswith(name_starts_with):
+                blob = MagicMock()
+                blob.name = name
+                blob.metadata = self.blobs[name][1] if include and "metadata" in include else None
+                yield blob
+
+
+@pytest.mark.skipif(not AZURE_AVAILABLE, reason="azure-storage-blob not installed")
+class TestAzureBlobArchiveStoreShardedIndex:
+    """Tests for the sharded metadata index mode."""
+
+    @pytest.fixture
+    def container(self):
+        """Patch BlobServiceClient to serve an in-memory container."""
+        container = _FakeContainer()
+        with patch("copilot_archive_store.azure_blob_archive_store.BlobServiceClient") as mock_bsc:
+            mock_bsc.return_value.get_container_client.return_value = container
+            yield container
+
+    def _store(self):
+        return AzureBlobArchiveStore(
+            account_name="testaccount", account_key="testkey123==", prefix="pfx", index_mode="sharded"
+        )
+
+    def test_round_trip_without_single_index(self, container):
+        """Test store, lookups, listing and delete use per-archive index blobs only."""
+        store = self._store()
+        content = b"Sharded archive"
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        archive_id = store.store_archive("source-a", "/tmp/a.mbox", content)
+
+        assert store.get_archive(archive_id) == content
+        assert store.get_archive_by_hash(content_hash) == archive_id
+        assert store.archive_exists(archive_id) is True
+        archives = store.list_archives("source-a")
+        assert [(a["archive_id"], a["file_path"], a["size_bytes"]) for a in archives] == [
+            (archive_id, "/tmp/a.mbox", len(content))
+        ]
+        assert f"pfx/metadata/archives/{archive_id}.json" in container.blobs
+        assert f"pfx/metadata/hashes/{content_hash[:2]}/{content_hash}" in container.blobs
+        assert "pfx/metadata/archives_index.json" not in container.blobs
+        # No conditional (ETag) writes are needed
+        assert all(not kwargs for _, kwargs in container.uploads)
+
+        assert store.delete_archive(archive_id) is True
+        assert store.get_archive_by_hash(content_hash) is None
+        assert store.list_archives("source-a") == []
+        assert container.blobs == {}
+
+    def test_replicas_see_each_others_writes(self, container):
+        """Test that archives stored by one instance are found by another without reloading."""
+        first, second = self._store(), self._store()
+
+        id1 = first.store_archive("source-a", "a.mbox", b"first")
+        id2 = second.store_archive("source-a", "b.mbox", b"second")
+
+        assert {a["archive_id"] for a in first.list_archives("source-a")} == {id1, id2}
+        assert second.get_archive(id1) == b"first"
+
+    def test_restore_under_other_source_moves_entry(self, container):
+        """Test that storing known content under another source moves its manifest entry."""
+        store = self._store()
+
+        archive_id = store.store_archive("source-a", "a.mbox", b"same")
+        assert store.store_archive("source-ab", "a.mbox", b"same") == archive_id
+
+        assert store.list_archives("source-a") == []
+        assert [a["archive_id"] for a in store.list_archives("source-ab")] == [archive_id]
+
+    def test_migrates_single_index(self, container):
+        """Test that an existing single index blob is migrated on startup."""
+        entry = {
+            "archive_id": "abcdef0123456789",
+            "source_name": "legacy",
+            "blob_name": "pfx/legacy/old.mbox",
+            "original_path": "old.mbox",
+            "content_hash": "abcdef0123456789" + "0" * 48,
+            "size_bytes": 3,
+            "stored_at": "2025-01-01T00:00:00.000000Z",
+        }
+        container.blobs["pfx/metadata/archives_index.json"] = (json.dumps({entry["archive_id"]: entry}).encode(), {})
+        container.blobs["pfx/legacy/old.mbox"] = (b"old", {})
+
+        store = self._store()
+
+        assert "pfx/metadata/archives_index.json" not in container.blobs
+        assert "pfx/metadata/archives_index.json.migrated" in container.blobs
+        assert store.get_archive_by_hash(entry["content_hash"]) == entry["archive_id"]
+        assert store.get_archive(entry["archive_id"]) == b"old"
+        assert store.list_archives("legacy")[0]["stored_at"] == entry["stored_at"]
+
+    def test_invalid_index_mode(self, container):
+        """Test that an unknown index mode is rejected."""
+        with pytest.raises(ValueError, match="index_mode"):
+            AzureBlobArchiveStore(account_name="testaccount", account_key="key==", index_mode="bogus")
@@ -14,6 +14,9 @@ To run these tests locally, set the following environment variables:
 
 Or use a connection string:
 - AZURE_STORAGE_CONNECTION_STRING: Full Azure Storage connection string
+  ("UseDevelopmentStorage=true" runs the tests against Azurite)
+
+Every test runs against both the single and the sharded metadata index mode.
 """
 
 import hashlib
@@ -54,8 +57,8 @@ def has_azure_credentials() -> bool:
 class TestAzureBlobArchiveStoreIntegration:
     """Integration tests using actual Azure Blob Storage."""
 
-    @pytest.fixture
-    def store(self):
+    @pytest.fixture(params=["single", "sharded"])
+    def store(self, request):
         """Create an AzureBlobArchiveStore instance using environment credentials."""
         # Use a test-specific prefix to isolate test data
         prefix = os.getenv("AZURE_STORAGE_PREFIX", "")
@@ -73,6 +76,7 @@ class TestAzureBlobArchiveStoreIntegration:
                 connection_string=connection_string,
                 container_name=container_name,
                 prefix=test_prefix,
+                index_mode=request.param,
             )
         else:
             store = AzureBlobArchiveStore(
@@ -81,6 +85,7 @@ class TestAzureBlobArchiveStoreIntegration:
                 sas_token=sas_token,
                 container_name=container_name,
                 prefix=test_prefix,
+                index_mode=request.param,
             )
         yield store
 
@@ -259,6 +264,7 @@ class TestAzureBlobArchiveStoreIntegration:
                 connection_string=connection_string,
                 container_name=container_name,
                 prefix=store.prefix,
+                index_mode=store.index_mode,
             )
         else:
             store2 = AzureBlobArchiveStore(
@@ -267,6 +273,7 @@ class TestAzureBlobArchiveStoreIntegration:
                 sas_token=sas_token,
                 container_name=container_name,
                 prefix=store.prefix,
+                index_mode=store.index_mode,
             )
 
         # Should be able to retrieve archive using new instance
@@ -278,6 +285,35 @@ class TestAzureBlobArchiveStoreIntegration:
         assert len(archives) >= 1
         assert any(a["archive_id"] == archive_id for a in archives)
 
+    def test_concurrent_writers(self, store):
+        """Test that two instances storing archives for the same source both succeed."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if store.index_mode != "sharded":
+            pytest.skip("Concurrent writers conflict on the single index blob")
+
+        other = AzureBlobArchiveStore(
+            connection_string=store.connection_string,
+            account_name=store.account_name,
+            account_key=store.account_key,
+            sas_token=store.sas_token,
+            container_name=store.container_name,
+            prefix=store.prefix,
+            index_mode=store.index_mode,
+        )
+        contents = [f"Concurrent archive {i}".encode() for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ids = list(
+                pool.map(
+                    lambda i: (store, other)[i % 2].store_archive("concurrent-test", f"archive{i}.mbox", contents[i]),
+                    range(len(contents)),
+                )
+            )
+
+        assert {a["archive_id"] for a in store.list_archives("concurrent-test")} == set(ids)
+        for archive_id, content in zip(ids, contents):
+            assert other.get_archive_by_hash(hashlib.sha256(content).hexdigest()) == archive_id
+
     def test_special_characters_in_filenames(self, store):
         """Test handling filenames with special characters."""
         content = b"Special chars test"
@@ -3,6 +3,8 @@
 
 """Unit tests for LocalVolumeArchiveStore."""
 
+import hashlib
+import json
 import shutil
 import tempfile
 from pathlib import Path
@@ -61,6 +63,23 @@ def test_get_archive_not_found(store):
     assert result is None
 
 
+def test_open_archive_stream(store):
+    """Test streaming an archive from disk."""
+    content = b"From a@example.com\nSubject: one\n\nbody\n"
+    archive_id = store.store_archive(source_name="test-source", file_path="stream.mbox", content=content)
+
+    stream = store.open_archive_stream(archive_id)
+    assert stream is not None
+    with stream:
+        assert stream.readline() == b"From a@example.com\n"
+        assert stream.read() == content[len(b"From a@example.com\n") :]
+
+
+def test_open_archive_stream_not_found(store):
+    """Test streaming non-existent archive returns None."""
+    assert store.open_archive_stream("nonexistent_id") is None
+
+
 def test_get_archive_by_hash(store):
     """Test retrieving archive ID by content hash."""
     import hashlib
@@ -202,3 +221,54 @@ def test_archive_metadata_structure(store):
     assert metadata["archive_id"] == archive_id
     assert metadata["source_name"] == "test-source"
     assert metadata["size_bytes"] == len(content)
+
+
+def test_metadata_stored_in_sqlite(store, temp_dir):
+    """Test that metadata goes to the SQLite index instead of a JSON file."""
+    store.store_archive("test-source", "test.mbox", b"content")
+
+    assert (Path(temp_dir) / "metadata" / "archives.sqlite3").exists()
+    assert not (Path(temp_dir) / "metadata" / "archives.json").exists()
+
+
+def test_writes_visible_to_other_instances(temp_dir):
+    """Test that archives stored by one instance are found by an instance opened earlier."""
+    reader = LocalVolumeArchiveStore(base_path=temp_dir)
+    writer = LocalVolumeArchiveStore(base_path=temp_dir)
+
+    archive_id = writer.store_archive("test-source", "test.mbox", b"shared content")
+
+    assert reader.get_archive(archive_id) == b"shared content"
+    assert reader.get_archive_by_hash(hashlib.sha256(b"shared content").hexdigest()) == archive_id
+    writer.delete_archive(archive_id)
+    assert reader.archive_exists(archive_id) is False
+
+
+def test_legacy_json_metadata_migrated_once(temp_dir):
+    """Test that an existing archives.json index is imported and renamed."""
+    archive_path = Path(temp_dir) / "legacy-source" / "old.mbox"
+    archive_path.parent.mkdir(parents=True)
+    archive_path.write_bytes(b"legacy content")
+    metadata_dir = Path(temp_dir) / "metadata"
+    metadata_dir.mkdir()
+    legacy = {
+        "abc123": {
+            "archive_id": "abc123",
+            "source_name": "legacy-source",
+            "file_path": str(archive_path),
+            "original_path": "old.mbox",
+            "content_hash": "abc123" + "0" * 58,
+            "size_bytes": 14,
+            "stored_at": "2025-01-01T00:00:00Z",
+        }
+    }
+    (metadata_dir / "archives.json").write_text(json.dumps(legacy))
+
+    store = LocalVolumeArchiveStore(base_path=temp_dir)
+
+    assert store.get_archive("abc123") == b"legacy content"
+    assert store.list_archives("legacy-source") == [legacy["abc123"]]
+    assert not (metadata_dir / "archives.json").exists()
+    assert (metadata_dir / "archives.json.migrated").exists()
+    # Reopening does not need the JSON file any more
+    assert LocalVolumeArchiveStore(base_path=temp_dir).archive_exists("abc123") is True
@@ -41,6 +41,13 @@ from .chunkers import (
     ThreadChunker,
     create_chunker,
 )
+from .tokenizers import (
+    HuggingFaceTokenizer,
+    TiktokenTokenizer,
+    Tokenizer,
+    WhitespaceTokenizer,
+    create_tokenizer,
+)
 
 __all__ = [
     # Version
@@ -50,6 +57,12 @@ __all__ = [
     # Data classes
     "Chunk",
     "Thread",
+    # Tokenizers
+    "Tokenizer",
+    "WhitespaceTokenizer",
+    "HuggingFaceTokenizer",
+    "TiktokenTokenizer",
     # Factory
     "create_chunker",
+    "create_tokenizer",
 ]
@@ -6,9 +6,15 @@
 This module provides an abstraction layer for different thread chunking strategies,
 enabling flexible experimentation with different approaches to breaking up email
 threads before embedding or summarization.
+
+Chunkers measure text with a Tokenizer (whitespace words by default, or the
+embedding model's own tokenizer). Text is tokenized once; chunk text is sliced
+from the original text by token index and carries its character offsets.
 """
 
+import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Any, TypeAlias
 
@@ -21,6 +27,8 @@ from copilot_config.generated.adapters.chunker import (
 )
 from copilot_schema_validation import generate_chunk_id
 
+from .tokenizers import Tokenizer, WhitespaceTokenizer, create_tokenizer
+
 ChunkerDriverConfig: TypeAlias = (
     DriverConfig_Chunker_FixedSize | DriverConfig_Chunker_Semantic | DriverConfig_Chunker_TokenWindow
 )
@@ -109,9 +117,17 @@ class TokenWindowChunker(ThreadChunker):
         overlap: Number of tokens to overlap between chunks
         min_chunk_size: Minimum acceptable chunk size (discard smaller)
         max_chunk_size: Maximum chunk size (hard limit)
+        tokenizer: Tokenizer that defines what a token is
     """
 
-    def __init__(self, chunk_size: int = 384, overlap: int = 50, min_chunk_size: int = 100, max_chunk_size: int = 512):
+    def __init__(
+        self,
+        chunk_size: int = 384,
+        overlap: int = 50,
+        min_chunk_size: int = 100,
+        max_chunk_size: int = 512,
+        tokenizer: Tokenizer | None = None,
+    ):
         """Initialize TokenWindowChunker.
 
         Args:
@@ -119,11 +135,13 @@ class TokenWindowChunker(ThreadChunker):
             overlap: Overlap between chunks in tokens (default: 50)
             min_chunk_size: Minimum chunk size in tokens (default: 100)
             max_chunk_size: Maximum chunk size in tokens (default: 512)
+            tokenizer: Tokenizer used to count tokens (default: whitespace words)
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
+        self.tokenizer = tokenizer or WhitespaceTokenizer()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_Chunker_TokenWindow) -> "TokenWindowChunker":
@@ -134,6 +152,9 @@ class TokenWindowChunker(ThreadChunker):
         - overlap (int)
         - min_chunk_size (int)
         - max_chunk_size (int)
+        - tokenizer (str)
+        - tokenizer_model (str, optional)
+        - preserve_whitespace (bool)
         """
         chunk_size = driver_config.chunk_size
         overlap = driver_config.overlap
@@ -145,6 +166,11 @@ class TokenWindowChunker(ThreadChunker):
             overlap=int(overlap if overlap is not None else 50),
             min_chunk_size=int(min_chunk_size if min_chunk_size is not None else 100),
             max_chunk_size=int(max_chunk_size if max_chunk_size is not None else 512),
+            tokenizer=create_tokenizer(
+                driver_config.tokenizer,
+                driver_config.tokenizer_model,
+                preserve_whitespace=bool(driver_config.preserve_whitespace),
+            ),
         )
 
     def chunk(self, thread: Thread) -> list[Chunk]:
@@ -164,49 +190,33 @@ class TokenWindowChunker(ThreadChunker):
         if thread.message_doc_id is None:
             raise ValueError("Thread message_doc_id must be provided before chunking")
 
-        # Simple word-based approximation for token counting
-        # In a real implementation, use tiktoken or similar
-        words = thread.text.split()
+        # Tokenize once; windows are sliced from the original text by token index, or
+        # re-joined from words by the whitespace tokenizer unless it preserves whitespace
+        window_size = max(1, min(self.chunk_size, self.max_chunk_size))
+        # Overlap of at least a full window cannot make progress; fall back to no overlap
+        step = window_size - self.overlap if 0 <= self.overlap < window_size else window_size
+        windows = self.tokenizer.window_texts(thread.text, window_size, step)
         chunks = []
 
-        start_idx = 0
         chunk_index = 0
 
-        while start_idx < len(words):
-            # Calculate end index for this chunk
-            end_idx = min(start_idx + self.chunk_size, len(words))
-
-            # Get the chunk text
-            chunk_words = words[start_idx:end_idx]
-            chunk_text = " ".join(chunk_words)
-
+        for position, (token_count, chunk_text, start_offset, end_offset) in enumerate(windows):
             # Only create chunk if it meets minimum size
-            if len(chunk_words) >= self.min_chunk_size or end_idx == len(words):
+            if token_count >= self.min_chunk_size or position == len(windows) - 1:
                 chunk = Chunk(
                     chunk_id=generate_chunk_id(thread.message_doc_id, chunk_index),
                     message_doc_id=thread.message_doc_id,
                     thread_id=thread.thread_id,
                     text=chunk_text,
                     chunk_index=chunk_index,
-                    token_count=len(chunk_words),
+                    token_count=token_count,
                     metadata=thread.metadata.copy(),
-                    start_offset=None,  # Could calculate character offsets if needed
-                    end_offset=None,
+                    start_offset=start_offset,
+                    end_offset=end_offset,
                 )
                 chunks.append(chunk)
                 chunk_index += 1
 
-            # Move to next window with overlap
-            if end_idx == len(words):
-                break
-
-            prev_start_idx = start_idx
-            start_idx = end_idx - self.overlap
-
-            # Ensure we make progress (avoid infinite loops)
-            if start_idx <= prev_start_idx:
-                start_idx = end_idx
-
         return chunks
 
 
@@ -218,17 +228,20 @@ class FixedSizeChunker(ThreadChunker):
 
     Attributes:
         messages_per_chunk: Number of messages to include in each chunk
+        tokenizer: Tokenizer used to count the tokens of each chunk
     """
 
-    def __init__(self, messages_per_chunk: int = 5):
+    def __init__(self, messages_per_chunk: int = 5, tokenizer: Tokenizer | None = None):
         """Initialize FixedSizeChunker.
 
         Args:
             messages_per_chunk: Number of messages per chunk (default: 5)
+            tokenizer: Tokenizer used to count tokens (default: whitespace words)
         """
         if messages_per_chunk < 1:
             raise ValueError("messages_per_chunk must be at least 1")
         self.messages_per_chunk = messages_per_chunk
+        self.tokenizer = tokenizer or WhitespaceTokenizer()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_Chunker_FixedSize) -> "FixedSizeChunker":
@@ -236,9 +249,14 @@ class FixedSizeChunker(ThreadChunker):
 
         Expected keys:
         - messages_per_chunk (int)
+        - tokenizer (str)
+        - tokenizer_model (str, optional)
         """
         messages_per_chunk = driver_config.messages_per_chunk
-        return cls(messages_per_chunk=int(messages_per_chunk if messages_per_chunk is not None else 5))
+        return cls(
+            messages_per_chunk=int(messages_per_chunk if messages_per_chunk is not None else 5),
+            tokenizer=create_tokenizer(driver_config.tokenizer, driver_config.tokenizer_model),
+        )
 
     def chunk(self, thread: Thread) -> list[Chunk]:
         """Chunk a thread by grouping N messages together.
@@ -264,15 +282,14 @@ class FixedSizeChunker(ThreadChunker):
             raise ValueError("Thread must have either messages or text")
 
         # Split by double newlines as a simple message separator heuristic
-        message_blocks = [block.strip() for block in thread.text.split("\n\n") if block.strip()]
+        message_blocks = _block_spans(thread.text)
 
         chunks = []
         for i in range(0, len(message_blocks), self.messages_per_chunk):
             chunk_blocks = message_blocks[i : i + self.messages_per_chunk]
-            chunk_text = "\n\n".join(chunk_blocks)
-
-            # Simple word count as token approximation
-            token_count = len(chunk_text.split())
+            start_offset = chunk_blocks[0][0]
+            end_offset = chunk_blocks[-1][1]
+            chunk_text = thread.text[start_offset:end_offset]
 
             chunk_idx = i // self.messages_per_chunk
             chunk = Chunk(
@@ -281,8 +298,10 @@ class FixedSizeChunker(ThreadChunker):
                 thread_id=thread.thread_id,
                 text=chunk_text,
                 chunk_index=chunk_idx,
-                token_count=token_count,
+                token_count=self.tokenizer.count(chunk_text),
                 metadata=thread.metadata.copy(),
+                start_offset=start_offset,
+                end_offset=end_offset,
             )
             chunks.append(chunk)
 
@@ -332,7 +351,7 @@ class FixedSizeChunker(ThreadChunker):
             combined_metadata["message_doc_ids"] = [msg["message_doc_id"] for msg in chunk_messages]
             combined_metadata["message_count"] = len(chunk_messages)
 
-            token_count = len(chunk_text.split())
+            token_count = self.tokenizer.count(chunk_text)
 
             chunk_idx = i // self.messages_per_chunk
             chunk = Chunk(
@@ -359,17 +378,22 @@ class SemanticChunker(ThreadChunker):
     Attributes:
         target_chunk_size: Target size for chunks in tokens
         split_on_speaker: Whether to split on speaker changes (not yet implemented)
+        tokenizer: Tokenizer that defines what a token is
     """
 
-    def __init__(self, target_chunk_size: int = 400, split_on_speaker: bool = False):
+    def __init__(
+        self, target_chunk_size: int = 400, split_on_speaker: bool = False, tokenizer: Tokenizer | None = None
+    ):
         """Initialize SemanticChunker.
 
         Args:
             target_chunk_size: Target chunk size in tokens (default: 400)
             split_on_speaker: Split on speaker changes (not yet implemented)
+            tokenizer: Tokenizer used to count tokens (default: whitespace words)
         """
         self.target_chunk_size = target_chunk_size
         self.split_on_speaker = split_on_speaker
+        self.tokenizer = tokenizer or WhitespaceTokenizer()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_Chunker_Semantic) -> "SemanticChunker":
@@ -378,19 +402,23 @@ class SemanticChunker(ThreadChunker):
         Expected keys:
         - target_chunk_size (int)
         - split_on_speaker (bool)
+        - tokenizer (str)
+        - tokenizer_model (str, optional)
         """
         target_chunk_size = driver_config.target_chunk_size
         split_on_speaker = driver_config.split_on_speaker
         return cls(
             target_chunk_size=int(target_chunk_size if target_chunk_size is not None else 400),
             split_on_speaker=bool(split_on_speaker if split_on_speaker is not None else False),
+            tokenizer=create_tokenizer(driver_config.tokenizer, driver_config.tokenizer_model),
         )
 
     def chunk(self, thread: Thread) -> list[Chunk]:
         """Chunk a thread on sentence boundaries.
 
         This is a basic implementation that splits on sentence boundaries
-        and groups sentences until the target chunk size is reached.
+        and groups sentences until the target chunk size is reached. A
+        sentence longer than the target is split by token count.
 
         Args:
             thread: The thread to chunk
@@ -406,53 +434,53 @@ class SemanticChunker(ThreadChunker):
         if thread.message_doc_id is None:
             raise ValueError("Thread message_doc_id must be provided before chunking")
 
-        # Simple sentence splitting on common terminators
-        # A more robust implementation would use NLTK or spaCy
-        sentences = self._split_sentences(thread.text)
-
-        chunks = []
-        current_chunk_sentences: list[str] = []
-        current_token_count = 0
-        chunk_index = 0
-
-        for sentence in sentences:
-            sentence_tokens = len(sentence.split())
-
-            # If adding this sentence would exceed target, create a chunk
-            if current_chunk_sentences and current_token_count + sentence_tokens > self.target_chunk_size:
-                chunk_text = " ".join(current_chunk_sentences)
-                chunk = Chunk(
-                    chunk_id=generate_chunk_id(thread.message_doc_id, chunk_index),
+        # Tokenize once and map sentence boundaries to token indexes, so each
+        # sentence is a contiguous token range and chunks are text slices
+        spans = self.tokenizer.token_spans(thread.text)
+        token_starts = [start for start, _ in spans]
+        boundaries = [0]
+        for sentence_start, _ in self._sentence_spans(thread.text)[1:]:
+            boundaries.append(bisect_left(token_starts, sentence_start))
+        boundaries.append(len(spans))
+
+        target = max(1, self.target_chunk_size)
+        chunks: list[Chunk] = []
+        chunk_start = 0
+        chunk_tokens = 0
+
+        def emit(first: int, last: int) -> None:
+            start_offset = spans[first][0]
+            end_offset = spans[last - 1][1]
+            chunks.append(
+                Chunk(
+                    chunk_id=generate_chunk_id(thread.message_doc_id, len(chunks)),
                     message_doc_id=thread.message_doc_id,
                     thread_id=thread.thread_id,
-                    text=chunk_text,
-                    chunk_index=chunk_index,
-                    token_count=current_token_count,
+                    text=thread.text[start_offset:end_offset],
+                    chunk_index=len(chunks),
+                    token_count=last - first,
                     metadata=thread.metadata.copy(),
+                    start_offset=start_offset,
+                    end_offset=end_offset,
                 )
-                chunks.append(chunk)
-                chunk_index += 1
+            )
 
-                # Start new chunk
-                current_chunk_sentences = []
-                current_token_count = 0
+        for sentence_first, sentence_last in zip(boundaries, boundaries[1:]):
+            # Oversized sentences are split into target-sized pieces
+            for piece_first in range(sentence_first, sentence_last, target):
+                piece_tokens = min(target, sentence_last - piece_first)
 
-            current_chunk_sentences.append(sentence)
-            current_token_count += sentence_tokens
+                # If adding this piece would exceed target, create a chunk
+                if chunk_tokens and chunk_tokens + piece_tokens > target:
+                    emit(chunk_start, chunk_start + chunk_tokens)
+                    chunk_tokens = 0
+                if not chunk_tokens:
+                    chunk_start = piece_first
+                chunk_tokens += piece_tokens
 
         # Add final chunk if there are remaining sentences
-        if current_chunk_sentences:
-            chunk_text = " ".join(current_chunk_sentences)
-            chunk = Chunk(
-                chunk_id=generate_chunk_id(thread.message_doc_id, chunk_index),
-                message_doc_id=thread.message_doc_id,
-                thread_id=thread.thread_id,
-                text=chunk_text,
-                chunk_index=chunk_index,
-                token_count=current_token_count,
-                metadata=thread.metadata.copy(),
-            )
-            chunks.append(chunk)
+        if chunk_tokens:
+            emit(chunk_start, chunk_start + chunk_tokens)
 
         return chunks
 
@@ -468,11 +496,44 @@ class SemanticChunker(ThreadChunker):
         Returns:
             List of sentences
         """
-        import re
+        return [text[start:end] for start, end in self._sentence_spans(text)]
 
+    def _sentence_spans(self, text: str) -> list[tuple[int, int]]:
+        """Find the character span of each sentence.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (start, end) offsets of the non-empty, stripped sentences
+        """
         # Split on sentence terminators followed by whitespace
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [s.strip() for s in sentences if s.strip()]
+        return _stripped_spans(text, _SENTENCE_BREAK_RE)
+
+
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+_BLOCK_BREAK_RE = re.compile(r"\n\n")
+
+
+def _stripped_spans(text: str, separator: re.Pattern[str]) -> list[tuple[int, int]]:
+    """Split text on a separator and return the spans of the non-blank parts, stripped of whitespace."""
+    spans = []
+    position = 0
+    for match in [*separator.finditer(text), None]:
+        end = match.start() if match else len(text)
+        part = text[position:end]
+        stripped = part.strip()
+        if stripped:
+            start = position + (len(part) - len(part.lstrip()))
+            spans.append((start, start + len(stripped)))
+        if match:
+            position = match.end()
+    return spans
+
+
+def _block_spans(text: str) -> list[tuple[int, int]]:
+    """Find the character span of each paragraph block (separated by blank lines)."""
+    return _stripped_spans(text, _BLOCK_BREAK_RE)
 
 
 def create_chunker(
@@ -0,0 +1,276 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Tokenizers used by the chunkers to measure and slice text.
+
+Every tokenizer returns the character span of each token in the original
+text, so chunkers can slice chunk text straight out of the source (no
+re-joining of words) and record real character offsets. The whitespace
+tokenizer skips that by default and re-joins split words, which is faster;
+pass ``preserve_whitespace=True`` to slice and record offsets as well.
+"""
+
+import importlib
+import logging
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TOKENIZER_TYPES = ("whitespace", "huggingface", "tiktoken")
+
+DEFAULT_HUGGINGFACE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_TIKTOKEN_ENCODING = "cl100k_base"
+
+_WORD_RE = re.compile(r"\S+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=64)
+def _words_pattern(count: int) -> re.Pattern[str]:
+    """Compile a pattern matching ``count`` consecutive words from the start of a word."""
+    return re.compile(rf"\S+(?:\s+\S+){{{count - 1}}}")
+
+
+class Tokenizer(ABC):
+    """Abstract tokenizer that reports token character spans."""
+
+    @abstractmethod
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Tokenize text once and return the character span of each token.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            List of (start, end) character offsets into text, in order
+        """
+        pass
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Number of tokens
+        """
+        return len(self.token_spans(text))
+
+    def window_spans(self, text: str, size: int, step: int) -> list[tuple[int, int, int]]:
+        """Cut text into windows of ``size`` tokens starting every ``step`` tokens.
+
+        The last window ends at the last token and may be shorter.
+
+        Args:
+            text: Text to cut
+            size: Tokens per window
+            step: Tokens between window starts (1 <= step <= size)
+
+        Returns:
+            List of (token_count, start_offset, end_offset) per window
+        """
+        spans = self.token_spans(text)
+        windows = []
+        for start in range(0, len(spans), step):
+            end = min(start + size, len(spans))
+            windows.append((end - start, spans[start][0], spans[end - 1][1]))
+            if end == len(spans):
+                break
+        return windows
+
+    def window_texts(self, text: str, size: int, step: int) -> list[tuple[int, str, int | None, int | None]]:
+        """Cut text into windows like window_spans() and return the text of each.
+
+        Args:
+            text: Text to cut
+            size: Tokens per window
+            step: Tokens between window starts (1 <= step <= size)
+
+        Returns:
+            List of (token_count, window_text, start_offset, end_offset) per
+            window; offsets are None when the text is not sliced from the original
+        """
+        return [(count, text[start:end], start, end) for count, start, end in self.window_spans(text, size, step)]
+
+
+class WhitespaceTokenizer(Tokenizer):
+    """Approximates tokens as whitespace-separated words (the default fast path).
+
+    Window texts are the window's words joined by single spaces, without
+    offsets, unless ``preserve_whitespace`` is set.
+    """
+
+    def __init__(self, preserve_whitespace: bool = False):
+        """Initialize the tokenizer.
+
+        Args:
+            preserve_whitespace: Slice window texts out of the original text,
+                keeping whitespace and line breaks and recording offsets
+        """
+        self.preserve_whitespace = preserve_whitespace
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Return the span of each run of non-whitespace characters."""
+        return [match.span() for match in _WORD_RE.finditer(text)]
+
+    def count(self, text: str) -> int:
+        """Count whitespace-separated words without building spans."""
+        return len(text.split())
+
+    def window_spans(self, text: str, size: int, step: int) -> list[tuple[int, int, int]]:
+        """Cut text into word windows without building per-word spans.
+
+        Only window boundaries are located: a regular expression skips the
+        ``step`` words up to the next window start and then the overlapping
+        words up to the window end, so each character is scanned about once.
+        """
+        total = len(text.split())
+        if not total:
+            return []
+        last_end = len(text.rstrip())
+        step_words = _words_pattern(step)
+        overlap_words = _words_pattern(size - step) if size > step else None
+
+        windows = []
+        start = 0
+        position = len(text) - len(text.lstrip())
+        while True:
+            if start + size >= total:
+                windows.append((total - start, position, last_end))
+                return windows
+            step_end = step_words.match(text, position).end()
+            next_position = _SPACE_RE.match(text, step_end).end()
+            end_offset = overlap_words.match(text, next_position).end() if overlap_words else step_end
+            windows.append((size, position, end_offset))
+            position = next_position
+            start += step
+
+    def window_texts(self, text: str, size: int, step: int) -> list[tuple[int, str, int | None, int | None]]:
+        """Cut text into word windows, re-joining split words unless whitespace is preserved."""
+        if self.preserve_whitespace:
+            return super().window_texts(text, size, step)
+        words = text.split()
+        windows: list[tuple[int, str, int | None, int | None]] = []
+        for start in range(0, len(words), step):
+            window = words[start : start + size]
+            windows.append((len(window), " ".join(window), None, None))
+            if start + size >= len(words):
+                break
+        return windows
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer backed by a Hugging Face fast tokenizer.
+
+    Use the tokenizer of the embedding model so that chunk sizes match the
+    model's real token limit. Special tokens (e.g. [CLS] and [SEP]) are not
+    counted.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_HUGGINGFACE_MODEL, cache_dir: str | None = None):
+        """Initialize the tokenizer.
+
+        Args:
+            model_name: Hugging Face model whose tokenizer is loaded
+            cache_dir: Directory to cache tokenizer files (optional)
+
+        Raises:
+            ImportError: If transformers is not installed
+            ValueError: If the model has no fast tokenizer (required for offset mapping)
+        """
+        try:
+            transformers: Any = importlib.import_module("transformers")
+        except ImportError as exc:
+            raise ImportError(
+                "transformers is required for the huggingface tokenizer. Install it with: pip install transformers"
+            ) from exc
+
+        self.model_name = model_name
+        logger.info(f"Loading Hugging Face tokenizer: {model_name}")
+        self._tokenizer = transformers.AutoTokenizer.from_pretrained(model_name, use_fast=True, cache_dir=cache_dir)
+        if not getattr(self._tokenizer, "is_fast", False):
+            raise ValueError(f"Model {model_name} has no fast tokenizer; offset mapping is unavailable")
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Tokenize with offset mapping."""
+        encoding = self._tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            truncation=False,
+            verbose=False,
+        )
+        return [(int(start), int(end)) for start, end in encoding["offset_mapping"]]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by a tiktoken encoding (OpenAI embedding models)."""
+
+    def __init__(self, encoding_name: str = DEFAULT_TIKTOKEN_ENCODING):
+        """Initialize the tokenizer.
+
+        Args:
+            encoding_name: tiktoken encoding name (e.g., "cl100k_base") or OpenAI model name
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        try:
+            tiktoken: Any = importlib.import_module("tiktoken")
+        except ImportError as exc:
+            raise ImportError(
+                "tiktoken is required for the tiktoken tokenizer. Install it with: pip install tiktoken"
+            ) from exc
+
+        self.encoding_name = encoding_name
+        try:
+            self._encoding = tiktoken.get_encoding(encoding_name)
+        except ValueError:
+            self._encoding = tiktoken.encoding_for_model(encoding_name)
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Tokenize and derive spans from the decoded token start offsets."""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if not tokens:
+            return []
+        _, starts = self._encoding.decode_with_offsets(tokens)
+        ends = starts[1:] + [len(text)]
+        # A character split across tokens gives consecutive tokens the same start
+        return [(start, max(start, end)) for start, end in zip(starts, ends)]
+
+    def count(self, text: str) -> int:
+        """Count tokens without computing offsets."""
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def create_tokenizer(
+    tokenizer_type: str | None = None, model: str | None = None, preserve_whitespace: bool = False
+) -> Tokenizer:
+    """Create a tokenizer by type.
+
+    Args:
+        tokenizer_type: One of "whitespace" (default), "huggingface" or "tiktoken"
+        model: Hugging Face model name or tiktoken encoding (backend default if omitted)
+        preserve_whitespace: Make the whitespace tokenizer slice window texts
+            out of the original text (the other tokenizers always do)
+
+    Returns:
+        Tokenizer instance
+
+    Raises:
+        ValueError: If tokenizer_type is not recognized
+    """
+    tokenizer_type = str(tokenizer_type or "whitespace").lower()
+    if tokenizer_type == "whitespace":
+        return WhitespaceTokenizer(preserve_whitespace=preserve_whitespace)
+    if tokenizer_type == "huggingface":
+        return HuggingFaceTokenizer(model or DEFAULT_HUGGINGFACE_MODEL)
+    if tokenizer_type == "tiktoken":
+        return TiktokenTokenizer(model or DEFAULT_TIKTOKEN_ENCODING)
+    raise ValueError(f"Unknown tokenizer: {tokenizer_type}. Supported: {', '.join(TOKENIZER_TYPES)}")
@@ -44,6 +44,13 @@ setup(
             "pylint>=3.0.0",
             "mypy>=1.0.0",
         ],
+        # Tokenizers matching embedding models (see README "Tokenizers")
+        "huggingface": [
+            "transformers>=4.30.0",
+        ],
+        "tiktoken": [
+            "tiktoken>=0.5.0",
+        ],
         # Test extra for factory tests (chunking has no external driver dependencies)
         "test": [
             "pytest>=7.0.0",
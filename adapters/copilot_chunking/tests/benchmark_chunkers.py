@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Manual benchmark for TokenWindowChunker.
+
+Chunks synthetic email bodies with the previous word-split implementation
+(str.split() plus a " ".join() per window) and with TokenWindowChunker using
+the whitespace tokenizer, with and without preserve_whitespace, and
+optionally a real tokenizer. For a real
+tokenizer, it also reports how many word-split chunks would exceed the
+model's token limit.
+
+Usage:
+    python tests/benchmark_chunkers.py --messages 2000 --words 800
+    python tests/benchmark_chunkers.py --tokenizer huggingface --model sentence-transformers/all-MiniLM-L6-v2
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from copilot_chunking.chunkers import Thread, TokenWindowChunker
+from copilot_chunking.tokenizers import WhitespaceTokenizer, create_tokenizer
+
+VOCABULARY = (
+    "the connection migration draft-ietf-quic-transport-34 RFC9000 endpoint MUST SHOULD path validation "
+    "packet number space; handshake, retransmission (timeout) https://datatracker.ietf.org/doc/ "
+    "implementers consensus chairs"
+).split()
+
+
+def word_split_windows(text: str, chunk_size: int, overlap: int) -> list[str]:
+    """Previous TokenWindowChunker windowing: split on whitespace and re-join each window."""
+    words = text.split()
+    windows = []
+    start_idx = 0
+    while start_idx < len(words):
+        end_idx = min(start_idx + chunk_size, len(words))
+        windows.append(" ".join(words[start_idx:end_idx]))
+        if end_idx == len(words):
+            break
+        start_idx = max(end_idx - overlap, start_idx + 1)
+    return windows
+
+
+def main():
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="Number of message bodies")
+    parser.add_argument("--words", type=int, default=800, help="Words per message body")
+    parser.add_argument("--chunk-size", type=int, default=384, help="Chunk size in tokens")
+    parser.add_argument("--overlap", type=int, default=50, help="Chunk overlap in tokens")
+    parser.add_argument("--tokenizer", choices=["huggingface", "tiktoken"], help="Also benchmark a real tokenizer")
+    parser.add_argument("--model", help="Hugging Face model or tiktoken encoding")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = []
+    for _ in range(args.messages):
+        words = [rng.choice(VOCABULARY) for _ in range(args.words)]
+        # Mix in line breaks so bodies look like email text
+        texts.append(" ".join(w + ("\n" if rng.random() < 0.1 else "") for w in words))
+    threads = [
+        Thread(thread_id="thread", text=text, metadata={}, message_doc_id="abcd1234abcd1234") for text in texts
+    ]
+
+    start = time.perf_counter()
+    legacy_windows = [word_split_windows(text, args.chunk_size, args.overlap) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"word split + join:       {elapsed:7.3f}s ({args.messages / elapsed:,.0f} messages/s)")
+
+    chunkers = {
+        "whitespace tokenizer": TokenWindowChunker(args.chunk_size, args.overlap, 1, args.chunk_size),
+        "whitespace (preserved)": TokenWindowChunker(
+            args.chunk_size, args.overlap, 1, args.chunk_size, tokenizer=WhitespaceTokenizer(preserve_whitespace=True)
+        ),
+    }
+    real_tokenizer = None
+    if args.tokenizer:
+        real_tokenizer = create_tokenizer(args.tokenizer, args.model)
+        chunkers[f"{args.tokenizer} tokenizer"] = TokenWindowChunker(
+            args.chunk_size, args.overlap, 1, args.chunk_size, tokenizer=real_tokenizer
+        )
+
+    for name, chunker in chunkers.items():
+        start = time.perf_counter()
+        for thread in threads:
+            chunker.chunk(thread)
+        elapsed = time.perf_counter() - start
+        print(f"{name + ':':24} {elapsed:7.3f}s ({args.messages / elapsed:,.0f} messages/s)")
+
+    if real_tokenizer is not None:
+        windows = [window for message_windows in legacy_windows for window in message_windows]
+        overflowing = sum(1 for window in windows if real_tokenizer.count(window) > args.chunk_size)
+        print(
+            f"word-split chunks over {args.chunk_size} {args.tokenizer} tokens: "
+            f"{overflowing} of {len(windows)} ({overflowing / len(windows):.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from copilot_chunking import (
     create_chunker,
 )
 from copilot_chunking.chunkers import FixedSizeChunker, SemanticChunker, TokenWindowChunker
+from copilot_chunking.tokenizers import Tokenizer, WhitespaceTokenizer
 from copilot_config.generated.adapters.chunker import (
     AdapterConfig_Chunker,
     DriverConfig_Chunker_FixedSize,
@@ -19,6 +20,16 @@ from copilot_config.generated.adapters.chunker import (
 )
 
 
+class TrigramTokenizer(Tokenizer):
+    """Test tokenizer that splits each word into 3-character subword tokens."""
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        spans = []
+        for start, end in WhitespaceTokenizer().token_spans(text):
+            spans.extend((i, min(i + 3, end)) for i in range(start, end, 3))
+        return spans
+
+
 class TestChunkDataClass:
     """Tests for Chunk data class."""
 
@@ -180,6 +191,46 @@ class TestTokenWindowChunker:
         assert len(chunks) >= 2
 
 
+    def test_default_chunks_are_joined_words(self):
+        """Test that the default whitespace tokenizer re-joins words and sets no offsets."""
+        chunker = TokenWindowChunker(chunk_size=4, overlap=1, min_chunk_size=1)
+        text = "one two\nthree  four five\n\nsix seven eight"
+        thread = Thread(thread_id="test-thread", text=text, metadata={}, message_doc_id="abcd1234abcd1234")
+
+        chunks = chunker.chunk(thread)
+
+        assert [c.text for c in chunks] == ["one two three four", "four five six seven", "seven eight"]
+        assert all(c.start_offset is None and c.end_offset is None for c in chunks)
+
+    def test_chunks_are_slices_with_offsets(self):
+        """Test that chunk text is sliced from the original text at its offsets."""
+        chunker = TokenWindowChunker(
+            chunk_size=4, overlap=1, min_chunk_size=1, tokenizer=WhitespaceTokenizer(preserve_whitespace=True)
+        )
+        text = "one two\nthree  four five\n\nsix seven eight"
+        thread = Thread(thread_id="test-thread", text=text, metadata={}, message_doc_id="abcd1234abcd1234")
+
+        chunks = chunker.chunk(thread)
+
+        assert [c.text for c in chunks] == ["one two\nthree  four", "four five\n\nsix seven", "seven eight"]
+        for chunk in chunks:
+            assert text[chunk.start_offset : chunk.end_offset] == chunk.text
+
+    def test_tokenizer_defines_window_size(self):
+        """Test that windows are measured in the tokenizer's tokens and capped at max_chunk_size."""
+        chunker = TokenWindowChunker(
+            chunk_size=10, overlap=0, min_chunk_size=1, max_chunk_size=4, tokenizer=TrigramTokenizer()
+        )
+        thread = Thread(
+            thread_id="test-thread", text="abcdefghi jklmno", metadata={}, message_doc_id="abcd1234abcd1234"
+        )
+
+        chunks = chunker.chunk(thread)
+
+        assert [(c.text, c.token_count) for c in chunks] == [("abcdefghi jkl", 4), ("mno", 1)]
+        assert (chunks[1].start_offset, chunks[1].end_offset) == (13, 16)
+
+
 class TestFixedSizeChunker:
     """Tests for FixedSizeChunker."""
 
@@ -270,6 +321,18 @@ class TestFixedSizeChunker:
         assert chunks[0].chunk_index == 0
 
 
+    def test_text_blocks_have_offsets(self):
+        """Test that text-block chunks carry offsets into the original text."""
+        chunker = FixedSizeChunker(messages_per_chunk=1)
+        text = "First block.\n\n\n  Second block.  "
+        thread = Thread(thread_id="test-thread", text=text, metadata={}, message_doc_id="abcd1234abcd1234")
+
+        chunks = chunker.chunk(thread)
+
+        assert [c.text for c in chunks] == ["First block.", "Second block."]
+        assert [(c.start_offset, c.end_offset) for c in chunks] == [(0, 12), (17, 30)]
+
+
 class TestSemanticChunker:
     """Tests for SemanticChunker."""
 
@@ -364,6 +427,32 @@ class TestSemanticChunker:
         assert sentences[3] == "Fourth."
 
 
+    def test_chunks_have_offsets(self):
+        """Test that sentence chunks are slices of the original text."""
+        chunker = SemanticChunker(target_chunk_size=6)
+        text = "First sentence here.\nSecond one follows. Third sentence is here."
+        thread = Thread(thread_id="test-thread", text=text, metadata={}, message_doc_id="abcd1234abcd1234")
+
+        chunks = chunker.chunk(thread)
+
+        assert [c.text for c in chunks] == ["First sentence here.\nSecond one follows.", "Third sentence is here."]
+        assert [c.token_count for c in chunks] == [6, 4]
+        for chunk in chunks:
+            assert text[chunk.start_offset : chunk.end_offset] == chunk.text
+
+    def test_long_sentence_is_split(self):
+        """Test that a sentence longer than the target never yields an oversized chunk."""
+        chunker = SemanticChunker(target_chunk_size=3, tokenizer=TrigramTokenizer())
+        thread = Thread(
+            thread_id="test-thread", text="Short. abcdefghijklmnop.", metadata={}, message_doc_id="abcd1234abcd1234"
+        )
+
+        chunks = chunker.chunk(thread)
+
+        assert all(c.token_count <= 3 for c in chunks)
+        assert [c.text for c in chunks] == ["Short.", "abcdefghi", "jklmnop."]
+
+
 class TestCreateChunker:
     """Tests for create_chunker factory method."""
 
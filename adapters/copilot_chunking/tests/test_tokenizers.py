@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Tests for chunker tokenizers."""
+
+import pytest
+from copilot_chunking.tokenizers import (
+    HuggingFaceTokenizer,
+    TiktokenTokenizer,
+    Tokenizer,
+    WhitespaceTokenizer,
+    create_tokenizer,
+)
+
+
+class TestWhitespaceTokenizer:
+    """Tests for WhitespaceTokenizer."""
+
+    def test_token_spans(self):
+        """Test that spans cover each word of the original text."""
+        text = "  Hello,\tworld!\n\nNext  line "
+        spans = WhitespaceTokenizer().token_spans(text)
+
+        assert [text[start:end] for start, end in spans] == text.split()
+
+    def test_count_matches_split(self):
+        """Test that count matches str.split()."""
+        assert WhitespaceTokenizer().count("one  two\nthree") == 3
+
+    @pytest.mark.parametrize("size,step", [(1, 1), (3, 1), (3, 2), (4, 4), (5, 3), (20, 10)])
+    def test_window_spans_match_token_spans(self, size, step):
+        """Test that the boundary-only fast path matches windows built from token spans."""
+        tokenizer = WhitespaceTokenizer()
+        text = "\n a bb  ccc\td\n\ne ff ggg h  i j\n"
+
+        expected = Tokenizer.window_spans(tokenizer, text, size, step)
+
+        assert tokenizer.window_spans(text, size, step) == expected
+        assert expected[-1][2] == len(text.rstrip())
+
+    @pytest.mark.parametrize("size,step", [(1, 1), (3, 1), (3, 2), (4, 4), (5, 3), (20, 10)])
+    def test_window_texts_match_windows(self, size, step):
+        """Test that joined window texts hold the same words as the sliced windows."""
+        text = "\n a bb  ccc\td\n\ne ff ggg h  i j\n"
+
+        joined = WhitespaceTokenizer().window_texts(text, size, step)
+        sliced = WhitespaceTokenizer(preserve_whitespace=True).window_texts(text, size, step)
+
+        assert [(count, " ".join(window.split())) for count, window, _, _ in sliced] == [
+            (count, window) for count, window, _, _ in joined
+        ]
+        assert all(text[start:end] == window for _, window, start, end in sliced)
+
+    def test_window_spans_empty(self):
+        """Test that whitespace-only text has no windows."""
+        assert WhitespaceTokenizer().window_spans(" \n ", 3, 2) == []
+
+
+class TestCreateTokenizer:
+    """Tests for create_tokenizer."""
+
+    def test_default_is_whitespace(self):
+        """Test that no type selects the whitespace tokenizer."""
+        assert isinstance(create_tokenizer(None), WhitespaceTokenizer)
+
+    def test_unknown_type(self):
+        """Test that an unknown type is rejected."""
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            create_tokenizer("sentencepiece")
+
+
+class TestTiktokenTokenizer:
+    """Tests for TiktokenTokenizer (requires tiktoken and its encoding files)."""
+
+    def test_spans_reassemble_text(self):
+        """Test that token spans are contiguous and cover the text."""
+        pytest.importorskip("tiktoken")
+        tokenizer = TiktokenTokenizer("cl100k_base")
+        text = "Connection migration: see RFC 9000, section 9."
+
+        spans = tokenizer.token_spans(text)
+
+        assert len(spans) == tokenizer.count(text)
+        assert "".join(text[start:end] for start, end in spans) == text
+
+
+class TestHuggingFaceTokenizer:
+    """Tests for HuggingFaceTokenizer (requires transformers and the model files)."""
+
+    def test_spans_point_into_text(self):
+        """Test that offset mapping spans point at the tokenized text."""
+        pytest.importorskip("transformers")
+        tokenizer = HuggingFaceTokenizer()
+        text = "Connection migration"
+
+        spans = tokenizer.token_spans(text)
+
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(text)
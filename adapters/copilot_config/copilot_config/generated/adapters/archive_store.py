@@ -21,6 +21,8 @@ class DriverConfig_ArchiveStore_Azureblob_ConnectionString:
     # Authentication mode discriminator
     azureblob_container_name: str = "archives"
     # Azure Blob Storage container name for archives
+    azureblob_index_mode: str = "single"
+    # Metadata index layout: single (one index blob) or sharded (per-archive, per-source and per-hash index blobs)
     azureblob_prefix: str = ""
     # Optional path prefix for organizing blobs
 
@@ -37,6 +39,8 @@ class DriverConfig_ArchiveStore_Azureblob_AccountKey:
     # Authentication mode discriminator
     azureblob_container_name: str = "archives"
     # Azure Blob Storage container name for archives
+    azureblob_index_mode: str = "single"
+    # Metadata index layout: single (one index blob) or sharded (per-archive, per-source and per-hash index blobs)
     azureblob_prefix: str = ""
     # Optional path prefix for organizing blobs
 
@@ -53,6 +57,8 @@ class DriverConfig_ArchiveStore_Azureblob_SasToken:
     # Authentication mode discriminator
     azureblob_container_name: str = "archives"
     # Azure Blob Storage container name for archives
+    azureblob_index_mode: str = "single"
+    # Metadata index layout: single (one index blob) or sharded (per-archive, per-source and per-hash index blobs)
     azureblob_prefix: str = ""
     # Optional path prefix for organizing blobs
 
@@ -67,6 +73,8 @@ class DriverConfig_ArchiveStore_Azureblob_ManagedIdentity:
     # Authentication mode discriminator
     azureblob_container_name: str = "archives"
     # Azure Blob Storage container name for archives
+    azureblob_index_mode: str = "single"
+    # Metadata index layout: single (one index blob) or sharded (per-archive, per-source and per-hash index blobs)
     azureblob_prefix: str = ""
     # Optional path prefix for organizing blobs
 
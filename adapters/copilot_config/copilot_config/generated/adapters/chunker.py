@@ -17,6 +17,11 @@ class DriverConfig_Chunker_FixedSize:
 
     messages_per_chunk: int = 5
     # Number of messages per chunk
+    tokenizer: str = "whitespace"
+    # How tokens are counted: whitespace-separated words, a Hugging Face fast tokenizer or a tiktoken encoding
+    tokenizer_model: str | None = None
+    # Hugging Face model or tiktoken encoding to tokenize with (default: sentence-transformers/all-MiniLM-L6-v2 or
+    # cl100k_base)
 
 
 @dataclass
@@ -27,6 +32,11 @@ class DriverConfig_Chunker_Semantic:
     # Split on speaker changes
     target_chunk_size: int = 400
     # Target chunk size in tokens
+    tokenizer: str = "whitespace"
+    # How tokens are counted: whitespace-separated words, a Hugging Face fast tokenizer or a tiktoken encoding
+    tokenizer_model: str | None = None
+    # Hugging Face model or tiktoken encoding to tokenize with (default: sentence-transformers/all-MiniLM-L6-v2 or
+    # cl100k_base)
 
 
 @dataclass
@@ -41,6 +51,14 @@ class DriverConfig_Chunker_TokenWindow:
     # Minimum chunk size in tokens
     overlap: int = 50
     # Chunk overlap in tokens
+    preserve_whitespace: bool = False
+    # With the whitespace tokenizer, slice chunks from the original text (keeping whitespace and line breaks, and
+    # recording offsets) instead of re-joining words with single spaces
+    tokenizer: str = "whitespace"
+    # How tokens are counted: whitespace-separated words, a Hugging Face fast tokenizer or a tiktoken encoding
+    tokenizer_model: str | None = None
+    # Hugging Face model or tiktoken encoding to tokenize with (default: sentence-transformers/all-MiniLM-L6-v2 or
+    # cl100k_base)
 
 
 @dataclass
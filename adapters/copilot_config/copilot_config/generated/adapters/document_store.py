@@ -27,7 +27,8 @@ class DriverConfig_DocumentStore_AzureCosmosdb:
 class DriverConfig_DocumentStore_Inmemory:
     """Configuration for document_store adapter using inmemory driver."""
 
-    pass
+    copy_on_read: bool = True
+    # Deep-copy documents returned by reads; false returns shallow copies whose nested values must not be modified
 
 
 @dataclass
@@ -36,6 +37,10 @@ class DriverConfig_DocumentStore_Mongodb:
 
     database: str = "copilot"
     # MongoDB database name
+    ensure_indexes: bool = True
+    # Create the indexes declared in docs/schemas/documents/collections.config.json on connect
+    explain_slow_query_ms: int | None = None
+    # Debug: explain queries taking at least this many milliseconds and warn on collection scans (unset disables)
     host: str = "documentdb"
     # MongoDB hostname
     password: str | None = None
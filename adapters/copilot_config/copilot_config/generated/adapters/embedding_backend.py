@@ -23,6 +23,10 @@ class DriverConfig_EmbeddingBackend_AzureOpenai:
     # Azure OpenAI deployment name for embeddings
     api_version: str = "2024-02-15-preview"
     # Azure OpenAI API version
+    max_batch_size: int = 256
+    # Maximum number of texts sent in one embeddings request (API limit: 2048)
+    max_batch_tokens: int = 100000
+    # Estimated token budget per embeddings request; batches are split to stay under it
     model: str | None = None
     # Optional model name to map to deployment
 
@@ -35,6 +39,8 @@ class DriverConfig_EmbeddingBackend_Huggingface:
     # Device to use (e.g., "cpu", "mps", "cuda", "cuda:0", "cuda:1")
     model_name: str
     # HuggingFace model name (e.g., 'sentence-transformers/all-MiniLM-L6-v2')
+    batch_size: int = 32
+    # Number of texts encoded per forward pass by embed_batch
     cache_dir: str | None = None
     # Cache directory for model files
     max_length: int = 512
@@ -57,6 +63,10 @@ class DriverConfig_EmbeddingBackend_Openai:
     # OpenAI API key
     model: str
     # OpenAI embedding model name
+    max_batch_size: int = 256
+    # Maximum number of texts sent in one embeddings request (API limit: 2048)
+    max_batch_tokens: int = 100000
+    # Estimated token budget per embeddings request; batches are split to stay under it
     organization: str | None = None
     # Optional OpenAI organization id
 
@@ -65,6 +75,8 @@ class DriverConfig_EmbeddingBackend_Openai:
 class DriverConfig_EmbeddingBackend_Sentencetransformers:
     """Configuration for embedding_backend adapter using sentencetransformers driver."""
 
+    batch_size: int = 32
+    # Number of texts encoded per forward pass by embed_batch
     cache_dir: str | None = None
     # Cache folder for model files
     device: str = "cpu"
@@ -19,6 +19,8 @@ class DriverConfig_EventRetry_Default:
     # Exponential backoff factor
     base_delay_ms: int = 250
     # Base delay in milliseconds before first retry
+    delayed_redelivery: bool = False
+    # Republish retryable events with a delay via the message bus instead of sleeping in the consumer
     max_attempts: int = 8
     # Maximum attempts for event race-condition retries
     max_delay_ms: int = 60000
@@ -35,6 +37,8 @@ class DriverConfig_EventRetry_Noop:
     # No backoff
     base_delay_ms: int = 0
     # No delay
+    delayed_redelivery: bool = False
+    # No delayed redelivery
     max_attempts: int = 1
     # Disable event retry by limiting to 1 attempt
     max_delay_ms: int = 0
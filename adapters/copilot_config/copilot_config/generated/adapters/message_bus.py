@@ -72,6 +72,11 @@ class DriverConfig_MessageBus_Rabbitmq:
     # Heartbeat interval in seconds (default: 300). Higher values reduce network overhead and prevent disconnects during
     # CPU-intensive tasks. Setting to 0 disables heartbeats entirely, which can lead to undetected connection failures
     # and is strongly discouraged in production.
+    ordered_routing_keys: str | None = None
+    # Comma-separated routing keys whose events must be handled in delivery order (pinned to a single subscriber worker)
+    prefetch_multiplier: int = 2
+    # Unacknowledged deliveries per subscriber worker; with worker_count > 1 the channel prefetch count is worker_count
+    # * prefetch_multiplier
     queue_durable: bool = True
     # Whether the queue survives broker restart
     queue_name: str | None = None
@@ -80,6 +85,9 @@ class DriverConfig_MessageBus_Rabbitmq:
     # RabbitMQ hostname
     rabbitmq_port: int = 5672
     # RabbitMQ port
+    worker_count: int = 1
+    # Number of subscriber threads handling events concurrently (default: 1 handles events on the connection I/O
+    # thread). Callbacks must be thread-safe when greater than 1.
 
 
 @dataclass
@@ -36,10 +36,24 @@ class DriverConfig_VectorStore_Faiss:
 
     dimension: int = 384
     # Embedding vector dimension
+    hnsw_ef_search: int = 64
+    # HNSW search-time candidate list size (hnsw)
+    hnsw_m: int = 32
+    # Neighbors per HNSW graph node (hnsw)
     index_type: str = "flat"
-    # FAISS index type (flat, ivf)
+    # FAISS index type (flat, ivf, ivfpq, hnsw)
+    nlist: int = 100
+    # Number of IVF clusters (ivf, ivfpq)
+    nprobe: int = 10
+    # Number of IVF clusters searched per query (ivf, ivfpq)
     persist_path: str | None = None
-    # Optional path to persist the index
+    # Optional path to persist the index (metadata is written to <persist_path>.meta)
+    pq_m: int = 8
+    # Number of product-quantizer sub-vectors (ivfpq); must divide the dimension
+    save_interval_seconds: float = 60.0
+    # Minimum seconds between automatic saves when persist_path is set (0 saves after every write)
+    train_size: int | None = None
+    # Vectors to collect before training an IVF index (defaults to 39 * nlist; must be at least nlist)
 
 
 @dataclass
@@ -27,6 +27,8 @@ class ServiceSettings_Chunking:
     chunk_overlap: int | None = 50
     chunk_size: int | None = 384
     chunking_strategy: str | None = "token_window"
+    event_batch_max_wait_ms: int | None = 250
+    event_batch_size: int | None = 16
     http_port: int | None = 8000
     jwt_auth_enabled: bool | None = True
     max_chunk_size: int | None = 512
@@ -26,8 +26,12 @@ class ServiceSettings_Embedding:
 
     auth_service_url: str | None = "http://auth:8090"
     batch_size: int | None = 32
+    cache_backend: str | None = "document_store"
+    cache_path: str | None = "/tmp/embedding_cache.sqlite3"
     cache_ttl_seconds: int | None = 86400
-    enable_cache: bool | None = True
+    enable_cache: bool | None = False
+    event_batch_max_wait_ms: int | None = 250
+    event_batch_size: int | None = 16
     http_host: str | None = "0.0.0.0"
     http_port: int | None = 8000
     jwt_auth_enabled: bool | None = True
@@ -26,10 +26,11 @@ class ServiceSettings_Ingestion:
     auth_service_url: str | None = "http://auth:8090"
     batch_size: int | None = 100
     concurrent_sources: int | None = 5
-    enable_incremental: bool | None = True
+    enable_incremental: bool | None = False
     http_host: str | None = "0.0.0.0"
     http_port: int | None = 8000
     jwt_auth_enabled: bool | None = True
+    max_concurrent_per_host: int | None = 2
     max_retries: int | None = 3
     poll_interval_seconds: int | None = 3600
     request_timeout_seconds: int | None = 60
@@ -23,10 +23,13 @@ class ServiceSettings_Parsing:
     """Service-specific settings for parsing."""
 
     auth_service_url: str | None = "http://auth:8090"
+    enable_thread_index: bool | None = True
     http_host: str | None = "0.0.0.0"
     http_port: int | None = 8000
     jwt_auth_enabled: bool | None = True
     max_retries: int | None = 3
+    message_batch_size: int | None = 500
+    parse_workers: int | None = 1
     retry_delay_seconds: int | None = 5
     service_audience: str | None = "copilot-for-consensus"
 
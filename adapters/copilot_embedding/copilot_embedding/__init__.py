@@ -32,6 +32,13 @@ Example:
 __version__ = "0.1.0"
 
 from .base import EmbeddingProvider
+from .cache import (
+    CachedEmbeddingProvider,
+    DocumentStoreEmbeddingCacheStore,
+    EmbeddingCacheStore,
+    InMemoryEmbeddingCacheStore,
+    SQLiteEmbeddingCacheStore,
+)
 from .factory import create_embedding_provider
 
 __all__ = [
@@ -41,4 +48,10 @@ __all__ = [
     "EmbeddingProvider",
     # Factory
     "create_embedding_provider",
+    # Caching
+    "CachedEmbeddingProvider",
+    "EmbeddingCacheStore",
+    "InMemoryEmbeddingCacheStore",
+    "SQLiteEmbeddingCacheStore",
+    "DocumentStoreEmbeddingCacheStore",
 ]
@@ -23,3 +23,20 @@ class EmbeddingProvider(ABC):
             List of floats representing the embedding vector
         """
         pass
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts at once.
+
+        The default implementation calls embed() for each text. Providers
+        whose model or API accepts many inputs per call should override this.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            ValueError: If any text is None or empty
+        """
+        return [self.embed(text) for text in texts]
@@ -0,0 +1,429 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Content-addressed embedding cache.
+
+Vectors are cached under a key derived from the embedding backend, the model
+and the normalized text, so identical text (boilerplate, re-posted drafts,
+archives re-ingested under another source) is embedded only once per model.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .base import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_COLLECTION = "embedding_cache"
+
+# Minimum time between purges of expired cache entries
+DEFAULT_EVICTION_INTERVAL_SECONDS = 3600.0
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying by collapsing runs of whitespace.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Text with leading/trailing whitespace removed and inner whitespace
+        collapsed to single spaces
+    """
+    return " ".join(text.split())
+
+
+def make_cache_key(backend: str, model: str, text: str) -> str:
+    """Build the content-addressed cache key for a text.
+
+    Args:
+        backend: Embedding backend name (e.g., "sentencetransformers")
+        model: Embedding model name
+        text: Input text (normalized before hashing)
+
+    Returns:
+        Hex SHA256 digest of backend, model and normalized text
+    """
+    payload = "\0".join((backend, model, normalize_text(text)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCacheStore(ABC):
+    """Abstract key-value store for cached embedding vectors."""
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping of the keys that were found (and not expired) to their vectors
+        """
+        pass
+
+    @abstractmethod
+    def set_many(self, entries: dict[str, list[float]]) -> None:
+        """Store vectors, replacing any existing entries with the same keys.
+
+        Args:
+            entries: Mapping of cache keys to vectors
+        """
+        pass
+
+    def evict_expired(self) -> int:
+        """Delete entries older than the store's TTL.
+
+        Stores without expiry keep every entry and return 0.
+
+        Returns:
+            Number of entries deleted
+        """
+        return 0
+
+
+class InMemoryEmbeddingCacheStore(EmbeddingCacheStore):
+    """Process-local cache store, mainly for tests and development."""
+
+    def __init__(self, ttl_seconds: int = 0):
+        """Initialize an empty in-memory cache store.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, skipping expired entries."""
+        cutoff = time.time() - self.ttl_seconds if self.ttl_seconds > 0 else None
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and (cutoff is None or entry[0] >= cutoff):
+                    found[key] = list(entry[1])
+        return found
+
+    def set_many(self, entries: dict[str, list[float]]) -> None:
+        """Store vectors with the current timestamp."""
+        now = time.time()
+        with self._lock:
+            for key, vector in entries.items():
+                self._entries[key] = (now, list(vector))
+
+    def evict_expired(self) -> int:
+        """Delete entries older than the TTL."""
+        if self.ttl_seconds <= 0:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired = [key for key, (created_at, _) in self._entries.items() if created_at < cutoff]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+
+class SQLiteEmbeddingCacheStore(EmbeddingCacheStore):
+    """Cache store backed by a local SQLite file.
+
+    Vectors are stored as float32 blobs, matching the precision the vector
+    stores index with, at half the size of float64.
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    _MAX_KEYS_PER_QUERY = 500
+
+    def __init__(self, path: str, ttl_seconds: int = 0):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path (":memory:" for a private in-memory database)
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # The connection is shared between threads; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS embedding_cache_created_at ON embedding_cache (created_at)")
+        logger.info(f"Opened SQLite embedding cache at {path}")
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, skipping expired entries."""
+        cutoff = time.time() - self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self._MAX_KEYS_PER_QUERY):
+                batch = keys[start : start + self._MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*batch, cutoff),
+                )
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def set_many(self, entries: dict[str, list[float]]) -> None:
+        """Store vectors with the current timestamp."""
+        now = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in entries.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embedding_cache VALUES (?, ?, ?)", rows)
+
+    def evict_expired(self) -> int:
+        """Delete entries older than the TTL."""
+        if self.ttl_seconds <= 0:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM embedding_cache WHERE created_at < ?", (cutoff,)).rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class DocumentStoreEmbeddingCacheStore(EmbeddingCacheStore):
+    """Cache store backed by a document store collection.
+
+    Shares cached vectors across service replicas and survives restarts.
+    Documents follow docs/schemas/documents/embedding_cache.schema.json.
+    """
+
+    # Expired entries removed per delete_documents() call
+    _DELETE_BATCH_SIZE = 500
+
+    def __init__(self, document_store: Any, collection: str = DEFAULT_CACHE_COLLECTION, ttl_seconds: int = 0):
+        """Initialize the cache store.
+
+        Args:
+            document_store: Connected copilot_storage DocumentStore
+            collection: Collection holding cache entries
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.document_store = document_store
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, skipping expired entries."""
+        if not keys:
+            return {}
+        docs = self.document_store.query_documents(self.collection, filter_dict={"_id": {"$in": keys}}, limit=len(keys))
+        # Expiry is checked here rather than in the query because not every
+        # backend supports range operators in query_documents
+        cutoff = ""
+        if self.ttl_seconds > 0:
+            cutoff = _isoformat(datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds))
+        return {str(doc["_id"]): list(doc["vector"]) for doc in docs if str(doc.get("created_at", "")) >= cutoff}
+
+    def set_many(self, entries: dict[str, list[float]]) -> None:
+        """Upsert vectors with the current timestamp."""
+        if not entries:
+            return
+        created_at = _isoformat(datetime.now(timezone.utc))
+        docs = [{"_id": key, "vector": list(vector), "created_at": created_at} for key, vector in entries.items()]
+        result = self.document_store.upsert_documents(self.collection, docs)
+        if result.errors:
+            logger.warning(f"Failed to cache {len(result.errors)} of {len(docs)} embeddings")
+
+    def evict_expired(self) -> int:
+        """Delete entries older than the TTL.
+
+        Only IDs and timestamps are read, oldest first (served by the
+        created_at index), and the scan stops at the first unexpired entry;
+        as with get_many, the age check happens here because not every
+        backend supports range operators in queries. Expired entries are
+        removed with bulk delete_documents() calls.
+        """
+        if self.ttl_seconds <= 0:
+            return 0
+        cutoff = _isoformat(datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds))
+        expired = []
+        for doc in self.document_store.iter_documents(
+            self.collection, {}, sort_by="created_at", sort_order="asc", projection={"_id": 1, "created_at": 1}
+        ):
+            if str(doc.get("created_at", "")) >= cutoff:
+                break
+            expired.append(str(doc["_id"]))
+
+        deleted = 0
+        for start in range(0, len(expired), self._DELETE_BATCH_SIZE):
+            result = self.document_store.delete_documents(
+                self.collection, expired[start : start + self._DELETE_BATCH_SIZE]
+            )
+            deleted += len(result.succeeded)
+        return deleted
+
+
+def _isoformat(value: datetime) -> str:
+    """Format a UTC datetime the way the services store timestamps."""
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """Embedding provider wrapper that serves repeated texts from a cache.
+
+    Wraps any EmbeddingProvider. Texts whose key is already cached are not
+    sent to the wrapped provider; the remaining texts (deduplicated) are
+    embedded in one embed_batch() call and written back to the cache.
+    Cache store failures are logged and treated as misses, so the cache
+    can never fail embedding generation.
+
+    Expired entries are purged from the store (see
+    EmbeddingCacheStore.evict_expired) on a background thread, started
+    after a write at most once every ``eviction_interval_seconds``, so a
+    purge never delays embedding generation.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        store: EmbeddingCacheStore,
+        backend: str,
+        model: str,
+        dimension: int | None = None,
+        metrics_collector: Any | None = None,
+        eviction_interval_seconds: float = DEFAULT_EVICTION_INTERVAL_SECONDS,
+    ):
+        """Initialize the caching wrapper.
+
+        Args:
+            provider: Provider used to embed cache misses
+            store: Store holding cached vectors
+            backend: Embedding backend name, part of the cache key
+            model: Embedding model name, part of the cache key
+            dimension: Expected vector dimension; cached vectors of another
+                dimension are treated as misses
+            metrics_collector: Optional copilot_metrics MetricsCollector for
+                embedding_cache_hits_total / embedding_cache_misses_total
+            eviction_interval_seconds: Minimum time between purges of
+                expired entries (0 purges after every write)
+        """
+        self.provider = provider
+        self.store = store
+        self.backend = backend
+        self.model = model
+        self.dimension = dimension
+        self.metrics_collector = metrics_collector
+        self.eviction_interval_seconds = eviction_interval_seconds
+        self._last_eviction = time.monotonic()
+        self._eviction_lock = threading.Lock()
+        self._eviction_thread: threading.Thread | None = None
+
+    def embed(self, text: str) -> list[float]:
+        """Generate (or fetch cached) embeddings for a single text.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+
+        Raises:
+            ValueError: If text is None or empty
+        """
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate (or fetch cached) embeddings for several texts.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            ValueError: If any text is None or empty
+        """
+        for text in texts:
+            if text is None or not text.strip():
+                raise ValueError("Text cannot be empty or whitespace-only")
+        if not texts:
+            return []
+
+        keys = [make_cache_key(self.backend, self.model, text) for text in texts]
+        unique_keys = list(dict.fromkeys(keys))
+
+        try:
+            cached = self.store.get_many(unique_keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding without cache: {e}")
+            cached = {}
+        if self.dimension is not None:
+            cached = {key: vector for key, vector in cached.items() if len(vector) == self.dimension}
+
+        # Embed each missing key once, using the first text that produced it
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = self.provider.embed_batch(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            try:
+                self.store.set_many(computed)
+            except Exception as e:
+                logger.warning(f"Failed to write {len(computed)} embeddings to cache: {e}")
+            cached.update(computed)
+            self._maybe_evict_expired()
+
+        hits = len(texts) - len(missing)
+        logger.debug(f"Embedding cache: {hits} hits, {len(missing)} misses")
+        self._record_metrics(hits, len(missing))
+
+        return [cached[key] for key in keys]
+
+    def _maybe_evict_expired(self) -> None:
+        """Start a background purge of expired entries if the eviction interval has elapsed."""
+        with self._eviction_lock:
+            if self._eviction_thread is not None and self._eviction_thread.is_alive():
+                return
+            if time.monotonic() - self._last_eviction < self.eviction_interval_seconds:
+                return
+            self._last_eviction = time.monotonic()
+            self._eviction_thread = threading.Thread(
+                target=self._evict_expired, daemon=True, name="embedding-cache-eviction"
+            )
+            self._eviction_thread.start()
+
+    def _evict_expired(self) -> None:
+        """Purge expired entries from the store, logging failures."""
+        try:
+            evicted = self.store.evict_expired()
+        except Exception as e:
+            logger.warning(f"Failed to evict expired embedding cache entries: {e}")
+            return
+        if evicted:
+            logger.info(f"Evicted {evicted} expired embedding cache entries")
+
+    def _record_metrics(self, hits: int, misses: int) -> None:
+        """Emit cache hit/miss counters."""
+        if self.metrics_collector is None:
+            return
+        tags = {"backend": self.backend}
+        if hits:
+            self.metrics_collector.increment("embedding_cache_hits_total", hits, tags=tags)
+        if misses:
+            self.metrics_collector.increment("embedding_cache_misses_total", misses, tags=tags)
@@ -61,6 +61,30 @@ class MockEmbeddingProvider(EmbeddingProvider):
         Raises:
             ValueError: If text is None or empty
         """
+        self._validate_text(text)
+        return self._hash_embedding(text)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate mock embeddings for several texts.
+
+        All texts are validated before any embedding is generated.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One mock embedding vector per input text, in input order
+
+        Raises:
+            ValueError: If any text is None or empty
+        """
+        for text in texts:
+            self._validate_text(text)
+        return [self._hash_embedding(text) for text in texts]
+
+    @staticmethod
+    def _validate_text(text: str) -> None:
+        """Reject None, non-string, and empty inputs."""
         if text is None:
             raise ValueError("Text cannot be None")
         if not isinstance(text, str):
@@ -68,6 +92,8 @@ class MockEmbeddingProvider(EmbeddingProvider):
         if not text.strip():
             raise ValueError("Text cannot be empty or whitespace-only")
 
+    def _hash_embedding(self, text: str) -> list[float]:
+        """Build a deterministic mock embedding from the hash of a text."""
         # Generate deterministic mock embeddings based on text hash
         # Uses modulo arithmetic to create different values for each dimension
         # Formula ensures values are in [0, 1] range and deterministic for same text
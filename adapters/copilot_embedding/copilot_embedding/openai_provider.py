@@ -16,6 +16,10 @@ from .base import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
 
+# Rough characters-per-token ratio for English text with OpenAI tokenizers,
+# used to estimate request size without a tokenizer dependency
+_CHARS_PER_TOKEN = 4
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI/Azure OpenAI embedding provider."""
@@ -27,6 +31,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         api_base: str | None = None,
         api_version: str | None = None,
         deployment_name: str | None = None,
+        max_batch_size: int = 256,
+        max_batch_tokens: int = 100_000,
     ):
         """Initialize OpenAI embedding provider.
 
@@ -36,6 +42,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             api_base: API base URL (for Azure OpenAI)
             api_version: API version (for Azure OpenAI)
             deployment_name: Deployment name (for Azure OpenAI)
+            max_batch_size: Maximum number of texts per embeddings request
+            max_batch_tokens: Estimated token budget per embeddings request
         """
         try:
             openai_module = importlib.import_module("openai")
@@ -55,6 +63,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             )
 
         self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
         self.is_azure = api_base is not None
 
         if api_base is not None:
@@ -83,6 +93,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                            - api_base: API endpoint (required for Azure)
                            - api_version: API version (optional, for Azure)
                            - deployment_name: Deployment name (optional, for Azure)
+                           - max_batch_size: Texts per embeddings request
+                           - max_batch_tokens: Estimated token budget per request
 
         Returns:
             Configured OpenAIEmbeddingProvider
@@ -98,12 +110,19 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                 api_base=str(driver_config.api_base),
                 api_version=driver_config.api_version,
                 deployment_name=driver_config.deployment_name,
+                max_batch_size=int(driver_config.max_batch_size),
+                max_batch_tokens=int(driver_config.max_batch_tokens),
             )
 
         if not isinstance(driver_config, DriverConfig_EmbeddingBackend_Openai):
             raise TypeError("driver_config must be DriverConfig_EmbeddingBackend_Openai")
 
-        return cls(api_key=str(driver_config.api_key), model=str(driver_config.model))
+        return cls(
+            api_key=str(driver_config.api_key),
+            model=str(driver_config.model),
+            max_batch_size=int(driver_config.max_batch_size),
+            max_batch_tokens=int(driver_config.max_batch_tokens),
+        )
 
     def embed(self, text: str) -> list[float]:
         """Generate embeddings using OpenAI API.
@@ -117,8 +136,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         Raises:
             ValueError: If text is None, non-string, or empty
         """
-        if not text.strip():
-            raise ValueError("Text cannot be empty or whitespace-only")
+        self._validate_text(text)
 
         if self.is_azure:
             response = self.client.embeddings.create(input=text, model=self.deployment_name)
@@ -126,3 +144,57 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             response = self.client.embeddings.create(input=text, model=self.model)
 
         return response.data[0].embedding
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts with array-input API requests.
+
+        Texts are sent as arrays, split into sub-batches that respect both
+        ``max_batch_size`` and the estimated ``max_batch_tokens`` budget. A
+        single text larger than the budget is sent in a request of its own.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            ValueError: If any text is None, non-string, or empty
+        """
+        for text in texts:
+            self._validate_text(text)
+
+        model = self.deployment_name if self.is_azure else self.model
+        vectors: list[list[float]] = []
+        for batch in self._split_batches(texts):
+            response = self.client.embeddings.create(input=batch, model=model)
+            # The API returns one item per input, tagged with its input index
+            data = sorted(response.data, key=lambda item: item.index)
+            vectors.extend(item.embedding for item in data)
+        return vectors
+
+    @staticmethod
+    def _validate_text(text: str) -> None:
+        """Reject None, non-string, and empty inputs."""
+        if text is None:
+            raise ValueError("Text cannot be None")
+        if not isinstance(text, str):
+            raise ValueError(f"Text must be a string, got {type(text).__name__}")
+        if not text.strip():
+            raise ValueError("Text cannot be empty or whitespace-only")
+
+    def _split_batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into request-sized batches by count and estimated tokens."""
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = len(text) // _CHARS_PER_TOKEN + 1
+            if current and (len(current) >= self.max_batch_size or current_tokens + tokens > self.max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
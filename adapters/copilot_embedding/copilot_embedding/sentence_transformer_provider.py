@@ -19,13 +19,20 @@ logger = logging.getLogger(__name__)
 class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
     """SentenceTransformer embedding provider for local models."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str = "cpu", cache_dir: str | None = None):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        device: str = "cpu",
+        cache_dir: str | None = None,
+        batch_size: int = 32,
+    ):
         """Initialize SentenceTransformer provider.
 
         Args:
             model_name: Name of the SentenceTransformer model
             device: Device to run inference on (cpu, cuda, mps)
             cache_dir: Directory to cache models
+            batch_size: Number of texts encoded per forward pass in embed_batch()
         """
         try:
             st_module = importlib.import_module("sentence_transformers")
@@ -45,6 +52,7 @@ class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
         self.model_name = model_name
         self.device = device
         self.cache_dir = cache_dir
+        self.batch_size = batch_size
 
         logger.info(f"Loading SentenceTransformer model: {model_name} on device: {device}")
         self.model = SentenceTransformer(model_name, device=device, cache_folder=cache_dir)
@@ -62,6 +70,7 @@ class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
                           - model_name: Model name
                           - device: Compute device (cpu or cuda)
                           - cache_dir: Cache directory (optional)
+                          - batch_size: Texts per forward pass in embed_batch()
 
         Returns:
             Configured SentenceTransformerEmbeddingProvider
@@ -71,6 +80,7 @@ class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
             model_name=str(driver_config.model_name),
             device=str(driver_config.device),
             cache_dir=driver_config.cache_dir,
+            batch_size=int(driver_config.batch_size),
         )
 
     def embed(self, text: str) -> list[float]:
@@ -92,3 +102,29 @@ class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
 
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts with batched model inference.
+
+        Texts are passed to the model together so it can encode ``batch_size``
+        of them per forward pass instead of one at a time.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            ValueError: If any text is None or empty
+        """
+        for text in texts:
+            if text is None:
+                raise ValueError("Text cannot be None")
+            if not text.strip():
+                raise ValueError("Text cannot be empty or whitespace-only")
+        if not texts:
+            return []
+
+        embeddings = self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True)
+        return embeddings.tolist()
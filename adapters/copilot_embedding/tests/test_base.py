@@ -14,3 +14,12 @@ class TestEmbeddingProvider:
         """Test that abstract base class cannot be instantiated."""
         with pytest.raises(TypeError):
             EmbeddingProvider()
+
+    def test_embed_batch_defaults_to_embed(self):
+        """Test that the default embed_batch calls embed for each text in order."""
+
+        class LengthProvider(EmbeddingProvider):
+            def embed(self, text: str) -> list[float]:
+                return [float(len(text))]
+
+        assert LengthProvider().embed_batch(["a", "abc", "ab"]) == [[1.0], [3.0], [2.0]]
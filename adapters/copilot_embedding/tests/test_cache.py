@@ -0,0 +1,308 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Tests for the content-addressed embedding cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from copilot_embedding.cache import (
+    CachedEmbeddingProvider,
+    DocumentStoreEmbeddingCacheStore,
+    InMemoryEmbeddingCacheStore,
+    SQLiteEmbeddingCacheStore,
+    make_cache_key,
+)
+from copilot_embedding.mock_provider import MockEmbeddingProvider
+
+
+def _spy_provider(dimension: int = 8) -> Mock:
+    """Create a mock provider that records embed_batch calls and returns mock vectors."""
+    provider = MockEmbeddingProvider(dimension=dimension)
+    return Mock(wraps=provider)
+
+
+class TestCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_whitespace_is_normalized(self):
+        """Test that texts differing only in whitespace share a key."""
+        assert make_cache_key("st", "m", "hello   world\n") == make_cache_key("st", "m", " hello world")
+
+    def test_model_and_backend_are_part_of_key(self):
+        """Test that the same text under another model or backend gets another key."""
+        key = make_cache_key("st", "model-a", "text")
+        assert key != make_cache_key("st", "model-b", "text")
+        assert key != make_cache_key("openai", "model-a", "text")
+
+    def test_key_is_sha256_hex(self):
+        """Test that keys are 64-character hex digests."""
+        key = make_cache_key("st", "m", "text")
+        assert len(key) == 64
+        int(key, 16)
+
+
+class TestCachedEmbeddingProvider:
+    """Tests for CachedEmbeddingProvider."""
+
+    def test_second_call_is_served_from_cache(self):
+        """Test that previously embedded texts are not re-embedded."""
+        provider = _spy_provider()
+        cached = CachedEmbeddingProvider(provider, InMemoryEmbeddingCacheStore(), backend="mock", model="mock")
+
+        first = cached.embed_batch(["alpha", "beta"])
+        second = cached.embed_batch(["beta", "alpha", "gamma"])
+
+        assert second == [first[1], first[0], provider.embed("gamma")]
+        calls = [call.args[0] for call in provider.embed_batch.call_args_list]
+        assert calls == [["alpha", "beta"], ["gamma"]]
+
+    def test_duplicates_within_batch_embedded_once(self):
+        """Test that repeated texts in one batch are embedded once."""
+        provider = _spy_provider()
+        cached = CachedEmbeddingProvider(provider, InMemoryEmbeddingCacheStore(), backend="mock", model="mock")
+
+        vectors = cached.embed_batch(["same", "other", "same"])
+
+        provider.embed_batch.assert_called_once_with(["same", "other"])
+        assert vectors[0] == vectors[2]
+
+    def test_embed_uses_cache(self):
+        """Test that single-text embed goes through the cache."""
+        provider = _spy_provider()
+        cached = CachedEmbeddingProvider(provider, InMemoryEmbeddingCacheStore(), backend="mock", model="mock")
+
+        assert cached.embed("text") == cached.embed("text")
+        assert provider.embed_batch.call_count == 1
+
+    def test_metrics_emitted(self):
+        """Test that hit and miss counters are emitted."""
+        metrics = Mock()
+        cached = CachedEmbeddingProvider(
+            _spy_provider(), InMemoryEmbeddingCacheStore(), backend="mock", model="mock", metrics_collector=metrics
+        )
+
+        cached.embed_batch(["a", "b"])
+        cached.embed_batch(["a", "c"])
+
+        calls = [(call.args[0], call.args[1]) for call in metrics.increment.call_args_list]
+        assert calls == [
+            ("embedding_cache_misses_total", 2),
+            ("embedding_cache_hits_total", 1),
+            ("embedding_cache_misses_total", 1),
+        ]
+        assert metrics.increment.call_args.kwargs["tags"] == {"backend": "mock"}
+
+    def test_store_failure_falls_back_to_provider(self):
+        """Test that cache store errors do not fail embedding."""
+        store = Mock()
+        store.get_many.side_effect = RuntimeError("lookup failed")
+        store.set_many.side_effect = RuntimeError("write failed")
+        provider = _spy_provider()
+        cached = CachedEmbeddingProvider(provider, store, backend="mock", model="mock")
+
+        vectors = cached.embed_batch(["text"])
+
+        assert vectors == [provider.embed("text")]
+
+    def test_dimension_mismatch_is_a_miss(self):
+        """Test that cached vectors of another dimension are ignored."""
+        store = InMemoryEmbeddingCacheStore()
+        store.set_many({make_cache_key("mock", "mock", "text"): [0.5, 0.5]})
+        provider = _spy_provider(dimension=4)
+        cached = CachedEmbeddingProvider(provider, store, backend="mock", model="mock", dimension=4)
+
+        assert len(cached.embed("text")) == 4
+        provider.embed_batch.assert_called_once_with(["text"])
+
+    def test_expired_entries_evicted_after_interval(self):
+        """Test that writes purge expired entries once the eviction interval has elapsed."""
+        store = InMemoryEmbeddingCacheStore(ttl_seconds=60)
+        with patch("copilot_embedding.cache.time.time", return_value=1000.0):
+            store.set_many({"stale": [1.0]})
+        cached = CachedEmbeddingProvider(_spy_provider(), store, backend="mock", model="m", eviction_interval_seconds=0)
+
+        with patch("copilot_embedding.cache.time.time", return_value=1061.0):
+            cached.embed_batch(["fresh text"])
+            cached._eviction_thread.join(timeout=5)
+
+        assert "stale" not in store._entries
+        assert len(store._entries) == 1
+
+    def test_eviction_runs_off_the_request_path(self):
+        """Test that a slow purge neither blocks embed_batch nor starts a second purge."""
+        import threading
+
+        release = threading.Event()
+        store = InMemoryEmbeddingCacheStore(ttl_seconds=60)
+        store.evict_expired = Mock(side_effect=lambda: release.wait(5) and 0)
+        cached = CachedEmbeddingProvider(_spy_provider(), store, backend="mock", model="m", eviction_interval_seconds=0)
+
+        cached.embed_batch(["first"])
+        cached.embed_batch(["second"])
+        release.set()
+        cached._eviction_thread.join(timeout=5)
+
+        store.evict_expired.assert_called_once()
+
+    def test_rejects_empty_text(self):
+        """Test that empty texts are rejected before touching the store."""
+        store = Mock()
+        cached = CachedEmbeddingProvider(_spy_provider(), store, backend="mock", model="mock")
+
+        with pytest.raises(ValueError):
+            cached.embed_batch(["valid", " "])
+        store.get_many.assert_not_called()
+
+
+class TestInMemoryEmbeddingCacheStore:
+    """Tests for InMemoryEmbeddingCacheStore."""
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are not returned."""
+        store = InMemoryEmbeddingCacheStore(ttl_seconds=60)
+        with patch("copilot_embedding.cache.time.time", return_value=1000.0):
+            store.set_many({"k": [1.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1030.0):
+            assert store.get_many(["k"]) == {"k": [1.0]}
+        with patch("copilot_embedding.cache.time.time", return_value=1061.0):
+            assert store.get_many(["k"]) == {}
+
+    def test_evict_expired_removes_entries(self):
+        """Test that expired entries are deleted, not just hidden."""
+        store = InMemoryEmbeddingCacheStore(ttl_seconds=60)
+        with patch("copilot_embedding.cache.time.time", return_value=1000.0):
+            store.set_many({"old": [1.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1050.0):
+            store.set_many({"new": [2.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1061.0):
+            assert store.evict_expired() == 1
+
+        assert list(store._entries) == ["new"]
+
+
+class TestSQLiteEmbeddingCacheStore:
+    """Tests for SQLiteEmbeddingCacheStore."""
+
+    def test_round_trip_persists_across_instances(self, tmp_path):
+        """Test that vectors written by one instance are read by another."""
+        path = str(tmp_path / "cache.sqlite3")
+        store = SQLiteEmbeddingCacheStore(path)
+        store.set_many({"a": [0.25, -1.5], "b": [2.0, 0.0]})
+        store.close()
+
+        reopened = SQLiteEmbeddingCacheStore(path)
+        assert reopened.get_many(["a", "b", "missing"]) == {"a": [0.25, -1.5], "b": [2.0, 0.0]}
+        reopened.close()
+
+    def test_many_keys(self):
+        """Test lookups with more keys than fit in one statement."""
+        store = SQLiteEmbeddingCacheStore(":memory:")
+        entries = {f"key-{i}": [float(i)] for i in range(1200)}
+        store.set_many(entries)
+
+        assert store.get_many(list(entries)) == entries
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are not returned."""
+        store = SQLiteEmbeddingCacheStore(":memory:", ttl_seconds=60)
+        with patch("copilot_embedding.cache.time.time", return_value=1000.0):
+            store.set_many({"k": [1.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1061.0):
+            assert store.get_many(["k"]) == {}
+
+    def test_evict_expired_deletes_rows(self):
+        """Test that expired rows are deleted from the database file."""
+        store = SQLiteEmbeddingCacheStore(":memory:", ttl_seconds=60)
+        with patch("copilot_embedding.cache.time.time", return_value=1000.0):
+            store.set_many({"old": [1.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1050.0):
+            store.set_many({"new": [2.0]})
+        with patch("copilot_embedding.cache.time.time", return_value=1061.0):
+            assert store.evict_expired() == 1
+
+        rows = store._conn.execute("SELECT key FROM embedding_cache").fetchall()
+        assert rows == [("new",)]
+
+    def test_evict_expired_without_ttl_keeps_rows(self):
+        """Test that a store without a TTL never deletes entries."""
+        store = SQLiteEmbeddingCacheStore(":memory:")
+        store.set_many({"k": [1.0]})
+
+        assert store.evict_expired() == 0
+        assert store.get_many(["k"]) == {"k": [1.0]}
+
+
+class TestDocumentStoreEmbeddingCacheStore:
+    """Tests for DocumentStoreEmbeddingCacheStore."""
+
+    def test_set_many_upserts_documents(self):
+        """Test that entries are upserted into the cache collection."""
+        document_store = Mock()
+        document_store.upsert_documents.return_value = Mock(errors=[])
+        store = DocumentStoreEmbeddingCacheStore(document_store)
+
+        store.set_many({"k": [0.1, 0.2]})
+
+        collection, docs = document_store.upsert_documents.call_args.args
+        assert collection == "embedding_cache"
+        assert docs[0]["_id"] == "k"
+        assert docs[0]["vector"] == [0.1, 0.2]
+        assert docs[0]["created_at"].endswith("Z")
+
+    def test_get_many_filters_expired_entries(self):
+        """Test that lookups query by key and drop entries older than the TTL."""
+        now = datetime.now(timezone.utc)
+        fresh = (now - timedelta(seconds=10)).isoformat().replace("+00:00", "Z")
+        stale = (now - timedelta(seconds=120)).isoformat().replace("+00:00", "Z")
+        document_store = Mock()
+        document_store.query_documents.return_value = [
+            {"_id": "fresh", "vector": [1.0], "created_at": fresh},
+            {"_id": "stale", "vector": [2.0], "created_at": stale},
+        ]
+        store = DocumentStoreEmbeddingCacheStore(document_store, ttl_seconds=60)
+
+        assert store.get_many(["fresh", "stale"]) == {"fresh": [1.0]}
+        document_store.query_documents.assert_called_once_with(
+            "embedding_cache", filter_dict={"_id": {"$in": ["fresh", "stale"]}}, limit=2
+        )
+
+    def test_evict_expired_deletes_documents(self):
+        """Test that expired cache documents are deleted from the collection."""
+        now = datetime.now(timezone.utc)
+        fresh = (now - timedelta(seconds=10)).isoformat().replace("+00:00", "Z")
+        stale = (now - timedelta(seconds=120)).isoformat().replace("+00:00", "Z")
+        document_store = Mock()
+        document_store.iter_documents.return_value = iter(
+            [{"_id": "stale", "created_at": stale}, {"_id": "fresh", "created_at": fresh}]
+        )
+        document_store.delete_documents.return_value = Mock(succeeded=["stale"])
+        store = DocumentStoreEmbeddingCacheStore(document_store, ttl_seconds=60)
+
+        assert store.evict_expired() == 1
+        document_store.delete_documents.assert_called_once_with("embedding_cache", ["stale"])
+        document_store.delete_document.assert_not_called()
+        kwargs = document_store.iter_documents.call_args.kwargs
+        assert kwargs["projection"] == {"_id": 1, "created_at": 1}
+        assert (kwargs["sort_by"], kwargs["sort_order"]) == ("created_at", "asc")
+
+    def test_evict_expired_stops_at_first_unexpired_entry(self):
+        """Test that the oldest-first scan is not consumed past the first unexpired entry."""
+        now = datetime.now(timezone.utc)
+        fresh = (now - timedelta(seconds=10)).isoformat().replace("+00:00", "Z")
+        stale = (now - timedelta(seconds=120)).isoformat().replace("+00:00", "Z")
+        remaining = iter([{"_id": "later", "created_at": fresh}])
+
+        def iter_documents(*args, **kwargs):
+            yield {"_id": "stale", "created_at": stale}
+            yield {"_id": "fresh", "created_at": fresh}
+            yield from remaining
+
+        document_store = Mock()
+        document_store.iter_documents.side_effect = iter_documents
+        document_store.delete_documents.return_value = Mock(succeeded=["stale"])
+        store = DocumentStoreEmbeddingCacheStore(document_store, ttl_seconds=60)
+
+        assert store.evict_expired() == 1
+        assert next(remaining)["_id"] == "later"
@@ -3,7 +3,7 @@
 
 """Tests for HuggingFaceEmbeddingProvider."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from copilot_config.generated.adapters.embedding_backend import DriverConfig_EmbeddingBackend_Huggingface
@@ -116,3 +116,58 @@ class TestHuggingFaceEmbeddingProvider:
             embedding = provider.embed("test text")
 
             assert embedding == [0.1, 0.2, 0.3]
+
+    def test_embed_batch(self):
+        """Test that embed_batch tokenizes and runs the model once per sub-batch."""
+        mock_transformers_module = Mock()
+        mock_tokenizer = Mock()
+        mock_model = MagicMock()
+        mock_transformers_module.AutoTokenizer.from_pretrained.return_value = mock_tokenizer
+        mock_transformers_module.AutoModel.from_pretrained.return_value = mock_model
+        mock_model.to.return_value = mock_model
+
+        # Tokenizer output behaves like a dict for **inputs and for the attention mask lookup
+        mock_inputs = MagicMock()
+        mock_inputs.keys.return_value = ["input_ids", "attention_mask"]
+        mock_tokenizer.return_value.to.return_value = mock_inputs
+
+        # Pooled embeddings: (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(...)
+        mock_outputs = MagicMock()
+        mock_model.return_value = mock_outputs
+        summed = mock_outputs.last_hidden_state.__mul__.return_value.sum.return_value
+        pooled = summed.__truediv__.return_value
+        pooled.cpu.return_value.numpy.return_value.tolist.side_effect = [[[0.1, 0.2], [0.3, 0.4]], [[0.5, 0.6]]]
+
+        class MockNoGrad:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+        mock_torch_module = Mock()
+        mock_torch_module.no_grad = MockNoGrad
+
+        with patch.dict("sys.modules", {"transformers": mock_transformers_module, "torch": mock_torch_module}):
+            provider = HuggingFaceEmbeddingProvider(
+                model_name="sentence-transformers/all-MiniLM-L6-v2", device="cpu", max_length=128, batch_size=2
+            )
+            embeddings = provider.embed_batch(["first", "second", "third"])
+
+            assert embeddings == [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+            tokenized = [call.args[0] for call in mock_tokenizer.call_args_list]
+            assert tokenized == [["first", "second"], ["third"]]
+            assert mock_model.call_count == 2
+
+    def test_embed_batch_rejects_empty_text(self):
+        """Test that embed_batch validates texts before tokenizing."""
+        mock_transformers_module = Mock()
+        mock_tokenizer = Mock()
+        mock_transformers_module.AutoTokenizer.from_pretrained.return_value = mock_tokenizer
+
+        with patch.dict("sys.modules", {"transformers": mock_transformers_module, "torch": Mock()}):
+            provider = HuggingFaceEmbeddingProvider(model_name="test-model", device="cpu", max_length=128)
+
+            with pytest.raises(ValueError):
+                provider.embed_batch(["valid", ""])
+            mock_tokenizer.assert_not_called()
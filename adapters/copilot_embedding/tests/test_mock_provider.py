@@ -84,3 +84,24 @@ class TestMockEmbeddingProvider:
             provider.embed(123)
 
         assert "must be a string" in str(exc_info.value)
+
+    def test_embed_batch_matches_embed(self):
+        """Test that embed_batch returns the same vectors as embed, in order."""
+        provider = MockEmbeddingProvider(dimension=10)
+        texts = ["text one", "text two", "text one"]
+
+        embeddings = provider.embed_batch(texts)
+
+        assert embeddings == [provider.embed(text) for text in texts]
+
+    def test_embed_batch_empty_list(self):
+        """Test that embed_batch with no texts returns no vectors."""
+        provider = MockEmbeddingProvider(dimension=10)
+        assert provider.embed_batch([]) == []
+
+    def test_embed_batch_rejects_empty_text(self):
+        """Test that embed_batch validates every text."""
+        provider = MockEmbeddingProvider(dimension=10)
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            provider.embed_batch(["valid", "   "])
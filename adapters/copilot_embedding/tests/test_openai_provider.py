@@ -103,3 +103,102 @@ class TestOpenAIEmbeddingProvider:
 
             assert embedding == [0.4, 0.5, 0.6]
             mock_client.embeddings.create.assert_called_once_with(input="test text", model="test-deployment")
+
+    @staticmethod
+    def _batch_response(inputs):
+        """Build a mock embeddings response whose items arrive in reverse order."""
+        response = Mock()
+        response.data = [
+            Mock(index=index, embedding=[float(len(text))]) for index, text in reversed(list(enumerate(inputs)))
+        ]
+        return response
+
+    def _openai_provider(self, mock_client, **kwargs):
+        """Create an OpenAI provider backed by a mock client."""
+        mock_openai_module = Mock()
+        mock_openai_module.OpenAI = Mock(return_value=mock_client)
+        mock_openai_module.AzureOpenAI = Mock(return_value=mock_client)
+        with patch.dict("sys.modules", {"openai": mock_openai_module}):
+            return OpenAIEmbeddingProvider(api_key="test-key", **kwargs)
+
+    def test_embed_batch_single_request(self):
+        """Test that embed_batch sends texts as one array and restores input order."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: self._batch_response(input)
+        provider = self._openai_provider(mock_client)
+
+        embeddings = provider.embed_batch(["a", "bb", "ccc"])
+
+        assert embeddings == [[1.0], [2.0], [3.0]]
+        mock_client.embeddings.create.assert_called_once_with(input=["a", "bb", "ccc"], model="text-embedding-ada-002")
+
+    def test_embed_batch_splits_by_batch_size(self):
+        """Test that embed_batch sends at most max_batch_size texts per request."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: self._batch_response(input)
+        provider = self._openai_provider(mock_client, max_batch_size=2)
+
+        embeddings = provider.embed_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        batches = [call.kwargs["input"] for call in mock_client.embeddings.create.call_args_list]
+        assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+    def test_embed_batch_splits_by_token_budget(self):
+        """Test that embed_batch keeps each request within the estimated token budget."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: self._batch_response(input)
+        # Each 40-character text is estimated at 11 tokens
+        provider = self._openai_provider(mock_client, max_batch_tokens=25)
+        texts = [str(i) * 40 for i in range(5)]
+
+        embeddings = provider.embed_batch(texts)
+
+        assert embeddings == [[40.0]] * 5
+        batches = [call.kwargs["input"] for call in mock_client.embeddings.create.call_args_list]
+        assert batches == [texts[0:2], texts[2:4], texts[4:5]]
+
+    def test_embed_batch_oversized_text_sent_alone(self):
+        """Test that a text larger than the token budget gets its own request."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: self._batch_response(input)
+        provider = self._openai_provider(mock_client, max_batch_tokens=10)
+        texts = ["short", "x" * 400, "tiny"]
+
+        provider.embed_batch(texts)
+
+        batches = [call.kwargs["input"] for call in mock_client.embeddings.create.call_args_list]
+        assert batches == [["short"], ["x" * 400], ["tiny"]]
+
+    def test_embed_batch_azure_uses_deployment(self):
+        """Test that Azure embed_batch requests target the deployment name."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: self._batch_response(input)
+        provider = self._openai_provider(
+            mock_client, api_base="https://test.openai.azure.com/", deployment_name="test-deployment"
+        )
+
+        provider.embed_batch(["one", "two"])
+
+        mock_client.embeddings.create.assert_called_once_with(input=["one", "two"], model="test-deployment")
+
+    def test_embed_batch_rejects_empty_text(self):
+        """Test that embed_batch validates texts before sending any request."""
+        mock_client = Mock()
+        provider = self._openai_provider(mock_client)
+
+        with pytest.raises(ValueError):
+            provider.embed_batch(["valid", "  "])
+        mock_client.embeddings.create.assert_not_called()
+
+    @pytest.mark.parametrize("invalid", [None, 123])
+    def test_embed_batch_rejects_non_string_text(self, invalid):
+        """Test that None and non-string texts raise ValueError rather than AttributeError."""
+        mock_client = Mock()
+        provider = self._openai_provider(mock_client)
+
+        with pytest.raises(ValueError):
+            provider.embed_batch(["valid", invalid])
+        with pytest.raises(ValueError):
+            provider.embed(invalid)
+        mock_client.embeddings.create.assert_not_called()
@@ -76,3 +76,34 @@ class TestSentenceTransformerEmbeddingProvider:
 
             assert embedding == [0.1, 0.2, 0.3]
             mock_model.encode.assert_called_once_with("test text", convert_to_numpy=True)
+
+    def test_embed_batch(self):
+        """Test that embed_batch encodes all texts in one batched model call."""
+        mock_st_module = Mock()
+        mock_st_class = Mock()
+        mock_model = Mock()
+        mock_embeddings = Mock()
+        mock_embeddings.tolist.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        mock_model.encode.return_value = mock_embeddings
+        mock_st_class.return_value = mock_model
+        mock_st_module.SentenceTransformer = mock_st_class
+
+        with patch.dict("sys.modules", {"sentence_transformers": mock_st_module}):
+            provider = SentenceTransformerEmbeddingProvider(batch_size=16)
+            embeddings = provider.embed_batch(["first", "second"])
+
+            assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+            mock_model.encode.assert_called_once_with(["first", "second"], batch_size=16, convert_to_numpy=True)
+
+    def test_embed_batch_rejects_empty_text(self):
+        """Test that embed_batch validates texts before calling the model."""
+        mock_st_module = Mock()
+        mock_model = Mock()
+        mock_st_module.SentenceTransformer = Mock(return_value=mock_model)
+
+        with patch.dict("sys.modules", {"sentence_transformers": mock_st_module}):
+            provider = SentenceTransformerEmbeddingProvider()
+
+            with pytest.raises(ValueError):
+                provider.embed_batch(["valid", ""])
+            mock_model.encode.assert_not_called()
@@ -8,7 +8,12 @@ transient failures, particularly race conditions where events arrive before docu
 are queryable in eventually-consistent datastores like CosmosDB.
 """
 
-from .event_handler import DocumentNotFoundError, RetryableError, handle_event_with_retry
+from .event_handler import (
+    DelayedRedelivery,
+    DocumentNotFoundError,
+    RetryableError,
+    handle_event_with_retry,
+)
 from .retry_policy import RetryConfig, RetryContext, RetryPolicy
 
 __all__ = [
@@ -16,6 +21,7 @@ __all__ = [
     "RetryConfig",
     "RetryContext",
     "handle_event_with_retry",
+    "DelayedRedelivery",
     "RetryableError",
     "DocumentNotFoundError",
 ]
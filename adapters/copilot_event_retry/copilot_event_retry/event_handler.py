@@ -3,8 +3,10 @@
 
 """Event handler wrapper with retry logic for transient failures."""
 
+import copy
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -12,6 +14,10 @@ from .retry_policy import RetryConfig, RetryContext, RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+# Event envelope "headers" keys carrying retry state across redeliveries
+RETRY_ATTEMPT_HEADER = "retry_attempt"
+RETRY_FIRST_ATTEMPT_AT_HEADER = "retry_first_attempt_at"
+
 
 class RetryableError(Exception):
     """Base class for errors that should trigger retry."""
@@ -45,6 +51,25 @@ class RetryExhaustedError(Exception):
         self.dlq_info = dlq_info
 
 
+@dataclass
+class DelayedRedelivery:
+    """Target for republishing events that need another attempt later.
+
+    Instead of sleeping inside the consumer callback, a retryable failure
+    republishes the event with publisher.publish_delayed() and returns, so
+    the original delivery is acknowledged and the consumer moves on.
+
+    Attributes:
+        publisher: copilot_message_bus EventPublisher supporting publish_delayed()
+        exchange: Exchange the event was originally published to
+        routing_key: Routing key the event was originally published with
+    """
+
+    publisher: Any
+    exchange: str
+    routing_key: str
+
+
 def handle_event_with_retry(
     handler: Callable[[dict[str, Any]], Any],
     event: dict[str, Any],
@@ -53,13 +78,19 @@ def handle_event_with_retry(
     metrics_collector: Any = None,
     error_reporter: Any = None,
     service_name: str = "unknown",
-) -> None:
+    redelivery: DelayedRedelivery | None = None,
+) -> bool:
     """Handle event with retry logic for transient failures.
 
     Wraps an event handler with retry logic that handles race conditions where
     documents are not yet queryable. Implements exponential backoff with jitter,
     TTL enforcement, and dead letter queue integration.
 
+    By default the backoff delay is slept in-process. When redelivery is given,
+    a retryable failure instead republishes the event with a delay and returns
+    immediately; the attempt number and first-attempt time travel in the event
+    "headers", so max attempts and TTL are enforced across redeliveries.
+
     Args:
         handler: Event handler function to call (return value is ignored)
         event: Event data dictionary
@@ -68,17 +99,21 @@ def handle_event_with_retry(
         metrics_collector: Optional metrics collector for observability
         error_reporter: Optional error reporter for failure tracking
         service_name: Service name for logging and metrics
+        redelivery: Optional delayed-redelivery target (sleeps in-process if None)
+
+    Returns:
+        True if the handler succeeded, False if the event was scheduled for
+        delayed redelivery
 
     Raises:
         RetryExhaustedError: When all retry attempts are exhausted
-        Exception: Non-retryable errors are re-raised immediately
+        Exception: Non-retryable errors are re-raised immediately, as are
+            failures to republish the event for redelivery
     """
     policy = RetryPolicy(config or RetryConfig())
-    context = RetryContext(
-        attempt_number=1,
-        idempotency_key=idempotency_key,
-        metadata={"service": service_name, "event_type": event.get("event_type")},
-    )
+    context = _context_from_headers(event)
+    context.idempotency_key = idempotency_key
+    context.metadata = {"service": service_name, "event_type": event.get("event_type")}
 
     while True:
         try:
@@ -119,7 +154,7 @@ def handle_event_with_retry(
                     f"({context.elapsed_seconds():.2f}s elapsed)"
                 )
 
-            return
+            return True
 
         except RetryableError as e:
             context.last_exception = e
@@ -168,6 +203,16 @@ def handle_event_with_retry(
                     },
                 )
 
+            if redelivery is not None:
+                # Hand the next attempt to the message bus so this consumer is not blocked
+                redelivery.publisher.publish_delayed(
+                    redelivery.exchange,
+                    redelivery.routing_key,
+                    _with_retry_headers(event, context.attempt_number + 1, context.start_time),
+                    delay_ms,
+                )
+                return False
+
             # Sleep before next attempt
             policy.sleep(delay_ms)
 
@@ -201,6 +246,51 @@ def handle_event_with_retry(
             raise
 
 
+def _context_from_headers(event: dict[str, Any]) -> RetryContext:
+    """Restore retry state carried in the event headers by a previous redelivery.
+
+    Args:
+        event: Event data dictionary
+
+    Returns:
+        Retry context for the current attempt (a fresh context if the event
+        carries no valid retry headers)
+    """
+    context = RetryContext()
+    headers = event.get("headers") or {}
+    try:
+        context.attempt_number = max(1, int(headers.get(RETRY_ATTEMPT_HEADER, 1)))
+        first_attempt_at = headers.get(RETRY_FIRST_ATTEMPT_AT_HEADER)
+        if first_attempt_at:
+            start_time = datetime.fromisoformat(first_attempt_at.replace("Z", "+00:00"))
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=timezone.utc)
+            context.start_time = start_time
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Ignoring invalid retry headers on event: {e}")
+        context = RetryContext()
+    return context
+
+
+def _with_retry_headers(event: dict[str, Any], attempt_number: int, start_time: datetime) -> dict[str, Any]:
+    """Copy an event, recording retry state in its headers.
+
+    Args:
+        event: Event data dictionary
+        attempt_number: Attempt number the redelivered event represents
+        start_time: When the first attempt started
+
+    Returns:
+        New event dictionary with updated headers
+    """
+    redelivered = copy.deepcopy(event)
+    headers = dict(redelivered.get("headers") or {})
+    headers[RETRY_ATTEMPT_HEADER] = attempt_number
+    headers[RETRY_FIRST_ATTEMPT_AT_HEADER] = start_time.isoformat().replace("+00:00", "Z")
+    redelivered["headers"] = headers
+    return redelivered
+
+
 def _build_dlq_info(event: dict[str, Any], context: RetryContext, config: RetryConfig) -> dict[str, Any]:
     """Build diagnostic payload for dead letter queue.
 
@@ -21,6 +21,8 @@ class RetryConfig:
         max_delay_ms: Maximum delay cap in milliseconds (default: 60000 = 60s)
         ttl_seconds: Time-to-live in seconds; abandon after this duration (default: 1800 = 30 minutes)
         use_jitter: Whether to apply full jitter to delays (default: True)
+        delayed_redelivery: Whether services should republish retryable events
+            with a delay instead of sleeping in the consumer (default: False)
     """
 
     max_attempts: int = 8
@@ -29,6 +31,7 @@ class RetryConfig:
     max_delay_ms: int = 60000
     ttl_seconds: int = 1800
     use_jitter: bool = True
+    delayed_redelivery: bool = False
 
 
 @dataclass
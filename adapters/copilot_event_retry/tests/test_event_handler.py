@@ -3,10 +3,12 @@
 
 """Tests for event handler retry wrapper."""
 
-from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
 
 import pytest
 from copilot_event_retry import (
+    DelayedRedelivery,
     DocumentNotFoundError,
     RetryableError,
     RetryConfig,
@@ -312,3 +314,114 @@ class TestDLQInfoBuilding:
         assert "idempotency_key" in dlq_info
         assert dlq_info["idempotency_key"] == "key-123"
         assert "metadata" in dlq_info
+
+
+class TestDelayedRedelivery:
+    """Tests for handle_event_with_retry with delayed redelivery."""
+
+    def test_retryable_error_republishes_without_sleeping(self):
+        """Test that a retryable failure is republished with a delay and returns."""
+        handler = Mock(side_effect=DocumentNotFoundError("Not found"))
+        publisher = Mock()
+        event = {"event_type": "TestEvent", "data": {"id": "123"}}
+        config = RetryConfig(max_attempts=5, base_delay_ms=100, use_jitter=False)
+
+        with patch("copilot_event_retry.retry_policy.time.sleep") as mock_sleep:
+            handled = handle_event_with_retry(
+                handler,
+                event,
+                config=config,
+                redelivery=DelayedRedelivery(publisher, "copilot.events", "chunks.prepared"),
+            )
+
+        assert handled is False
+        handler.assert_called_once()
+        mock_sleep.assert_not_called()
+        exchange, routing_key, redelivered, delay_ms = publisher.publish_delayed.call_args.args
+        assert (exchange, routing_key, delay_ms) == ("copilot.events", "chunks.prepared", 200)
+        assert redelivered["data"] == event["data"]
+        assert redelivered["headers"]["retry_attempt"] == 2
+        assert "headers" not in event
+
+    def test_attempt_number_restored_from_headers(self):
+        """Test that a redelivered event continues counting attempts."""
+        handler = Mock(side_effect=DocumentNotFoundError("Not found"))
+        publisher = Mock()
+        first_attempt_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        event = {
+            "event_type": "TestEvent",
+            "data": {},
+            "headers": {"retry_attempt": 3, "retry_first_attempt_at": first_attempt_at},
+        }
+        config = RetryConfig(max_attempts=5, base_delay_ms=100, use_jitter=False)
+
+        handle_event_with_retry(
+            handler, event, config=config, redelivery=DelayedRedelivery(publisher, "copilot.events", "key")
+        )
+
+        redelivered = publisher.publish_delayed.call_args.args[2]
+        assert redelivered["headers"]["retry_attempt"] == 4
+        assert redelivered["headers"]["retry_first_attempt_at"] == first_attempt_at
+        assert publisher.publish_delayed.call_args.args[3] == 800
+
+    def test_exhausted_across_redeliveries(self):
+        """Test that max attempts counts attempts made before redelivery."""
+        handler = Mock(side_effect=DocumentNotFoundError("Not found"))
+        publisher = Mock()
+        event = {"event_type": "TestEvent", "data": {}, "headers": {"retry_attempt": 3}}
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            handle_event_with_retry(
+                handler,
+                event,
+                config=RetryConfig(max_attempts=3),
+                redelivery=DelayedRedelivery(publisher, "copilot.events", "key"),
+            )
+
+        assert exc_info.value.context.attempt_number == 3
+        publisher.publish_delayed.assert_not_called()
+
+    def test_ttl_enforced_from_first_attempt_header(self):
+        """Test that TTL is measured from the first attempt, not the redelivery."""
+        handler = Mock(side_effect=DocumentNotFoundError("Not found"))
+        publisher = Mock()
+        first_attempt_at = (datetime.now(timezone.utc) - timedelta(seconds=120)).isoformat()
+        event = {"event_type": "TestEvent", "data": {}, "headers": {"retry_first_attempt_at": first_attempt_at}}
+
+        with pytest.raises(RetryExhaustedError):
+            handle_event_with_retry(
+                handler,
+                event,
+                config=RetryConfig(ttl_seconds=60),
+                redelivery=DelayedRedelivery(publisher, "copilot.events", "key"),
+            )
+
+        publisher.publish_delayed.assert_not_called()
+
+    def test_success_returns_true(self):
+        """Test that a successful redelivered attempt reports success."""
+        handler = Mock()
+        publisher = Mock()
+        event = {"event_type": "TestEvent", "data": {}, "headers": {"retry_attempt": 2}}
+
+        handled = handle_event_with_retry(
+            handler, event, redelivery=DelayedRedelivery(publisher, "copilot.events", "key")
+        )
+
+        assert handled is True
+        publisher.publish_delayed.assert_not_called()
+
+    def test_invalid_headers_start_fresh(self):
+        """Test that malformed retry headers are ignored."""
+        handler = Mock(side_effect=DocumentNotFoundError("Not found"))
+        publisher = Mock()
+        event = {"event_type": "TestEvent", "data": {}, "headers": {"retry_attempt": "many"}}
+
+        handle_event_with_retry(
+            handler,
+            event,
+            config=RetryConfig(use_jitter=False),
+            redelivery=DelayedRedelivery(publisher, "copilot.events", "key"),
+        )
+
+        assert publisher.publish_delayed.call_args.args[2]["headers"]["retry_attempt"] == 2
@@ -43,7 +43,7 @@ from copilot_schema_validation import (  # type: ignore[import-not-found]
     SummaryCompleteEvent,
 )
 
-from .base import EventPublisher, EventSubscriber
+from .base import EventPublisher, EventSubscriber, PublishBatchResult
 from .factory import create_publisher, create_subscriber
 
 # Import validation exceptions (needed for error handling)
@@ -59,6 +59,7 @@ __all__ = [
     # Base interfaces (for type hints)
     "EventPublisher",
     "EventSubscriber",
+    "PublishBatchResult",
     # Validation exceptions (for error handling)
     "ValidationError",
     "SubscriberValidationError",
@@ -6,6 +6,7 @@
 import json
 import logging
 import time
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from copilot_config.generated.adapters.message_bus import DriverConfig_MessageBus_AzureServiceBus
@@ -13,16 +14,17 @@ from copilot_config.generated.adapters.message_bus import DriverConfig_MessageBu
 try:
     from azure.identity import DefaultAzureCredential
     from azure.servicebus import ServiceBusClient, ServiceBusMessage, TransportType
-    from azure.servicebus.exceptions import ServiceBusConnectionError, ServiceBusError
+    from azure.servicebus.exceptions import MessageSizeExceededError, ServiceBusConnectionError, ServiceBusError
 except ImportError:
     ServiceBusClient = None  # type: ignore
     ServiceBusMessage = None  # type: ignore
     ServiceBusError = None  # type: ignore
     ServiceBusConnectionError = None  # type: ignore
+    MessageSizeExceededError = None  # type: ignore
     TransportType = None  # type: ignore
     DefaultAzureCredential = None  # type: ignore
 
-from .base import EventPublisher
+from .base import EventPublisher, PublishBatchResult
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +308,50 @@ class AzureServiceBusPublisher(EventPublisher):
             ServiceBusError: If message publishing fails after all retry attempts
             Exception: For other publishing failures
         """
+        self._send(exchange, routing_key, event)
+
+    def publish_delayed(self, exchange: str, routing_key: str, event: dict[str, Any], delay_ms: int) -> None:
+        """Publish an event that Service Bus makes visible only after a delay.
+
+        Uses the message's scheduled enqueue time, so no extra entities are needed.
+        Targets are resolved the same way as in publish().
+
+        Args:
+            exchange: Exchange name (used as topic name if topic_name not set)
+            routing_key: Routing key (used as queue name if queue_name not set, or as message label)
+            event: Event data as dictionary
+            delay_ms: Minimum delay before delivery in milliseconds
+
+        Raises:
+            ConnectionError: If not connected to Azure Service Bus
+            RuntimeError: If azure-servicebus library is not installed
+            ServiceBusError: If message publishing fails after all retry attempts
+        """
+        scheduled_enqueue_time = datetime.now(timezone.utc) + timedelta(milliseconds=max(delay_ms, 0))
+        self._send(exchange, routing_key, event, scheduled_enqueue_time=scheduled_enqueue_time)
+
+    def publish_batch(self, exchange: str, routing_key: str, events: list[dict[str, Any]]) -> PublishBatchResult:
+        """Publish several events using ServiceBusMessageBatch.
+
+        Events are packed into message batches up to the entity's maximum
+        batch size; a new batch is started whenever the next message does not
+        fit. Each batch is one send, retried on transient errors like
+        publish(). A message too large to fit in an empty batch, or all
+        messages of a batch whose send fails, are reported as failed.
+
+        Args:
+            exchange: Exchange name (used as topic name if topic_name not set)
+            routing_key: Routing key (used as queue name if queue_name not set, or as message label)
+            events: Event data dictionaries, published in order
+
+        Returns:
+            PublishBatchResult with the per-event failures
+
+        Raises:
+            ConnectionError: If not connected to Azure Service Bus
+            RuntimeError: If azure-servicebus library is not installed
+            ValueError: If no topic or queue is configured for publishing
+        """
         if ServiceBusClient is None or ServiceBusMessage is None:
             error_msg = "azure-servicebus library is not installed"
             logger.error(error_msg)
@@ -316,10 +362,95 @@ class AzureServiceBusPublisher(EventPublisher):
             logger.error(error_msg)
             raise ConnectionError(error_msg)
 
-        # Serialize event to JSON and create message outside retry loop for efficiency
-        message_body = json.dumps(event)
+        result = PublishBatchResult()
+        if not events:
+            return result
+
+        target_topic, target_queue = self._determine_publish_target(exchange, routing_key)
+        if target_topic:
+            sender_context = self.client.get_topic_sender(topic_name=target_topic)
+        elif target_queue:
+            sender_context = self.client.get_queue_sender(queue_name=target_queue)
+        else:
+            error_msg = "No topic or queue configured for publishing"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        with sender_context as sender:
+            batch = sender.create_message_batch()
+            positions: list[int] = []
+            for index, event in enumerate(events):
+                message = self._build_message(exchange, routing_key, event)
+                try:
+                    batch.add_message(message)
+                except MessageSizeExceededError as e:
+                    if not positions:
+                        logger.error(f"Event {event.get('event_type')} exceeds the maximum batch size: {e}")
+                        result.errors[index] = e
+                        continue
+                    # Batch is full: send it and start a new one with this message
+                    self._send_batch(sender, batch, positions, result)
+                    batch = sender.create_message_batch()
+                    positions = []
+                    try:
+                        batch.add_message(message)
+                    except MessageSizeExceededError as size_error:
+                        logger.error(f"Event {event.get('event_type')} exceeds the maximum batch size: {size_error}")
+                        result.errors[index] = size_error
+                        continue
+                positions.append(index)
+            if positions:
+                self._send_batch(sender, batch, positions, result)
+
+        logger.info(
+            f"Published {result.published}/{len(events)} events to {target_topic or target_queue} "
+            f"({len(result.errors)} failed)"
+        )
+        return result
+
+    def _send_batch(self, sender: Any, batch: Any, positions: list[int], result: PublishBatchResult) -> None:
+        """Send one message batch, retrying transient errors, and record the outcome.
+
+        Args:
+            sender: Open ServiceBusSender
+            batch: ServiceBusMessageBatch to send
+            positions: Input positions of the events in the batch
+            result: Batch result to update
+        """
+        attempt = 0
+        while True:
+            try:
+                sender.send_messages(batch)
+                result.published += len(positions)
+                return
+            except Exception as e:
+                if self._is_transient_error(e) and attempt < self.retry_attempts:
+                    backoff = self.retry_backoff_seconds * (2 ** attempt)
+                    logger.warning(
+                        f"Transient error sending batch of {len(positions)} events: {e}. "
+                        f"Retrying in {backoff:.1f}s (attempt {attempt + 1}/{self.retry_attempts})"
+                    )
+                    time.sleep(backoff)
+                    attempt += 1
+                    continue
+                logger.error(f"Failed to send batch of {len(positions)} events: {e}")
+                for index in positions:
+                    result.errors[index] = e
+                return
+
+    def _build_message(self, exchange: str, routing_key: str, event: dict[str, Any]) -> Any:
+        """Build the ServiceBusMessage for an event.
+
+        Args:
+            exchange: Exchange name, recorded in the application properties
+            routing_key: Routing key, used as the message subject
+            event: Event data as dictionary
+
+        Returns:
+            ServiceBusMessage with a JSON body
+        """
         message = ServiceBusMessage(
-            body=message_body,
+            body=json.dumps(event),
             content_type="application/json",
             subject=routing_key,  # Use subject for message filtering in subscriptions
         )
@@ -330,6 +461,30 @@ class AzureServiceBusPublisher(EventPublisher):
             "routing_key": routing_key,
             "exchange": exchange,
         }
+        return message
+
+    def _send(
+        self,
+        exchange: str,
+        routing_key: str,
+        event: dict[str, Any],
+        scheduled_enqueue_time: datetime | None = None,
+    ) -> None:
+        """Send one event, retrying transient errors; see publish() for routing."""
+        if ServiceBusClient is None or ServiceBusMessage is None:
+            error_msg = "azure-servicebus library is not installed"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        if not self.client:
+            error_msg = "Not connected to Azure Service Bus"
+            logger.error(error_msg)
+            raise ConnectionError(error_msg)
+
+        # Create message outside retry loop for efficiency
+        message = self._build_message(exchange, routing_key, event)
+        if scheduled_enqueue_time is not None:
+            message.scheduled_enqueue_time_utc = scheduled_enqueue_time
 
         # Determine target: topic or queue
         target_topic, target_queue = self._determine_publish_target(exchange, routing_key)
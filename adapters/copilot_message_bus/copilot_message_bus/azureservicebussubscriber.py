@@ -22,15 +22,23 @@ except ImportError:
     DefaultAzureCredential = None  # type: ignore
 
 from .base import EventSubscriber
+from .batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, EventBatcher
 
 logger = logging.getLogger(__name__)
 
+# Shortest receive wait while a batch is pending (the SDK rejects a wait of 0)
+_MIN_BATCH_RECEIVE_WAIT = 0.05
+
 
 class AzureServiceBusSubscriber(EventSubscriber):
     """Azure Service Bus implementation of EventSubscriber.
 
     Subscribes to events from Azure Service Bus queues or topic subscriptions
     and dispatches them to registered callbacks based on event type.
+
+    Event types subscribed with ``subscribe_batch`` are collected across
+    receive calls and completed, or abandoned for redelivery, together once
+    their batch callback has run.
     """
 
     def __init__(
@@ -76,6 +84,7 @@ class AzureServiceBusSubscriber(EventSubscriber):
         self.client: Any = None  # ServiceBusClient after connect()
         self._credential: Any = None  # DefaultAzureCredential if using managed identity
         self.callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
+        self._batchers: dict[str, EventBatcher] = {}
         self._consuming = threading.Event()  # Thread-safe flag for consumption control
         self._last_error_log_time: float = 0  # Rate limiting for error logs
         self._error_log_interval: float = 60.0  # Log errors at most once per minute
@@ -210,6 +219,45 @@ class AzureServiceBusSubscriber(EventSubscriber):
 
         logger.info(f"Registered callback for event type: {event_type}")
 
+    def subscribe_batch(
+        self,
+        event_type: str,
+        batch_callback: Callable[[list[dict[str, Any]]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        routing_key: str | None = None,
+        exchange: str | None = None,
+        event_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Subscribe to events of a specific type, delivered in micro-batches.
+
+        In peek-lock mode the messages of a pending batch stay locked (and are
+        registered with the auto-lock renewer) until the batch is processed.
+        Pending messages are abandoned when the receiver closes.
+
+        Messages whose event the filter rejects are dead-lettered on their own.
+
+        Args:
+            event_type: Type of event to subscribe to
+            batch_callback: Function to call with each batch of events
+            max_batch_size: Maximum number of events per batch
+            max_wait_ms: Maximum time in milliseconds an event waits for its batch to fill
+            routing_key: Not used for Azure Service Bus (kept for interface compatibility)
+            exchange: Not used for Azure Service Bus (kept for interface compatibility)
+            event_filter: Optional check run on each event before it is batched
+        """
+        batcher = EventBatcher(
+            batch_callback, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, event_filter=event_filter
+        )
+
+        def callback(event: dict[str, Any]) -> None:
+            if batcher.accepts(event):
+                batch_callback([event])
+
+        self.subscribe(event_type, callback, routing_key=routing_key, exchange=exchange)
+        self._batchers[event_type] = batcher
+        logger.info(f"Batching {event_type} events (max {max_batch_size} events or {max_wait_ms}ms)")
+
     def start_consuming(self) -> None:
         """Start consuming events from the queue or subscription.
 
@@ -333,6 +381,8 @@ class AzureServiceBusSubscriber(EventSubscriber):
     def _consume_with_receiver(self) -> None:
         """Consume messages with a receiver instance."""
         renewer: Any | None = None
+        # Messages of unfinished batches from a previous receiver can no longer be settled
+        self._discard_pending_batches()
 
         try:
             # ServiceBusReceiveMode is checked in start_consuming() before calling this method
@@ -371,9 +421,17 @@ class AzureServiceBusSubscriber(EventSubscriber):
                         # In peek-lock mode, avoid locking a batch that might expire
                         # before it can be processed.
                         max_message_count = 10 if self.auto_complete else 1
+                        max_wait_time: float = self.max_wait_time
+                        if self._batchers:
+                            # Batched events are settled together, so receive up to a full batch
+                            # and wake up in time to flush a batch that is waiting to fill
+                            max_message_count = max(
+                                max_message_count, *(batcher.max_batch_size for batcher in self._batchers.values())
+                            )
+                            max_wait_time = self._batch_receive_wait()
                         messages = receiver.receive_messages(
                             max_message_count=max_message_count,
-                            max_wait_time=self.max_wait_time,
+                            max_wait_time=max_wait_time,
                         )
 
                         for msg in messages:
@@ -392,7 +450,8 @@ class AzureServiceBusSubscriber(EventSubscriber):
                                     logger.warning(f"Failed to register auto-lock renewer: {e}")
 
                             try:
-                                self._process_message(msg, receiver)
+                                if not self._add_to_batch(msg, receiver):
+                                    self._process_message(msg, receiver)
                             except AttributeError as e:
                                 # Known azure-servicebus SDK bug: receiver._handler can become None
                                 # This is a race condition where the handler is closed during message processing
@@ -420,6 +479,8 @@ class AzureServiceBusSubscriber(EventSubscriber):
                                     except Exception as abandon_error:
                                         logger.error(f"Error abandoning message: {abandon_error}")
 
+                        self._flush_due_batches(receiver)
+
                     except AttributeError as e:
                         # Known azure-servicebus SDK bug: receiver._handler can become None
                         if self._consuming.is_set():
@@ -446,6 +507,9 @@ class AzureServiceBusSubscriber(EventSubscriber):
                             self._log_rate_limited(f"Error receiving messages: {e}", level="error")
                         # Continue processing unless explicitly stopped
 
+                # Stopped: release the messages of unfinished batches for redelivery
+                self._abandon_pending_batches(receiver)
+
         finally:
             try:
                 if renewer is not None:
@@ -486,6 +550,107 @@ class AzureServiceBusSubscriber(EventSubscriber):
             # Log at debug level to avoid spam while still capturing for debugging
             logger.debug(f"[Rate-limited] {message}")
 
+    def _batch_receive_wait(self) -> float:
+        """Return how long a receive call may wait without delaying a pending batch."""
+        wait = float(self.max_wait_time)
+        for batcher in self._batchers.values():
+            remaining = batcher.seconds_until_due()
+            if remaining is not None:
+                wait = min(wait, remaining)
+        return max(wait, _MIN_BATCH_RECEIVE_WAIT)
+
+    def _add_to_batch(self, msg: Any, receiver: Any) -> bool:
+        """Add a message to its event type's batch, flushing the batch when it is full.
+
+        Args:
+            msg: ServiceBusReceivedMessage object
+            receiver: ServiceBusReceiver object
+
+        Returns:
+            False if the message is not batched and must be processed on its own
+            (including malformed messages, which _process_message() settles)
+        """
+        if not self._batchers:
+            return False
+        try:
+            body_bytes = b"".join(section for section in msg.body)
+            event = json.loads(body_bytes.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return False
+        if not isinstance(event, dict) or event.get("event_type") not in self._batchers:
+            return False
+
+        batcher = self._batchers[event["event_type"]]
+        if not batcher.accepts(event):
+            self._dead_letter_rejected(msg, receiver, event)
+            return True
+        if batcher.add(event, msg):
+            self._flush_batch(batcher, receiver)
+        return True
+
+    def _dead_letter_rejected(self, msg: Any, receiver: Any, event: dict[str, Any]) -> None:
+        """Dead-letter a message whose event the batch's event filter rejected."""
+        logger.warning(f"Rejected {event['event_type']} event {event.get('event_id')} before batching")
+        if self.auto_complete:
+            return
+        try:
+            receiver.dead_letter_message(msg, reason="EventRejected", error_description="Rejected by event filter")
+        except Exception as e:
+            logger.error(f"Error dead-lettering rejected message: {e}")
+
+    def _flush_due_batches(self, receiver: Any) -> None:
+        """Process every batch that is full or has waited long enough."""
+        for batcher in self._batchers.values():
+            if batcher.is_due():
+                self._flush_batch(batcher, receiver)
+
+    def _flush_batch(self, batcher: EventBatcher, receiver: Any) -> None:
+        """Process a pending batch, then complete all of its messages or abandon all of them.
+
+        Args:
+            batcher: Batcher holding the pending batch
+            receiver: ServiceBusReceiver the messages were received on
+        """
+        events, messages = batcher.take()
+        if not events:
+            return
+        succeeded = batcher.process(events)
+        if self.auto_complete:
+            return
+        for msg in messages:
+            try:
+                if succeeded:
+                    receiver.complete_message(msg)
+                else:
+                    receiver.abandon_message(msg)
+            except AttributeError as e:
+                # The lock expires and the message is redelivered
+                logger.error(f"Cannot settle batched message - receiver AttributeError: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Error settling batched message: {e}")
+
+    def _abandon_pending_batches(self, receiver: Any) -> None:
+        """Abandon the messages of unfinished batches so they are redelivered."""
+        for event_type, batcher in self._batchers.items():
+            _, messages = batcher.take()
+            if not messages:
+                continue
+            logger.info(f"Abandoning {len(messages)} pending {event_type} messages")
+            if self.auto_complete:
+                continue
+            for msg in messages:
+                try:
+                    receiver.abandon_message(msg)
+                except Exception as e:
+                    logger.error(f"Error abandoning message: {e}")
+
+    def _discard_pending_batches(self) -> None:
+        """Forget unfinished batches received on a previous receiver; their locks expire."""
+        for event_type, batcher in self._batchers.items():
+            events, _ = batcher.take()
+            if events:
+                logger.info(f"Discarded {len(events)} pending {event_type} messages from a closed receiver")
+
     def _process_message(self, msg: Any, receiver: Any) -> None:
         """Process a received message.
 
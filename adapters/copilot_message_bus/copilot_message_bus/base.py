@@ -5,8 +5,27 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
+from .batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+
+
+@dataclass
+class PublishBatchResult:
+    """Per-event outcome of a batch publish.
+
+    A failure on one event does not stop the remaining events from being
+    published. Callers inspect ``errors`` to decide which events to retry.
+
+    Attributes:
+        published: Number of events accepted by the message bus
+        errors: Exceptions for the events that failed, keyed by input position
+    """
+
+    published: int = 0
+    errors: dict[int, Exception] = field(default_factory=dict)
+
 
 class EventPublisher(ABC):
     """Abstract base class for event publishers."""
@@ -25,6 +44,51 @@ class EventPublisher(ABC):
         """
         pass
 
+    def publish_batch(self, exchange: str, routing_key: str, events: list[dict[str, Any]]) -> PublishBatchResult:
+        """Publish several events with the same exchange and routing key.
+
+        The default implementation calls publish() for each event. Backends
+        override it to amortize broker round-trips across the batch.
+
+        Args:
+            exchange: Exchange name (e.g., "copilot.events")
+            routing_key: Routing key (e.g., "json.parsed")
+            events: Event data dictionaries, published in order
+
+        Returns:
+            PublishBatchResult with the per-event failures
+
+        Raises:
+            Exception: If the batch cannot be attempted at all (e.g., not connected)
+        """
+        result = PublishBatchResult()
+        for index, event in enumerate(events):
+            try:
+                self.publish(exchange, routing_key, event)
+                result.published += 1
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
+    def publish_delayed(self, exchange: str, routing_key: str, event: dict[str, Any], delay_ms: int) -> None:
+        """Publish an event that consumers receive only after a delay.
+
+        Used for non-blocking retries: the consumer republishes the event and
+        acknowledges the original delivery instead of sleeping. Implementations
+        may round the delay up to a supported granularity.
+
+        Args:
+            exchange: Exchange name (e.g., "copilot.events")
+            routing_key: Routing key (e.g., "chunks.prepared")
+            event: Event data as dictionary
+            delay_ms: Minimum delay before delivery in milliseconds
+
+        Raises:
+            NotImplementedError: If the publisher does not support delayed delivery
+            Exception: If publishing fails for any reason
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support delayed publishing")
+
     @abstractmethod
     def connect(self) -> None:
         """Connect to the message bus.
@@ -81,6 +145,48 @@ class EventSubscriber(ABC):
         """
         pass
 
+    def subscribe_batch(
+        self,
+        event_type: str,
+        batch_callback: Callable[[list[dict[str, Any]]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        routing_key: str | None = None,
+        exchange: str | None = None,
+        event_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Subscribe to events of a specific type, delivered in micro-batches.
+
+        Events are accumulated until max_batch_size events have arrived or the
+        oldest has waited max_wait_ms, then passed to batch_callback together.
+        All deliveries of a batch are acknowledged if the callback returns and
+        negatively acknowledged (for redelivery) if it raises.
+
+        Events rejected by event_filter never enter a batch. Their deliveries
+        are settled one by one without redelivery (dead-lettered where the
+        backend supports it), leaving the rest of the batch unaffected.
+
+        The default implementation delivers every event as a batch of one.
+        Backends override it to coalesce deliveries.
+
+        Args:
+            event_type: Type of event to subscribe to (e.g., "JSONParsed")
+            batch_callback: Function to call with each batch of events
+            max_batch_size: Maximum number of events per batch
+            max_wait_ms: Maximum time in milliseconds an event waits for its batch to fill
+            routing_key: Optional routing key pattern for filtering events
+            exchange: Optional exchange name (for subscribers that support it)
+            event_filter: Optional check run on each event before it is batched
+        """
+        del max_batch_size, max_wait_ms
+
+        def callback(event: dict[str, Any]) -> None:
+            if event_filter is not None and not event_filter(event):
+                return
+            batch_callback([event])
+
+        self.subscribe(event_type, callback, routing_key=routing_key, exchange=exchange)
+
     @abstractmethod
     def start_consuming(self) -> None:
         """Start consuming events.
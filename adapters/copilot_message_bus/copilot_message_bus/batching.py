@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Micro-batching of received events.
+
+Subscribers that support EventSubscriber.subscribe_batch() keep one
+EventBatcher per batched event type. Deliveries are added as they arrive and
+the batch is handed to the batch callback once it holds ``max_batch_size``
+events or its oldest event has waited ``max_wait_ms``. The subscriber then
+acknowledges every delivery of the batch if the callback returned, or
+negatively acknowledges all of them if it raised.
+
+An optional event filter screens each delivery before it joins a batch.
+Deliveries it rejects are settled on their own (dead-lettered or discarded)
+so that one bad event never fails, and redelivers, the events batched with it.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT_MS = 250
+
+
+class EventBatcher:
+    """Accumulates events of one type into batches.
+
+    Each event is stored with an opaque delivery handle (e.g., a RabbitMQ
+    delivery tag or an Azure Service Bus message) that the subscriber uses to
+    settle it once the batch has been processed. Not thread-safe: a
+    subscriber adds and takes batches from a single thread.
+    """
+
+    def __init__(
+        self,
+        batch_callback: Callable[[list[dict[str, Any]]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        event_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            batch_callback: Function called with the events of each batch
+            max_batch_size: Number of events that completes a batch
+            max_wait_ms: Milliseconds the oldest event may wait for the batch to fill
+            event_filter: Optional check run on each event before it is batched;
+                events it rejects are settled on their own and never batched
+
+        Raises:
+            ValueError: For invalid batch limits
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}")
+
+        self.batch_callback = batch_callback
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.event_filter = event_filter
+        self._events: list[dict[str, Any]] = []
+        self._deliveries: list[Any] = []
+        self._started_at = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of pending events."""
+        return len(self._events)
+
+    def add(self, event: dict[str, Any], delivery: Any) -> bool:
+        """Add an event to the pending batch.
+
+        Args:
+            event: Decoded event
+            delivery: Handle used to settle the delivery later
+
+        Returns:
+            True if the batch is now full
+        """
+        if not self._events:
+            self._started_at = time.monotonic()
+        self._events.append(event)
+        self._deliveries.append(delivery)
+        return len(self._events) >= self.max_batch_size
+
+    def accepts(self, event: dict[str, Any]) -> bool:
+        """Check whether an event may join a batch.
+
+        Args:
+            event: Decoded event
+
+        Returns:
+            True if there is no event filter or the filter admits the event;
+            False if the filter rejects it or raises
+        """
+        if self.event_filter is None:
+            return True
+        try:
+            return bool(self.event_filter(event))
+        except Exception as e:
+            logger.error(f"Error in event filter for {event.get('event_type')} event: {e}")
+            return False
+
+    def seconds_until_due(self) -> float | None:
+        """Return how long the pending batch may still wait, or None if there is none."""
+        if not self._events:
+            return None
+        if len(self._events) >= self.max_batch_size:
+            return 0.0
+        return max(0.0, self._started_at + self.max_wait_ms / 1000 - time.monotonic())
+
+    def is_due(self) -> bool:
+        """Check whether the pending batch is full or has waited long enough."""
+        return self.seconds_until_due() == 0.0
+
+    def take(self) -> tuple[list[dict[str, Any]], list[Any]]:
+        """Remove and return the pending batch.
+
+        Returns:
+            Tuple of (events, delivery handles), in arrival order
+        """
+        events, deliveries = self._events, self._deliveries
+        self._events, self._deliveries = [], []
+        return events, deliveries
+
+    def process(self, events: list[dict[str, Any]]) -> bool:
+        """Run the batch callback.
+
+        Args:
+            events: Events of one batch
+
+        Returns:
+            True if the callback succeeded (ack all), False if it raised (nack all)
+        """
+        event_type = events[0].get("event_type") if events else None
+        try:
+            self.batch_callback(events)
+            logger.debug(f"Processed batch of {len(events)} {event_type} events")
+            return True
+        except Exception as e:
+            logger.error(f"Error in batch callback for {len(events)} {event_type} events: {e}")
+            return False
@@ -3,23 +3,33 @@
 
 """No-op event publisher for testing."""
 
+import heapq
+import itertools
 import logging
+import time
 from typing import Any
 
 from copilot_config.generated.adapters.message_bus import DriverConfig_MessageBus_Noop
 
-from .base import EventPublisher
+from .base import EventPublisher, PublishBatchResult
 
 logger = logging.getLogger(__name__)
 
 
 class NoopPublisher(EventPublisher):
-    """No-op publisher for testing that stores events in memory."""
+    """No-op publisher for testing that stores events in memory.
+
+    Delayed events are held in a timer heap and move to published_events
+    once release_due_events() is called at or after their due time.
+    """
 
     def __init__(self) -> None:
         """Initialize no-op publisher."""
         self.published_events: list[dict[str, Any]] = []
         self.connected = False
+        # (due_time, sequence, record); the sequence keeps equal due times in publish order
+        self._scheduled: list[tuple[float, int, dict[str, Any]]] = []
+        self._sequence = itertools.count()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_MessageBus_Noop) -> "NoopPublisher":
@@ -61,9 +71,65 @@ class NoopPublisher(EventPublisher):
         )
         logger.debug(f"NoopPublisher: published {event.get('event_type')} to {exchange}/{routing_key}")
 
+    def publish_batch(self, exchange: str, routing_key: str, events: list[dict[str, Any]]) -> PublishBatchResult:
+        """Store several events without publishing to a real message bus.
+
+        Args:
+            exchange: Exchange name
+            routing_key: Routing key
+            events: Event data dictionaries
+
+        Returns:
+            PublishBatchResult counting every event as published
+        """
+        for event in events:
+            self.published_events.append({"exchange": exchange, "routing_key": routing_key, "event": event})
+        logger.debug(f"NoopPublisher: published batch of {len(events)} events to {exchange}/{routing_key}")
+        return PublishBatchResult(published=len(events))
+
+    def publish_delayed(self, exchange: str, routing_key: str, event: dict[str, Any], delay_ms: int) -> None:
+        """Hold an event until its delay has elapsed.
+
+        Args:
+            exchange: Exchange name
+            routing_key: Routing key
+            event: Event data as dictionary
+            delay_ms: Delay before the event counts as published, in milliseconds
+        """
+        due_time = time.monotonic() + max(delay_ms, 0) / 1000.0
+        record = {"exchange": exchange, "routing_key": routing_key, "event": event}
+        heapq.heappush(self._scheduled, (due_time, next(self._sequence), record))
+        logger.debug(f"NoopPublisher: scheduled {event.get('event_type')} to {exchange}/{routing_key} in {delay_ms}ms")
+
+    def release_due_events(self, now: float | None = None) -> int:
+        """Move delayed events whose due time has passed to published_events.
+
+        Args:
+            now: time.monotonic() value to release against (defaults to the current time)
+
+        Returns:
+            Number of events released
+        """
+        now = time.monotonic() if now is None else now
+        released = 0
+        while self._scheduled and self._scheduled[0][0] <= now:
+            _, _, record = heapq.heappop(self._scheduled)
+            self.published_events.append(record)
+            released += 1
+        return released
+
+    def get_scheduled_events(self) -> list[dict[str, Any]]:
+        """Get delayed events that have not been released yet, in due order.
+
+        Returns:
+            List of scheduled events
+        """
+        return [record for _, _, record in sorted(self._scheduled)]
+
     def clear_events(self) -> None:
         """Clear all stored events (useful for testing)."""
         self.published_events.clear()
+        self._scheduled.clear()
 
     def get_events(self, event_type: str | None = None) -> list[dict[str, Any]]:
         """Get stored events, optionally filtered by event type.
@@ -5,25 +5,49 @@
 
 import json
 import logging
+import threading
 import time
 from typing import Any
 
 from copilot_config.generated.adapters.message_bus import DriverConfig_MessageBus_Rabbitmq
 
-from .base import EventPublisher
+from .base import EventPublisher, PublishBatchResult
 
 try:
     import pika
+    from pika.adapters.blocking_connection import ReturnedMessage
 except ImportError:
     pika = None
+    ReturnedMessage = None
 
 pika_exceptions: Any = getattr(pika, "exceptions", None)
 
 logger = logging.getLogger(__name__)
 
+# Events per transaction in publish_batch()
+DEFAULT_MAX_BATCH_SIZE = 500
+
+# Delays supported by publish_delayed(); requested delays are rounded up to the next tier
+DEFAULT_DELAY_TIERS_MS = (1000, 5000, 15000, 60000, 300000)
+
 
 class RabbitMQPublisher(EventPublisher):
-    """RabbitMQ-based event publisher with persistent messages."""
+    """RabbitMQ-based event publisher with persistent messages.
+
+    Publishing is serialized with a lock, so one publisher can be shared by
+    the worker threads of a multi-worker subscriber.
+
+    Delayed publishing uses one TTL queue per delay tier. Each tier has a
+    fanout exchange "<exchange>.delay.<ms>" bound to a queue of the same name
+    whose messages expire after <ms> and are dead-lettered back to <exchange>
+    with their original routing key. All messages in a tier queue share one
+    TTL, so they expire in order and never wait behind a longer delay.
+
+    Batch publishing uses a second channel in transaction mode. Blocking
+    channels wait for each publisher confirm inside basic_publish(), so
+    confirms cannot be pipelined; a transaction instead commits a whole chunk
+    of messages with one broker round-trip and the same durability guarantee.
+    """
 
     def __init__(
         self,
@@ -38,6 +62,8 @@ class RabbitMQPublisher(EventPublisher):
         reconnect_delay: float = 2.0,
         heartbeat: int = 300,
         blocked_connection_timeout: int = 600,
+        delay_tiers_ms: tuple[int, ...] = DEFAULT_DELAY_TIERS_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
     ):
         """Initialize RabbitMQ publisher.
 
@@ -57,10 +83,17 @@ class RabbitMQPublisher(EventPublisher):
             blocked_connection_timeout: Timeout in seconds for blocked connections due to
                                        TCP backpressure (default: 600). Should be at least
                                        2x the heartbeat interval.
+            delay_tiers_ms: Delays in milliseconds available to publish_delayed()
+            max_batch_size: Maximum events committed per transaction in publish_batch()
 
         Raises:
             ValueError: For invalid initialization parameters
         """
+        if not delay_tiers_ms or any(tier <= 0 for tier in delay_tiers_ms):
+            raise ValueError("delay_tiers_ms must contain at least one positive delay")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
         self.host = host
         self.port = port
         self.username = username
@@ -72,11 +105,18 @@ class RabbitMQPublisher(EventPublisher):
         self.reconnect_delay = reconnect_delay
         self.heartbeat = heartbeat
         self.blocked_connection_timeout = blocked_connection_timeout
+        self.delay_tiers_ms = tuple(sorted(set(delay_tiers_ms)))
+        self.max_batch_size = max_batch_size
         self.connection: Any = None  # pika.BlockingConnection after connect()
         self.channel: Any = None  # pika.channel.Channel after connect()
+        self._batch_channel: Any = None  # Transactional channel, opened on first publish_batch()
+        self._batch_returns: dict[int, Exception] = {}
         self._declared_queues: set[str] = set()
+        self._declared_delay_exchanges: set[str] = set()
         self._last_reconnect_time = 0.0
         self._reconnect_count = 0
+        # pika connections are not thread-safe; guards the connection and channel
+        self._lock = threading.RLock()
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_MessageBus_Rabbitmq) -> "RabbitMQPublisher":
@@ -142,6 +182,8 @@ class RabbitMQPublisher(EventPublisher):
         )
         self.connection = pika.BlockingConnection(parameters)
         self.channel = self.connection.channel()
+        self._batch_channel = None
+        self._declared_delay_exchanges.clear()
 
         # Enable publisher confirms for guaranteed delivery
         if self.enable_publisher_confirms:
@@ -352,6 +394,175 @@ class RabbitMQPublisher(EventPublisher):
             pika.exceptions.NackError: If message is rejected by broker
             Exception: For other publishing failures
         """
+        with self._lock:
+            self._publish(exchange, routing_key, event)
+
+    def publish_batch(self, exchange: str, routing_key: str, events: list[dict[str, Any]]) -> PublishBatchResult:
+        """Publish several events, committing up to max_batch_size per transaction.
+
+        Messages are persistent and mandatory as in publish(). Unroutable
+        messages are reported individually; if a commit fails, every event in
+        that chunk is reported as failed and the next chunk is attempted on a
+        fresh channel.
+
+        Args:
+            exchange: Exchange name
+            routing_key: Routing key
+            events: Event data dictionaries, published in order
+
+        Returns:
+            PublishBatchResult with the per-event failures
+
+        Raises:
+            ConnectionError: If not connected and reconnection fails
+            RuntimeError: If pika library is not installed
+        """
+        result = PublishBatchResult()
+        if not events:
+            return result
+
+        with self._lock:
+            if pika is None:
+                error_msg = "pika library is not installed"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            if not self._is_connected() and not self._reconnect():
+                error_msg = "Not connected to RabbitMQ and reconnection failed"
+                logger.error(error_msg)
+                raise ConnectionError(error_msg)
+
+            for start in range(0, len(events), self.max_batch_size):
+                chunk = events[start : start + self.max_batch_size]
+                try:
+                    self._publish_chunk(exchange, routing_key, chunk, start)
+                except Exception as e:
+                    logger.error(f"Failed to commit {len(chunk)} events to {exchange}/{routing_key}: {e}")
+                    for index in range(start, start + len(chunk)):
+                        result.errors[index] = e
+                    self._close_batch_channel()
+                    if not self._is_connected():
+                        self._reconnect()
+                    continue
+                for index, error in self._batch_returns.items():
+                    result.errors[index] = error
+                result.published += len(chunk) - len(self._batch_returns)
+
+        logger.info(
+            f"Published {result.published}/{len(events)} events to {exchange}/{routing_key} "
+            f"({len(result.errors)} failed)"
+        )
+        return result
+
+    def _publish_chunk(self, exchange: str, routing_key: str, chunk: list[dict[str, Any]], start: int) -> None:
+        """Publish one chunk in a transaction; the caller must hold self._lock.
+
+        Returned (unroutable) messages are collected in self._batch_returns,
+        keyed by batch position.
+        """
+        channel = self._get_batch_channel()
+        self._batch_returns = {}
+        for offset, event in enumerate(chunk):
+            channel.basic_publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=json.dumps(event),
+                properties=pika.BasicProperties(
+                    delivery_mode=2,
+                    content_type="application/json",
+                    headers={"batch_index": start + offset},
+                ),
+                mandatory=True,
+            )
+        channel.tx_commit()
+        # Basic.Return frames arrive before Tx.CommitOk; dispatch them to _on_batch_return
+        self.connection.process_data_events(time_limit=0)
+
+    def _get_batch_channel(self) -> Any:
+        """Open the transactional batch channel if needed; the caller must hold self._lock."""
+        if self._batch_channel is None or not self._batch_channel.is_open:
+            channel = self.connection.channel()
+            channel.tx_select()
+            channel.add_on_return_callback(self._on_batch_return)
+            self._batch_channel = channel
+        return self._batch_channel
+
+    def _close_batch_channel(self) -> None:
+        """Discard the batch channel after a failure; the caller must hold self._lock."""
+        try:
+            if self._batch_channel is not None and self._batch_channel.is_open:
+                self._batch_channel.close()
+        except Exception as e:
+            logger.debug(f"Error closing batch channel: {e}")
+        self._batch_channel = None
+
+    def _on_batch_return(self, channel: Any, method: Any, properties: Any, body: bytes) -> None:
+        """Record an unroutable message returned by the broker during publish_batch()."""
+        del channel
+        index = (properties.headers or {}).get("batch_index")
+        if index is None:
+            return
+        logger.error(f"Message unroutable - no queue bound for {method.exchange}/{method.routing_key}")
+        self._batch_returns[index] = pika_exceptions.UnroutableError([ReturnedMessage(method, properties, body)])
+
+    def publish_delayed(self, exchange: str, routing_key: str, event: dict[str, Any], delay_ms: int) -> None:
+        """Publish an event that is routed to its queue after a delay.
+
+        The delay is rounded up to the nearest configured tier (delays above
+        the largest tier use the largest tier). The tier's exchange and TTL
+        queue are declared on first use.
+
+        Args:
+            exchange: Exchange the event is delivered to after the delay
+            routing_key: Routing key
+            event: Event data as dictionary
+            delay_ms: Minimum delay before delivery in milliseconds
+
+        Raises:
+            ConnectionError: If not connected and reconnection fails
+            RuntimeError: If pika library is not installed
+            Exception: For other publishing failures
+        """
+        if delay_ms <= 0:
+            self.publish(exchange, routing_key, event)
+            return
+
+        tier_ms = next((tier for tier in self.delay_tiers_ms if tier >= delay_ms), self.delay_tiers_ms[-1])
+        delay_exchange = f"{exchange}.delay.{tier_ms}"
+
+        with self._lock:
+            if pika is None:
+                error_msg = "pika library is not installed"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            if not self._is_connected() and not self._reconnect():
+                error_msg = "Not connected to RabbitMQ and reconnection failed"
+                logger.error(error_msg)
+                raise ConnectionError(error_msg)
+            if delay_exchange not in self._declared_delay_exchanges:
+                self._declare_delay_tier(delay_exchange, exchange, tier_ms)
+            self._publish(delay_exchange, routing_key, event)
+
+        logger.debug(f"Scheduled {event.get('event_type')} for {exchange}/{routing_key} in {tier_ms}ms")
+
+    def _declare_delay_tier(self, delay_exchange: str, target_exchange: str, tier_ms: int) -> None:
+        """Declare a delay tier's exchange and TTL queue; the caller must hold self._lock."""
+        self.channel.exchange_declare(exchange=delay_exchange, exchange_type="fanout", durable=True)
+        self.channel.queue_declare(
+            queue=delay_exchange,
+            durable=True,
+            auto_delete=False,
+            exclusive=False,
+            arguments={
+                "x-message-ttl": tier_ms,
+                "x-dead-letter-exchange": target_exchange,
+            },
+        )
+        self.channel.queue_bind(exchange=delay_exchange, queue=delay_exchange)
+        self._declared_delay_exchanges.add(delay_exchange)
+        logger.info(f"Declared delay tier '{delay_exchange}' ({tier_ms}ms) dead-lettering to {target_exchange}")
+
+    def _publish(self, exchange: str, routing_key: str, event: dict[str, Any]) -> None:
+        """Publish an event; the caller must hold self._lock."""
         if pika is None:
             error_msg = "pika library is not installed"
             logger.error(error_msg)
@@ -3,17 +3,23 @@
 
 """RabbitMQ event subscriber implementation."""
 
+import functools
 import json
 import logging
+import queue
 import random
 import re
+import threading
 import time
+import zlib
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from copilot_config.generated.adapters.message_bus import DriverConfig_MessageBus_Rabbitmq
 
 from .base import EventSubscriber
+from .batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, EventBatcher
 
 try:
     import pika
@@ -24,12 +30,48 @@ pika_exceptions: Any = getattr(pika, "exceptions", None)
 
 logger = logging.getLogger(__name__)
 
+# How a delivery is settled once its callback has run
+_ACK = "ack"
+_NACK_REQUEUE = "nack_requeue"
+_NACK_DISCARD = "nack_discard"
+
+# Seconds to wait for each worker thread to finish its current event on shutdown
+_WORKER_JOIN_TIMEOUT = 30.0
+
+
+@dataclass
+class _BatchJob:
+    """A completed micro-batch queued for a worker thread."""
+
+    connection: Any
+    batcher: EventBatcher
+    events: list[dict[str, Any]]
+    deliveries: list[tuple[Any, int]]  # (channel, delivery_tag)
+
 
 class RabbitMQSubscriber(EventSubscriber):
     """RabbitMQ implementation of EventSubscriber.
 
     Subscribes to events from a RabbitMQ exchange and dispatches them
     to registered callbacks based on event type.
+
+    By default callbacks run one at a time on the pika I/O thread and the
+    channel keeps the broker's prefetch setting. With ``worker_count > 1``
+    deliveries are handed to a pool of worker threads and the channel
+    prefetch is set to ``worker_count * prefetch_multiplier`` so every worker
+    has work queued. With ``auto_ack`` the prefetch does not limit delivery,
+    so each worker's queue holds at most ``prefetch_multiplier`` items and the
+    I/O thread waits for room, pushing back on the broker instead of
+    buffering a backlog in memory. Acks and nacks are marshalled back to
+    the I/O thread with ``connection.add_callback_threadsafe``. Events whose
+    routing key is listed in ``ordered_routing_keys`` are always handled by
+    the same worker, preserving their delivery order; other events go to the
+    least busy worker. Callbacks must be thread-safe in worker-pool mode.
+
+    Event types subscribed with ``subscribe_batch`` are accumulated on the
+    I/O thread and each completed batch is handled like a single delivery
+    (inline or by one worker), then all of its deliveries are acked, or all
+    nacked for redelivery, together.
     """
 
     def __init__(
@@ -48,6 +90,9 @@ class RabbitMQSubscriber(EventSubscriber):
         max_reconnect_attempts: int = 10,
         reconnect_delay: float = 2.0,
         max_reconnect_delay: float = 60.0,
+        worker_count: int = 1,
+        prefetch_multiplier: int = 2,
+        ordered_routing_keys: list[str] | None = None,
     ):
         """Initialize RabbitMQ subscriber.
 
@@ -70,10 +115,22 @@ class RabbitMQSubscriber(EventSubscriber):
             max_reconnect_attempts: Maximum number of reconnection attempts per cycle
             reconnect_delay: Base delay between reconnection attempts in seconds
             max_reconnect_delay: Maximum delay between reconnection attempts (default: 60.0)
+            worker_count: Number of threads handling events (default: 1, handle events
+                          on the I/O thread)
+            prefetch_multiplier: Unacknowledged deliveries per worker; with more than
+                                 one worker the channel prefetch count is
+                                 worker_count * prefetch_multiplier
+            ordered_routing_keys: Routing keys whose events must be handled in delivery
+                                  order (pinned to a single worker)
 
         Raises:
             ValueError: For invalid initialization parameters
         """
+        if worker_count < 1:
+            raise ValueError(f"worker_count must be at least 1, got {worker_count}")
+        if prefetch_multiplier < 1:
+            raise ValueError(f"prefetch_multiplier must be at least 1, got {prefetch_multiplier}")
+
         self.host = host
         self.port = port
         self.username = username
@@ -88,6 +145,9 @@ class RabbitMQSubscriber(EventSubscriber):
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.max_reconnect_delay = max_reconnect_delay
+        self.worker_count = worker_count
+        self.prefetch_multiplier = prefetch_multiplier
+        self.ordered_routing_keys = set(ordered_routing_keys or [])
 
         self.connection: Any = None  # pika.BlockingConnection after connect()
         self.channel: Any = None  # pika.channel.Channel after connect()
@@ -100,6 +160,10 @@ class RabbitMQSubscriber(EventSubscriber):
         self._consumer_tag: str | None = None
         self._consume_channel_id: int | None = None
         self._is_exclusive_queue = False  # Track if queue is exclusive (for reconnection)
+        self._worker_queues: list[queue.Queue] = []
+        self._workers: list[threading.Thread] = []
+        self._batchers: dict[str, EventBatcher] = {}
+        self._batch_timers: dict[str, Any] = {}  # event_type -> pending flush timer id
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_MessageBus_Rabbitmq) -> "RabbitMQSubscriber":
@@ -118,6 +182,9 @@ class RabbitMQSubscriber(EventSubscriber):
                           - auto_ack: Auto-ack messages (optional)
                           - heartbeat: Heartbeat interval (optional)
                           - blocked_connection_timeout: Blocked connection timeout (optional)
+                          - worker_count: Event handler threads (optional)
+                          - prefetch_multiplier: Prefetch per worker (optional)
+                          - ordered_routing_keys: Comma-separated ordered routing keys (optional)
 
         Returns:
             RabbitMQSubscriber instance
@@ -137,6 +204,9 @@ class RabbitMQSubscriber(EventSubscriber):
         auto_ack = driver_config.auto_ack
         heartbeat = driver_config.heartbeat
         blocked_connection_timeout = driver_config.blocked_connection_timeout
+        ordered_routing_keys = [
+            key.strip() for key in (driver_config.ordered_routing_keys or "").split(",") if key.strip()
+        ]
 
         return cls(
             host=host,
@@ -150,6 +220,9 @@ class RabbitMQSubscriber(EventSubscriber):
             auto_ack=auto_ack,
             heartbeat=heartbeat,
             blocked_connection_timeout=blocked_connection_timeout,
+            worker_count=driver_config.worker_count,
+            prefetch_multiplier=driver_config.prefetch_multiplier,
+            ordered_routing_keys=ordered_routing_keys,
         )
 
     def connect(self) -> None:
@@ -174,6 +247,8 @@ class RabbitMQSubscriber(EventSubscriber):
         self.connection = pika.BlockingConnection(parameters)
         self.channel = self.connection.channel()
 
+        self._apply_prefetch()
+
         # Declare exchange
         self.channel.exchange_declare(exchange=self.exchange_name, exchange_type=self.exchange_type, durable=True)
 
@@ -197,6 +272,26 @@ class RabbitMQSubscriber(EventSubscriber):
             f"exchange={self.exchange_name}, queue={self.queue_name}"
         )
 
+    def _apply_prefetch(self) -> None:
+        """Set the channel prefetch count in worker-pool mode.
+
+        Bounds unacknowledged deliveries so each worker has work queued without
+        this consumer hoarding messages other replicas could be processing. A
+        single-worker subscriber leaves the channel's prefetch unchanged.
+        """
+        if self.worker_count > 1:
+            self.channel.basic_qos(prefetch_count=self._prefetch_count())
+
+    def _prefetch_count(self) -> int:
+        """Return the channel prefetch count.
+
+        Each worker gets prefetch_multiplier deliveries, or room for a full
+        batch of every batched event type, since a batch cannot fill if the
+        broker stops delivering before it is complete.
+        """
+        batch_room = sum(batcher.max_batch_size for batcher in self._batchers.values())
+        return self.worker_count * max(self.prefetch_multiplier, batch_room)
+
     def disconnect(self) -> None:
         """Disconnect from RabbitMQ server."""
         try:
@@ -373,6 +468,47 @@ class RabbitMQSubscriber(EventSubscriber):
             f"Subscribed to {event_type} events on exchange {target_exchange} " f"with routing key: {routing_key}"
         )
 
+    def subscribe_batch(
+        self,
+        event_type: str,
+        batch_callback: Callable[[list[dict[str, Any]]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        routing_key: str | None = None,
+        exchange: str | None = None,
+        event_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Subscribe to events of a specific type, delivered in micro-batches.
+
+        Deliveries of an unfinished batch stay unacknowledged, so the broker
+        redelivers them if the consumer stops or the connection is lost. The
+        channel prefetch is raised to fit a full batch per worker.
+
+        Deliveries whose event the filter rejects are nacked without requeue,
+        so the broker dead-letters them if the queue has a dead-letter exchange.
+
+        Args:
+            event_type: Type of event to subscribe to
+            batch_callback: Function to call with each batch of events
+            max_batch_size: Maximum number of events per batch
+            max_wait_ms: Maximum time in milliseconds an event waits for its batch to fill
+            routing_key: Routing key pattern (defaults to event_type in snake_case)
+            exchange: Exchange to subscribe to (defaults to self.exchange_name)
+            event_filter: Optional check run on each event before it is batched
+        """
+        batcher = EventBatcher(
+            batch_callback, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, event_filter=event_filter
+        )
+
+        def callback(event: dict[str, Any]) -> None:
+            if batcher.accepts(event):
+                batch_callback([event])
+
+        self.subscribe(event_type, callback, routing_key=routing_key, exchange=exchange)
+        self._batchers[event_type] = batcher
+        self._apply_prefetch()
+        logger.info(f"Batching {event_type} events (max {max_batch_size} events or {max_wait_ms}ms)")
+
     def start_consuming(self) -> None:
         """Start consuming events from the queue with automatic reconnection.
 
@@ -387,7 +523,16 @@ class RabbitMQSubscriber(EventSubscriber):
             raise RuntimeError("Not connected. Call connect() first.")
 
         self._shutdown_requested = False
+        if self.worker_count > 1:
+            self._start_workers()
 
+        try:
+            self._consume_loop()
+        finally:
+            self._stop_workers()
+
+    def _consume_loop(self) -> None:
+        """Consume until shutdown, reconnecting after connection or channel failures."""
         while not self._shutdown_requested:
             if not self._is_connected():
                 logger.warning("Not connected, attempting to reconnect...")
@@ -408,6 +553,7 @@ class RabbitMQSubscriber(EventSubscriber):
             if self._consume_channel_id != channel_id:
                 self._consume_channel_id = channel_id
                 self._consumer_tag = None
+                self._discard_pending_batches()
 
             if self._consumer_tag is None:
                 self._consumer_tag = channel.basic_consume(
@@ -504,6 +650,9 @@ class RabbitMQSubscriber(EventSubscriber):
     def _on_message(self, channel: Any, method: Any, properties: Any, body: bytes) -> None:
         """Handle incoming message from RabbitMQ.
 
+        Runs the callback inline, or hands the delivery to a worker thread
+        when a worker pool is running.
+
         Args:
             channel: Channel object
             method: Method frame with delivery info
@@ -511,6 +660,27 @@ class RabbitMQSubscriber(EventSubscriber):
             body: Message body (bytes)
         """
         del properties
+        if self._batchers:
+            event = self._decode_batched_event(body)
+            if event is not None:
+                self._add_to_batch(channel, method, event)
+                return
+
+        if self._worker_queues:
+            self._dispatch_to_worker(channel, method, body)
+            return
+
+        self._settle(channel, method.delivery_tag, self._process_message(body))
+
+    def _process_message(self, body: bytes) -> str:
+        """Decode a message and run its registered callback.
+
+        Args:
+            body: Message body (bytes)
+
+        Returns:
+            How the delivery should be settled (_ACK, _NACK_REQUEUE or _NACK_DISCARD)
+        """
         try:
             # Decode and parse message
             message_str = body.decode("utf-8")
@@ -521,9 +691,7 @@ class RabbitMQSubscriber(EventSubscriber):
 
             if not event_type:
                 logger.warning("Received event without event_type field")
-                if not self.auto_ack:
-                    self._safe_ack(channel, method.delivery_tag)
-                return
+                return _ACK
 
             # Find and call registered callback
             callback = self.callbacks.get(event_type)
@@ -535,29 +703,238 @@ class RabbitMQSubscriber(EventSubscriber):
                 except Exception as e:
                     logger.error(f"Error in callback for {event_type}: {e}")
                     # Don't ack if callback fails (for retry)
-                    if not self.auto_ack:
-                        self._safe_nack(channel, method.delivery_tag, requeue=True)
-                    return
+                    return _NACK_REQUEUE
             else:
                 logger.debug(f"No callback registered for {event_type}")
 
-            # Acknowledge message if not auto-ack
-            if not self.auto_ack:
-                self._safe_ack(channel, method.delivery_tag)
+            return _ACK
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode event JSON: {e}")
             # Ack malformed messages so they don't block the queue
-            if not self.auto_ack:
-                self._safe_ack(channel, method.delivery_tag)
+            return _ACK
         except Exception as e:
             logger.error(f"Error processing message: {e}")
-            if not self.auto_ack:
-                self._safe_nack(
-                    channel,
-                    method.delivery_tag,
-                    requeue=False,  # Don't requeue unexpected errors
-                )
+            # Don't requeue unexpected errors
+            return _NACK_DISCARD
+
+    def _decode_batched_event(self, body: bytes) -> dict[str, Any] | None:
+        """Decode a message body if it carries an event type subscribed in batches.
+
+        Returns:
+            The decoded event, or None if the message is handled per event
+            (including malformed messages, which _process_message() settles)
+        """
+        try:
+            event = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        if isinstance(event, dict) and event.get("event_type") in self._batchers:
+            return event
+        return None
+
+    def _add_to_batch(self, channel: Any, method: Any, event: dict[str, Any]) -> None:
+        """Add a delivery to its event type's batch, flushing the batch when it is full.
+
+        Args:
+            channel: Channel the message was delivered on
+            method: Method frame with delivery info
+            event: Decoded event
+        """
+        event_type = event["event_type"]
+        routing_key = getattr(method, "routing_key", None)
+        batcher = self._batchers[event_type]
+        if not batcher.accepts(event):
+            logger.warning(f"Rejected {event_type} event {event.get('event_id')} before batching")
+            self._settle(channel, method.delivery_tag, _NACK_DISCARD)
+            return
+        if batcher.add(event, (channel, method.delivery_tag)):
+            self._flush_batch(event_type, routing_key)
+        elif len(batcher) == 1:
+            self._schedule_batch_flush(event_type, batcher.max_wait_ms / 1000, routing_key)
+
+    def _schedule_batch_flush(self, event_type: str, delay: float, routing_key: str | None) -> None:
+        """Flush an event type's batch on the I/O thread once it is due."""
+        connection = self.connection
+        if connection is None:
+            return
+        try:
+            self._batch_timers[event_type] = connection.call_later(
+                delay, functools.partial(self._flush_due_batch, event_type, routing_key)
+            )
+        except Exception as e:
+            logger.warning(f"Could not schedule flush of {event_type} batch: {e}")
+
+    def _flush_due_batch(self, event_type: str, routing_key: str | None) -> None:
+        """Timer callback: flush the batch if it has waited long enough."""
+        self._batch_timers.pop(event_type, None)
+        remaining = self._batchers[event_type].seconds_until_due()
+        if remaining is None:
+            return
+        if remaining > 0:
+            self._schedule_batch_flush(event_type, remaining, routing_key)
+            return
+        self._flush_batch(event_type, routing_key)
+
+    def _flush_batch(self, event_type: str, routing_key: str | None) -> None:
+        """Process the pending batch of an event type and settle all of its deliveries.
+
+        Args:
+            event_type: Batched event type
+            routing_key: Routing key of the batch's deliveries (selects the worker)
+        """
+        timer = self._batch_timers.pop(event_type, None)
+        if timer is not None and self.connection is not None:
+            try:
+                self.connection.remove_timeout(timer)
+            except Exception as e:
+                logger.debug(f"Could not cancel flush timer of {event_type} batch: {e}")
+
+        batcher = self._batchers[event_type]
+        events, deliveries = batcher.take()
+        if not events:
+            return
+        if self._worker_queues:
+            job = _BatchJob(self.connection, batcher, events, deliveries)
+            self._worker_queues[self._worker_index(routing_key)].put(job)
+            return
+        outcome = _ACK if batcher.process(events) else _NACK_REQUEUE
+        self._settle_batch(deliveries, outcome)
+
+    def _settle_batch(self, deliveries: list[tuple[Any, int]], outcome: str) -> None:
+        """Settle every delivery of a batch with the same outcome.
+
+        Must run on the connection's I/O thread.
+        """
+        for channel, delivery_tag in deliveries:
+            self._settle(channel, delivery_tag, outcome)
+
+    def _discard_pending_batches(self) -> None:
+        """Forget unfinished batches delivered on a previous channel.
+
+        Their deliveries can no longer be acknowledged; the broker redelivers them.
+        """
+        self._batch_timers.clear()
+        for event_type, batcher in self._batchers.items():
+            events, _ = batcher.take()
+            if events:
+                logger.info(f"Discarded {len(events)} pending {event_type} events from a closed channel")
+
+    def _settle(self, channel: Any, delivery_tag: int, outcome: str) -> None:
+        """Ack or nack a delivery according to its processing outcome.
+
+        Must run on the connection's I/O thread.
+
+        Args:
+            channel: Channel the message was delivered on
+            delivery_tag: Delivery tag to settle
+            outcome: Result of _process_message()
+        """
+        if self.auto_ack:
+            return
+        if outcome == _ACK:
+            self._safe_ack(channel, delivery_tag)
+        else:
+            self._safe_nack(channel, delivery_tag, requeue=outcome == _NACK_REQUEUE)
+
+    def _start_workers(self) -> None:
+        """Start the event handler threads."""
+        # Acked deliveries are bounded by the channel prefetch; auto-acked ones
+        # are not, so their queues are bounded here instead
+        maxsize = self.prefetch_multiplier if self.auto_ack else 0
+        self._worker_queues = [queue.Queue(maxsize=maxsize) for _ in range(self.worker_count)]
+        self._workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(work_queue,),
+                name=f"rabbitmq-subscriber-worker-{index}",
+                daemon=True,
+            )
+            for index, work_queue in enumerate(self._worker_queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(f"Started {self.worker_count} subscriber workers (prefetch={self._prefetch_count()})")
+
+    def _stop_workers(self) -> None:
+        """Stop the event handler threads after their current event.
+
+        Deliveries still queued for a worker are left unacknowledged, so the
+        broker redelivers them once the connection closes.
+        """
+        if not self._workers:
+            return
+        for work_queue in self._worker_queues:
+            work_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=_WORKER_JOIN_TIMEOUT)
+            if worker.is_alive():
+                logger.warning(f"Subscriber worker {worker.name} did not stop within {_WORKER_JOIN_TIMEOUT}s")
+        self._worker_queues = []
+        self._workers = []
+
+        # Deliver acks the workers queued after the I/O loop stopped
+        connection = self.connection
+        if connection is not None and not connection.is_closed:
+            try:
+                connection.process_data_events(time_limit=0)
+            except Exception as e:
+                logger.debug(f"Could not flush pending acks on shutdown: {e}")
+
+    def _dispatch_to_worker(self, channel: Any, method: Any, body: bytes) -> None:
+        """Queue a delivery for a worker thread.
+
+        Ordered routing keys always map to the same worker; other deliveries
+        go to the worker with the shortest backlog.
+
+        Args:
+            channel: Channel the message was delivered on
+            method: Method frame with delivery info
+            body: Message body (bytes)
+        """
+        index = self._worker_index(getattr(method, "routing_key", None))
+        self._worker_queues[index].put((self.connection, channel, method.delivery_tag, body))
+
+    def _worker_index(self, routing_key: str | None) -> int:
+        """Pick the worker for a delivery (or batch) with the given routing key."""
+        if routing_key in self.ordered_routing_keys:
+            return zlib.crc32(routing_key.encode("utf-8")) % len(self._worker_queues)
+        return min(range(len(self._worker_queues)), key=lambda i: self._worker_queues[i].qsize())
+
+    def _worker_loop(self, work_queue: queue.Queue) -> None:
+        """Process deliveries from a worker queue until a stop sentinel arrives.
+
+        Args:
+            work_queue: Queue of (connection, channel, delivery_tag, body) items and batch jobs
+        """
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return
+            if isinstance(item, _BatchJob):
+                self._run_batch_job(item)
+                continue
+            connection, channel, delivery_tag, body = item
+            outcome = self._process_message(body)
+            if self.auto_ack:
+                continue
+            # pika channels are not thread-safe: settle on the I/O thread
+            try:
+                connection.add_callback_threadsafe(functools.partial(self._settle, channel, delivery_tag, outcome))
+            except Exception as e:
+                # The connection is gone; the broker will redeliver the message
+                logger.warning(f"Could not settle delivery {delivery_tag} after connection loss: {e}")
+
+    def _run_batch_job(self, job: _BatchJob) -> None:
+        """Process a batch on a worker thread and settle its deliveries in one I/O thread callback."""
+        outcome = _ACK if job.batcher.process(job.events) else _NACK_REQUEUE
+        if self.auto_ack:
+            return
+        try:
+            job.connection.add_callback_threadsafe(functools.partial(self._settle_batch, job.deliveries, outcome))
+        except Exception as e:
+            # The connection is gone; the broker will redeliver the messages
+            logger.warning(f"Could not settle batch of {len(job.deliveries)} deliveries after connection loss: {e}")
 
     def _safe_ack(self, channel: Any, delivery_tag: int) -> None:
         """Safely acknowledge a message, catching channel closure errors.
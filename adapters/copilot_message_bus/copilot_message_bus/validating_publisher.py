@@ -6,6 +6,7 @@
 import logging
 from typing import Any
 
+from .base import PublishBatchResult
 from .publisher import EventPublisher
 
 logger = logging.getLogger(__name__)
@@ -118,19 +119,15 @@ class ValidatingEventPublisher(EventPublisher):
             logger.error("Validation failed with exception: %s", exc)
             return False, [f"Validation exception: {exc}"]
 
-    def publish(self, exchange: str, routing_key: str, event: dict[str, Any]) -> None:
-        """Publish an event after validating it against its schema.
+    def _check_event(self, event: dict[str, Any]) -> None:
+        """Validate an event, raising in strict mode and warning otherwise.
 
         Args:
-            exchange: Exchange name (e.g., "copilot.events")
-            routing_key: Routing key (e.g., "archive.ingested")
-            event: Event data as dictionary
+            event: Event dictionary to validate
 
         Raises:
             ValidationError: If strict=True and validation fails
-            Exception: If publishing fails (propagated from underlying publisher)
         """
-        # Validate event
         is_valid, errors = self._validate_event(event)
 
         if not is_valid:
@@ -143,9 +140,68 @@ class ValidatingEventPublisher(EventPublisher):
             # In non-strict mode, log warning and continue
             logger.warning("Event validation failed for '%s' but continuing in non-strict mode: %s", event_type, errors)
 
+    def publish(self, exchange: str, routing_key: str, event: dict[str, Any]) -> None:
+        """Publish an event after validating it against its schema.
+
+        Args:
+            exchange: Exchange name (e.g., "copilot.events")
+            routing_key: Routing key (e.g., "archive.ingested")
+            event: Event data as dictionary
+
+        Raises:
+            ValidationError: If strict=True and validation fails
+            Exception: If publishing fails (propagated from underlying publisher)
+        """
+        self._check_event(event)
+
         # Delegate to underlying publisher
         self._publisher.publish(exchange, routing_key, event)
 
+    def publish_batch(self, exchange: str, routing_key: str, events: list[dict[str, Any]]) -> PublishBatchResult:
+        """Validate several events and publish the valid ones as one batch.
+
+        In strict mode, events that fail validation are reported as
+        ValidationError entries in the result and are not published.
+
+        Args:
+            exchange: Exchange name (e.g., "copilot.events")
+            routing_key: Routing key (e.g., "json.parsed")
+            events: Event data dictionaries
+
+        Returns:
+            PublishBatchResult with errors keyed by position in ``events``
+        """
+        errors: dict[int, Exception] = {}
+        valid_positions: list[int] = []
+        for index, event in enumerate(events):
+            try:
+                self._check_event(event)
+                valid_positions.append(index)
+            except ValidationError as e:
+                errors[index] = e
+
+        inner = self._publisher.publish_batch(exchange, routing_key, [events[i] for i in valid_positions])
+        # Map positions in the validated sub-batch back to the caller's positions
+        for position, error in inner.errors.items():
+            errors[valid_positions[position]] = error
+        return PublishBatchResult(published=inner.published, errors=dict(sorted(errors.items())))
+
+    def publish_delayed(self, exchange: str, routing_key: str, event: dict[str, Any], delay_ms: int) -> None:
+        """Publish an event with a delivery delay after validating it against its schema.
+
+        Args:
+            exchange: Exchange name (e.g., "copilot.events")
+            routing_key: Routing key (e.g., "chunks.prepared")
+            event: Event data as dictionary
+            delay_ms: Minimum delay before delivery in milliseconds
+
+        Raises:
+            ValidationError: If strict=True and validation fails
+            Exception: If publishing fails (propagated from underlying publisher)
+        """
+        self._check_event(event)
+        self._publisher.publish_delayed(exchange, routing_key, event, delay_ms)
+
     def connect(self) -> None:
         """Connect to the message bus.
 
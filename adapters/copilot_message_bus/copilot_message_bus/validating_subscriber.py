@@ -7,6 +7,7 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
+from .batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
 from .subscriber import EventSubscriber
 
 logger = logging.getLogger(__name__)
@@ -203,6 +204,75 @@ class ValidatingEventSubscriber(EventSubscriber):
 
         self._subscriber.subscribe(**kwargs)
 
+    def subscribe_batch(
+        self,
+        event_type: str,
+        batch_callback: Callable[[list[dict[str, Any]]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        routing_key: str | None = None,
+        exchange: str | None = None,
+    ) -> None:
+        """Subscribe to events of a specific type, delivered in micro-batches.
+
+        Every event is validated as it arrives, before it joins a batch. In
+        strict mode an invalid event is rejected on its own (dead-lettered
+        where the backend supports it) and never reaches the batch callback, so
+        it cannot fail or redeliver the valid events batched with it.
+        Otherwise invalid events are logged and left out of the batch.
+
+        Args:
+            event_type: Type of event to subscribe to (e.g., "JSONParsed")
+            batch_callback: Function to call with each batch of events
+            max_batch_size: Maximum number of events per batch
+            max_wait_ms: Maximum time in milliseconds an event waits for its batch to fill
+            routing_key: Optional routing key pattern for filtering events
+            exchange: Optional exchange name (for compatibility)
+        """
+        self._callbacks[event_type] = batch_callback
+
+        def validate_before_batching(event: dict[str, Any]) -> bool:
+            is_valid, errors = self._validate_event(event)
+            if not is_valid:
+                logger.error("Rejecting invalid received event for '%s': %s", event_type, errors)
+            return is_valid
+
+        def validating_batch_callback(events: list[dict[str, Any]]) -> None:
+            valid_events = []
+            for event in events:
+                is_valid, errors = self._validate_event(event)
+                if is_valid:
+                    valid_events.append(event)
+                else:
+                    logger.warning(
+                        "Received event validation failed for '%s' but skipping in non-strict mode: %s",
+                        event_type,
+                        errors,
+                    )
+            if valid_events:
+                batch_callback(valid_events)
+
+        if self._strict:
+            self._subscriber.subscribe_batch(
+                event_type,
+                batch_callback,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                routing_key=routing_key,
+                exchange=exchange,
+                event_filter=validate_before_batching,
+            )
+            return
+
+        self._subscriber.subscribe_batch(
+            event_type,
+            validating_batch_callback,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            routing_key=routing_key,
+            exchange=exchange,
+        )
+
     def start_consuming(self) -> None:
         """Start consuming events.
 
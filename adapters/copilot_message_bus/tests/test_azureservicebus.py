@@ -465,3 +465,79 @@ class TestAzureServiceBusSubscriberStartConsuming:
         receiver.receive_messages.assert_any_call(max_message_count=10, max_wait_time=0)
         assert created["renewer_inits"] == 0
 
+
+    def test_batched_subscription_settles_batch_together(self, monkeypatch):
+        from copilot_message_bus import azureservicebussubscriber as module
+
+        subscriber = AzureServiceBusSubscriber(
+            connection_string="Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test",
+            queue_name="test-queue",
+            max_wait_time=5,
+            max_auto_lock_renewal_duration=0,
+        )
+
+        class _ReceiveMode:
+            PEEK_LOCK = object()
+            RECEIVE_AND_DELETE = object()
+
+        monkeypatch.setattr(module, "ServiceBusReceiveMode", _ReceiveMode)
+
+        receiver = Mock()
+        receiver.__enter__ = Mock(return_value=receiver)
+        receiver.__exit__ = Mock(return_value=False)
+
+        messages = []
+        for event_id in ("1", "2", "3"):
+            msg = Mock()
+            msg.body = [f'{{"event_type":"TestEvent","event_id":"{event_id}"}}'.encode()]
+            messages.append(msg)
+
+        batches = []
+
+        def _batch_callback(events):
+            batches.append([event["event_id"] for event in events])
+            subscriber.stop_consuming()
+
+        subscriber.client = Mock()
+        subscriber.client.get_queue_receiver = Mock(return_value=receiver)
+        subscriber.subscribe_batch("TestEvent", _batch_callback, max_batch_size=2, max_wait_ms=60000)
+
+        receiver.receive_messages = Mock(side_effect=[[messages[0]], messages[1:], []])
+
+        subscriber.start_consuming()
+
+        assert receiver.receive_messages.call_args_list[0].kwargs["max_message_count"] == 2
+        assert batches == [["1", "2"]]
+        completed = [call.args[0] for call in receiver.complete_message.call_args_list]
+        assert completed == messages[:2]
+        # The third message was pending when consumption stopped
+        receiver.abandon_message.assert_called_once_with(messages[2])
+
+    def test_batched_subscription_dead_letters_rejected_message_alone(self):
+        """Test that a message rejected by the event filter is dead-lettered without joining the batch."""
+        subscriber = AzureServiceBusSubscriber(
+            connection_string="Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test",
+            queue_name="test-queue",
+        )
+        subscriber.client = Mock()
+        batches = []
+        subscriber.subscribe_batch(
+            "TestEvent",
+            batches.append,
+            max_batch_size=2,
+            event_filter=lambda event: event["event_id"] != "bad",
+        )
+        receiver = Mock()
+        messages = []
+        for event_id in ("1", "bad", "2"):
+            msg = Mock()
+            msg.body = [f'{{"event_type":"TestEvent","event_id":"{event_id}"}}'.encode()]
+            messages.append(msg)
+            assert subscriber._add_to_batch(msg, receiver) is True
+
+        assert [[event["event_id"] for event in batch] for batch in batches] == [["1", "2"]]
+        receiver.dead_letter_message.assert_called_once()
+        assert receiver.dead_letter_message.call_args.args[0] is messages[1]
+        completed = [call.args[0] for call in receiver.complete_message.call_args_list]
+        assert completed == [messages[0], messages[2]]
+        receiver.abandon_message.assert_not_called()
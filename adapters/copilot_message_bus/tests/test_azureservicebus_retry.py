@@ -3,6 +3,7 @@
 
 """Tests for Azure Service Bus retry logic for SSL EOF and connection errors."""
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -125,6 +126,75 @@ class TestAzureServiceBusPublisherRetryLogic:
             assert mock_sender.send_messages.call_count == 3
             assert mock_sleep.call_count == 2
 
+    def test_publish_delayed_sets_scheduled_enqueue_time(self, publisher):
+        """Test that delayed publishing schedules the message instead of sleeping."""
+        mock_client = Mock()
+        publisher.client = mock_client
+        mock_sender = Mock()
+        mock_sender.__enter__ = Mock(return_value=mock_sender)
+        mock_sender.__exit__ = Mock(return_value=False)
+        mock_client.get_topic_sender.return_value = mock_sender
+
+        before = datetime.now(timezone.utc)
+        publisher.publish_delayed("copilot.events", "chunks.prepared", {"event_type": "Test"}, 30000)
+
+        message = mock_sender.send_messages.call_args.args[0]
+        scheduled = message.scheduled_enqueue_time_utc
+        assert before + timedelta(seconds=29) < scheduled < datetime.now(timezone.utc) + timedelta(seconds=31)
+        assert message.subject == "chunks.prepared"
+
+    def test_publish_batch_splits_full_batches(self, publisher):
+        """Test that events are split across message batches when a batch is full."""
+        from azure.servicebus.exceptions import MessageSizeExceededError
+
+        mock_client = Mock()
+        publisher.client = mock_client
+        mock_sender = Mock()
+        mock_sender.__enter__ = Mock(return_value=mock_sender)
+        mock_sender.__exit__ = Mock(return_value=False)
+        mock_client.get_topic_sender.return_value = mock_sender
+
+        batches = []
+
+        def create_message_batch():
+            """Create a fake batch that holds two messages."""
+            batch = []
+
+            def add_message(message):
+                if len(batch) == 2:
+                    raise MessageSizeExceededError(message="batch full")
+                batch.append(message)
+
+            fake = Mock()
+            fake.add_message.side_effect = add_message
+            fake.messages = batch
+            batches.append(fake)
+            return fake
+
+        mock_sender.create_message_batch.side_effect = create_message_batch
+
+        result = publisher.publish_batch("copilot.events", "json.parsed", [{"event_type": "Test"} for _ in range(5)])
+
+        assert result.published == 5
+        assert result.errors == {}
+        assert [len(batch.messages) for batch in batches] == [2, 2, 1]
+        assert mock_sender.send_messages.call_count == 3
+
+    def test_publish_batch_reports_failed_send(self, publisher):
+        """Test that a non-transient send failure fails the events of that batch only."""
+        mock_client = Mock()
+        publisher.client = mock_client
+        mock_sender = Mock()
+        mock_sender.__enter__ = Mock(return_value=mock_sender)
+        mock_sender.__exit__ = Mock(return_value=False)
+        mock_client.get_topic_sender.return_value = mock_sender
+        mock_sender.send_messages.side_effect = ValueError("rejected")
+
+        result = publisher.publish_batch("copilot.events", "json.parsed", [{"event_type": "Test"}, {"event_type": "Test"}])
+
+        assert result.published == 0
+        assert sorted(result.errors) == [0, 1]
+
     def test_publish_fails_after_max_retries(self, publisher):
         """Test that publish fails after exhausting all retry attempts."""
         mock_client = Mock()
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Tests for micro-batching of received events."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from copilot_message_bus.batching import EventBatcher
+from copilot_message_bus.noop_subscriber import NoopSubscriber
+
+
+class TestEventBatcher:
+    """Tests for EventBatcher."""
+
+    def test_add_reports_full_batch(self):
+        """Test that add() returns True once max_batch_size events are pending."""
+        batcher = EventBatcher(Mock(), max_batch_size=2, max_wait_ms=1000)
+
+        assert batcher.add({"event_id": "1"}, "d1") is False
+        assert batcher.add({"event_id": "2"}, "d2") is True
+        assert batcher.is_due()
+
+    def test_take_returns_and_clears_batch(self):
+        """Test that take() returns events and delivery handles in arrival order."""
+        batcher = EventBatcher(Mock(), max_batch_size=5)
+        batcher.add({"event_id": "1"}, "d1")
+        batcher.add({"event_id": "2"}, "d2")
+
+        events, deliveries = batcher.take()
+
+        assert events == [{"event_id": "1"}, {"event_id": "2"}]
+        assert deliveries == ["d1", "d2"]
+        assert len(batcher) == 0
+        assert batcher.seconds_until_due() is None
+
+    def test_batch_is_due_after_max_wait(self):
+        """Test that a partial batch becomes due once its oldest event has waited max_wait_ms."""
+        batcher = EventBatcher(Mock(), max_batch_size=5, max_wait_ms=100)
+        with patch("copilot_message_bus.batching.time.monotonic", return_value=10.0):
+            batcher.add({"event_id": "1"}, "d1")
+        with patch("copilot_message_bus.batching.time.monotonic", return_value=10.05):
+            assert batcher.seconds_until_due() == pytest.approx(0.05)
+            assert not batcher.is_due()
+        with patch("copilot_message_bus.batching.time.monotonic", return_value=10.1):
+            assert batcher.is_due()
+
+    def test_process_reports_callback_outcome(self):
+        """Test that process() returns False instead of raising when the callback fails."""
+        callback = Mock(side_effect=[None, RuntimeError("boom")])
+        batcher = EventBatcher(callback)
+
+        assert batcher.process([{"event_type": "TestEvent"}]) is True
+        assert batcher.process([{"event_type": "TestEvent"}]) is False
+
+    @pytest.mark.parametrize("max_batch_size,max_wait_ms", [(0, 100), (1, -1)])
+    def test_invalid_limits(self, max_batch_size, max_wait_ms):
+        """Test that invalid batch limits are rejected."""
+        with pytest.raises(ValueError):
+            EventBatcher(Mock(), max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+
+def test_default_subscribe_batch_delivers_batches_of_one():
+    """Test that subscribers without batching support pass each event as a batch of one."""
+    subscriber = NoopSubscriber()
+    batch_callback = Mock()
+
+    subscriber.subscribe_batch("TestEvent", batch_callback, max_batch_size=10)
+    subscriber.inject_event({"event_type": "TestEvent", "event_id": "1"})
+
+    batch_callback.assert_called_once_with([{"event_type": "TestEvent", "event_id": "1"}])
@@ -3,6 +3,8 @@
 
 """Tests for event publishers."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from copilot_config.generated.adapters.message_bus import (
     AdapterConfig_MessageBus,
@@ -160,6 +162,36 @@ class TestNoopPublisher:
         assert len(events) == 2
         assert all(e["event"]["event_type"] == "TypeA" for e in events)
 
+    def test_publish_batch(self):
+        """Test that batch publishing stores every event."""
+        publisher = NoopPublisher()
+        publisher.connect()
+
+        result = publisher.publish_batch("ex", "key", [{"event_type": "A"}, {"event_type": "B"}])
+
+        assert result.published == 2
+        assert result.errors == {}
+        assert [e["event"]["event_type"] for e in publisher.published_events] == ["A", "B"]
+
+    def test_publish_delayed_held_until_due(self):
+        """Test that delayed events are released only once due."""
+        publisher = NoopPublisher()
+        publisher.connect()
+
+        with patch("copilot_message_bus.noop_publisher.time.monotonic", return_value=100.0):
+            publisher.publish_delayed("ex", "key", {"event_type": "Late"}, 5000)
+            publisher.publish_delayed("ex", "key", {"event_type": "Early"}, 1000)
+
+        assert publisher.published_events == []
+        assert [e["event"]["event_type"] for e in publisher.get_scheduled_events()] == ["Early", "Late"]
+
+        assert publisher.release_due_events(now=102.0) == 1
+        assert publisher.get_events() == [{"exchange": "ex", "routing_key": "key", "event": {"event_type": "Early"}}]
+
+        assert publisher.release_due_events(now=105.0) == 1
+        assert publisher.get_scheduled_events() == []
+        assert len(publisher.published_events) == 2
+
 
 class TestRabbitMQPublisher:
     """Tests for RabbitMQPublisher."""
@@ -211,5 +243,105 @@ class TestRabbitMQPublisher:
         # Initially no queues declared
         assert len(publisher._declared_queues) == 0
 
+    def test_publish_delayed_rounds_up_to_tier(self):
+        """Test that delayed events go to the TTL queue of the next larger tier."""
+        publisher = RabbitMQPublisher(
+            host="localhost", port=5672, username="guest", password="guest", delay_tiers_ms=(1000, 5000)
+        )
+        publisher.channel = Mock()
+
+        with patch.object(publisher, "_is_connected", return_value=True):
+            publisher.publish_delayed("copilot.events", "chunks.prepared", {"event_type": "Test"}, 1500)
+            publisher.publish_delayed("copilot.events", "chunks.prepared", {"event_type": "Test"}, 4000)
+
+        # The tier is declared once and dead-letters back to the original exchange
+        publisher.channel.exchange_declare.assert_called_once_with(
+            exchange="copilot.events.delay.5000", exchange_type="fanout", durable=True
+        )
+        queue_args = publisher.channel.queue_declare.call_args.kwargs["arguments"]
+        assert queue_args == {"x-message-ttl": 5000, "x-dead-letter-exchange": "copilot.events"}
+
+        publish_kwargs = publisher.channel.basic_publish.call_args.kwargs
+        assert publish_kwargs["exchange"] == "copilot.events.delay.5000"
+        assert publish_kwargs["routing_key"] == "chunks.prepared"
+
+    def test_publish_delayed_caps_at_largest_tier(self):
+        """Test that delays beyond the largest tier use the largest tier."""
+        publisher = RabbitMQPublisher(
+            host="localhost", port=5672, username="guest", password="guest", delay_tiers_ms=(1000, 5000)
+        )
+        publisher.channel = Mock()
+
+        with patch.object(publisher, "_is_connected", return_value=True):
+            publisher.publish_delayed("copilot.events", "key", {"event_type": "Test"}, 60000)
+
+        assert publisher.channel.basic_publish.call_args.kwargs["exchange"] == "copilot.events.delay.5000"
+
+    def _batch_publisher(self, max_batch_size=500):
+        """Create a publisher with a mocked connection whose channels record publishes."""
+        publisher = RabbitMQPublisher(
+            host="localhost", port=5672, username="guest", password="guest", max_batch_size=max_batch_size
+        )
+        publisher.connection = Mock()
+        batch_channel = Mock()
+        publisher.connection.channel.return_value = batch_channel
+        return publisher, batch_channel
+
+    def test_publish_batch_commits_per_chunk(self):
+        """Test that events are published in transactions of max_batch_size."""
+        publisher, batch_channel = self._batch_publisher(max_batch_size=2)
+        events = [{"event_type": "Test", "n": n} for n in range(5)]
+
+        with patch.object(publisher, "_is_connected", return_value=True):
+            result = publisher.publish_batch("copilot.events", "json.parsed", events)
+
+        assert result.published == 5
+        assert result.errors == {}
+        batch_channel.tx_select.assert_called_once()
+        assert batch_channel.basic_publish.call_count == 5
+        assert batch_channel.tx_commit.call_count == 3
+        properties = batch_channel.basic_publish.call_args.kwargs["properties"]
+        assert properties.delivery_mode == 2
+        assert properties.headers == {"batch_index": 4}
+
+    def test_publish_batch_reports_unroutable_events(self):
+        """Test that messages returned by the broker are reported individually."""
+        import pika
+
+        publisher, batch_channel = self._batch_publisher()
+
+        def return_second_message(time_limit):
+            method = pika.spec.Basic.Return(exchange="copilot.events", routing_key="json.parsed")
+            properties = pika.BasicProperties(headers={"batch_index": 1})
+            on_return = batch_channel.add_on_return_callback.call_args.args[0]
+            on_return(batch_channel, method, properties, b"{}")
+
+        publisher.connection.process_data_events.side_effect = return_second_message
+
+        with patch.object(publisher, "_is_connected", return_value=True):
+            result = publisher.publish_batch("copilot.events", "json.parsed", [{"n": 0}, {"n": 1}, {"n": 2}])
+
+        assert result.published == 2
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], pika.exceptions.UnroutableError)
+
+    def test_publish_batch_failed_commit_fails_chunk(self):
+        """Test that a failed commit marks the chunk failed and later chunks still publish."""
+        publisher, batch_channel = self._batch_publisher(max_batch_size=2)
+        batch_channel.tx_commit.side_effect = [Exception("commit failed"), None]
+
+        with patch.object(publisher, "_is_connected", return_value=True):
+            result = publisher.publish_batch("copilot.events", "json.parsed", [{"n": n} for n in range(4)])
+
+        assert result.published == 2
+        assert sorted(result.errors) == [0, 1]
+        # A fresh transactional channel is opened after the failure
+        assert publisher.connection.channel.call_count == 2
+
+    def test_invalid_delay_tiers(self):
+        """Test that delay tiers must be positive."""
+        with pytest.raises(ValueError):
+            RabbitMQPublisher(host="localhost", port=5672, username="guest", password="guest", delay_tiers_ms=())
+
     # Note: Actual connection tests would require a running RabbitMQ instance
     # or mocking the pika library, which is beyond the scope of basic unit tests
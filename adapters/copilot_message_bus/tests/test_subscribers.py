@@ -403,3 +403,360 @@ class TestRabbitMQSubscriber:
 
         # Verify consuming flag was reset
         assert subscriber._consuming is False
+
+
+class TestRabbitMQSubscriberWorkerPool:
+    """Tests for RabbitMQSubscriber multi-worker consumption."""
+
+    @staticmethod
+    def _delivery(tag, routing_key="test.event"):
+        """Build a mock delivery method frame."""
+        from unittest.mock import MagicMock
+
+        method = MagicMock()
+        method.delivery_tag = tag
+        method.routing_key = routing_key
+        return method
+
+    @staticmethod
+    def _body(event_type="TestEvent", event_id="1"):
+        """Encode an event message body."""
+        import json
+
+        return json.dumps({"event_type": event_type, "event_id": event_id}).encode("utf-8")
+
+    def _run_deliveries(self, subscriber, deliveries, expected_settlements):
+        """Consume the given deliveries through start_consuming and wait for them to settle."""
+        import threading
+        from unittest.mock import MagicMock
+
+        mock_connection = MagicMock()
+        mock_connection.is_closed = False
+        mock_channel = MagicMock()
+        subscriber.connection = mock_connection
+        subscriber.channel = mock_channel
+
+        settled = threading.Semaphore(0)
+
+        def run_on_io_thread(callback):
+            # Stand-in for the pika I/O loop: run the marshalled callback immediately
+            callback()
+            settled.release()
+
+        mock_connection.add_callback_threadsafe.side_effect = run_on_io_thread
+
+        def consume():
+            for method, body in deliveries:
+                subscriber._on_message(mock_channel, method, None, body)
+            for _ in range(expected_settlements):
+                assert settled.acquire(timeout=5)
+            subscriber._shutdown_requested = True
+
+        mock_channel.start_consuming.side_effect = consume
+        subscriber.start_consuming()
+        return mock_channel
+
+    def test_invalid_worker_count_raises(self):
+        """Test that a worker count below 1 is rejected."""
+        with pytest.raises(ValueError, match="worker_count"):
+            RabbitMQSubscriber(host="localhost", port=5672, username="guest", password="guest", worker_count=0)
+
+    def test_connect_sets_prefetch(self):
+        """Test that connect() sets the channel prefetch to workers * multiplier."""
+        from unittest.mock import MagicMock, patch
+
+        subscriber = RabbitMQSubscriber(
+            host="localhost",
+            port=5672,
+            username="guest",
+            password="guest",
+            queue_name="test-queue",
+            worker_count=4,
+            prefetch_multiplier=3,
+        )
+        mock_connection = MagicMock()
+        with patch("copilot_message_bus.rabbitmq_subscriber.pika") as mock_pika:
+            mock_pika.BlockingConnection.return_value = mock_connection
+            subscriber.connect()
+
+        mock_connection.channel.return_value.basic_qos.assert_called_once_with(prefetch_count=12)
+
+    def test_connect_single_worker_keeps_default_prefetch(self):
+        """Test that a single-worker subscriber does not change the channel prefetch."""
+        from unittest.mock import MagicMock, patch
+
+        subscriber = RabbitMQSubscriber(
+            host="localhost", port=5672, username="guest", password="guest", queue_name="test-queue"
+        )
+        mock_connection = MagicMock()
+        with patch("copilot_message_bus.rabbitmq_subscriber.pika") as mock_pika:
+            mock_pika.BlockingConnection.return_value = mock_connection
+            subscriber.connect()
+
+        mock_connection.channel.return_value.basic_qos.assert_not_called()
+
+    def test_auto_ack_worker_queues_are_bounded(self):
+        """Test that auto-ack worker queues are bounded, since the prefetch does not limit delivery."""
+        acked = RabbitMQSubscriber(host="localhost", port=5672, username="guest", password="guest", worker_count=2)
+        auto_acked = RabbitMQSubscriber(
+            host="localhost",
+            port=5672,
+            username="guest",
+            password="guest",
+            worker_count=2,
+            prefetch_multiplier=3,
+            auto_ack=True,
+        )
+        for subscriber in (acked, auto_acked):
+            subscriber._start_workers()
+        try:
+            assert [q.maxsize for q in acked._worker_queues] == [0, 0]
+            assert [q.maxsize for q in auto_acked._worker_queues] == [3, 3]
+        finally:
+            acked._stop_workers()
+            auto_acked._stop_workers()
+
+    def test_from_config_worker_settings(self):
+        """Test that worker settings are read from the driver config."""
+        subscriber = RabbitMQSubscriber.from_config(
+            DriverConfig_MessageBus_Rabbitmq(
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+                worker_count=4,
+                prefetch_multiplier=3,
+                ordered_routing_keys="archive.ingested, source.deletion.requested",
+            )
+        )
+
+        assert subscriber.worker_count == 4
+        assert subscriber.prefetch_multiplier == 3
+        assert subscriber.ordered_routing_keys == {"archive.ingested", "source.deletion.requested"}
+
+    def test_workers_handle_events_concurrently(self):
+        """Test that events are handled on worker threads in parallel and acked via the I/O thread."""
+        import threading
+
+        subscriber = RabbitMQSubscriber(host="localhost", port=5672, username="guest", password="guest", worker_count=2)
+        # Both callbacks must be running at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        handler_threads = set()
+
+        def callback(event):
+            handler_threads.add(threading.current_thread().name)
+            barrier.wait()
+
+        subscriber.callbacks["TestEvent"] = callback
+
+        deliveries = [(self._delivery(1), self._body(event_id="1")), (self._delivery(2), self._body(event_id="2"))]
+        mock_channel = self._run_deliveries(subscriber, deliveries, expected_settlements=2)
+
+        acked = sorted(call.kwargs["delivery_tag"] for call in mock_channel.basic_ack.call_args_list)
+        assert acked == [1, 2]
+        mock_channel.basic_nack.assert_not_called()
+        assert len(handler_threads) == 2
+        assert threading.current_thread().name not in handler_threads
+        assert subscriber._workers == []
+
+    def test_worker_callback_failure_nacks_with_requeue(self):
+        """Test that a failing callback on a worker is nacked for redelivery."""
+        subscriber = RabbitMQSubscriber(host="localhost", port=5672, username="guest", password="guest", worker_count=2)
+
+        def callback(event):
+            raise RuntimeError("boom")
+
+        subscriber.callbacks["TestEvent"] = callback
+
+        mock_channel = self._run_deliveries(subscriber, [(self._delivery(7), self._body())], expected_settlements=1)
+
+        mock_channel.basic_nack.assert_called_once_with(delivery_tag=7, requeue=True)
+        mock_channel.basic_ack.assert_not_called()
+
+    def test_ordered_routing_key_preserves_order(self):
+        """Test that events with an ordered routing key are handled one at a time in delivery order."""
+        import time
+
+        subscriber = RabbitMQSubscriber(
+            host="localhost",
+            port=5672,
+            username="guest",
+            password="guest",
+            worker_count=4,
+            ordered_routing_keys=["archive.ingested"],
+        )
+        handled = []
+
+        def callback(event):
+            # Later events finish faster, so any parallelism would reorder them
+            time.sleep(0.01 * (5 - int(event["event_id"])))
+            handled.append(event["event_id"])
+
+        subscriber.callbacks["TestEvent"] = callback
+
+        deliveries = [
+            (self._delivery(i, routing_key="archive.ingested"), self._body(event_id=str(i))) for i in range(5)
+        ]
+        self._run_deliveries(subscriber, deliveries, expected_settlements=5)
+
+        assert handled == ["0", "1", "2", "3", "4"]
+
+    def test_settle_after_connection_loss_is_logged(self):
+        """Test that a worker survives failing to marshal an ack to a closed connection."""
+        import queue
+        from unittest.mock import MagicMock
+
+        subscriber = RabbitMQSubscriber(host="localhost", port=5672, username="guest", password="guest")
+        subscriber.callbacks["TestEvent"] = lambda event: None
+        mock_connection = MagicMock()
+        mock_connection.add_callback_threadsafe.side_effect = RuntimeError("connection closed")
+
+        work_queue = queue.Queue()
+        work_queue.put((mock_connection, MagicMock(), 3, self._body()))
+        work_queue.put(None)
+
+        subscriber._worker_loop(work_queue)
+
+        mock_connection.add_callback_threadsafe.assert_called_once()
+
+
+class TestRabbitMQSubscriberBatching:
+    """Tests for RabbitMQSubscriber micro-batched subscriptions."""
+
+    @staticmethod
+    def _subscriber(**kwargs):
+        """Build a subscriber with a mocked connection and channel."""
+        from unittest.mock import MagicMock
+
+        subscriber = RabbitMQSubscriber(
+            host="localhost", port=5672, username="guest", password="guest", queue_name="test-queue", **kwargs
+        )
+        subscriber.connection = MagicMock()
+        subscriber.connection.is_closed = False
+        subscriber.channel = MagicMock()
+        return subscriber
+
+    _delivery = staticmethod(TestRabbitMQSubscriberWorkerPool._delivery)
+    _body = staticmethod(TestRabbitMQSubscriberWorkerPool._body)
+
+    def test_subscribe_batch_raises_prefetch(self):
+        """Test that the prefetch leaves room for a full batch per worker."""
+        subscriber = self._subscriber(worker_count=2)
+
+        subscriber.subscribe_batch("TestEvent", lambda events: None, max_batch_size=20)
+
+        subscriber.channel.basic_qos.assert_called_with(prefetch_count=40)
+        subscriber.channel.queue_bind.assert_called_once()
+
+    def test_subscribe_batch_single_worker_keeps_default_prefetch(self):
+        """Test that batching on a single-worker subscriber leaves the prefetch unchanged."""
+        subscriber = self._subscriber()
+
+        subscriber.subscribe_batch("TestEvent", lambda events: None, max_batch_size=20)
+
+        subscriber.channel.basic_qos.assert_not_called()
+
+    def test_full_batch_is_processed_and_acked_together(self):
+        """Test that a full batch invokes the callback once and acks every delivery."""
+        subscriber = self._subscriber()
+        batches = []
+        subscriber.subscribe_batch("TestEvent", batches.append, max_batch_size=3, max_wait_ms=1000)
+
+        for tag in (1, 2, 3):
+            subscriber._on_message(subscriber.channel, self._delivery(tag), None, self._body(event_id=str(tag)))
+
+        assert [[event["event_id"] for event in batch] for batch in batches] == [["1", "2", "3"]]
+        acked = [call.kwargs["delivery_tag"] for call in subscriber.channel.basic_ack.call_args_list]
+        assert acked == [1, 2, 3]
+        subscriber.connection.remove_timeout.assert_called_once()
+
+    def test_failed_batch_is_nacked_together(self):
+        """Test that a failing batch callback nacks every delivery for redelivery."""
+        subscriber = self._subscriber()
+
+        def batch_callback(events):
+            raise RuntimeError("boom")
+
+        subscriber.subscribe_batch("TestEvent", batch_callback, max_batch_size=2)
+
+        subscriber._on_message(subscriber.channel, self._delivery(1), None, self._body(event_id="1"))
+        subscriber._on_message(subscriber.channel, self._delivery(2), None, self._body(event_id="2"))
+
+        nacked = [call.kwargs for call in subscriber.channel.basic_nack.call_args_list]
+        assert nacked == [{"delivery_tag": 1, "requeue": True}, {"delivery_tag": 2, "requeue": True}]
+        subscriber.channel.basic_ack.assert_not_called()
+
+    def test_partial_batch_is_flushed_by_timer(self):
+        """Test that a partial batch is processed when its flush timer fires."""
+        subscriber = self._subscriber()
+        batches = []
+        subscriber.subscribe_batch("TestEvent", batches.append, max_batch_size=10, max_wait_ms=0)
+
+        subscriber._on_message(subscriber.channel, self._delivery(1), None, self._body(event_id="1"))
+        subscriber._on_message(subscriber.channel, self._delivery(2), None, self._body(event_id="2"))
+        assert batches == []
+
+        # Only the first event of a batch schedules a flush
+        subscriber.connection.call_later.assert_called_once()
+        delay, flush = subscriber.connection.call_later.call_args.args
+        assert delay == 0
+        flush()
+
+        assert [len(batch) for batch in batches] == [2]
+        assert subscriber.channel.basic_ack.call_count == 2
+
+    def test_other_event_types_are_processed_individually(self):
+        """Test that events without a batched subscription still use their per-event callback."""
+        from unittest.mock import Mock
+
+        subscriber = self._subscriber()
+        batch_callback = Mock()
+        subscriber.subscribe_batch("BatchedEvent", batch_callback, max_batch_size=10)
+        callback = Mock()
+        subscriber.callbacks["TestEvent"] = callback
+
+        subscriber._on_message(subscriber.channel, self._delivery(5), None, self._body())
+
+        callback.assert_called_once()
+        batch_callback.assert_not_called()
+        subscriber.channel.basic_ack.assert_called_once_with(delivery_tag=5)
+
+    def test_worker_processes_batch_and_settles_in_one_callback(self):
+        """Test that a worker handles a whole batch and marshals all of its acks at once."""
+        import threading
+        from unittest.mock import Mock
+
+        subscriber = RabbitMQSubscriber(
+            host="localhost", port=5672, username="guest", password="guest", queue_name="q", worker_count=2
+        )
+        subscriber.channel = Mock()
+        batches = []
+        handler_threads = set()
+
+        def batch_callback(events):
+            handler_threads.add(threading.current_thread().name)
+            batches.append(events)
+
+        subscriber.subscribe_batch("TestEvent", batch_callback, max_batch_size=2)
+
+        deliveries = [(self._delivery(1), self._body(event_id="1")), (self._delivery(2), self._body(event_id="2"))]
+        mock_channel = TestRabbitMQSubscriberWorkerPool()._run_deliveries(
+            subscriber, deliveries, expected_settlements=1
+        )
+
+        assert [len(batch) for batch in batches] == [2]
+        assert threading.current_thread().name not in handler_threads
+        acked = sorted(call.kwargs["delivery_tag"] for call in mock_channel.basic_ack.call_args_list)
+        assert acked == [1, 2]
+
+    def test_new_channel_discards_pending_batch(self):
+        """Test that deliveries pending from a previous channel are dropped, not processed."""
+        from unittest.mock import Mock
+
+        subscriber = self._subscriber()
+        batch_callback = Mock()
+        subscriber.subscribe_batch("TestEvent", batch_callback, max_batch_size=10)
+        subscriber._on_message(subscriber.channel, self._delivery(1), None, self._body())
+
+        subscriber._discard_pending_batches()
+
+        assert len(subscriber._batchers["TestEvent"]) == 0
+        batch_callback.assert_not_called()
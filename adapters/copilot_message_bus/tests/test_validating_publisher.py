@@ -191,6 +191,40 @@ class TestValidatingEventPublisher:
         # Should succeed in non-strict mode
         publisher.publish("copilot.events", "test.event", event)
 
+    def test_publish_delayed_validates_and_delegates(self):
+        """Test that delayed publishing validates before delegating."""
+        base = NoopPublisher()
+        base.connect()
+
+        publisher = ValidatingEventPublisher(base, MockSchemaProvider({}), strict=True)
+
+        with pytest.raises(ValidationError):
+            publisher.publish_delayed("copilot.events", "test.event", {"event_type": "UnknownEvent", "data": {}}, 1000)
+        assert base.get_scheduled_events() == []
+
+        publisher = ValidatingEventPublisher(base, schema_provider=None)
+        publisher.publish_delayed("copilot.events", "test.event", {"event_type": "UnknownEvent", "data": {}}, 1000)
+        assert len(base.get_scheduled_events()) == 1
+
+    def test_publish_batch_reports_invalid_events_by_position(self):
+        """Test that invalid events are reported and valid ones are published."""
+        base = NoopPublisher()
+        base.connect()
+        schema = {"type": "object", "required": ["data"]}
+        publisher = ValidatingEventPublisher(base, MockSchemaProvider({"TestEvent": schema}), strict=True)
+
+        events = [
+            {"event_type": "TestEvent", "data": {}},
+            {"event_type": "TestEvent"},
+            {"event_type": "TestEvent", "data": {"n": 2}},
+        ]
+        result = publisher.publish_batch("copilot.events", "test.event", events)
+
+        assert result.published == 2
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], ValidationError)
+        assert [e["event"] for e in base.published_events] == [events[0], events[2]]
+
     def test_connect_delegates_to_underlying_publisher(self):
         """Test that connect is delegated to underlying publisher."""
         base = NoopPublisher()
@@ -3,6 +3,7 @@
 
 """Tests for ValidatingEventSubscriber."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -384,3 +385,68 @@ class TestValidatingEventSubscriber:
 
             # Original callback should be called
             mock_callback.assert_called_once_with(event)
+
+    def test_subscribe_batch_strict_rejects_invalid_events_before_batching(self):
+        """Test that strict mode screens events before batching instead of failing the batch."""
+        mock_subscriber = Mock()
+        subscriber = ValidatingEventSubscriber(subscriber=mock_subscriber, schema_provider=Mock(), strict=True)
+        batch_callback = Mock()
+
+        subscriber.subscribe_batch("TestEvent", batch_callback, max_batch_size=8, max_wait_ms=100)
+        call = mock_subscriber.subscribe_batch.call_args
+        assert call.args[1] is batch_callback
+        assert call.kwargs["max_batch_size"] == 8
+        event_filter = call.kwargs["event_filter"]
+
+        valid = {"event_type": "TestEvent", "data": {"id": 1}}
+        invalid = {"event_type": "TestEvent", "data": {}}
+        with patch.object(subscriber, "_validate_event", side_effect=[(True, []), (False, ["missing id"])]):
+            assert event_filter(valid) is True
+            assert event_filter(invalid) is False
+
+    def test_subscribe_batch_strict_settles_invalid_event_alone(self):
+        """Test that one invalid event among valid ones is rejected alone and the rest are acked."""
+        from unittest.mock import MagicMock
+
+        from copilot_message_bus.rabbitmq_subscriber import RabbitMQSubscriber
+
+        rabbitmq = RabbitMQSubscriber(
+            host="localhost", port=5672, username="guest", password="guest", queue_name="test-queue"
+        )
+        rabbitmq.connection = MagicMock()
+        rabbitmq.connection.is_closed = False
+        rabbitmq.channel = MagicMock()
+        subscriber = ValidatingEventSubscriber(subscriber=rabbitmq, schema_provider=Mock(), strict=True)
+        batches = []
+        subscriber.subscribe_batch("TestEvent", batches.append, max_batch_size=3)
+
+        def validate(event):
+            if event["data"].get("id") is None:
+                return False, ["missing id"]
+            return True, []
+
+        bodies = [{"id": 1}, {}, {"id": 3}, {"id": 4}]
+        with patch.object(subscriber, "_validate_event", side_effect=validate):
+            for tag, data in enumerate(bodies, start=1):
+                body = json.dumps({"event_type": "TestEvent", "event_id": str(tag), "data": data}).encode()
+                rabbitmq._on_message(rabbitmq.channel, Mock(delivery_tag=tag, routing_key="test.event"), None, body)
+
+        assert [[event["event_id"] for event in batch] for batch in batches] == [["1", "3", "4"]]
+        rabbitmq.channel.basic_nack.assert_called_once_with(delivery_tag=2, requeue=False)
+        acked = [call.kwargs["delivery_tag"] for call in rabbitmq.channel.basic_ack.call_args_list]
+        assert acked == [1, 3, 4]
+
+    def test_subscribe_batch_non_strict_drops_invalid_events(self):
+        """Test that invalid events are left out of the batch in non-strict mode."""
+        mock_subscriber = Mock()
+        subscriber = ValidatingEventSubscriber(subscriber=mock_subscriber, schema_provider=Mock(), strict=False)
+        batch_callback = Mock()
+
+        subscriber.subscribe_batch("TestEvent", batch_callback)
+        wrapped_callback = mock_subscriber.subscribe_batch.call_args.args[1]
+
+        events = [{"event_type": "TestEvent", "data": {"id": 1}}, {"event_type": "TestEvent", "data": {}}]
+        with patch.object(subscriber, "_validate_event", side_effect=[(True, []), (False, ["missing id"])]):
+            wrapped_callback(events)
+
+        batch_callback.assert_called_once_with([events[0]])
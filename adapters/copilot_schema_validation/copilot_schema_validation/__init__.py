@@ -58,13 +58,14 @@ from .schema_registry import (
     load_schema,
     validate_registry,
 )
-from .schema_validator import validate_json
+from .schema_validator import reset_validator_cache, validate_json
 
 __all__ = [
     # Schema validation
     "SchemaProvider",
     "create_schema_provider",
     "validate_json",
+    "reset_validator_cache",
     # Schema registry
     "get_schema_path",
     "load_schema",
@@ -4,8 +4,12 @@
 """Utilities for validating JSON documents against JSON Schemas."""
 
 import copy
+import functools
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +18,16 @@ from referencing import Registry, Resource
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on distinct schemas kept compiled; services use a few dozen at most
+_VALIDATOR_CACHE_MAX_SIZE = 256
+
+_validator_cache_lock = threading.Lock()
+# Compiled validators keyed by schema content hash
+_validators_by_fingerprint: OrderedDict[str, Draft202012Validator] = OrderedDict()
+# Identity fast path: id(schema) -> (schema, validator). Holding the schema keeps
+# its id from being reused by another object while the entry is cached.
+_validators_by_identity: dict[int, tuple[dict[str, Any], Draft202012Validator]] = {}
+
 
 def _build_registry() -> Registry:
     """Build a referencing Registry with preloaded schemas.
@@ -61,6 +75,12 @@ def _build_registry() -> Registry:
     return Registry().with_resources(resources.items())
 
 
+@functools.lru_cache(maxsize=1)
+def _get_registry() -> Registry:
+    """Return the process-wide registry, building it on first use."""
+    return _build_registry()
+
+
 def _strip_allof_additional_properties(schema: dict[str, Any]) -> dict[str, Any]:
     """Relax additionalProperties inside allOf blocks to avoid double-rejection.
 
@@ -88,9 +108,65 @@ def _strip_allof_additional_properties(schema: dict[str, Any]) -> dict[str, Any]
     return normalized
 
 
+def _schema_fingerprint(schema: dict[str, Any]) -> str:
+    """Return a stable content hash for a schema."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _get_validator(schema: dict[str, Any]) -> Draft202012Validator:
+    """Return a compiled validator for the schema, compiling it at most once.
+
+    Schema providers hand out the same cached dict for every lookup, so the
+    identity check almost always hits. Equal schemas passed as different
+    objects share one validator via the content hash. Schemas are treated as
+    immutable once validated against; mutating one in place is not detected.
+
+    Args:
+        schema: The JSON schema to compile.
+
+    Returns:
+        Draft 2020-12 validator bound to the shared registry.
+    """
+    entry = _validators_by_identity.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    fingerprint = _schema_fingerprint(schema)
+    with _validator_cache_lock:
+        validator = _validators_by_fingerprint.get(fingerprint)
+        if validator is None:
+            validator = Draft202012Validator(_strip_allof_additional_properties(schema), registry=_get_registry())
+            _validators_by_fingerprint[fingerprint] = validator
+            if len(_validators_by_fingerprint) > _VALIDATOR_CACHE_MAX_SIZE:
+                _validators_by_fingerprint.popitem(last=False)
+        else:
+            _validators_by_fingerprint.move_to_end(fingerprint)
+
+        if len(_validators_by_identity) >= _VALIDATOR_CACHE_MAX_SIZE:
+            _validators_by_identity.clear()
+        _validators_by_identity[id(schema)] = (schema, validator)
+
+    return validator
+
+
+def reset_validator_cache() -> None:
+    """Discard compiled validators and the shared registry.
+
+    Only needed when schema files change on disk within a running process
+    (e.g., in tests).
+    """
+    with _validator_cache_lock:
+        _validators_by_fingerprint.clear()
+        _validators_by_identity.clear()
+    _get_registry.cache_clear()
+
+
 def validate_json(document: dict[str, Any], schema: dict[str, Any], schema_provider=None) -> tuple[bool, list[str]]:
     """Validate a JSON document against a JSON schema.
 
+    Compiled validators are cached per schema for the lifetime of the process,
+    and valid documents return without collecting error details.
+
     Args:
         document: The JSON document to validate.
         schema: The JSON schema to validate against.
@@ -104,13 +180,11 @@ def validate_json(document: dict[str, Any], schema: dict[str, Any], schema_provi
     """
     del schema_provider
     try:
-        normalized_schema = _strip_allof_additional_properties(schema)
-        registry = _build_registry()
-        validator = Draft202012Validator(normalized_schema, registry=registry)
-        errors = sorted(validator.iter_errors(document), key=lambda e: e.path)
-        if not errors:
+        validator = _get_validator(schema)
+        if validator.is_valid(document):
             return True, []
 
+        errors = sorted(validator.iter_errors(document), key=lambda e: e.path)
         messages: list[str] = []
         for err in errors:
             path = ".".join([str(p) for p in err.absolute_path])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Manual microbenchmark for per-event schema validation cost.
+
+Compares the uncached validation path (rebuild the registry, normalize the
+schema and compile a fresh validator for every call) with validate_json(),
+which reuses a compiled validator per schema.
+
+Usage:
+    python tests/benchmark_validate_json.py --iterations 2000
+"""
+
+import argparse
+import time
+import uuid
+
+from copilot_schema_validation import create_schema_provider, validate_json
+from copilot_schema_validation.schema_validator import _build_registry, _strip_allof_additional_properties
+from jsonschema import Draft202012Validator
+
+
+def build_event() -> dict:
+    """Build a valid JSONParsed event."""
+    return {
+        "event_type": "JSONParsed",
+        "event_id": str(uuid.uuid4()),
+        "timestamp": "2025-01-01T00:00:00Z",
+        "version": "1.0",
+        "data": {
+            "archive_id": "0123456789abcdef",
+            "message_doc_ids": ["0123456789abcdef"],
+            "message_count": 1,
+            "thread_ids": ["fedcba9876543210"],
+            "thread_count": 1,
+            "parsing_duration_seconds": 0.5,
+        },
+    }
+
+
+def validate_uncached(document: dict, schema: dict) -> tuple[bool, list[str]]:
+    """Validation path without caching, as every call used to run it."""
+    validator = Draft202012Validator(_strip_allof_additional_properties(schema), registry=_build_registry())
+    errors = sorted(validator.iter_errors(document), key=lambda e: e.path)
+    return not errors, [err.message for err in errors]
+
+
+def measure(func, event: dict, schema: dict, iterations: int) -> float:
+    """Return the mean time per validation in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(event, schema)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Run the benchmark and print per-event costs."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Validations per variant")
+    args = parser.parse_args()
+
+    schema = create_schema_provider().get_schema("JSONParsed")
+    event = build_event()
+
+    valid, errors = validate_json(event, schema)
+    if not valid:
+        raise SystemExit(f"Benchmark event does not match the JSONParsed schema: {errors}")
+
+    before = measure(validate_uncached, event, schema, args.iterations)
+    after = measure(validate_json, event, schema, args.iterations)
+
+    print(f"uncached:      {before:9.1f} us/event")
+    print(f"validate_json: {after:9.1f} us/event  ({before / after:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -53,3 +53,45 @@ def test_validate_json_malformed_schema():
 
     assert valid is False
     assert len(errors) > 0
+
+
+def test_validate_json_compiles_each_schema_once(monkeypatch):
+    from copilot_schema_validation import schema_validator
+
+    schema_validator.reset_validator_cache()
+    compiled = []
+    original = schema_validator.Draft202012Validator
+
+    def counting_validator(*args, **kwargs):
+        compiled.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(schema_validator, "Draft202012Validator", counting_validator)
+
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+    for _ in range(3):
+        assert validate_json({"name": "Alice"}, schema) == (True, [])
+    # An equal schema held in a different object reuses the compiled validator
+    assert validate_json({"name": 1}, dict(schema))[0] is False
+
+    assert len(compiled) == 1
+
+
+def test_validate_json_builds_registry_once(monkeypatch):
+    from copilot_schema_validation import schema_validator
+
+    schema_validator.reset_validator_cache()
+    calls = []
+    original = schema_validator._build_registry
+
+    def counting_build_registry():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(schema_validator, "_build_registry", counting_build_registry)
+
+    validate_json({"a": 1}, {"type": "object"})
+    validate_json({"b": 1}, {"type": "object", "required": ["b"]})
+
+    assert len(calls) == 1
+    schema_validator.reset_validator_cache()
@@ -50,6 +50,7 @@ class StartupRequeue:
         id_field: str,
         build_event_data: Callable[[dict[str, Any]], dict[str, Any]],
         limit: int = 1000,
+        projection: dict[str, Any] | None = None,
     ) -> int:
         """Requeue incomplete documents from a collection.
 
@@ -61,6 +62,8 @@ class StartupRequeue:
             id_field: Document ID field name (e.g., "archive_id")
             build_event_data: Function to build event data from document
             limit: Maximum documents to requeue (default: 1000)
+            projection: Optional projection limiting the fetched fields to those
+                build_event_data reads (default: whole documents)
 
         Returns:
             Number of documents requeued
@@ -74,10 +77,12 @@ class StartupRequeue:
 
         try:
             # Query for incomplete documents
+            query_kwargs: dict[str, Any] = {"projection": projection} if projection else {}
             incomplete_docs = self.document_store.query_documents(
                 collection=collection,
                 filter_dict=query,
                 limit=limit,
+                **query_kwargs,
             )
 
             if not incomplete_docs:
@@ -86,6 +91,12 @@ class StartupRequeue:
 
             count = len(incomplete_docs)
             logger.info(f"Found {count} incomplete documents in {collection}, requeuing...")
+            if count >= limit:
+                # The rest are picked up by the next startup scan once these complete
+                logger.warning(
+                    f"Startup requeue for {collection} reached its limit of {limit} documents; "
+                    "remaining incomplete documents were not requeued"
+                )
 
             # Requeue each document
             requeued = 0
@@ -332,6 +332,60 @@ class TestStartupRequeue:
         call_kwargs = mock_store.query_documents.call_args[1]
         assert call_kwargs["limit"] == 50
 
+    def test_requeue_with_projection(self):
+        """Test requeue passes the projection to the document store query."""
+        mock_store = Mock()
+        mock_publisher = Mock()
+        mock_store.query_documents.return_value = [{"_id": "abcd1234abcd1234", "message_doc_id": "aabbccddaabbccdd"}]
+
+        requeue = StartupRequeue(
+            document_store=mock_store,
+            publisher=mock_publisher,
+        )
+
+        count = requeue.requeue_incomplete(
+            collection="chunks",
+            query={"embedding_generated": False},
+            event_type="ChunksPrepared",
+            routing_key="chunks.prepared",
+            id_field="_id",
+            build_event_data=lambda doc: {"message_doc_ids": [doc.get("message_doc_id")]},
+            projection={"message_doc_id": 1},
+        )
+
+        assert count == 1
+        mock_store.query_documents.assert_called_once_with(
+            collection="chunks",
+            filter_dict={"embedding_generated": False},
+            limit=1000,
+            projection={"message_doc_id": 1},
+        )
+
+    def test_requeue_warns_when_limit_reached(self, caplog):
+        """Test requeue logs a warning when the scan is truncated at the limit."""
+        mock_store = Mock()
+        mock_publisher = Mock()
+        mock_store.query_documents.return_value = [{"_id": f"doc{i}"} for i in range(2)]
+
+        requeue = StartupRequeue(
+            document_store=mock_store,
+            publisher=mock_publisher,
+        )
+
+        with caplog.at_level("WARNING", logger="copilot_startup.startup_requeue"):
+            count = requeue.requeue_incomplete(
+                collection="chunks",
+                query={"embedding_generated": False},
+                event_type="ChunksPrepared",
+                routing_key="chunks.prepared",
+                id_field="_id",
+                build_event_data=lambda doc: {"chunk_ids": [doc.get("_id")]},
+                limit=2,
+            )
+
+        assert count == 2
+        assert "reached its limit of 2 documents" in caplog.text
+
     def test_requeue_emits_error_metrics_on_failure(self):
         """Test error metrics are emitted on query failure."""
         # Setup mocks
@@ -10,16 +10,20 @@ in the Copilot-for-Consensus system.
 __version__ = "0.1.0"
 
 from .document_store import (  # noqa: E402
+    BulkWriteResult,
     DocumentAlreadyExistsError,
     DocumentNotFoundError,
+    DocumentPage,
     DocumentStore,
     DocumentStoreConnectionError,
     DocumentStoreError,
     DocumentStoreNotConnectedError,
+    InvalidCursorError,
 )
 from .factory import create_document_store  # noqa: E402
 from .schema_registry import (  # noqa: E402
     get_collection_fields,
+    get_collection_indexes,
     reset_registry,
     sanitize_document,
     sanitize_documents,
@@ -32,15 +36,19 @@ from .validating_document_store import (  # noqa: E402
 __all__ = [
     "__version__",
     "create_document_store",
+    "BulkWriteResult",
+    "DocumentPage",
     "DocumentStore",
     "DocumentStoreError",
     "DocumentStoreNotConnectedError",
     "DocumentStoreConnectionError",
     "DocumentNotFoundError",
     "DocumentAlreadyExistsError",
+    "InvalidCursorError",
     "DocumentValidationError",
     "ValidatingDocumentStore",
     "get_collection_fields",
+    "get_collection_indexes",
     "reset_registry",
     "sanitize_document",
     "sanitize_documents",
@@ -7,17 +7,29 @@ import copy
 import logging
 import re
 import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from copilot_config.generated.adapters.document_store import DriverConfig_DocumentStore_AzureCosmosdb
 
 from .document_store import (
+    DEFAULT_PAGE_SIZE,
+    BulkWriteResult,
     DocumentAlreadyExistsError,
     DocumentNotFoundError,
+    DocumentPage,
     DocumentStore,
     DocumentStoreConnectionError,
     DocumentStoreError,
     DocumentStoreNotConnectedError,
+    InvalidCursorError,
+    apply_projection,
+    check_page_size,
+    compute_operator_patch,
+    decode_cursor,
+    encode_cursor,
+    parse_projection,
 )
 from .schema_registry import sanitize_document, sanitize_documents
 
@@ -31,6 +43,15 @@ try:
 except ImportError:
     cosmos_exceptions = None
 
+# Maximum number of concurrent requests issued by a single bulk operation.
+# Every document is its own logical partition (partition key /id), so Cosmos
+# transactional batches (single partition only) cannot group them; bulk
+# operations fan out point writes instead.
+BULK_MAX_CONCURRENCY = 16
+
+# Attempts of an ETag-conditional read-modify-write before giving up on contention
+UPDATE_OPERATOR_MAX_ATTEMPTS = 10
+
 
 class AzureCosmosDocumentStore(DocumentStore):
     """Azure Cosmos DB document store implementation using Core (SQL) API.
@@ -124,6 +145,32 @@ class AzureCosmosDocumentStore(DocumentStore):
 
         return True
 
+    def _select_list(self, projection: dict[str, Any] | None) -> str:
+        """Build the SELECT list of a query for a projection.
+
+        Included fields are selected individually so that only they are
+        transferred; excluded fields cannot be expressed in Cosmos SQL, so
+        exclusion projections select the whole document.
+
+        Args:
+            projection: MongoDB-style projection, or None
+
+        Returns:
+            SELECT list, e.g. "*" or "c._id, c.thread_id"
+
+        Raises:
+            DocumentStoreError: If the projection is invalid or names an unsafe field
+        """
+        if not projection:
+            return "*"
+        include, fields = parse_projection(projection)
+        if not include:
+            return "*"
+        invalid = sorted(name for name in fields if not self._is_valid_field_name(name))
+        if invalid:
+            raise DocumentStoreError(f"Invalid projection field names {invalid}")
+        return ", ".join(f"c.{name}" for name in sorted(fields))
+
     def _is_valid_document_id(self, doc_id: str) -> bool:
         """Validate that a document ID meets Cosmos DB requirements.
 
@@ -347,6 +394,146 @@ class AzureCosmosDocumentStore(DocumentStore):
             logger.error(f"AzureCosmosDocumentStore: insert failed - {e}")
             raise DocumentStoreError(f"Failed to insert document into {collection}") from e
 
+    def insert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents using concurrent point writes.
+
+        Args:
+            collection: Name of the logical collection
+            docs: Documents to insert
+
+        Returns:
+            BulkWriteResult with the inserted IDs and per-item errors
+            (DocumentAlreadyExistsError for duplicates)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+        """
+        # Resolve the container once up front so connection problems surface immediately
+        self._get_container_for_collection(collection)
+
+        result = self._execute_concurrently(docs, lambda doc: self.insert_document(collection, doc))
+        logger.debug(
+            f"AzureCosmosDocumentStore: inserted {len(result.succeeded)} documents into {collection}, "
+            f"{len(result.errors)} failed"
+        )
+        return result
+
+    def upsert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert or replace multiple documents using concurrent upsert_item calls.
+
+        Args:
+            collection: Name of the logical collection
+            docs: Documents to upsert; each must carry an ``_id``
+
+        Returns:
+            BulkWriteResult with the written IDs and per-item errors
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+        """
+        container = self._get_container_for_collection(collection)
+
+        def _upsert(doc: dict[str, Any]) -> str:
+            if doc.get("_id") is None:
+                raise DocumentStoreError("Document has no _id to upsert on")
+
+            doc_id = doc["id"] if doc.get("id") is not None else doc["_id"]
+            if not self._is_valid_document_id(doc_id):
+                raise DocumentStoreError(
+                    f"Invalid document ID '{doc_id}': IDs cannot contain '/', '\\', '#', '?', or control characters"
+                )
+
+            doc_copy = copy.deepcopy(doc)
+            doc_copy["id"] = doc_id
+            try:
+                container.upsert_item(body=doc_copy)
+            except cosmos_exceptions.CosmosHttpResponseError as e:
+                if e.status_code == 429:
+                    logger.warning(f"AzureCosmosDocumentStore: throttled during upsert - {e}")
+                    raise DocumentStoreError(f"Throttled during upsert: {str(e)}") from e
+                logger.error(f"AzureCosmosDocumentStore: upsert failed - {e}")
+                raise DocumentStoreError(f"Failed to upsert document {doc_id} into {collection}") from e
+            return doc_id
+
+        result = self._execute_concurrently(docs, _upsert)
+        logger.debug(f"AzureCosmosDocumentStore: upserted {len(result.succeeded)} documents into {collection}")
+        return result
+
+    def update_documents(self, collection: str, updates: list[tuple[str, dict[str, Any]]]) -> BulkWriteResult:
+        """Apply patches to multiple documents using concurrent point updates.
+
+        Args:
+            collection: Name of the logical collection
+            updates: (document ID, patch) pairs
+
+        Returns:
+            BulkWriteResult with the updated IDs and per-item errors
+            (DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+        """
+        self._get_container_for_collection(collection)
+
+        def _update(update: tuple[str, dict[str, Any]]) -> str:
+            doc_id, patch = update
+            self.update_document(collection, doc_id, patch)
+            return doc_id
+
+        result = self._execute_concurrently(updates, _update)
+        logger.debug(f"AzureCosmosDocumentStore: updated {len(result.succeeded)} documents in {collection}")
+        return result
+
+    def delete_documents(self, collection: str, doc_ids: list[str]) -> BulkWriteResult:
+        """Delete multiple documents using concurrent point deletes.
+
+        Args:
+            collection: Name of the logical collection
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            BulkWriteResult with the deleted IDs and per-item errors
+            (DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+        """
+        self._get_container_for_collection(collection)
+
+        def _delete(doc_id: str) -> str:
+            self.delete_document(collection, doc_id)
+            return doc_id
+
+        result = self._execute_concurrently(doc_ids, _delete)
+        logger.debug(f"AzureCosmosDocumentStore: deleted {len(result.succeeded)} documents from {collection}")
+        return result
+
+    def _execute_concurrently(self, items: list[Any], operation: Callable[[Any], str]) -> BulkWriteResult:
+        """Run a per-item write operation concurrently and collect per-item outcomes.
+
+        Args:
+            items: Inputs to the operation, one per document
+            operation: Callable performing one write and returning the document ID
+
+        Returns:
+            BulkWriteResult in input order
+        """
+        result = BulkWriteResult()
+        if not items:
+            return result
+
+        doc_ids: dict[int, str] = {}
+        with ThreadPoolExecutor(max_workers=min(BULK_MAX_CONCURRENCY, len(items))) as executor:
+            futures = [executor.submit(operation, item) for item in items]
+            for index, future in enumerate(futures):
+                try:
+                    doc_ids[index] = future.result()
+                except Exception as e:
+                    result.errors[index] = e
+
+        result.succeeded = [doc_ids[index] for index in sorted(doc_ids)]
+        return result
+
     def get_document(self, collection: str, doc_id: str) -> dict[str, Any] | None:
         """Retrieve a document by its ID.
 
@@ -390,6 +577,116 @@ class AzureCosmosDocumentStore(DocumentStore):
             logger.error(f"AzureCosmosDocumentStore: get_document failed - {e}", exc_info=True)
             raise DocumentStoreError(f"Failed to retrieve document {doc_id} from {collection}") from e
 
+    def _build_query(
+        self,
+        filter_dict: dict[str, Any],
+        sort_by: str | None,
+        sort_order: str,
+        projection: dict[str, Any] | None,
+    ) -> tuple[str, list[dict[str, object]]] | None:
+        """Translate a query_documents() filter, sort and projection into Cosmos SQL.
+
+        Supports MongoDB-style operators: $in, $eq
+
+        Args:
+            filter_dict: Filter criteria as dictionary
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc')
+            projection: Optional projection of top-level fields
+
+        Returns:
+            Tuple of (query, parameters) without OFFSET/LIMIT, or None if no
+            document can match (an empty $in list)
+
+        Raises:
+            DocumentStoreError: If the sort or projection is invalid
+        """
+        # Build SQL query for Cosmos DB
+        # Each collection has its own container, so no collection filter needed
+        query = f"SELECT {self._select_list(projection)} FROM c WHERE 1=1"
+        parameters: list[dict[str, object]] = []
+
+        param_counter = 0
+
+        # Add filter conditions
+        for key, value in filter_dict.items():
+            # Validate field name to prevent SQL injection
+            if not self._is_valid_field_name(key):
+                logger.warning(f"AzureCosmosDocumentStore: skipping invalid field name '{key}'")
+                continue
+
+            if isinstance(value, dict):
+                # Handle MongoDB-style operators
+                # Validate that all keys in the dict are operators (start with '$')
+                non_operators = [k for k in value.keys() if not k.startswith("$")]
+                if non_operators:
+                    logger.warning(
+                        f"AzureCosmosDocumentStore: filter dict for '{key}' contains non-operator keys "
+                        f"{non_operators}, treating as invalid - skipping field"
+                    )
+                    continue
+
+                for op, op_value in value.items():
+                    if op == "$in":
+                        # Translate $in to Cosmos SQL IN operator
+                        # Example: {"status": {"$in": ["pending", "processing"]}}
+                        # becomes: AND c.status IN (@param0, @param1)
+                        if not isinstance(op_value, list):
+                            logger.warning(
+                                "AzureCosmosDocumentStore: $in operator requires list value, "
+                                f"got {type(op_value).__name__}"
+                            )
+                            continue
+                        if not op_value:
+                            # Empty list - no documents match
+                            logger.debug(
+                                "AzureCosmosDocumentStore: $in operator with empty list " "- returning empty result"
+                            )
+                            return None
+
+                        # Build parameter list for IN clause
+                        param_names = []
+                        for item in op_value:
+                            param_name = f"@param{param_counter}"
+                            param_counter += 1
+                            param_names.append(param_name)
+                            parameters.append({"name": param_name, "value": item})
+
+                        query += f" AND c.{key} IN ({', '.join(param_names)})"
+                    elif op == "$eq":
+                        # Explicit equality
+                        param_name = f"@param{param_counter}"
+                        param_counter += 1
+                        query += f" AND c.{key} = {param_name}"
+                        parameters.append({"name": param_name, "value": op_value})
+                    else:
+                        logger.warning(
+                            f"AzureCosmosDocumentStore: unsupported operator '{op}' in query_documents, skipping"
+                        )
+            else:
+                # Simple equality check
+                param_name = f"@param{param_counter}"
+                param_counter += 1
+                query += f" AND c.{key} = {param_name}"
+                parameters.append({"name": param_name, "value": value})
+
+        # Add sorting if requested
+        if sort_by:
+            if not self._is_valid_field_name(sort_by):
+                raise DocumentStoreError(f"Invalid sort_by field name '{sort_by}'")
+            if sort_order not in ("asc", "desc"):
+                raise DocumentStoreError(
+                    f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'"
+                )
+            order = "DESC" if sort_order == "desc" else "ASC"
+            # Single-field ORDER BY works with the default /* range index.
+            # Documents with missing/null sort fields sort as the lowest
+            # value (first in ASC, last in DESC). This is Cosmos DB's
+            # native behavior and the canonical contract for all backends.
+            query += f" ORDER BY c.{sort_by} {order}"
+
+        return query, parameters
+
     def query_documents(
         self,
         collection: str,
@@ -397,6 +694,7 @@ class AzureCosmosDocumentStore(DocumentStore):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents matching the filter criteria.
 
@@ -411,6 +709,8 @@ class AzureCosmosDocumentStore(DocumentStore):
             limit: Maximum number of documents to return
             sort_by: Optional field name to sort results by
             sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields; inclusions become the
+                SELECT list, exclusions are applied to the returned documents
 
         Returns:
             List of sanitized matching documents (empty list if no matches)
@@ -423,89 +723,10 @@ class AzureCosmosDocumentStore(DocumentStore):
         container = self._get_container_for_collection(collection)
 
         try:
-            # Build SQL query for Cosmos DB
-            # Each collection has its own container, so no collection filter needed
-            query = "SELECT * FROM c WHERE 1=1"
-            parameters: list[dict[str, object]] = []
-
-            param_counter = 0
-
-            # Add filter conditions
-            for key, value in filter_dict.items():
-                # Validate field name to prevent SQL injection
-                if not self._is_valid_field_name(key):
-                    logger.warning(f"AzureCosmosDocumentStore: skipping invalid field name '{key}'")
-                    continue
-
-                if isinstance(value, dict):
-                    # Handle MongoDB-style operators
-                    # Validate that all keys in the dict are operators (start with '$')
-                    non_operators = [k for k in value.keys() if not k.startswith("$")]
-                    if non_operators:
-                        logger.warning(
-                            f"AzureCosmosDocumentStore: filter dict for '{key}' contains non-operator keys "
-                            f"{non_operators}, treating as invalid - skipping field"
-                        )
-                        continue
-
-                    for op, op_value in value.items():
-                        if op == "$in":
-                            # Translate $in to Cosmos SQL IN operator
-                            # Example: {"status": {"$in": ["pending", "processing"]}}
-                            # becomes: AND c.status IN (@param0, @param1)
-                            if not isinstance(op_value, list):
-                                logger.warning(
-                                    "AzureCosmosDocumentStore: $in operator requires list value, "
-                                    f"got {type(op_value).__name__}"
-                                )
-                                continue
-                            if not op_value:
-                                # Empty list - no documents match
-                                logger.debug(
-                                    "AzureCosmosDocumentStore: $in operator with empty list " "- returning empty result"
-                                )
-                                return []
-
-                            # Build parameter list for IN clause
-                            param_names = []
-                            for item in op_value:
-                                param_name = f"@param{param_counter}"
-                                param_counter += 1
-                                param_names.append(param_name)
-                                parameters.append({"name": param_name, "value": item})
-
-                            query += f" AND c.{key} IN ({', '.join(param_names)})"
-                        elif op == "$eq":
-                            # Explicit equality
-                            param_name = f"@param{param_counter}"
-                            param_counter += 1
-                            query += f" AND c.{key} = {param_name}"
-                            parameters.append({"name": param_name, "value": op_value})
-                        else:
-                            logger.warning(
-                                f"AzureCosmosDocumentStore: unsupported operator '{op}' in query_documents, skipping"
-                            )
-                else:
-                    # Simple equality check
-                    param_name = f"@param{param_counter}"
-                    param_counter += 1
-                    query += f" AND c.{key} = {param_name}"
-                    parameters.append({"name": param_name, "value": value})
-
-            # Add sorting if requested
-            if sort_by:
-                if not self._is_valid_field_name(sort_by):
-                    raise DocumentStoreError(f"Invalid sort_by field name '{sort_by}'")
-                if sort_order not in ("asc", "desc"):
-                    raise DocumentStoreError(
-                        f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'"
-                    )
-                order = "DESC" if sort_order == "desc" else "ASC"
-                # Single-field ORDER BY works with the default /* range index.
-                # Documents with missing/null sort fields sort as the lowest
-                # value (first in ASC, last in DESC). This is Cosmos DB's
-                # native behavior and the canonical contract for all backends.
-                query += f" ORDER BY c.{sort_by} {order}"
+            built = self._build_query(filter_dict, sort_by, sort_order, projection)
+            if built is None:
+                return []
+            query, parameters = built
 
             # Add limit (validate to prevent SQL injection)
             # Cosmos DB requires OFFSET...LIMIT syntax, not standalone LIMIT
@@ -522,6 +743,8 @@ class AzureCosmosDocumentStore(DocumentStore):
                 f"AzureCosmosDocumentStore: query on {collection} with {filter_dict} "
                 f"returned {len(items)} documents"
             )
+            if projection:
+                items = [apply_projection(item, projection) for item in items]
             return sanitize_documents(items, collection)
 
         except DocumentStoreError:
@@ -537,6 +760,145 @@ class AzureCosmosDocumentStore(DocumentStore):
             logger.error(f"AzureCosmosDocumentStore: query_documents failed - {e}", exc_info=True)
             raise DocumentStoreError(f"Failed to query documents from {collection}") from e
 
+    def query_page(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+        cursor: str | None = None,
+    ) -> DocumentPage:
+        """Query one page of matching documents using Cosmos DB continuation tokens.
+
+        The cursor wraps the continuation token returned by Cosmos DB, so the
+        next page resumes the query where it stopped instead of re-reading
+        the preceding pages. Cosmos DB may return fewer than ``page_size``
+        documents in a page that is not the last one.
+
+        Args:
+            collection: Name of the logical collection
+            filter_dict: Filter criteria as dictionary (supports equality and MongoDB operators)
+            page_size: Maximum number of documents in the page
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            DocumentPage with the sanitized documents and the cursor of the next page
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+            InvalidCursorError: If the cursor is malformed or does not match the query
+            DocumentStoreError: If the page size is invalid or the query fails
+        """
+        container = self._get_container_for_collection(collection)
+        check_page_size(page_size)
+
+        token = None
+        if cursor:
+            token = decode_cursor(cursor, sort_by, sort_order).get("token")
+            if not isinstance(token, str):
+                raise InvalidCursorError("Invalid pagination cursor")
+
+        try:
+            built = self._build_query(filter_dict, sort_by, sort_order, projection)
+            if built is None:
+                return DocumentPage()
+            query, parameters = built
+
+            pages = container.query_items(
+                query=query,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=page_size,
+            ).by_page(token)
+            items = list(next(pages, []))
+            next_token = pages.continuation_token
+
+        except DocumentStoreError:
+            raise
+        except cosmos_exceptions.CosmosHttpResponseError as e:
+            if e.status_code == 429:
+                logger.warning(f"AzureCosmosDocumentStore: throttled during query - {e}")
+                raise DocumentStoreError(f"Throttled during query: {str(e)}") from e
+            if e.status_code == 400 and token is not None:
+                # Cosmos DB rejects continuation tokens that no longer match the query
+                raise InvalidCursorError("Invalid pagination cursor") from e
+            logger.error(f"AzureCosmosDocumentStore: query_page failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to query documents from {collection}") from e
+        except Exception as e:
+            logger.error(f"AzureCosmosDocumentStore: query_page failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to query documents from {collection}") from e
+
+        if projection:
+            items = [apply_projection(item, projection) for item in items]
+        next_cursor = encode_cursor({"token": next_token}, sort_by, sort_order) if next_token else None
+        return DocumentPage(documents=sanitize_documents(items, collection), next_cursor=next_cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all matching documents.
+
+        The Cosmos DB query iterator fetches ``page_size`` items per request
+        and follows the continuation tokens as the caller consumes them.
+
+        Args:
+            collection: Name of the logical collection
+            filter_dict: Filter criteria as dictionary (all documents if omitted)
+            page_size: Number of documents fetched per round-trip
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+
+        Yields:
+            Sanitized matching documents
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+            DocumentStoreError: If the page size is invalid or the query fails
+        """
+        container = self._get_container_for_collection(collection)
+        check_page_size(page_size)
+
+        try:
+            built = self._build_query(filter_dict or {}, sort_by, sort_order, projection)
+            if built is None:
+                return
+            query, parameters = built
+
+            items = container.query_items(
+                query=query,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=page_size,
+            )
+            for item in items:
+                if projection:
+                    item = apply_projection(item, projection)
+                yield sanitize_document(item, collection)
+
+        except DocumentStoreError:
+            raise
+        except cosmos_exceptions.CosmosHttpResponseError as e:
+            if e.status_code == 429:
+                logger.warning(f"AzureCosmosDocumentStore: throttled during query - {e}")
+                raise DocumentStoreError(f"Throttled during query: {str(e)}") from e
+            logger.error(f"AzureCosmosDocumentStore: iter_documents failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to iterate documents from {collection}") from e
+        except Exception as e:
+            logger.error(f"AzureCosmosDocumentStore: iter_documents failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to iterate documents from {collection}") from e
+
     def update_document(self, collection: str, doc_id: str, patch: dict[str, Any]) -> None:
         """Update a document with the provided patch.
 
@@ -604,6 +966,61 @@ class AzureCosmosDocumentStore(DocumentStore):
             logger.error(f"AzureCosmosDocumentStore: update_document failed - {e}", exc_info=True)
             raise DocumentStoreError(f"Failed to update document {doc_id} in {collection}") from e
 
+    def apply_update_operators(self, collection: str, doc_id: str, operators: dict[str, dict[str, Any]]) -> None:
+        """Update a document with MongoDB-style update operators.
+
+        Cosmos DB patch operations cannot express $min/$max/$addToSet, so the
+        new values are computed from the current document and written back
+        with an ETag condition. A concurrent change makes the write fail and
+        the update is recomputed from the new document.
+
+        Args:
+            collection: Name of the logical collection
+            doc_id: Document ID
+            operators: Update operators ($inc, $min, $max, $addToSet)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to Cosmos DB
+            DocumentNotFoundError: If document does not exist
+            DocumentStoreError: If an operator is unsupported or the update fails
+        """
+        from azure.core import MatchConditions
+
+        container = self._get_container_for_collection(collection)
+
+        try:
+            for _ in range(UPDATE_OPERATOR_MAX_ATTEMPTS):
+                try:
+                    existing_doc = container.read_item(item=doc_id, partition_key=doc_id)
+                except cosmos_exceptions.CosmosResourceNotFoundError:
+                    raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+
+                patch = compute_operator_patch(existing_doc, operators)
+                if not patch:
+                    return
+                try:
+                    container.replace_item(
+                        item=doc_id,
+                        body={**existing_doc, **patch},
+                        etag=existing_doc.get("_etag"),
+                        match_condition=MatchConditions.IfNotModified,
+                    )
+                except cosmos_exceptions.CosmosAccessConditionFailedError:
+                    logger.debug(f"AzureCosmosDocumentStore: document {doc_id} changed concurrently, retrying")
+                    continue
+                logger.debug(f"AzureCosmosDocumentStore: applied update operators to document {doc_id} in {collection}")
+                return
+        except (DocumentNotFoundError, DocumentStoreError):
+            raise
+        except Exception as e:
+            logger.error(f"AzureCosmosDocumentStore: apply_update_operators failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to update document {doc_id} in {collection}") from e
+
+        raise DocumentStoreError(
+            f"Failed to update document {doc_id} in {collection}: "
+            f"changed concurrently {UPDATE_OPERATOR_MAX_ATTEMPTS} times"
+        )
+
     def delete_document(self, collection: str, doc_id: str) -> None:
         """Delete a document by its ID.
 
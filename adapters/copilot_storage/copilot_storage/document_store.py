@@ -3,7 +3,12 @@
 
 """Abstract document store interface for NoSQL backends."""
 
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -37,6 +42,201 @@ class DocumentAlreadyExistsError(DocumentStoreError):
     pass
 
 
+class InvalidCursorError(DocumentStoreError):
+    """Exception raised when a pagination cursor is malformed or does not match the query."""
+
+    pass
+
+
+@dataclass
+class BulkWriteResult:
+    """Per-item outcome of a bulk write operation.
+
+    Bulk writes are unordered: a failure on one item does not prevent the
+    remaining items from being written. Callers inspect ``errors`` to decide
+    which failures are permanent (e.g., duplicates) and which should be retried.
+
+    Attributes:
+        succeeded: IDs of the documents written successfully, in input order
+        errors: Exceptions for the items that failed, keyed by input position
+    """
+
+    succeeded: list[str] = field(default_factory=list)
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+
+@dataclass
+class DocumentPage:
+    """One page of a paginated query.
+
+    Attributes:
+        documents: Documents of the page, in query order
+        next_cursor: Opaque cursor of the following page, or None if this is the last page
+    """
+
+    documents: list[dict[str, Any]] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+# Documents fetched per round-trip by DocumentStore.query_page() and iter_documents()
+DEFAULT_PAGE_SIZE = 500
+
+# Update operators accepted by DocumentStore.apply_update_operators()
+UPDATE_OPERATORS = ("$inc", "$min", "$max", "$addToSet")
+
+
+def compute_operator_patch(doc: dict[str, Any], operators: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Compute the fields that MongoDB-style update operators change on a document.
+
+    Follows MongoDB semantics: $inc treats a missing field as 0, $min/$max set a
+    missing field and order null below any value, and $addToSet appends values
+    (a single value, or a list given as {"$each": [...]}) not already present.
+
+    Args:
+        doc: Current document
+        operators: Update operators, e.g. {"$inc": {"count": 1}}
+
+    Returns:
+        Patch with the new values of the changed fields
+
+    Raises:
+        DocumentStoreError: If an unsupported operator is used
+    """
+    patch: dict[str, Any] = {}
+    for operator, fields in operators.items():
+        if operator not in UPDATE_OPERATORS:
+            supported = ", ".join(UPDATE_OPERATORS)
+            raise DocumentStoreError(f"Unsupported update operator {operator}; supported: {supported}")
+        for name, value in fields.items():
+            current = doc.get(name)
+            if operator == "$inc":
+                patch[name] = (current or 0) + value
+            elif operator == "$min":
+                if name not in doc or (current is not None and value is not None and value < current):
+                    patch[name] = value
+            elif operator == "$max":
+                if name not in doc or current is None or (value is not None and value > current):
+                    patch[name] = value
+            else:
+                values = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+                existing = list(current or [])
+                merged = existing + [item for item in values if item not in existing]
+                if name not in doc or len(merged) != len(existing):
+                    patch[name] = merged
+    return patch
+
+
+def parse_projection(projection: dict[str, Any]) -> tuple[bool, set[str]]:
+    """Split a MongoDB-style projection into its mode and fields.
+
+    A projection either includes fields ({"thread_id": 1}) or excludes them
+    ({"body_raw": 0}); the two cannot be mixed. As in MongoDB, ``_id`` is
+    returned unless excluded with {"_id": 0}, which is allowed in both modes.
+    Only top-level fields are supported.
+
+    Args:
+        projection: Mapping of field name to 1/True (include) or 0/False (exclude)
+
+    Returns:
+        Tuple of (include, fields): with include=True only ``fields`` are
+        returned, otherwise every field except ``fields``
+
+    Raises:
+        DocumentStoreError: If the projection mixes inclusion and exclusion or uses nested fields
+    """
+    nested = [name for name in projection if "." in name]
+    if nested:
+        raise DocumentStoreError(f"Projection supports top-level fields only, got {nested}")
+
+    included = {name for name, value in projection.items() if value and name != "_id"}
+    excluded = {name for name, value in projection.items() if not value and name != "_id"}
+    if included and excluded:
+        raise DocumentStoreError("Projection cannot mix included and excluded fields (except _id)")
+
+    id_excluded = "_id" in projection and not projection["_id"]
+    if included or (not excluded and not id_excluded):
+        return True, included if id_excluded else included | {"_id"}
+    return False, excluded | {"_id"} if id_excluded else excluded
+
+
+def encode_cursor(state: dict[str, Any], sort_by: str | None, sort_order: str) -> str:
+    """Encode backend pagination state as an opaque, URL-safe cursor.
+
+    The sort of the query is recorded so that decode_cursor() can reject a
+    cursor that is reused with a different sort.
+
+    Args:
+        state: JSON-serializable pagination state (e.g., the last sort key, or a continuation token)
+        sort_by: Sort field of the query
+        sort_order: Sort order of the query
+
+    Returns:
+        Cursor string
+
+    Raises:
+        DocumentStoreError: If the state cannot be serialized (e.g., a non-JSON sort value)
+    """
+    try:
+        payload = json.dumps({**state, "sort": [sort_by, sort_order]}, separators=(",", ":"))
+    except (TypeError, ValueError) as e:
+        raise DocumentStoreError(f"Cannot encode pagination cursor: {e}") from e
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str | None, sort_order: str) -> dict[str, Any]:
+    """Decode a cursor created by encode_cursor().
+
+    Args:
+        cursor: Cursor string
+        sort_by: Sort field of the query the cursor is used with
+        sort_order: Sort order of the query the cursor is used with
+
+    Returns:
+        Pagination state
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a different sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(state, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    if state.pop("sort", None) != [sort_by, sort_order]:
+        raise InvalidCursorError("Pagination cursor was issued for a different sort")
+    return state
+
+
+def check_page_size(page_size: int) -> None:
+    """Validate the page size of a paginated query.
+
+    Raises:
+        DocumentStoreError: If page_size is not a positive integer
+    """
+    if not isinstance(page_size, int) or isinstance(page_size, bool) or page_size < 1:
+        raise DocumentStoreError(f"Invalid page_size '{page_size}': must be a positive integer")
+
+
+def apply_projection(doc: dict[str, Any], projection: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the fields of a document selected by a projection.
+
+    Args:
+        doc: Document
+        projection: MongoDB-style projection (see parse_projection), or None for all fields
+
+    Returns:
+        New document with the projected fields (the document itself if projection is None)
+    """
+    if not projection:
+        return doc
+    include, fields = parse_projection(projection)
+    if include:
+        return {name: doc[name] for name in doc if name in fields}
+    return {name: value for name, value in doc.items() if name not in fields}
+
+
 class DocumentStore(ABC):
     """Abstract base class for document storage backends."""
 
@@ -96,6 +296,7 @@ class DocumentStore(ABC):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents matching the filter criteria.
 
@@ -109,6 +310,8 @@ class DocumentStore(ABC):
             limit: Maximum number of documents to return
             sort_by: Optional field name to sort results by
             sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional MongoDB-style projection of top-level fields,
+                e.g. {"_id": 1, "thread_id": 1} or {"body_raw": 0} (see parse_projection)
 
         Returns:
             List of sanitized matching documents
@@ -119,6 +322,108 @@ class DocumentStore(ABC):
         """
         pass
 
+    def query_page(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+        cursor: str | None = None,
+    ) -> DocumentPage:
+        """Query one page of the documents matching the filter criteria.
+
+        Pass the ``next_cursor`` of a page to fetch the page after it; a
+        cursor is only valid for the same filter, sort and projection.
+        Backends override this with keyset pagination or native continuation
+        tokens so that every page costs the same. The default implementation
+        re-runs query_documents() with a growing limit and slices the result,
+        so page N costs O(N * page_size), and documents deleted between pages
+        shift the following pages.
+
+        Args:
+            collection: Name of the collection/table
+            filter_dict: Filter criteria as dictionary
+            page_size: Maximum number of documents in the page
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional MongoDB-style projection of top-level fields
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            DocumentPage with the sanitized documents and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or does not match the query
+            DocumentStoreError: If the page size is invalid or the query fails
+        """
+        check_page_size(page_size)
+        offset = 0
+        if cursor:
+            offset = decode_cursor(cursor, sort_by, sort_order).get("offset", -1)
+            if not isinstance(offset, int) or offset < 0:
+                raise InvalidCursorError("Invalid pagination cursor")
+
+        docs = self.query_documents(
+            collection,
+            filter_dict,
+            limit=offset + page_size + 1,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            projection=projection,
+        )
+        next_cursor = None
+        if len(docs) > offset + page_size:
+            next_cursor = encode_cursor({"offset": offset + page_size}, sort_by, sort_order)
+        return DocumentPage(documents=docs[offset : offset + page_size], next_cursor=next_cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all documents matching the filter criteria.
+
+        Unlike query_documents(), the result is not capped at a limit:
+        documents are fetched ``page_size`` at a time as the caller consumes
+        them. The default implementation walks query_page(); backends may
+        override it with a native streaming cursor.
+
+        Args:
+            collection: Name of the collection/table
+            filter_dict: Filter criteria as dictionary (all documents if omitted)
+            page_size: Number of documents fetched per round-trip
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional MongoDB-style projection of top-level fields
+
+        Yields:
+            Sanitized matching documents
+
+        Raises:
+            DocumentStoreError: If the page size is invalid or a query fails
+        """
+        cursor = None
+        while True:
+            page = self.query_page(
+                collection,
+                filter_dict or {},
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                projection=projection,
+                cursor=cursor,
+            )
+            yield from page.documents
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
     @abstractmethod
     def update_document(self, collection: str, doc_id: str, patch: dict[str, Any]) -> None:
         """Update a document with the provided patch.
@@ -147,3 +452,143 @@ class DocumentStore(ABC):
             DocumentStoreError: If delete operation fails
         """
         pass
+
+    def insert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents into the specified collection.
+
+        Backends override this to write the whole batch in as few round-trips
+        as possible; the default implementation calls insert_document() per item.
+
+        Args:
+            collection: Name of the collection/table
+            docs: Documents to insert
+
+        Returns:
+            BulkWriteResult with the inserted IDs and per-item errors
+            (e.g., DocumentAlreadyExistsError for duplicates)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to the store
+        """
+        result = BulkWriteResult()
+        for index, doc in enumerate(docs):
+            try:
+                result.succeeded.append(self.insert_document(collection, doc))
+            except DocumentStoreNotConnectedError:
+                raise
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
+    def upsert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents, replacing any existing document with the same ID.
+
+        Every document must carry its ID in ``_id``. The default implementation
+        falls back to delete + insert per existing document, which is not atomic;
+        backends override this with a native upsert.
+
+        Args:
+            collection: Name of the collection/table
+            docs: Documents to upsert
+
+        Returns:
+            BulkWriteResult with the written IDs and per-item errors
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to the store
+        """
+        result = BulkWriteResult()
+        for index, doc in enumerate(docs):
+            try:
+                if doc.get("_id") is None:
+                    raise DocumentStoreError(f"Document at position {index} has no _id to upsert on")
+                try:
+                    doc_id = self.insert_document(collection, doc)
+                except DocumentAlreadyExistsError:
+                    self.delete_document(collection, str(doc["_id"]))
+                    doc_id = self.insert_document(collection, doc)
+                result.succeeded.append(doc_id)
+            except DocumentStoreNotConnectedError:
+                raise
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
+    def update_documents(self, collection: str, updates: list[tuple[str, dict[str, Any]]]) -> BulkWriteResult:
+        """Apply patches to multiple documents.
+
+        The default implementation calls update_document() per item.
+
+        Args:
+            collection: Name of the collection/table
+            updates: (document ID, patch) pairs
+
+        Returns:
+            BulkWriteResult with the updated IDs and per-item errors
+            (e.g., DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to the store
+        """
+        result = BulkWriteResult()
+        for index, (doc_id, patch) in enumerate(updates):
+            try:
+                self.update_document(collection, doc_id, patch)
+                result.succeeded.append(doc_id)
+            except DocumentStoreNotConnectedError:
+                raise
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
+    def delete_documents(self, collection: str, doc_ids: list[str]) -> BulkWriteResult:
+        """Delete multiple documents by ID.
+
+        The default implementation calls delete_document() per item.
+
+        Args:
+            collection: Name of the collection/table
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            BulkWriteResult with the deleted IDs and per-item errors
+            (e.g., DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to the store
+        """
+        result = BulkWriteResult()
+        for index, doc_id in enumerate(doc_ids):
+            try:
+                self.delete_document(collection, doc_id)
+                result.succeeded.append(doc_id)
+            except DocumentStoreNotConnectedError:
+                raise
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
+    def apply_update_operators(self, collection: str, doc_id: str, operators: dict[str, dict[str, Any]]) -> None:
+        """Update a document with MongoDB-style update operators.
+
+        Supports $inc, $min, $max and $addToSet (see compute_operator_patch).
+        Unlike update_document(), the new values depend on the stored ones, so
+        concurrent writers can fold partial aggregates into one document. The
+        default implementation reads, computes and writes back, which is not
+        atomic; backends override it with a native atomic update.
+
+        Args:
+            collection: Name of the collection/table
+            doc_id: Document ID
+            operators: Update operators, e.g. {"$inc": {"message_count": 3}}
+
+        Raises:
+            DocumentNotFoundError: If document does not exist
+            DocumentStoreError: If an operator is unsupported or the update fails
+        """
+        current = self.get_document(collection, doc_id)
+        if current is None:
+            raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+        patch = compute_operator_patch(current, operators)
+        if patch:
+            self.update_document(collection, doc_id, patch)
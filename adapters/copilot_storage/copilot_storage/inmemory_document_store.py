@@ -4,40 +4,164 @@
 """In-memory document store for testing and local development."""
 
 import copy
+import heapq
 import logging
 import uuid
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from copilot_config.generated.adapters.document_store import DriverConfig_DocumentStore_Inmemory
 
-from .document_store import DocumentAlreadyExistsError, DocumentNotFoundError, DocumentStore, DocumentStoreError
+from .document_store import (
+    DEFAULT_PAGE_SIZE,
+    BulkWriteResult,
+    DocumentAlreadyExistsError,
+    DocumentNotFoundError,
+    DocumentPage,
+    DocumentStore,
+    DocumentStoreError,
+    InvalidCursorError,
+    apply_projection,
+    check_page_size,
+    decode_cursor,
+    encode_cursor,
+    parse_projection,
+)
 from .schema_registry import sanitize_document, sanitize_documents
 
 logger = logging.getLogger(__name__)
 
+# Fields the pipeline services filter and join on
+DEFAULT_INDEXED_FIELDS = ("thread_id", "archive_id", "message_doc_id", "embedding_generated")
+
+# Index bucket for documents whose field value is unhashable (e.g., a list)
+_UNHASHABLE = object()
+
+
+def _matches_condition(value: Any, condition: Any) -> bool:
+    """Check a field value against a query_documents() filter condition."""
+    if isinstance(condition, dict) and set(condition) == {"$in"}:
+        return value in condition["$in"]
+    return value == condition
+
+
+def _page_key(doc: dict[str, Any], sort_by: str | None) -> tuple[str, str]:
+    """Return the (sort key, _id) order of a document in paginated queries.
+
+    Sort keys follow query_documents(): None/missing values sort as the lowest value.
+    """
+    value = doc.get(sort_by) if sort_by else None
+    return (str(value) if value is not None else "", str(doc.get("_id", "")))
+
+
+def _index_key(value: Any) -> Any:
+    """Return the hash index key for a field value."""
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE
+    return value
+
+
+def _condition_values(condition: Any) -> list[Any] | None:
+    """Return the values an equality, $eq or $in condition can match, or None if it cannot use an index."""
+    if isinstance(condition, dict):
+        if set(condition) == {"$in"} and isinstance(condition["$in"], list | tuple):
+            values = list(condition["$in"])
+        elif set(condition) == {"$eq"}:
+            values = [condition["$eq"]]
+        else:
+            return None
+    else:
+        values = [condition]
+    if any(_index_key(value) is _UNHASHABLE for value in values):
+        return None
+    return values
+
+
+class _Collection(dict):
+    """Documents of one collection, keyed by ID, with a counter of writes.
+
+    The counter lets the store notice documents added, replaced or removed
+    directly through ``collections`` (as some tests do) and rebuild its indexes.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, dict[str, Any]]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
 
 class InMemoryDocumentStore(DocumentStore):
-    """In-memory document store implementation for testing."""
+    """In-memory document store implementation for testing.
+
+    Equality and ``$in`` filters on ``_id`` and on the indexed fields are
+    answered from hash indexes instead of scanning the collection. Stored
+    documents are copy-on-write: writes replace a document rather than
+    modifying it in place, so with ``copy_on_read=False`` reads can return
+    shallow copies that share nested values with the store. Callers must then
+    treat nested values (lists, dicts) of returned documents as read-only.
+    Every write, including one made directly through ``collections``,
+    refreshes or invalidates the indexes; editing a stored document's fields
+    in place does not and is not supported.
+    """
 
     @classmethod
     def from_config(cls, driver_config: DriverConfig_DocumentStore_Inmemory) -> "InMemoryDocumentStore":
         """Create an InMemoryDocumentStore from configuration.
 
         Args:
-            driver_config: Configuration object (ignored, no configuration needed)
+            driver_config: Configuration object with the optional copy_on_read setting
 
         Returns:
             InMemoryDocumentStore instance
         """
-        del driver_config
-        # InMemoryDocumentStore has no configuration parameters
-        return cls()
+        return cls(copy_on_read=driver_config.copy_on_read)
+
+    def __init__(self, indexed_fields: Iterable[str] = DEFAULT_INDEXED_FIELDS, copy_on_read: bool = True):
+        """Initialize in-memory document store.
 
-    def __init__(self):
-        """Initialize in-memory document store."""
-        self.collections: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        Args:
+            indexed_fields: Fields with a hash index in every collection
+            copy_on_read: Deep-copy documents returned by reads (False returns
+                shallow copies whose nested values must not be modified)
+        """
+        self.collections: dict[str, dict[str, dict[str, Any]]] = defaultdict(_Collection)
         self.connected = False
+        self.indexed_fields = frozenset(indexed_fields)
+        self.copy_on_read = copy_on_read
+        # collection -> field -> index key -> document IDs (dict used as an ordered set)
+        self._indexes: dict[str, dict[str, dict[Any, dict[str, None]]]] = {}
+        # Collection versions the indexes were maintained for, to detect direct writes
+        self._indexed_versions: dict[str, int] = {}
 
     def connect(self) -> None:
         """Pretend to connect.
@@ -76,7 +200,7 @@ class InMemoryDocumentStore(DocumentStore):
         doc_copy = copy.deepcopy(doc)
         doc_copy["_id"] = doc_id
 
-        self.collections[collection][doc_id] = doc_copy
+        self._store(collection, doc_id, doc_copy)
         logger.debug(f"InMemoryDocumentStore: inserted document {doc_id} into {collection}")
 
         return doc_id
@@ -98,7 +222,7 @@ class InMemoryDocumentStore(DocumentStore):
         if doc:
             logger.debug(f"InMemoryDocumentStore: retrieved document {doc_id} from {collection}")
             # Return a deep copy to prevent external mutations affecting stored data
-            return sanitize_document(copy.deepcopy(doc), collection)
+            return sanitize_document(self._read_copy(doc), collection)
         logger.debug(f"InMemoryDocumentStore: document {doc_id} not found in {collection}")
         return None
 
@@ -109,6 +233,7 @@ class InMemoryDocumentStore(DocumentStore):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents matching the filter criteria.
 
@@ -117,23 +242,26 @@ class InMemoryDocumentStore(DocumentStore):
 
         Args:
             collection: Name of the collection
-            filter_dict: Filter criteria as dictionary (simple equality checks)
+            filter_dict: Filter criteria as dictionary (equality checks, or {"$in": [...]})
             limit: Maximum number of documents to return
             sort_by: Optional field name to sort results by
             sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields (only projected fields are copied)
 
         Returns:
             List of sanitized matching documents
         """
+        if projection:
+            parse_projection(projection)
+
         results = []
 
-        for doc in self.collections[collection].values():
+        for doc in self._candidates(collection, filter_dict):
             # Check if document matches all filter criteria
-            matches = all(doc.get(key) == value for key, value in filter_dict.items())
+            matches = all(_matches_condition(doc.get(key), value) for key, value in filter_dict.items())
 
             if matches:
-                # Use deep copy to prevent external mutations affecting stored data
-                results.append(copy.deepcopy(doc))
+                results.append(doc)
 
                 # When no sort is requested, stop once we have enough results
                 if sort_by is None and len(results) >= limit:
@@ -158,13 +286,115 @@ class InMemoryDocumentStore(DocumentStore):
                 reverse=reverse,
             )
 
-        results = results[:limit]
+        # Copy only the returned documents to prevent external mutations affecting stored data
+        results = [self._read_copy(apply_projection(doc, projection)) for doc in results[:limit]]
 
         logger.debug(
             f"InMemoryDocumentStore: query on {collection} with {filter_dict} " f"returned {len(results)} documents"
         )
         return sanitize_documents(results, collection)
 
+    def query_page(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+        cursor: str | None = None,
+    ) -> DocumentPage:
+        """Query one page of matching documents using keyset pagination.
+
+        Matches are ordered by (sort key, _id) and the cursor records the key
+        of the last document returned, so a page resumes after that document
+        even if documents were inserted or deleted in between.
+
+        Args:
+            collection: Name of the collection
+            filter_dict: Filter criteria as dictionary (equality checks, or {"$in": [...]})
+            page_size: Maximum number of documents in the page
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            DocumentPage with the sanitized documents and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or does not match the query
+            DocumentStoreError: If the page size, sort order or projection is invalid
+        """
+        check_page_size(page_size)
+        if sort_order not in ("asc", "desc"):
+            raise DocumentStoreError(f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'")
+        if projection:
+            parse_projection(projection)
+
+        after = None
+        if cursor:
+            key = decode_cursor(cursor, sort_by, sort_order).get("key")
+            if not isinstance(key, list) or len(key) != 2:
+                raise InvalidCursorError("Invalid pagination cursor")
+            after = tuple(key)
+
+        descending = sort_order == "desc"
+        matches = []
+        for doc in self._matching(collection, filter_dict):
+            key = _page_key(doc, sort_by)
+            if after is None or (key < after if descending else key > after):
+                matches.append((key, doc))
+
+        # Select the next page_size + 1 documents without sorting every match
+        select = heapq.nlargest if descending else heapq.nsmallest
+        selected = select(page_size + 1, matches, key=lambda match: match[0])
+
+        next_cursor = None
+        if len(selected) > page_size:
+            selected = selected[:page_size]
+            next_cursor = encode_cursor({"key": list(selected[-1][0])}, sort_by, sort_order)
+
+        results = [self._read_copy(apply_projection(doc, projection)) for _, doc in selected]
+        return DocumentPage(documents=sanitize_documents(results, collection), next_cursor=next_cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all matching documents.
+
+        The matches are collected when iteration starts; since stored
+        documents are copy-on-write, writes made while iterating do not
+        affect the documents yielded. ``page_size`` is validated but unused.
+
+        Args:
+            collection: Name of the collection
+            filter_dict: Filter criteria as dictionary (all documents if omitted)
+            page_size: Number of documents fetched per round-trip
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+
+        Yields:
+            Sanitized matching documents
+        """
+        check_page_size(page_size)
+        if sort_order not in ("asc", "desc"):
+            raise DocumentStoreError(f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'")
+        if projection:
+            parse_projection(projection)
+
+        matches = list(self._matching(collection, filter_dict or {}))
+        matches.sort(key=lambda doc: _page_key(doc, sort_by), reverse=sort_order == "desc")
+        for doc in matches:
+            yield sanitize_document(self._read_copy(apply_projection(doc, projection)), collection)
+
     def update_document(self, collection: str, doc_id: str, patch: dict[str, Any]) -> None:
         """Update a document with the provided patch.
 
@@ -180,8 +410,8 @@ class InMemoryDocumentStore(DocumentStore):
             logger.debug(f"InMemoryDocumentStore: document {doc_id} not found in {collection}")
             raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
 
-        # Apply patch to document
-        self.collections[collection][doc_id].update(patch)
+        # Apply patch to a new version of the document (copy-on-write)
+        self._store(collection, doc_id, {**self.collections[collection][doc_id], **patch})
         logger.debug(f"InMemoryDocumentStore: updated document {doc_id} in {collection}")
 
     def delete_document(self, collection: str, doc_id: str) -> None:
@@ -195,12 +425,119 @@ class InMemoryDocumentStore(DocumentStore):
             DocumentNotFoundError: If document does not exist
         """
         if doc_id in self.collections[collection]:
-            del self.collections[collection][doc_id]
+            self._discard(collection, doc_id)
             logger.debug(f"InMemoryDocumentStore: deleted document {doc_id} from {collection}")
         else:
             logger.debug(f"InMemoryDocumentStore: document {doc_id} not found in {collection}")
             raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
 
+    def insert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents into the specified collection.
+
+        Args:
+            collection: Name of the collection
+            docs: Documents to insert
+
+        Returns:
+            BulkWriteResult with the inserted IDs and a DocumentAlreadyExistsError
+            for each document whose ID is already present
+        """
+        result = BulkWriteResult()
+        stored = self.collections[collection]
+
+        for index, doc in enumerate(docs):
+            doc_id = doc.get("_id", str(uuid.uuid4()))
+            if doc_id in stored:
+                result.errors[index] = DocumentAlreadyExistsError(
+                    f"Document with id {doc_id} already exists in collection {collection}"
+                )
+                continue
+
+            doc_copy = copy.deepcopy(doc)
+            doc_copy["_id"] = doc_id
+            self._store(collection, doc_id, doc_copy)
+            result.succeeded.append(doc_id)
+
+        logger.debug(
+            f"InMemoryDocumentStore: inserted {len(result.succeeded)} documents into {collection}, "
+            f"{len(result.errors)} failed"
+        )
+        return result
+
+    def upsert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents, replacing any existing document with the same ID.
+
+        Args:
+            collection: Name of the collection
+            docs: Documents to upsert; each must carry an ``_id``
+
+        Returns:
+            BulkWriteResult with the written IDs and per-item errors
+        """
+        result = BulkWriteResult()
+
+        for index, doc in enumerate(docs):
+            doc_id = doc.get("_id")
+            if doc_id is None:
+                result.errors[index] = DocumentStoreError(f"Document at position {index} has no _id to upsert on")
+                continue
+
+            self._store(collection, doc_id, copy.deepcopy(doc))
+            result.succeeded.append(doc_id)
+
+        logger.debug(f"InMemoryDocumentStore: upserted {len(result.succeeded)} documents into {collection}")
+        return result
+
+    def update_documents(self, collection: str, updates: list[tuple[str, dict[str, Any]]]) -> BulkWriteResult:
+        """Apply patches to multiple documents.
+
+        Args:
+            collection: Name of the collection
+            updates: (document ID, patch) pairs
+
+        Returns:
+            BulkWriteResult with the updated IDs and a DocumentNotFoundError
+            for each missing document
+        """
+        result = BulkWriteResult()
+        stored = self.collections[collection]
+
+        for index, (doc_id, patch) in enumerate(updates):
+            if doc_id not in stored:
+                result.errors[index] = DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+                continue
+
+            self._store(collection, doc_id, {**stored[doc_id], **patch})
+            result.succeeded.append(doc_id)
+
+        logger.debug(f"InMemoryDocumentStore: updated {len(result.succeeded)} documents in {collection}")
+        return result
+
+    def delete_documents(self, collection: str, doc_ids: list[str]) -> BulkWriteResult:
+        """Delete multiple documents by ID.
+
+        Args:
+            collection: Name of the collection
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            BulkWriteResult with the deleted IDs and a DocumentNotFoundError
+            for each missing document
+        """
+        result = BulkWriteResult()
+        stored = self.collections[collection]
+
+        for index, doc_id in enumerate(doc_ids):
+            if doc_id not in stored:
+                result.errors[index] = DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+                continue
+
+            self._discard(collection, doc_id)
+            result.succeeded.append(doc_id)
+
+        logger.debug(f"InMemoryDocumentStore: deleted {len(result.succeeded)} documents from {collection}")
+        return result
+
     def clear_collection(self, collection: str) -> None:
         """Clear all documents in a collection (useful for testing).
 
@@ -208,11 +545,15 @@ class InMemoryDocumentStore(DocumentStore):
             collection: Name of the collection
         """
         self.collections[collection].clear()
+        self._indexes.pop(collection, None)
+        self._indexed_versions.pop(collection, None)
         logger.debug(f"InMemoryDocumentStore: cleared collection {collection}")
 
     def clear_all(self) -> None:
         """Clear all collections (useful for testing)."""
         self.collections.clear()
+        self._indexes.clear()
+        self._indexed_versions.clear()
         logger.debug("InMemoryDocumentStore: cleared all collections")
 
     def aggregate_documents(self, collection: str, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -224,9 +565,9 @@ class InMemoryDocumentStore(DocumentStore):
         This is a simplified implementation that supports common aggregation stages
         for testing purposes. It supports: $match, $lookup, $limit.
 
-        **Note**: This implementation is optimized for testing with small datasets.
-        Performance may degrade with large collections due to O(N*M) complexity in
-        $lookup operations.
+        Stages work on the stored documents without copying them; only the
+        final results are copied. A leading $match uses the hash indexes, and
+        $lookup is a hash join.
 
         **Supported operators in $match**:
         - $exists: Check if a field exists
@@ -245,7 +586,12 @@ class InMemoryDocumentStore(DocumentStore):
             logger.debug(f"InMemoryDocumentStore: collection '{collection}' not found for aggregation")
             return []
 
-        results = [copy.deepcopy(doc) for doc in self.collections[collection].values()]
+        results: list[dict[str, Any]] | None = None
+        if pipeline and "$match" in pipeline[0] and isinstance(pipeline[0]["$match"], dict):
+            # Narrow the starting documents with the indexes; the $match stage still applies every condition
+            results = list(self._candidates(collection, pipeline[0]["$match"]))
+        if results is None:
+            results = list(self.collections[collection].values())
 
         for stage in pipeline:
             stage_name = list(stage.keys())[0]
@@ -266,6 +612,8 @@ class InMemoryDocumentStore(DocumentStore):
             else:
                 logger.warning(f"InMemoryDocumentStore: aggregation stage '{stage_name}' not implemented, skipping")
 
+        results = [self._read_copy(doc) for doc in results]
+
         logger.debug(f"InMemoryDocumentStore: aggregation on {collection} " f"returned {len(results)} documents")
         return sanitize_documents(results, collection, preserve_extra=True)
 
@@ -321,16 +669,16 @@ class InMemoryDocumentStore(DocumentStore):
     def _apply_lookup(self, documents: list[dict[str, Any]], lookup_spec: dict[str, Any]) -> list[dict[str, Any]]:
         """Apply $lookup stage to join with another collection.
 
-        **Performance Note**: This implementation has O(N*M) complexity where N is
-        the number of input documents and M is the size of the foreign collection.
-        It is suitable for testing but may not perform well with large datasets.
+        Performs a hash join: the foreign collection is looked up through its
+        index on foreignField, or hashed in one pass if the field is not
+        indexed, so the join costs O(N + M) instead of O(N * M).
 
         Args:
             documents: List of documents to enrich
             lookup_spec: Lookup specification with 'from', 'localField', 'foreignField', 'as'
 
         Returns:
-            Documents with joined data
+            Documents with joined data (new documents; the inputs are not modified)
         """
         from_collection = lookup_spec["from"]
         local_field = lookup_spec["localField"]
@@ -341,28 +689,137 @@ class InMemoryDocumentStore(DocumentStore):
         if from_collection not in self.collections:
             logger.debug(f"InMemoryDocumentStore: foreign collection '{from_collection}' not found in $lookup")
             # Return documents with empty array for the 'as' field (mimics MongoDB behavior)
-            result_docs = []
-            for doc in documents:
-                enriched_doc = copy.deepcopy(doc)
-                enriched_doc[as_field] = []
-                result_docs.append(enriched_doc)
-            return result_docs
+            return [{**doc, as_field: []} for doc in documents]
+
+        foreign_docs = self.collections[from_collection]
+        join_table: dict[Any, list[dict[str, Any]]] = {}
+        index = self._field_index(from_collection, foreign_field)
+        if index is not None:
+            for key, doc_ids in index.items():
+                join_table[key] = [foreign_docs[doc_id] for doc_id in doc_ids]
+        else:
+            for foreign_doc in foreign_docs.values():
+                join_table.setdefault(_index_key(foreign_doc.get(foreign_field)), []).append(foreign_doc)
 
         result_docs = []
         for doc in documents:
-            # Make a copy to avoid modifying original
-            enriched_doc = copy.deepcopy(doc)
-
-            # Find matching documents in the foreign collection
             local_value = doc.get(local_field)
-            matches = []
-
-            for foreign_doc in self.collections[from_collection].values():
-                if foreign_doc.get(foreign_field) == local_value:
-                    matches.append(copy.deepcopy(foreign_doc))
+            key = _index_key(local_value)
+            if key is _UNHASHABLE:
+                # Unhashable values can only equal other unhashable values
+                matches = [d for d in join_table.get(_UNHASHABLE, []) if d.get(foreign_field) == local_value]
+            else:
+                matches = list(join_table.get(key, []))
 
-            # Add matches as an array field
-            enriched_doc[as_field] = matches
-            result_docs.append(enriched_doc)
+            # Add matches as an array field of a new document
+            result_docs.append({**doc, as_field: matches})
 
         return result_docs
+
+    def _read_copy(self, doc: dict[str, Any]) -> dict[str, Any]:
+        """Copy a stored document for returning to a caller.
+
+        Stored documents are never modified in place, so without copy_on_read
+        a shallow copy is enough to keep later writes from showing through.
+        """
+        return copy.deepcopy(doc) if self.copy_on_read else dict(doc)
+
+    def _live_indexes(self, collection: str) -> dict[str, dict[Any, dict[str, None]]]:
+        """Return the indexes of a collection, dropping them if the collection changed behind their back."""
+        version = self._collection_version(collection)
+        if version is None or self._indexed_versions.get(collection) != version:
+            self._indexes.pop(collection, None)
+            self._indexed_versions[collection] = version
+        return self._indexes.setdefault(collection, {})
+
+    def _collection_version(self, collection: str) -> int | None:
+        """Return the write counter of a collection, or None if it was replaced by a plain dict."""
+        return getattr(self.collections[collection], "version", None)
+
+    def _field_index(self, collection: str, field: str) -> dict[Any, dict[str, None]] | None:
+        """Return the hash index for a field, building it on first use.
+
+        Args:
+            collection: Name of the collection
+            field: Field name
+
+        Returns:
+            Mapping of index key to document IDs, or None if the field is not indexed
+        """
+        if field not in self.indexed_fields:
+            return None
+        indexes = self._live_indexes(collection)
+        index = indexes.get(field)
+        if index is None:
+            index = {}
+            for doc_id, doc in self.collections[collection].items():
+                index.setdefault(_index_key(doc.get(field)), {})[doc_id] = None
+            indexes[field] = index
+        return index
+
+    def _matching(self, collection: str, filter_dict: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield the stored documents that match a query_documents() filter."""
+        for doc in self._candidates(collection, filter_dict):
+            if all(_matches_condition(doc.get(key), value) for key, value in filter_dict.items()):
+                yield doc
+
+    def _candidates(self, collection: str, filter_dict: dict[str, Any]) -> Iterable[dict[str, Any]]:
+        """Return the documents that can match a filter.
+
+        Uses the primary key for ``_id`` conditions and the most selective
+        field index otherwise; falls back to the whole collection. The
+        caller still applies every filter condition to the candidates.
+        """
+        stored = self.collections[collection]
+        best: list[str] | None = None
+        for field, condition in filter_dict.items():
+            values = _condition_values(condition)
+            if values is None:
+                continue
+            if field == "_id":
+                doc_ids = list(dict.fromkeys(value for value in values if value in stored))
+            else:
+                index = self._field_index(collection, field)
+                if index is None:
+                    continue
+                doc_ids = list(dict.fromkeys(doc_id for value in values for doc_id in index.get(value, {})))
+                doc_ids.extend(index.get(_UNHASHABLE, {}))
+            if best is None or len(doc_ids) < len(best):
+                best = doc_ids
+        if best is None:
+            return stored.values()
+        return [stored[doc_id] for doc_id in best]
+
+    def _store(self, collection: str, doc_id: str, doc: dict[str, Any]) -> None:
+        """Store a new version of a document and update the built indexes."""
+        stored = self.collections[collection]
+        indexes = self._live_indexes(collection)
+        old = stored.get(doc_id)
+        for field, index in indexes.items():
+            new_key = _index_key(doc.get(field))
+            if old is not None:
+                old_key = _index_key(old.get(field))
+                if old_key is new_key or old_key == new_key:
+                    continue
+                self._unindex(index, old_key, doc_id)
+            index.setdefault(new_key, {})[doc_id] = None
+        stored[doc_id] = doc
+        self._indexed_versions[collection] = self._collection_version(collection)
+
+    def _discard(self, collection: str, doc_id: str) -> None:
+        """Remove a document and its index entries."""
+        stored = self.collections[collection]
+        indexes = self._live_indexes(collection)
+        old = stored.pop(doc_id)
+        for field, index in indexes.items():
+            self._unindex(index, _index_key(old.get(field)), doc_id)
+        self._indexed_versions[collection] = self._collection_version(collection)
+
+    @staticmethod
+    def _unindex(index: dict[Any, dict[str, None]], key: Any, doc_id: str) -> None:
+        """Remove a document ID from an index bucket."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(doc_id, None)
+            if not bucket:
+                del index[key]
@@ -4,19 +4,31 @@
 """MongoDB document store implementation."""
 
 import logging
+import time
+from collections.abc import Iterator
 from typing import Any, cast
 
 from copilot_config.generated.adapters.document_store import DriverConfig_DocumentStore_Mongodb
 
 from .document_store import (
+    DEFAULT_PAGE_SIZE,
+    BulkWriteResult,
     DocumentAlreadyExistsError,
     DocumentNotFoundError,
+    DocumentPage,
     DocumentStore,
     DocumentStoreConnectionError,
     DocumentStoreError,
     DocumentStoreNotConnectedError,
+    InvalidCursorError,
+    apply_projection,
+    check_page_size,
+    compute_operator_patch,
+    decode_cursor,
+    encode_cursor,
+    parse_projection,
 )
-from .schema_registry import sanitize_document, sanitize_documents
+from .schema_registry import get_collection_indexes, sanitize_document, sanitize_documents
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +37,26 @@ logger = logging.getLogger(__name__)
 # only to keep module import and type-checking lightweight; when pymongo is
 # missing, connect() will fail with a DocumentStoreConnectionError.
 try:
-    from pymongo.errors import DuplicateKeyError
+    from pymongo.errors import BulkWriteError, DuplicateKeyError
 except ImportError:
+    BulkWriteError = None  # type: ignore
     DuplicateKeyError = None  # type: ignore
 
+# Server error code reported in bulk write errors for duplicate keys
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+def _plan_stages(plan: Any) -> Iterator[str]:
+    """Yield the stage names of an explain() query plan, including nested input stages."""
+    if isinstance(plan, dict):
+        if isinstance(plan.get("stage"), str):
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _plan_stages(item)
+
 
 class MongoDocumentStore(DocumentStore):
     """MongoDB document store implementation."""
@@ -58,6 +86,8 @@ class MongoDocumentStore(DocumentStore):
             username=username,
             password=password,
             database=database,
+            ensure_indexes=driver_config.ensure_indexes,
+            explain_slow_query_ms=driver_config.explain_slow_query_ms,
         )
 
     def __init__(
@@ -67,6 +97,8 @@ class MongoDocumentStore(DocumentStore):
         username: str | None = None,
         password: str | None = None,
         database: str | None = None,
+        ensure_indexes: bool = True,
+        explain_slow_query_ms: int | None = None,
         **kwargs,
     ):
         """Initialize MongoDB document store.
@@ -77,6 +109,9 @@ class MongoDocumentStore(DocumentStore):
             username: MongoDB username (optional)
             password: MongoDB password (optional)
             database: Database name (required)
+            ensure_indexes: Create the indexes declared in collections.config.json on connect
+            explain_slow_query_ms: Debug option; explain queries taking at least this long and
+                warn when they scan a whole collection (None disables)
             **kwargs: Additional MongoDB client options
 
         Raises:
@@ -94,7 +129,11 @@ class MongoDocumentStore(DocumentStore):
         self.username = username
         self.password = password
         self.database_name = database
+        self.ensure_indexes = ensure_indexes
+        self.explain_slow_query_ms = explain_slow_query_ms
         self.client_options = kwargs
+        # Number of collection scans found by explain, per collection
+        self.collection_scans: dict[str, int] = {}
         # These are initialized in connect(); keep them loosely typed so this
         # adapter can be type-checked without requiring full PyMongo stubs.
         self.client: Any = None
@@ -142,6 +181,9 @@ class MongoDocumentStore(DocumentStore):
 
             logger.info("MongoDocumentStore: connected to %s:%s/%s", self.host, self.port, self.database_name)
 
+            if self.ensure_indexes:
+                self._ensure_indexes()
+
         except ConnectionFailure as e:
             logger.error("MongoDocumentStore: connection failed - %s", e, exc_info=True)
             raise DocumentStoreConnectionError(f"Failed to connect to MongoDB at {self.host}:{self.port}") from e
@@ -149,6 +191,31 @@ class MongoDocumentStore(DocumentStore):
             logger.error("MongoDocumentStore: unexpected error during connect - %s", e, exc_info=True)
             raise DocumentStoreConnectionError(f"Unexpected error connecting to MongoDB: {str(e)}") from e
 
+    def _ensure_indexes(self) -> None:
+        """Create the indexes declared in collections.config.json.
+
+        Index creation is idempotent, so this runs on every connect. A failure
+        (e.g., an existing index with the same name but different options, or
+        a user without createIndex permission) is logged and does not prevent
+        the connection from being used.
+        """
+        created = 0
+        for collection, specs in get_collection_indexes().items():
+            coll = self.database[collection]
+            for spec in specs:
+                options = dict(spec.get("options", {}))
+                try:
+                    coll.create_index(list(spec["keys"].items()), **options)
+                    created += 1
+                except Exception as e:
+                    logger.warning(
+                        "MongoDocumentStore: failed to ensure index %s on %s - %s",
+                        options.get("name", spec["keys"]),
+                        collection,
+                        e,
+                    )
+        logger.info("MongoDocumentStore: ensured %d declared indexes", created)
+
     def disconnect(self) -> None:
         """Disconnect from MongoDB."""
         if self.client:
@@ -190,6 +257,261 @@ class MongoDocumentStore(DocumentStore):
             logger.error(f"MongoDocumentStore: insert failed - {e}")
             raise
 
+    def insert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert multiple documents with a single unordered insert_many.
+
+        Args:
+            collection: Name of the collection
+            docs: Documents to insert
+
+        Returns:
+            BulkWriteResult with the inserted IDs and per-item errors
+            (DocumentAlreadyExistsError for duplicate keys)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentStoreError: If the batch could not be sent
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+
+        result = BulkWriteResult()
+        if not docs:
+            return result
+
+        try:
+            # ordered=False keeps writing past individual failures (e.g., duplicates)
+            self.database[collection].insert_many(docs, ordered=False)
+        except Exception as e:
+            if BulkWriteError is None or not isinstance(e, BulkWriteError):
+                logger.error(f"MongoDocumentStore: insert_documents failed - {e}", exc_info=True)
+                raise DocumentStoreError(f"Failed to insert documents into {collection}") from e
+            doc_ids = [doc.get("_id", "unknown") for doc in docs]
+            result.errors = self._map_write_errors(collection, e, list(range(len(docs))), doc_ids)
+
+        # insert_many assigns _id to every document before sending the batch
+        result.succeeded = [str(doc["_id"]) for index, doc in enumerate(docs) if index not in result.errors]
+        logger.debug(
+            f"MongoDocumentStore: inserted {len(result.succeeded)} documents into {collection}, "
+            f"{len(result.errors)} failed"
+        )
+        return result
+
+    def upsert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Insert or replace multiple documents with a single unordered bulk_write.
+
+        Args:
+            collection: Name of the collection
+            docs: Documents to upsert; each must carry an ``_id``
+
+        Returns:
+            BulkWriteResult with the written IDs and per-item errors
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentStoreError: If the batch could not be sent
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+
+        from pymongo import ReplaceOne
+
+        result = BulkWriteResult()
+        requests = []
+        positions = []
+        for index, doc in enumerate(docs):
+            if doc.get("_id") is None:
+                result.errors[index] = DocumentStoreError(f"Document at position {index} has no _id to upsert on")
+                continue
+            requests.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+            positions.append(index)
+
+        if requests:
+            try:
+                self.database[collection].bulk_write(requests, ordered=False)
+            except Exception as e:
+                if BulkWriteError is None or not isinstance(e, BulkWriteError):
+                    logger.error(f"MongoDocumentStore: upsert_documents failed - {e}", exc_info=True)
+                    raise DocumentStoreError(f"Failed to upsert documents into {collection}") from e
+                doc_ids = [doc.get("_id", "unknown") for doc in docs]
+                result.errors.update(self._map_write_errors(collection, e, positions, doc_ids))
+
+        result.succeeded = [str(docs[index]["_id"]) for index in positions if index not in result.errors]
+        logger.debug(f"MongoDocumentStore: upserted {len(result.succeeded)} documents into {collection}")
+        return result
+
+    def update_documents(self, collection: str, updates: list[tuple[str, dict[str, Any]]]) -> BulkWriteResult:
+        """Apply patches to multiple documents with a single unordered bulk_write.
+
+        Args:
+            collection: Name of the collection
+            updates: (document ID, patch) pairs
+
+        Returns:
+            BulkWriteResult with the updated IDs and per-item errors
+            (DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentStoreError: If the batch could not be sent
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+
+        from pymongo import UpdateOne
+
+        result = BulkWriteResult()
+        if not updates:
+            return result
+
+        coll = self.database[collection]
+        queries = [self._id_query(doc_id) for doc_id, _ in updates]
+        requests = [UpdateOne(query, {"$set": patch}) for query, (_, patch) in zip(queries, updates)]
+
+        matched_count = len(requests)
+        try:
+            matched_count = coll.bulk_write(requests, ordered=False).matched_count
+        except Exception as e:
+            if BulkWriteError is None or not isinstance(e, BulkWriteError):
+                logger.error(f"MongoDocumentStore: update_documents failed - {e}", exc_info=True)
+                raise DocumentStoreError(f"Failed to update documents in {collection}") from e
+            doc_ids = [doc_id for doc_id, _ in updates]
+            result.errors = self._map_write_errors(collection, e, list(range(len(updates))), doc_ids)
+            matched_count = e.details.get("nMatched", 0)
+
+        if matched_count < len(requests) - len(result.errors):
+            # bulk_write only reports an aggregate match count; look up which IDs are missing
+            try:
+                existing = {
+                    doc["_id"] for doc in coll.find({"_id": {"$in": [q["_id"] for q in queries]}}, {"_id": 1})
+                }
+            except Exception as e:
+                logger.error(f"MongoDocumentStore: update_documents failed - {e}", exc_info=True)
+                raise DocumentStoreError(f"Failed to update documents in {collection}") from e
+            for index, query in enumerate(queries):
+                if index not in result.errors and query["_id"] not in existing:
+                    doc_id = updates[index][0]
+                    result.errors[index] = DocumentNotFoundError(
+                        f"Document {doc_id} not found in collection {collection}"
+                    )
+
+        result.succeeded = [doc_id for index, (doc_id, _) in enumerate(updates) if index not in result.errors]
+        logger.debug(f"MongoDocumentStore: updated {len(result.succeeded)} documents in {collection}")
+        return result
+
+    def apply_update_operators(self, collection: str, doc_id: str, operators: dict[str, dict[str, Any]]) -> None:
+        """Update a document atomically with MongoDB update operators.
+
+        Args:
+            collection: Name of the collection
+            doc_id: Document ID
+            operators: Update operators ($inc, $min, $max, $addToSet)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentNotFoundError: If document does not exist
+            DocumentStoreError: If an operator is unsupported or the update fails
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+
+        # Rejects unsupported operators with the same error as the other backends
+        compute_operator_patch({}, operators)
+
+        try:
+            result = self.database[collection].update_one(self._id_query(doc_id), operators)
+        except Exception as e:
+            logger.error(f"MongoDocumentStore: apply_update_operators failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to update document {doc_id} in {collection}") from e
+
+        if result.matched_count == 0:
+            raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+        logger.debug(f"MongoDocumentStore: applied update operators to document {doc_id} in {collection}")
+
+    def delete_documents(self, collection: str, doc_ids: list[str]) -> BulkWriteResult:
+        """Delete multiple documents with a single delete_many.
+
+        Args:
+            collection: Name of the collection
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            BulkWriteResult with the deleted IDs and per-item errors
+            (DocumentNotFoundError for missing documents)
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentStoreError: If the lookup or the delete fails
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+
+        result = BulkWriteResult()
+        if not doc_ids:
+            return result
+
+        coll = self.database[collection]
+        ids = [self._id_query(doc_id)["_id"] for doc_id in doc_ids]
+        try:
+            # delete_many only reports an aggregate count; look up which IDs exist first
+            existing = {doc["_id"] for doc in coll.find({"_id": {"$in": ids}}, {"_id": 1})}
+            if existing:
+                coll.delete_many({"_id": {"$in": list(existing)}})
+        except Exception as e:
+            logger.error(f"MongoDocumentStore: delete_documents failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to delete documents from {collection}") from e
+
+        for index, (doc_id, _id) in enumerate(zip(doc_ids, ids)):
+            if _id in existing:
+                result.succeeded.append(doc_id)
+            else:
+                result.errors[index] = DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+
+        logger.debug(f"MongoDocumentStore: deleted {len(result.succeeded)} documents from {collection}")
+        return result
+
+    def _id_query(self, doc_id: str) -> dict[str, Any]:
+        """Build an _id filter, matching ObjectId when doc_id is a valid ObjectId string."""
+        from bson import ObjectId
+        from bson.errors import InvalidId
+
+        try:
+            return {"_id": ObjectId(doc_id)}
+        except (TypeError, ValueError, InvalidId):
+            return {"_id": doc_id}
+
+    def _map_write_errors(
+        self,
+        collection: str,
+        error: Any,
+        positions: list[int],
+        doc_ids: list[Any],
+    ) -> dict[int, Exception]:
+        """Translate BulkWriteError writeErrors into per-item store exceptions.
+
+        Args:
+            collection: Name of the collection
+            error: BulkWriteError raised by pymongo
+            positions: Input position of each request sent in the batch
+            doc_ids: Document ID of each input position, used in error messages
+
+        Returns:
+            Exceptions keyed by input position
+        """
+        errors: dict[int, Exception] = {}
+        for write_error in error.details.get("writeErrors", []):
+            index = positions[write_error["index"]]
+            doc_id = doc_ids[index]
+            if write_error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                errors[index] = DocumentAlreadyExistsError(
+                    f"Document with id {doc_id} already exists in collection {collection}"
+                )
+            else:
+                errors[index] = DocumentStoreError(
+                    f"Failed to write document {doc_id} to {collection}: {write_error.get('errmsg')}"
+                )
+        return errors
+
     def get_document(self, collection: str, doc_id: str) -> dict[str, Any] | None:
         """Retrieve a document by its ID.
 
@@ -247,6 +569,7 @@ class MongoDocumentStore(DocumentStore):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents matching the filter criteria.
 
@@ -259,6 +582,7 @@ class MongoDocumentStore(DocumentStore):
             limit: Maximum number of documents to return
             sort_by: Optional field name to sort results by
             sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields, passed to find()
 
         Returns:
             List of sanitized matching documents (empty list if no matches)
@@ -272,20 +596,8 @@ class MongoDocumentStore(DocumentStore):
 
         try:
             coll = self.database[collection]
-            cursor = coll.find(filter_dict)
-            if sort_by:
-                import pymongo
-
-                if sort_order not in ("asc", "desc"):
-                    raise DocumentStoreError(
-                        f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'"
-                    )
-                direction = pymongo.DESCENDING if sort_order == "desc" else pymongo.ASCENDING
-                # Note: MongoDB places NULL/missing values first in ASC and
-                # last in DESC. All backends (Cosmos DB, InMemory) follow the
-                # same convention: NULLs sort as the lowest value.
-                cursor = cursor.sort(sort_by, direction)
-            cursor = cursor.limit(limit)
+            start = time.monotonic()
+            cursor = self._find_cursor(coll, filter_dict, limit, sort_by, sort_order, projection)
 
             results = []
             for doc in cursor:
@@ -294,6 +606,10 @@ class MongoDocumentStore(DocumentStore):
                     doc["_id"] = str(doc["_id"])
                 results.append(doc)
 
+            elapsed_ms = (time.monotonic() - start) * 1000
+            if self.explain_slow_query_ms is not None and elapsed_ms >= self.explain_slow_query_ms:
+                self._check_query_plan(collection, filter_dict, limit, sort_by, sort_order, projection, elapsed_ms)
+
             logger.debug(
                 f"MongoDocumentStore: query on {collection} with {filter_dict} " f"returned {len(results)} documents"
             )
@@ -303,6 +619,229 @@ class MongoDocumentStore(DocumentStore):
             logger.error(f"MongoDocumentStore: query_documents failed - {e}", exc_info=True)
             raise DocumentStoreError(f"Failed to query documents from {collection}") from e
 
+    def query_page(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+        cursor: str | None = None,
+    ) -> DocumentPage:
+        """Query one page of matching documents using keyset pagination.
+
+        Documents are sorted by (sort_by, _id) and the cursor records the sort
+        value and _id of the last document returned. The next page is selected
+        with a range filter on those keys, so with an index on the sort field
+        every page costs the same however deep it is.
+
+        Args:
+            collection: Name of the collection
+            filter_dict: Filter criteria as dictionary (MongoDB query format)
+            page_size: Maximum number of documents in the page
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields, passed to find()
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            DocumentPage with the sanitized documents and the cursor of the next page
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            InvalidCursorError: If the cursor is malformed or does not match the query
+            DocumentStoreError: If the page size is invalid or the query fails
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+        check_page_size(page_size)
+        if sort_order not in ("asc", "desc"):
+            raise DocumentStoreError(f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'")
+
+        query = filter_dict
+        if cursor:
+            state = decode_cursor(cursor, sort_by, sort_order)
+            if "id" not in state:
+                raise InvalidCursorError("Invalid pagination cursor")
+            query = {"$and": [filter_dict, self._keyset_filter(state, sort_by, sort_order)]}
+
+        # The next cursor is built from the sort value and _id of the last document,
+        # so fetch them even if the projection leaves them out
+        fetch_projection = projection
+        if projection:
+            include, fields = parse_projection(projection)
+            cursor_fields = {"_id", sort_by} if sort_by else {"_id"}
+            if include:
+                fetch_projection = {name: 1 for name in fields | cursor_fields}
+            else:
+                fetch_projection = {name: 0 for name in fields - cursor_fields}
+
+        try:
+            import pymongo
+
+            direction = pymongo.DESCENDING if sort_order == "desc" else pymongo.ASCENDING
+            keys = [(sort_by, direction), ("_id", direction)] if sort_by else [("_id", direction)]
+            coll = self.database[collection]
+            if fetch_projection:
+                find_cursor = coll.find(query, fetch_projection)
+            else:
+                find_cursor = coll.find(query)
+            docs = list(find_cursor.sort(keys).limit(page_size + 1))
+        except Exception as e:
+            logger.error(f"MongoDocumentStore: query_page failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to query documents from {collection}") from e
+
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            last = docs[-1]
+            state = {"id": str(last["_id"]), "oid": not isinstance(last["_id"], str)}
+            if sort_by:
+                state["value"] = last.get(sort_by)
+            next_cursor = encode_cursor(state, sort_by, sort_order)
+
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+        if projection:
+            docs = [apply_projection(doc, projection) for doc in docs]
+        return DocumentPage(documents=sanitize_documents(docs, collection), next_cursor=next_cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all matching documents through a single server-side cursor.
+
+        The cursor fetches ``page_size`` documents per round-trip (its batch
+        size) as the caller consumes them. Without sort_by, documents come in
+        natural order, which avoids an in-memory sort on the server.
+
+        Args:
+            collection: Name of the collection
+            filter_dict: Filter criteria as dictionary (all documents if omitted)
+            page_size: Number of documents fetched per round-trip
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields, passed to find()
+
+        Yields:
+            Sanitized matching documents
+
+        Raises:
+            DocumentStoreNotConnectedError: If not connected to MongoDB
+            DocumentStoreError: If the page size is invalid or the query fails
+        """
+        if self.database is None:
+            raise DocumentStoreNotConnectedError("Not connected to MongoDB")
+        check_page_size(page_size)
+
+        try:
+            coll = self.database[collection]
+            cursor = self._find_cursor(coll, filter_dict or {}, 0, sort_by, sort_order, projection)
+            cursor = cursor.batch_size(page_size)
+            for doc in cursor:
+                if "_id" in doc:
+                    doc["_id"] = str(doc["_id"])
+                yield sanitize_document(doc, collection)
+        except DocumentStoreError:
+            raise
+        except Exception as e:
+            logger.error(f"MongoDocumentStore: iter_documents failed - {e}", exc_info=True)
+            raise DocumentStoreError(f"Failed to iterate documents from {collection}") from e
+
+    def _keyset_filter(self, state: dict[str, Any], sort_by: str | None, sort_order: str) -> dict[str, Any]:
+        """Build the filter selecting the documents after a keyset cursor position.
+
+        Follows MongoDB's sort order, where null/missing values are the
+        lowest: they come first in ASC and last in DESC.
+        """
+        operator = "$lt" if sort_order == "desc" else "$gt"
+        last_id: Any = state["id"]
+        if state.get("oid"):
+            from bson import ObjectId
+
+            last_id = ObjectId(last_id)
+        after_id = {"_id": {operator: last_id}}
+        if not sort_by:
+            return after_id
+
+        value = state.get("value")
+        if value is None:
+            if sort_order == "desc":
+                return {sort_by: None, **after_id}
+            return {"$or": [{sort_by: None, **after_id}, {sort_by: {"$ne": None}}]}
+
+        branches: list[dict[str, Any]] = [{sort_by: {operator: value}}, {sort_by: value, **after_id}]
+        if sort_order == "desc":
+            branches.append({sort_by: None})
+        return {"$or": branches}
+
+    @staticmethod
+    def _find_cursor(
+        coll: Any,
+        filter_dict: dict[str, Any],
+        limit: int,
+        sort_by: str | None,
+        sort_order: str,
+        projection: dict[str, Any] | None = None,
+    ) -> Any:
+        """Build the find() cursor of a query_documents() call (a limit of 0 means no limit)."""
+        if projection:
+            # Validate here so every backend rejects the same projections
+            parse_projection(projection)
+            cursor = coll.find(filter_dict, {name: 1 if value else 0 for name, value in projection.items()})
+        else:
+            cursor = coll.find(filter_dict)
+        if sort_by:
+            import pymongo
+
+            if sort_order not in ("asc", "desc"):
+                raise DocumentStoreError(
+                    f"Invalid sort_order '{sort_order}': must be 'asc' or 'desc'"
+                )
+            direction = pymongo.DESCENDING if sort_order == "desc" else pymongo.ASCENDING
+            # Note: MongoDB places NULL/missing values first in ASC and
+            # last in DESC. All backends (Cosmos DB, InMemory) follow the
+            # same convention: NULLs sort as the lowest value.
+            cursor = cursor.sort(sort_by, direction)
+        return cursor.limit(limit)
+
+    def _check_query_plan(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        limit: int,
+        sort_by: str | None,
+        sort_order: str,
+        projection: dict[str, Any] | None,
+        elapsed_ms: float,
+    ) -> None:
+        """Explain a slow query and warn if its winning plan scans the whole collection.
+
+        Explain failures are logged at debug level and never fail the query.
+        """
+        try:
+            coll = self.database[collection]
+            plan = self._find_cursor(coll, filter_dict, limit, sort_by, sort_order, projection).explain()
+        except Exception as e:
+            logger.debug(f"MongoDocumentStore: explain failed on {collection} - {e}")
+            return
+
+        winning_plan = plan.get("queryPlanner", {}).get("winningPlan", {})
+        if "COLLSCAN" in _plan_stages(winning_plan):
+            self.collection_scans[collection] = self.collection_scans.get(collection, 0) + 1
+            logger.warning(
+                f"MongoDocumentStore: COLLSCAN on {collection} for filter {filter_dict} "
+                f"(sort_by={sort_by}) took {elapsed_ms:.1f} ms; consider declaring an index "
+                "in collections.config.json"
+            )
+
     def update_document(self, collection: str, doc_id: str, patch: dict[str, Any]) -> None:
         """Update a document with the provided patch.
 
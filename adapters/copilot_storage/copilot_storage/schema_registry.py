@@ -142,6 +142,41 @@ def get_collection_fields(collection: str) -> set[str] | None:
     return _COLLECTION_SCHEMAS.get(collection)
 
 
+def get_collection_indexes(schema_dir: Path | None = None) -> dict[str, list[dict[str, Any]]]:
+    """Load the declared index specifications of every collection.
+
+    Indexes are declared next to the document schemas in
+    collections.config.json, as {"keys": {field: 1 | -1, ...}, "options": {...}}
+    entries where options are passed to the backend's index creation (e.g.,
+    name, unique, sparse).
+
+    Args:
+        schema_dir: Directory containing collections.config.json (defaults to docs/schemas/documents)
+
+    Returns:
+        Mapping of collection name to its index specifications (empty if the
+        config file is missing or invalid)
+    """
+    config_path = (schema_dir or _DEFAULT_SCHEMA_DIR) / "collections.config.json"
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Collections config not found: {config_path}. No indexes are declared.")
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load collections config from {config_path}: {e}")
+        return {}
+
+    indexes: dict[str, list[dict[str, Any]]] = {}
+    for definition in config.get("collections", []):
+        name = definition.get("name")
+        specs = [spec for spec in definition.get("indexes", []) if spec.get("keys")]
+        if name and specs:
+            indexes[name] = specs
+    return indexes
+
+
 def sanitize_document(doc: dict[str, Any], collection: str, preserve_extra: bool = False) -> dict[str, Any]:
     """Remove system and unknown fields from a document.
 
@@ -4,10 +4,17 @@
 """Validating document store that enforces schema validation."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any, Protocol, cast, runtime_checkable
 
-from .document_store import DocumentNotFoundError, DocumentStore
+from .document_store import (
+    DEFAULT_PAGE_SIZE,
+    BulkWriteResult,
+    DocumentNotFoundError,
+    DocumentPage,
+    DocumentStore,
+    compute_operator_patch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -178,6 +185,69 @@ class ValidatingDocumentStore(DocumentStore):
             "Document validation failed for collection '%s' but continuing in non-strict mode: %s", collection, errors
         )
 
+    def _get_current_document(self, collection: str, doc_id: str) -> tuple[dict[str, Any] | None, str]:
+        """Fetch the stored document a patch will be applied to.
+
+        Some backends (e.g., Cosmos DB) may store a different native document id
+        ("id") than the application-level canonical key (often stored in "_id").
+        In that case, get_document(collection, doc_id) can miss even though a
+        document exists with _id == doc_id.
+
+        Args:
+            collection: Collection name
+            doc_id: Document ID supplied by the caller
+
+        Returns:
+            Tuple of (current document or None, ID to pass to the underlying store)
+        """
+        current_doc = self._store.get_document(collection, doc_id)
+        effective_doc_id = doc_id
+
+        if current_doc is None:
+            candidates = self._store.query_documents(collection, {"_id": doc_id}, limit=1)
+            if candidates:
+                current_doc = candidates[0]
+                resolved_id = current_doc.get("id")
+                if resolved_id is None:
+                    resolved_id = current_doc.get("_id")
+                if resolved_id is not None:
+                    effective_doc_id = str(resolved_id)
+
+        return current_doc, effective_doc_id
+
+    def _get_current_documents(
+        self, collection: str, doc_ids: list[str]
+    ) -> dict[str, tuple[dict[str, Any] | None, str]]:
+        """Fetch the stored documents a batch of patches will be applied to.
+
+        All documents are fetched with a single ``$in`` query on ``_id``; only
+        IDs that query misses fall back to _get_current_document.
+
+        Args:
+            collection: Collection name
+            doc_ids: Document IDs supplied by the caller
+
+        Returns:
+            Mapping of caller ID to (current document or None, ID to pass to
+            the underlying store)
+        """
+        unique_ids = list(dict.fromkeys(doc_ids))
+        current: dict[str, tuple[dict[str, Any] | None, str]] = {}
+        if not unique_ids:
+            return current
+
+        for doc in self._store.query_documents(collection, {"_id": {"$in": unique_ids}}, limit=len(unique_ids)):
+            doc_id = str(doc.get("_id"))
+            resolved_id = doc.get("id")
+            if resolved_id is None:
+                resolved_id = doc.get("_id")
+            current[doc_id] = (doc, str(resolved_id))
+
+        for doc_id in unique_ids:
+            if doc_id not in current:
+                current[doc_id] = self._get_current_document(collection, doc_id)
+        return current
+
     def connect(self) -> None:
         """Connect to the document store.
 
@@ -213,6 +283,123 @@ class ValidatingDocumentStore(DocumentStore):
         # Delegate to underlying store
         return self._store.insert_document(collection, doc)
 
+    def insert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Validate documents and insert the valid ones in a single bulk call.
+
+        In strict mode, documents that fail validation are reported as
+        DocumentValidationError in the result instead of raising, so one bad
+        document does not block the rest of the batch.
+
+        Args:
+            collection: Name of the collection/table
+            docs: Documents to insert
+
+        Returns:
+            BulkWriteResult with the inserted IDs and per-item errors
+        """
+        result, positions = self._validate_documents_for_bulk(collection, docs)
+        inner = self._store.insert_documents(collection, [docs[index] for index in positions])
+        return self._merge_bulk_results(result, inner, positions)
+
+    def upsert_documents(self, collection: str, docs: list[dict[str, Any]]) -> BulkWriteResult:
+        """Validate documents and upsert the valid ones in a single bulk call.
+
+        Args:
+            collection: Name of the collection/table
+            docs: Documents to upsert; each must carry an ``_id``
+
+        Returns:
+            BulkWriteResult with the written IDs and per-item errors
+        """
+        result, positions = self._validate_documents_for_bulk(collection, docs)
+        inner = self._store.upsert_documents(collection, [docs[index] for index in positions])
+        return self._merge_bulk_results(result, inner, positions)
+
+    def update_documents(self, collection: str, updates: list[tuple[str, dict[str, Any]]]) -> BulkWriteResult:
+        """Validate merged documents and apply the valid patches in a single bulk call.
+
+        Args:
+            collection: Name of the collection/table
+            updates: (document ID, patch) pairs
+
+        Returns:
+            BulkWriteResult with the updated IDs and per-item errors
+            (DocumentNotFoundError, DocumentValidationError)
+        """
+        result = BulkWriteResult()
+        positions: list[int] = []
+        effective_updates: list[tuple[str, dict[str, Any]]] = []
+        current_docs = self._get_current_documents(collection, [doc_id for doc_id, _ in updates])
+
+        for index, (doc_id, patch) in enumerate(updates):
+            current_doc, effective_doc_id = current_docs[doc_id]
+            if current_doc is None:
+                result.errors[index] = DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+                continue
+
+            merged_doc = self._strip_store_metadata_for_validation({**current_doc, **patch})
+            is_valid, errors = self._validate_document(collection, merged_doc)
+            if not is_valid:
+                if self._strict:
+                    result.errors[index] = DocumentValidationError(collection, errors)
+                    continue
+                self._handle_validation_failure(collection, errors)
+
+            positions.append(index)
+            effective_updates.append((effective_doc_id, patch))
+
+        inner = self._store.update_documents(collection, effective_updates)
+        for inner_index, error in inner.errors.items():
+            result.errors[positions[inner_index]] = error
+        # Report the caller's IDs rather than backend-resolved ones
+        result.succeeded = [updates[index][0] for index in range(len(updates)) if index not in result.errors]
+        return result
+
+    def _validate_documents_for_bulk(
+        self, collection: str, docs: list[dict[str, Any]]
+    ) -> tuple[BulkWriteResult, list[int]]:
+        """Validate a batch of documents ahead of a bulk write.
+
+        Args:
+            collection: Collection name (used to determine schema)
+            docs: Documents to validate
+
+        Returns:
+            Tuple of (result holding validation errors, input positions of
+            the documents to forward to the underlying store)
+        """
+        result = BulkWriteResult()
+        positions: list[int] = []
+
+        for index, doc in enumerate(docs):
+            is_valid, errors = self._validate_document(collection, doc)
+            if not is_valid:
+                if self._strict:
+                    result.errors[index] = DocumentValidationError(collection, errors)
+                    continue
+                self._handle_validation_failure(collection, errors)
+            positions.append(index)
+
+        return result, positions
+
+    def _merge_bulk_results(
+        self, result: BulkWriteResult, inner: BulkWriteResult, positions: list[int]
+    ) -> BulkWriteResult:
+        """Fold the underlying store's bulk result back into input positions.
+
+        Args:
+            result: Result holding validation errors, keyed by input position
+            inner: Result from the underlying store, keyed by forwarded position
+            positions: Input position of each forwarded document
+
+        Returns:
+            The combined result
+        """
+        for inner_index, error in inner.errors.items():
+            result.errors[positions[inner_index]] = error
+        result.succeeded = inner.succeeded
+        return result
+
     def get_document(self, collection: str, doc_id: str) -> dict[str, Any] | None:
         """Retrieve a document by its ID.
 
@@ -306,6 +493,7 @@ class ValidatingDocumentStore(DocumentStore):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents matching the filter criteria.
 
@@ -315,13 +503,86 @@ class ValidatingDocumentStore(DocumentStore):
             limit: Maximum number of documents to return
             sort_by: Optional field name to sort results by
             sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
 
         Returns:
             List of matching documents
         """
-        # Delegate to underlying store
+        # Delegate to underlying store; projection is only passed when used so
+        # stores without projection support keep working for full-document queries
+        if projection:
+            return self._store.query_documents(
+                collection, filter_dict, limit, sort_by, sort_order, projection=projection
+            )
         return self._store.query_documents(collection, filter_dict, limit, sort_by, sort_order)
 
+    def query_page(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+        cursor: str | None = None,
+    ) -> DocumentPage:
+        """Query one page of the documents matching the filter criteria.
+
+        Args:
+            collection: Name of the collection/table
+            filter_dict: Filter criteria as dictionary
+            page_size: Maximum number of documents in the page
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            DocumentPage with the documents and the cursor of the next page
+        """
+        # Delegate to underlying store
+        return self._store.query_page(
+            collection,
+            filter_dict,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            projection=projection,
+            cursor=cursor,
+        )
+
+    def iter_documents(
+        self,
+        collection: str,
+        filter_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        projection: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all documents matching the filter criteria.
+
+        Args:
+            collection: Name of the collection/table
+            filter_dict: Filter criteria as dictionary (all documents if omitted)
+            page_size: Number of documents fetched per round-trip
+            sort_by: Optional field name to sort results by
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            projection: Optional projection of top-level fields
+
+        Returns:
+            Iterator over the matching documents
+        """
+        # Delegate to underlying store
+        return self._store.iter_documents(
+            collection,
+            filter_dict,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            projection=projection,
+        )
+
     def update_document(self, collection: str, doc_id: str, patch: dict[str, Any]) -> None:
         """Update a document with the provided patch.
 
@@ -337,22 +598,7 @@ class ValidatingDocumentStore(DocumentStore):
             DocumentNotFoundError: If document does not exist
         """
         # Fetch current document and merge with patch to validate the result.
-        # Some backends (e.g., Cosmos DB) may store a different native document id
-        # ("id") than the application-level canonical key (often stored in "_id").
-        # In that case, get_document(collection, doc_id) can miss even though a
-        # document exists with _id == doc_id.
-        current_doc = self._store.get_document(collection, doc_id)
-        effective_doc_id = doc_id
-
-        if current_doc is None:
-            candidates = self._store.query_documents(collection, {"_id": doc_id}, limit=1)
-            if candidates:
-                current_doc = candidates[0]
-                resolved_id = current_doc.get("id")
-                if resolved_id is None:
-                    resolved_id = current_doc.get("_id")
-                if resolved_id is not None:
-                    effective_doc_id = str(resolved_id)
+        current_doc, effective_doc_id = self._get_current_document(collection, doc_id)
 
         # Raise DocumentNotFoundError if document doesn't exist
         if current_doc is None:
@@ -370,6 +616,33 @@ class ValidatingDocumentStore(DocumentStore):
         # Delegate to underlying store
         self._store.update_document(collection, effective_doc_id, patch)
 
+    def apply_update_operators(self, collection: str, doc_id: str, operators: dict[str, dict[str, Any]]) -> None:
+        """Update a document with MongoDB-style update operators.
+
+        Validates the document as it would look after the update, then
+        delegates to the underlying store, which applies the operators
+        atomically against the stored document.
+
+        Args:
+            collection: Name of the collection/table
+            doc_id: Document ID
+            operators: Update operators ($inc, $min, $max, $addToSet)
+
+        Raises:
+            DocumentValidationError: If strict=True and validation fails
+            DocumentNotFoundError: If document does not exist
+        """
+        current_doc, effective_doc_id = self._get_current_document(collection, doc_id)
+        if current_doc is None:
+            raise DocumentNotFoundError(f"Document {doc_id} not found in collection {collection}")
+
+        merged_doc = {**current_doc, **compute_operator_patch(current_doc, operators)}
+        is_valid, errors = self._validate_document(collection, self._strip_store_metadata_for_validation(merged_doc))
+        if not is_valid:
+            self._handle_validation_failure(collection, errors)
+
+        self._store.apply_update_operators(collection, effective_doc_id, operators)
+
     def delete_document(self, collection: str, doc_id: str) -> None:
         """Delete a document by its ID.
 
@@ -383,6 +656,18 @@ class ValidatingDocumentStore(DocumentStore):
         # No validation needed for deletion
         self._store.delete_document(collection, doc_id)
 
+    def delete_documents(self, collection: str, doc_ids: list[str]) -> BulkWriteResult:
+        """Delete multiple documents by ID in a single bulk call.
+
+        Args:
+            collection: Name of the collection/table
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            BulkWriteResult with the deleted IDs and per-item errors
+        """
+        return self._store.delete_documents(collection, doc_ids)
+
     def aggregate_documents(self, collection: str, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Execute an aggregation pipeline on a collection.
 
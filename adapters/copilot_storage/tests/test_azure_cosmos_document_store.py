@@ -491,6 +491,32 @@ class TestAzureCosmosDocumentStore:
         with pytest.raises(DocumentNotFoundError):
             store.update_document("users", "nonexistent", {"age": 31})
 
+    def test_apply_update_operators_retries_on_etag_conflict(self):
+        """Test that update operators are recomputed when the document changed concurrently."""
+        from azure.core import MatchConditions
+        from azure.cosmos import exceptions
+
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        store.database = MagicMock()
+        store.containers["threads"] = mock_container
+
+        mock_container.read_item.side_effect = [
+            {"id": "t1", "message_count": 2, "_etag": "e1"},
+            {"id": "t1", "message_count": 4, "_etag": "e2"},
+        ]
+        mock_container.replace_item.side_effect = [
+            exceptions.CosmosAccessConditionFailedError(status_code=412, message="Precondition failed"),
+            None,
+        ]
+
+        store.apply_update_operators("threads", "t1", {"$inc": {"message_count": 3}})
+
+        call_args = mock_container.replace_item.call_args
+        assert call_args.kwargs["body"]["message_count"] == 7
+        assert call_args.kwargs["etag"] == "e2"
+        assert call_args.kwargs["match_condition"] == MatchConditions.IfNotModified
+
     def test_update_document_partition_key_parameter_compatibility(self):
         """Regression test: Verify replace_item does NOT receive partition_key.
 
@@ -581,6 +607,74 @@ class TestAzureCosmosDocumentStore:
         with pytest.raises(DocumentNotFoundError):
             store.delete_document("users", "nonexistent")
 
+    def test_insert_documents_reports_duplicates_per_item(self):
+        """Test bulk insert writes every document and reports conflicts per item."""
+        from azure.cosmos import exceptions
+
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+
+        mock_container = MagicMock()
+        store.database = MagicMock()
+        store.containers["messages"] = mock_container
+
+        def create_item(body):
+            if body["id"] == "m2":
+                raise exceptions.CosmosResourceExistsError(status_code=409, message="Document already exists")
+            return body
+
+        mock_container.create_item.side_effect = create_item
+
+        result = store.insert_documents("messages", [{"_id": "m1"}, {"_id": "m2"}, {"_id": "m3"}])
+
+        assert mock_container.create_item.call_count == 3
+        assert result.succeeded == ["m1", "m3"]
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], DocumentAlreadyExistsError)
+
+    def test_upsert_documents(self):
+        """Test bulk upsert uses upsert_item with the canonical _id as native id."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+
+        mock_container = MagicMock()
+        store.database = MagicMock()
+        store.containers["threads"] = mock_container
+
+        result = store.upsert_documents("threads", [{"_id": "t1", "subject": "A"}, {"subject": "no id"}])
+
+        assert result.succeeded == ["t1"]
+        assert isinstance(result.errors[1], DocumentStoreError)
+        mock_container.upsert_item.assert_called_once_with(body={"_id": "t1", "subject": "A", "id": "t1"})
+
+    def test_update_documents_reports_missing_per_item(self):
+        """Test bulk update reports missing documents without failing the batch."""
+        from azure.cosmos import exceptions
+
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+
+        mock_container = MagicMock()
+        store.database = MagicMock()
+        store.containers["chunks"] = mock_container
+
+        def read_item(item, partition_key):
+            if item == "missing":
+                raise exceptions.CosmosResourceNotFoundError(status_code=404, message="Not found")
+            return {"id": item, "_id": item}
+
+        mock_container.read_item.side_effect = read_item
+
+        result = store.update_documents("chunks", [("c1", {"embedding_generated": True}), ("missing", {})])
+
+        assert result.succeeded == ["c1"]
+        assert isinstance(result.errors[1], DocumentNotFoundError)
+        mock_container.replace_item.assert_called_once()
+
+    def test_bulk_methods_not_connected(self):
+        """Test that bulk methods fail when not connected."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+
+        with pytest.raises(DocumentStoreNotConnectedError):
+            store.insert_documents("messages", [{"_id": "m1"}])
+
     def test_aggregate_documents_not_connected(self):
         """Test that aggregation fails when not connected."""
         store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
@@ -1196,6 +1290,85 @@ class TestAzureCosmosDocumentStoreQueryOperators:
         # Verify result
         assert result == []
 
+    def test_query_documents_with_inclusion_projection(self):
+        """Test that an inclusion projection becomes the SELECT list."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        mock_container.query_items.return_value = [{"_id": "m1", "thread_id": "t1"}]
+        store.database = MagicMock()
+        store.database.create_container_if_not_exists.return_value = mock_container
+
+        result = store.query_documents("messages", {"archive_id": "a1"}, projection={"thread_id": 1})
+
+        query = mock_container.query_items.call_args.kwargs["query"]
+        assert query.startswith("SELECT c._id, c.thread_id FROM c WHERE 1=1")
+        assert result == [{"_id": "m1", "thread_id": "t1"}]
+
+    def test_query_documents_with_exclusion_projection(self):
+        """Test that an exclusion projection selects whole documents and drops the excluded fields."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        mock_container.query_items.return_value = [{"_id": "m1", "thread_id": "t1", "body_raw": "large"}]
+        store.database = MagicMock()
+        store.database.create_container_if_not_exists.return_value = mock_container
+
+        result = store.query_documents("messages", {}, projection={"body_raw": 0})
+
+        assert mock_container.query_items.call_args.kwargs["query"].startswith("SELECT * FROM c")
+        assert result == [{"_id": "m1", "thread_id": "t1"}]
+
+    def test_query_documents_rejects_invalid_projection_field(self):
+        """Test that projection field names are validated before building the SELECT list."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        store.database = MagicMock()
+        store.database.create_container_if_not_exists.return_value = mock_container
+
+        with pytest.raises(DocumentStoreError, match="Invalid projection field"):
+            store.query_documents("messages", {}, projection={"thread_id, body_raw": 1})
+
+    def test_query_page_follows_continuation_tokens(self):
+        """Test that query_page wraps the Cosmos continuation token in its cursor."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        pager = MagicMock()
+        pager.__next__.return_value = iter([{"_id": "t1"}, {"_id": "t2"}])
+        pager.continuation_token = '{"token":"+RID:abc"}'
+        mock_container.query_items.return_value.by_page.return_value = pager
+        store.database = MagicMock()
+        store.database.create_container_if_not_exists.return_value = mock_container
+
+        page = store.query_page("threads", {"archive_id": "a1"}, page_size=2, sort_by="first_message_date")
+
+        assert page.documents == [{"_id": "t1"}, {"_id": "t2"}]
+        call_kwargs = mock_container.query_items.call_args.kwargs
+        assert call_kwargs["max_item_count"] == 2
+        assert "OFFSET" not in call_kwargs["query"]
+        mock_container.query_items.return_value.by_page.assert_called_once_with(None)
+
+        pager.__next__.return_value = iter([{"_id": "t3"}])
+        pager.continuation_token = None
+        last_page = store.query_page(
+            "threads", {"archive_id": "a1"}, page_size=2, sort_by="first_message_date", cursor=page.next_cursor
+        )
+
+        mock_container.query_items.return_value.by_page.assert_called_with('{"token":"+RID:abc"}')
+        assert last_page.documents == [{"_id": "t3"}]
+        assert last_page.next_cursor is None
+
+    def test_iter_documents_pages_with_max_item_count(self):
+        """Test that iter_documents streams the query iterator with the page size."""
+        store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
+        mock_container = MagicMock()
+        mock_container.query_items.return_value = iter([{"_id": "c1", "text": "a"}, {"_id": "c2", "text": "b"}])
+        store.database = MagicMock()
+        store.database.create_container_if_not_exists.return_value = mock_container
+
+        docs = list(store.iter_documents("chunks", {"thread_id": "t1"}, page_size=50, projection={"text": 0}))
+
+        assert docs == [{"_id": "c1"}, {"_id": "c2"}]
+        assert mock_container.query_items.call_args.kwargs["max_item_count"] == 50
+
     def test_query_documents_with_non_operator_keys(self):
         """Test query_documents with mixed operator and non-operator keys logs warning and skips field."""
         store = AzureCosmosDocumentStore(endpoint="https://test.documents.azure.com:443/", key="testkey")
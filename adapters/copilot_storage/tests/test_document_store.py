@@ -10,7 +10,16 @@ from copilot_config.generated.adapters.document_store import (
     DriverConfig_DocumentStore_Inmemory,
     DriverConfig_DocumentStore_Mongodb,
 )
-from copilot_storage import DocumentNotFoundError, DocumentStore, DocumentStoreConnectionError, create_document_store, DocumentAlreadyExistsError
+from copilot_storage import (
+    BulkWriteResult,
+    DocumentAlreadyExistsError,
+    DocumentNotFoundError,
+    DocumentStore,
+    DocumentStoreConnectionError,
+    DocumentStoreError,
+    InvalidCursorError,
+    create_document_store,
+)
 from copilot_storage.azure_cosmos_document_store import AzureCosmosDocumentStore
 from copilot_storage.inmemory_document_store import InMemoryDocumentStore
 from copilot_storage.mongo_document_store import MongoDocumentStore
@@ -335,6 +344,333 @@ class TestInMemoryDocumentStore:
         with pytest.raises(DocumentNotFoundError):
             store.delete_document("users", "nonexistent")
 
+    def test_insert_documents(self):
+        """Test bulk insert reports duplicates per item and inserts the rest."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("users", {"_id": "u2", "name": "Existing"})
+
+        result = store.insert_documents(
+            "users",
+            [{"_id": "u1", "name": "Alice"}, {"_id": "u2", "name": "Bob"}, {"_id": "u3", "name": "Carol"}],
+        )
+
+        assert result.succeeded == ["u1", "u3"]
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], DocumentAlreadyExistsError)
+        assert store.get_document("users", "u2")["name"] == "Existing"
+        assert store.get_document("users", "u3")["name"] == "Carol"
+
+    def test_upsert_documents(self):
+        """Test bulk upsert replaces existing documents and inserts new ones."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("users", {"_id": "u1", "name": "Alice", "age": 30})
+
+        result = store.upsert_documents("users", [{"_id": "u1", "name": "Alicia"}, {"_id": "u2"}, {"name": "No id"}])
+
+        assert result.succeeded == ["u1", "u2"]
+        assert isinstance(result.errors[2], DocumentStoreError)
+        assert store.get_document("users", "u1") == {"_id": "u1", "name": "Alicia"}
+
+    def test_update_documents(self):
+        """Test bulk update applies patches and reports missing documents."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("users", {"_id": "u1", "age": 30})
+        store.insert_document("users", {"_id": "u2", "age": 40})
+
+        result = store.update_documents("users", [("u1", {"age": 31}), ("missing", {"age": 1}), ("u2", {"age": 41})])
+
+        assert result.succeeded == ["u1", "u2"]
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], DocumentNotFoundError)
+        assert store.get_document("users", "u1")["age"] == 31
+        assert store.get_document("users", "u2")["age"] == 41
+
+    def test_delete_documents(self):
+        """Test bulk delete removes existing documents and reports missing ones."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("users", {"_id": "u1"})
+        store.insert_document("users", {"_id": "u2"})
+
+        result = store.delete_documents("users", ["u1", "missing", "u2"])
+
+        assert result.succeeded == ["u1", "u2"]
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], DocumentNotFoundError)
+        assert store.query_documents("users", {}) == []
+
+    def test_query_documents_in_operator(self):
+        """Test that query_documents supports $in conditions."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        for doc_id in ("a", "b", "c"):
+            store.insert_document("items", {"_id": doc_id})
+
+        results = store.query_documents("items", {"_id": {"$in": ["a", "c", "missing"]}})
+
+        assert sorted(doc["_id"] for doc in results) == ["a", "c"]
+
+    def test_query_documents_uses_field_index(self):
+        """Test that equality and $in filters on indexed fields use the index and stay current after writes."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_documents(
+            "chunks",
+            [
+                {"_id": "c1", "message_doc_id": "m1", "embedding_generated": False},
+                {"_id": "c2", "message_doc_id": "m2", "embedding_generated": False},
+                {"_id": "c3", "message_doc_id": "m1", "embedding_generated": True},
+            ],
+        )
+
+        assert store.query_documents("chunks", {"message_doc_id": "m1", "embedding_generated": False}) == [
+            {"_id": "c1", "message_doc_id": "m1", "embedding_generated": False}
+        ]
+        assert "message_doc_id" in store._indexes["chunks"]
+
+        store.update_document("chunks", "c1", {"embedding_generated": True})
+        store.upsert_documents("chunks", [{"_id": "c2", "message_doc_id": "m3", "embedding_generated": False}])
+        store.delete_document("chunks", "c3")
+
+        pending = store.query_documents("chunks", {"embedding_generated": False})
+        assert [doc["_id"] for doc in pending] == ["c2"]
+        in_results = store.query_documents("chunks", {"message_doc_id": {"$in": ["m1", "m3"]}})
+        assert sorted(doc["_id"] for doc in in_results) == ["c1", "c2"]
+        assert store.query_documents("chunks", {"message_doc_id": "m2"}) == []
+
+    def test_query_documents_index_sees_directly_stored_documents(self):
+        """Test that indexes are rebuilt when documents are added without the store API."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("messages", {"_id": "m1", "thread_id": "t1"})
+        assert len(store.query_documents("messages", {"thread_id": "t1"})) == 1
+
+        store.collections["messages"]["m2"] = {"_id": "m2", "thread_id": "t1"}
+
+        assert len(store.query_documents("messages", {"thread_id": "t1"})) == 2
+
+    def test_query_documents_index_follows_updates_of_indexed_fields(self):
+        """Test that updating an indexed field moves the document to its new index bucket."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("chunks", {"_id": "c1", "embedding_generated": False, "thread_id": "t1"})
+        store.insert_document("chunks", {"_id": "c2", "embedding_generated": False, "thread_id": "t1"})
+        assert len(store.query_documents("chunks", {"embedding_generated": False})) == 2
+
+        store.update_document("chunks", "c1", {"embedding_generated": True})
+        store.update_documents("chunks", [("c2", {"thread_id": "t2"})])
+        store.apply_update_operators("chunks", "c2", {"$max": {"embedding_generated": True}})
+
+        assert sorted(d["_id"] for d in store.query_documents("chunks", {"embedding_generated": True})) == ["c1", "c2"]
+        assert store.query_documents("chunks", {"embedding_generated": False}) == []
+        assert [d["_id"] for d in store.query_documents("chunks", {"thread_id": "t2"})] == ["c2"]
+
+    def test_query_documents_index_sees_directly_replaced_documents(self):
+        """Test that indexes are rebuilt when a document is replaced without the store API."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("messages", {"_id": "m1", "thread_id": "t1"})
+        assert len(store.query_documents("messages", {"thread_id": "t1"})) == 1
+
+        store.collections["messages"]["m1"] = {"_id": "m1", "thread_id": "t2"}
+
+        assert store.query_documents("messages", {"thread_id": "t1"}) == []
+        assert len(store.query_documents("messages", {"thread_id": "t2"})) == 1
+
+    def test_query_documents_index_with_unhashable_values(self):
+        """Test that documents with list values in an indexed field are still matched."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("items", {"_id": "a", "archive_id": ["x", "y"]})
+        store.insert_document("items", {"_id": "b", "archive_id": "x"})
+
+        assert [doc["_id"] for doc in store.query_documents("items", {"archive_id": "x"})] == ["b"]
+        assert [doc["_id"] for doc in store.query_documents("items", {"archive_id": ["x", "y"]})] == ["a"]
+
+    def test_query_documents_projection(self):
+        """Test inclusion and exclusion projections, including _id handling."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("items", {"_id": "m1", "thread_id": "t1", "body": "large", "tags": ["a"]})
+
+        assert store.query_documents("items", {}, projection={"thread_id": 1}) == [{"_id": "m1", "thread_id": "t1"}]
+        assert store.query_documents("items", {}, projection={"_id": 1}) == [{"_id": "m1"}]
+        assert store.query_documents("items", {}, projection={"thread_id": 1, "_id": 0}) == [{"thread_id": "t1"}]
+        assert store.query_documents("items", {}, projection={"body": 0, "tags": 0}) == [
+            {"_id": "m1", "thread_id": "t1"}
+        ]
+
+    def test_query_documents_invalid_projection(self):
+        """Test that mixed or nested projections are rejected."""
+        store = InMemoryDocumentStore()
+        store.connect()
+
+        with pytest.raises(DocumentStoreError, match="cannot mix"):
+            store.query_documents("items", {}, projection={"thread_id": 1, "body": 0})
+        with pytest.raises(DocumentStoreError, match="top-level"):
+            store.query_documents("items", {}, projection={"metadata.author": 1})
+
+    def test_query_page_walks_all_documents(self):
+        """Test keyset pages cover every match once, in order, across deletes."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        dates = ["2024-01-03", None, "2024-01-01", "2024-01-03", "2024-01-02", None, "2024-01-04"]
+        for i, date in enumerate(dates):
+            store.insert_document("threads", {"_id": f"t{i}", "archive_id": "a1", "first_message_date": date})
+        store.insert_document("threads", {"_id": "other", "archive_id": "a2", "first_message_date": "2024-01-01"})
+
+        first = store.query_page("threads", {"archive_id": "a1"}, page_size=3, sort_by="first_message_date")
+        assert [doc["_id"] for doc in first.documents] == ["t6", "t3", "t0"]
+        assert first.next_cursor is not None
+
+        # Deleting a returned document does not shift the following pages
+        store.delete_document("threads", "t3")
+        ids = [doc["_id"] for doc in first.documents]
+        cursor = first.next_cursor
+        while cursor:
+            page = store.query_page(
+                "threads", {"archive_id": "a1"}, page_size=3, sort_by="first_message_date", cursor=cursor
+            )
+            ids.extend(doc["_id"] for doc in page.documents)
+            cursor = page.next_cursor
+
+        assert ids == ["t6", "t3", "t0", "t4", "t2", "t5", "t1"]
+
+    def test_query_page_rejects_invalid_cursor(self):
+        """Test that malformed cursors and cursors of another sort are rejected."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        for i in range(3):
+            store.insert_document("threads", {"_id": f"t{i}"})
+        page = store.query_page("threads", {}, page_size=1, sort_by="first_message_date")
+
+        with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+            store.query_page("threads", {}, page_size=1, cursor="not-a-cursor")
+        with pytest.raises(InvalidCursorError, match="different sort"):
+            store.query_page("threads", {}, page_size=1, sort_by="last_message_date", cursor=page.next_cursor)
+        with pytest.raises(DocumentStoreError, match="page_size"):
+            store.query_page("threads", {}, page_size=0)
+
+    def test_iter_documents_is_not_limited(self):
+        """Test that iter_documents yields every match, not just the first query_documents() limit."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        for i in range(250):
+            store.insert_document("chunks", {"_id": f"c{i:03d}", "thread_id": "t1", "text": "body"})
+
+        docs = list(store.iter_documents("chunks", {"thread_id": "t1"}, sort_order="asc", projection={"_id": 1}))
+
+        assert len(store.query_documents("chunks", {"thread_id": "t1"})) == 100
+        assert len(docs) == 250
+        assert docs[0] == {"_id": "c000"}
+        assert docs[-1] == {"_id": "c249"}
+
+    def test_default_query_page_and_iter_documents(self):
+        """Test the DocumentStore fallbacks built on query_documents()."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        for i in range(5):
+            store.insert_document("threads", {"_id": f"t{i}", "first_message_date": f"2024-01-0{i + 1}"})
+
+        first = DocumentStore.query_page(store, "threads", {}, page_size=2, sort_by="first_message_date")
+        second = DocumentStore.query_page(
+            store, "threads", {}, page_size=2, sort_by="first_message_date", cursor=first.next_cursor
+        )
+        assert [doc["_id"] for doc in first.documents + second.documents] == ["t4", "t3", "t2", "t1"]
+
+        docs = list(DocumentStore.iter_documents(store, "threads", page_size=2, sort_by="first_message_date"))
+        assert [doc["_id"] for doc in docs] == ["t4", "t3", "t2", "t1", "t0"]
+
+    def test_apply_update_operators(self):
+        """Test $inc, $min, $max and $addToSet folding into a stored document."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document(
+            "aggregates",
+            {"_id": "t1", "count": 2, "first": "2024-02-01", "last": "2024-02-03", "tags": ["a"]},
+        )
+
+        store.apply_update_operators(
+            "aggregates",
+            "t1",
+            {
+                "$inc": {"count": 3},
+                "$min": {"first": "2024-01-15", "created": "2024-03-01"},
+                "$max": {"last": "2024-02-02"},
+                "$addToSet": {"tags": {"$each": ["a", "b"]}},
+            },
+        )
+
+        doc = store.get_document("aggregates", "t1")
+        assert doc["count"] == 5
+        assert doc["first"] == "2024-01-15"
+        assert doc["created"] == "2024-03-01"
+        assert doc["last"] == "2024-02-03"
+        assert doc["tags"] == ["a", "b"]
+
+    def test_apply_update_operators_errors(self):
+        """Test missing documents and unsupported operators are rejected."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("aggregates", {"_id": "t1"})
+
+        with pytest.raises(DocumentNotFoundError):
+            store.apply_update_operators("aggregates", "missing", {"$inc": {"count": 1}})
+        with pytest.raises(DocumentStoreError, match="Unsupported update operator"):
+            store.apply_update_operators("aggregates", "t1", {"$set": {"count": 1}})
+
+    def test_default_bulk_methods_fall_back_to_single_document_calls(self):
+        """Backends without native bulk support get per-item results from the base class."""
+
+        class SingleDocumentStore(DocumentStore):
+            def __init__(self):
+                self.docs = {}
+
+            def connect(self):
+                pass
+
+            def disconnect(self):
+                pass
+
+            def insert_document(self, collection, doc):
+                if doc["_id"] in self.docs:
+                    raise DocumentAlreadyExistsError(doc["_id"])
+                self.docs[doc["_id"]] = dict(doc)
+                return doc["_id"]
+
+            def get_document(self, collection, doc_id):
+                return self.docs.get(doc_id)
+
+            def query_documents(self, collection, filter_dict, limit=100, sort_by=None, sort_order="desc"):
+                return []
+
+            def update_document(self, collection, doc_id, patch):
+                if doc_id not in self.docs:
+                    raise DocumentNotFoundError(doc_id)
+                self.docs[doc_id].update(patch)
+
+            def delete_document(self, collection, doc_id):
+                if doc_id not in self.docs:
+                    raise DocumentNotFoundError(doc_id)
+                del self.docs[doc_id]
+
+        store = SingleDocumentStore()
+
+        inserted = store.insert_documents("users", [{"_id": "u1"}, {"_id": "u1"}])
+        assert inserted.succeeded == ["u1"]
+        assert isinstance(inserted.errors[1], DocumentAlreadyExistsError)
+
+        updated = store.update_documents("users", [("u1", {"age": 1}), ("u2", {"age": 2})])
+        assert updated.succeeded == ["u1"]
+        assert isinstance(updated.errors[1], DocumentNotFoundError)
+
+        upserted = store.upsert_documents("users", [{"_id": "u1", "name": "Alice"}])
+        assert upserted == BulkWriteResult(succeeded=["u1"])
+        assert store.docs["u1"] == {"_id": "u1", "name": "Alice"}
+
     def test_clear_collection(self):
         """Test clearing a collection."""
         store = InMemoryDocumentStore()
@@ -446,6 +782,25 @@ class TestInMemoryDocumentStore:
         assert len(retrieved_again["projects"][1]["contributors"]) == 1
         assert retrieved_again["projects"][1]["contributors"][0]["roles"] == ["pm"]
 
+    def test_shallow_reads_without_copy_on_read(self):
+        """Test that reads without copy_on_read still do not see later writes."""
+        store = InMemoryDocumentStore(copy_on_read=False)
+        store.connect()
+        store.insert_document("users", {"_id": "u1", "name": "Alice", "tags": ["a"]})
+
+        retrieved = store.get_document("users", "u1")
+        retrieved["name"] = "Mallory"
+        store.update_document("users", "u1", {"tags": ["a", "b"]})
+
+        assert retrieved["tags"] == ["a"]
+        assert store.get_document("users", "u1") == {"_id": "u1", "name": "Alice", "tags": ["a", "b"]}
+
+    def test_from_config_copy_on_read(self):
+        """Test that from_config applies the copy_on_read setting."""
+        store = InMemoryDocumentStore.from_config(DriverConfig_DocumentStore_Inmemory(copy_on_read=False))
+
+        assert store.copy_on_read is False
+
     def test_aggregate_documents_simple_match(self):
         """Test aggregation with $match stage."""
         store = InMemoryDocumentStore()
@@ -605,6 +960,30 @@ class TestInMemoryDocumentStore:
         results = store.aggregate_documents("nonexistent", pipeline)
         assert results == []
 
+    def test_aggregate_documents_lookup_hash_join(self):
+        """Test that $lookup joins on indexed and non-indexed foreign fields without modifying stored documents."""
+        store = InMemoryDocumentStore()
+        store.connect()
+        store.insert_document("messages", {"_id": "m1", "thread_id": "t1"})
+        store.insert_document("messages", {"_id": "m2", "thread_id": "t2"})
+        store.insert_document("chunks", {"_id": "c1", "message_doc_id": "m1", "seq": 0})
+        store.insert_document("chunks", {"_id": "c2", "message_doc_id": "m1", "seq": 1})
+        store.insert_document("threads", {"_id": "t1", "subject": "Hello"})
+
+        results = store.aggregate_documents(
+            "messages",
+            [
+                {"$match": {"thread_id": "t1"}},
+                {"$lookup": {"from": "chunks", "localField": "_id", "foreignField": "message_doc_id", "as": "chunks"}},
+                {"$lookup": {"from": "threads", "localField": "thread_id", "foreignField": "_id", "as": "thread"}},
+            ],
+        )
+
+        assert len(results) == 1
+        assert [chunk["_id"] for chunk in results[0]["chunks"]] == ["c1", "c2"]
+        assert results[0]["thread"][0]["subject"] == "Hello"
+        assert "chunks" not in store.collections["messages"]["m1"]
+
     def test_aggregate_documents_lookup_nonexistent_foreign_collection(self):
         """Test $lookup with a foreign collection that doesn't exist."""
         store = InMemoryDocumentStore()
@@ -734,3 +1113,248 @@ class TestMongoDocumentStore:
         # Verify DocumentAlreadyExistsError is raised (not DuplicateKeyError)
         with pytest.raises(DocumentAlreadyExistsError, match="already exists"):
             store.insert_document("messages", {"_id": "test-123", "name": "test"})
+
+    def _connected_store(self):
+        """Create a MongoDocumentStore with a mocked database and collection."""
+        from unittest.mock import MagicMock, Mock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+        mock_collection = MagicMock()
+        mock_database = MagicMock()
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        store.database = mock_database
+        return store, mock_collection
+
+    def test_insert_documents_maps_bulk_write_errors(self):
+        """Test that insert_documents uses one insert_many and maps duplicate keys per item."""
+        from pymongo.errors import BulkWriteError
+
+        store, mock_collection = self._connected_store()
+        mock_collection.insert_many.side_effect = BulkWriteError(
+            {
+                "writeErrors": [
+                    {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"},
+                    {"index": 2, "code": 121, "errmsg": "Document failed validation"},
+                ],
+                "nInserted": 1,
+            }
+        )
+        docs = [{"_id": "m1"}, {"_id": "m2"}, {"_id": "m3"}]
+
+        result = store.insert_documents("messages", docs)
+
+        mock_collection.insert_many.assert_called_once_with(docs, ordered=False)
+        assert result.succeeded == ["m1"]
+        assert isinstance(result.errors[1], DocumentAlreadyExistsError)
+        assert type(result.errors[2]) is DocumentStoreError
+
+    def test_update_documents_reports_missing_documents(self):
+        """Test that update_documents uses one bulk_write and reports unmatched IDs."""
+        from unittest.mock import Mock
+
+        store, mock_collection = self._connected_store()
+        mock_collection.bulk_write.return_value = Mock(matched_count=1)
+        mock_collection.find.return_value = [{"_id": "c1"}]
+
+        result = store.update_documents("chunks", [("c1", {"embedding_generated": True}), ("c2", {"embedding_generated": True})])
+
+        mock_collection.bulk_write.assert_called_once()
+        assert len(mock_collection.bulk_write.call_args.args[0]) == 2
+        assert result.succeeded == ["c1"]
+        assert isinstance(result.errors[1], DocumentNotFoundError)
+
+    def test_delete_documents_is_a_single_delete_many(self):
+        """Test that delete_documents issues one delete_many and reports missing IDs."""
+        store, mock_collection = self._connected_store()
+        mock_collection.find.return_value = [{"_id": "c1"}]
+
+        result = store.delete_documents("chunks", ["c1", "c2"])
+
+        mock_collection.delete_many.assert_called_once_with({"_id": {"$in": ["c1"]}})
+        mock_collection.delete_one.assert_not_called()
+        assert result.succeeded == ["c1"]
+        assert isinstance(result.errors[1], DocumentNotFoundError)
+
+    def test_apply_update_operators_is_a_single_update(self):
+        """Test that update operators are passed to update_one unchanged."""
+        from unittest.mock import Mock
+
+        store, mock_collection = self._connected_store()
+        mock_collection.update_one.return_value = Mock(matched_count=1)
+        operators = {"$inc": {"message_count": 2}, "$addToSet": {"draft_mentions": {"$each": ["RFC 9000"]}}}
+
+        store.apply_update_operators("threads", "t1", operators)
+
+        mock_collection.update_one.assert_called_once_with({"_id": "t1"}, operators)
+
+        mock_collection.update_one.return_value = Mock(matched_count=0)
+        with pytest.raises(DocumentNotFoundError):
+            store.apply_update_operators("threads", "t2", operators)
+
+    def test_connect_ensures_declared_indexes(self):
+        """Test that connect() creates the indexes declared in collections.config.json."""
+        from unittest.mock import MagicMock, patch
+
+        from pymongo.errors import OperationFailure
+
+        mock_client = MagicMock()
+        collections: dict[str, MagicMock] = {}
+        mock_client.__getitem__.return_value.__getitem__.side_effect = lambda name: collections.setdefault(
+            name, MagicMock()
+        )
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+
+        with patch("pymongo.MongoClient", return_value=mock_client):
+            collections["archives"] = MagicMock()
+            collections["archives"].create_index.side_effect = OperationFailure("IndexOptionsConflict")
+            store.connect()
+
+        assert store.database is not None
+        chunk_indexes = [c.args[0] for c in collections["chunks"].create_index.call_args_list]
+        assert [("message_doc_id", 1)] in chunk_indexes
+        assert [("thread_id", 1), ("embedding_generated", 1)] in chunk_indexes
+        collections["sources"].create_index.assert_any_call([("name", 1)], name="name_idx", unique=True)
+
+    def test_connect_skips_indexes_when_disabled(self):
+        """Test that ensure_indexes=False leaves index management to the deployment."""
+        from unittest.mock import MagicMock, patch
+
+        mock_client = MagicMock()
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db", ensure_indexes=False)
+
+        with patch("pymongo.MongoClient", return_value=mock_client):
+            store.connect()
+
+        mock_client.__getitem__.return_value.__getitem__.return_value.create_index.assert_not_called()
+
+    def test_query_documents_warns_on_collection_scan(self, caplog):
+        """Test that slow queries are explained and collection scans are reported."""
+        from unittest.mock import MagicMock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db", explain_slow_query_ms=0)
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter([{"_id": "c1", "thread_id": "t1"}])
+        cursor.explain.return_value = {
+            "queryPlanner": {"winningPlan": {"stage": "LIMIT", "inputStage": {"stage": "COLLSCAN"}}}
+        }
+        store.database = MagicMock()
+        store.database.__getitem__.return_value.find.return_value = cursor
+
+        with caplog.at_level("WARNING"):
+            results = store.query_documents("chunks", {"thread_id": "t1"})
+
+        assert [doc["_id"] for doc in results] == ["c1"]
+        assert store.collection_scans == {"chunks": 1}
+        assert "COLLSCAN on chunks" in caplog.text
+
+    def test_query_documents_passes_projection_to_find(self):
+        """Test that the projection is pushed down to find()."""
+        from unittest.mock import MagicMock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter([{"_id": "m1", "thread_id": "t1"}])
+        store.database = MagicMock()
+        coll = store.database.__getitem__.return_value
+        coll.find.return_value = cursor
+
+        results = store.query_documents("messages", {"archive_id": "a1"}, projection={"thread_id": True})
+
+        coll.find.assert_called_once_with({"archive_id": "a1"}, {"thread_id": 1})
+        assert results == [{"_id": "m1", "thread_id": "t1"}]
+
+    def test_query_page_uses_keyset_cursor(self):
+        """Test that the next page is selected by a range filter on (sort field, _id)."""
+        from unittest.mock import MagicMock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+        cursor = MagicMock()
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter(
+            [
+                {"_id": "t3", "first_message_date": "2024-01-03"},
+                {"_id": "t2", "first_message_date": "2024-01-02"},
+                {"_id": "t1", "first_message_date": "2024-01-01"},
+            ]
+        )
+        store.database = MagicMock()
+        coll = store.database.__getitem__.return_value
+        coll.find.return_value = cursor
+
+        page = store.query_page("threads", {"archive_id": "a1"}, page_size=2, sort_by="first_message_date")
+
+        assert [doc["_id"] for doc in page.documents] == ["t3", "t2"]
+        coll.find.assert_called_once_with({"archive_id": "a1"})
+        cursor.sort.assert_called_once_with([("first_message_date", -1), ("_id", -1)])
+        cursor.limit.assert_called_once_with(3)
+
+        cursor.__iter__.return_value = iter([{"_id": "t1", "first_message_date": "2024-01-01"}])
+        next_page = store.query_page(
+            "threads", {"archive_id": "a1"}, page_size=2, sort_by="first_message_date", cursor=page.next_cursor
+        )
+
+        assert next_page.next_cursor is None
+        assert coll.find.call_args[0][0] == {
+            "$and": [
+                {"archive_id": "a1"},
+                {
+                    "$or": [
+                        {"first_message_date": {"$lt": "2024-01-02"}},
+                        {"first_message_date": "2024-01-02", "_id": {"$lt": "t2"}},
+                        {"first_message_date": None},
+                    ]
+                },
+            ]
+        }
+
+    def test_iter_documents_uses_batch_size(self):
+        """Test that iter_documents streams one cursor fetching page_size documents per batch."""
+        from unittest.mock import MagicMock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.batch_size.return_value = cursor
+        cursor.__iter__.return_value = iter([{"_id": "c1"}, {"_id": "c2"}])
+        store.database = MagicMock()
+        coll = store.database.__getitem__.return_value
+        coll.find.return_value = cursor
+
+        docs = list(store.iter_documents("chunks", {"source": "list"}, page_size=200, projection={"_id": 1}))
+
+        assert docs == [{"_id": "c1"}, {"_id": "c2"}]
+        coll.find.assert_called_once_with({"source": "list"}, {"_id": 1})
+        cursor.limit.assert_called_once_with(0)
+        cursor.batch_size.assert_called_once_with(200)
+
+    def test_query_documents_index_scan_not_reported(self):
+        """Test that queries using an index are not reported."""
+        from unittest.mock import MagicMock
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db", explain_slow_query_ms=0)
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter([])
+        cursor.explain.return_value = {
+            "queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}}
+        }
+        store.database = MagicMock()
+        store.database.__getitem__.return_value.find.return_value = cursor
+
+        store.query_documents("chunks", {"thread_id": "t1"})
+
+        assert store.collection_scans == {}
+
+    def test_bulk_methods_not_connected(self):
+        """Test that bulk methods raise when not connected."""
+        from copilot_storage import DocumentStoreNotConnectedError
+
+        store = MongoDocumentStore(host="localhost", port=27017, database="test_db")
+
+        with pytest.raises(DocumentStoreNotConnectedError):
+            store.insert_documents("messages", [{"_id": "m1"}])
+        with pytest.raises(DocumentStoreNotConnectedError):
+            store.update_documents("messages", [("m1", {})])
@@ -315,6 +315,23 @@ class TestValidatingDocumentStore:
         updated = store.get_document("test_collection", doc_id)
         assert updated["status"] == "updated"
 
+    @requires_schema_validation
+    def test_apply_update_operators_validates_result(self):
+        """Test that the document resulting from update operators is validated."""
+        base = _create_base_inmemory_store()
+        base.connect()
+
+        schema = {"type": "object", "properties": {"count": {"type": "integer", "maximum": 5}}}
+        store = ValidatingDocumentStore(base, MockSchemaProvider({"test_collection": schema}), strict=True)
+        doc_id = base.insert_document("test_collection", {"count": 2})
+
+        store.apply_update_operators("test_collection", doc_id, {"$inc": {"count": 3}})
+        assert store.get_document("test_collection", doc_id)["count"] == 5
+
+        with pytest.raises(DocumentValidationError):
+            store.apply_update_operators("test_collection", doc_id, {"$inc": {"count": 1}})
+        assert store.get_document("test_collection", doc_id)["count"] == 5
+
     @requires_schema_validation
     def test_update_invalid_document_strict_mode(self):
         """Test updating with an invalid patch in strict mode fails."""
@@ -421,6 +438,89 @@ class TestValidatingDocumentStore:
         with pytest.raises(DocumentNotFoundError):
             store.update_document("test_collection", "nonexistent", {"status": "updated"})
 
+    @requires_schema_validation
+    def test_insert_documents_reports_validation_errors_per_item(self):
+        """Invalid documents are reported per item and valid ones are still inserted."""
+        base = _create_base_inmemory_store()
+        base.connect()
+
+        schema = {
+            "type": "object",
+            "properties": {"archive_id": {"type": "string"}, "status": {"type": "string"}},
+            "required": ["archive_id", "status"],
+        }
+        store = ValidatingDocumentStore(base, MockSchemaProvider({"archives": schema}), strict=True)
+
+        result = store.insert_documents(
+            "archives",
+            [
+                {"_id": "a1", "archive_id": "a1", "status": "pending"},
+                {"_id": "a2", "archive_id": "a2"},
+                {"_id": "a3", "archive_id": "a3", "status": "pending"},
+            ],
+        )
+
+        assert result.succeeded == ["a1", "a3"]
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], DocumentValidationError)
+        assert base.get_document("archives", "a2") is None
+        assert base.get_document("archives", "a3") is not None
+
+    @requires_schema_validation
+    def test_update_documents_validates_merged_documents(self):
+        """Bulk updates validate each merged document and report missing ones."""
+        base = _create_base_inmemory_store()
+        base.connect()
+
+        schema = {"type": "object", "properties": {"status": {"type": "string"}}}
+        store = ValidatingDocumentStore(base, MockSchemaProvider({"test_collection": schema}), strict=True)
+
+        base.insert_document("test_collection", {"_id": "d1", "data": "one"})
+        base.insert_document("test_collection", {"_id": "d2", "data": "two"})
+
+        result = store.update_documents(
+            "test_collection",
+            [("d1", {"status": "updated"}), ("d2", {"status": 123}), ("missing", {"status": "updated"})],
+        )
+
+        assert result.succeeded == ["d1"]
+        assert isinstance(result.errors[1], DocumentValidationError)
+        assert isinstance(result.errors[2], DocumentNotFoundError)
+        assert base.get_document("test_collection", "d1")["status"] == "updated"
+        assert "status" not in base.get_document("test_collection", "d2")
+
+    @requires_schema_validation
+    def test_update_documents_fetches_current_documents_in_one_query(self, monkeypatch):
+        """Bulk updates fetch current documents with one $in query instead of per-ID gets."""
+        base = _create_base_inmemory_store()
+        base.connect()
+
+        schema = {"type": "object", "properties": {"status": {"type": "string"}}}
+        store = ValidatingDocumentStore(base, MockSchemaProvider({"test_collection": schema}), strict=True)
+
+        for doc_id in ("d1", "d2", "d3"):
+            base.insert_document("test_collection", {"_id": doc_id, "data": doc_id})
+
+        get_calls = []
+        original_get = base.get_document
+
+        def tracking_get(collection, doc_id):
+            get_calls.append(doc_id)
+            return original_get(collection, doc_id)
+
+        monkeypatch.setattr(base, "get_document", tracking_get)
+
+        result = store.update_documents(
+            "test_collection",
+            [("d1", {"status": "a"}), ("d2", {"status": "b"}), ("d3", {"status": "c"}), ("missing", {"status": "d"})],
+        )
+
+        assert result.succeeded == ["d1", "d2", "d3"]
+        assert isinstance(result.errors[3], DocumentNotFoundError)
+        # Only the ID the batch query missed falls back to a single-document read
+        assert get_calls == ["missing"]
+        assert original_get("test_collection", "d3")["status"] == "c"
+
     def test_query_documents(self):
         """Test querying documents."""
         base = _create_base_inmemory_store()
@@ -438,6 +538,38 @@ class TestValidatingDocumentStore:
         assert len(results) == 1
         assert results[0]["status"] == "active"
 
+    def test_query_documents_with_projection(self):
+        """Test that the projection is passed to the underlying store."""
+        base = _create_base_inmemory_store()
+        base.connect()
+        store = ValidatingDocumentStore(base, MockSchemaProvider())
+        base.insert_document("test_collection", {"_id": "d1", "status": "active", "data": "large"})
+
+        results = store.query_documents("test_collection", {"status": "active"}, projection={"status": 1})
+
+        assert results == [{"_id": "d1", "status": "active"}]
+
+    def test_query_page_and_iter_documents(self):
+        """Test that cursor paging and iteration are passed to the underlying store."""
+        base = _create_base_inmemory_store()
+        base.connect()
+        store = ValidatingDocumentStore(base, MockSchemaProvider())
+        for i in range(3):
+            base.insert_document("test_collection", {"_id": f"d{i}", "status": "active"})
+
+        first = store.query_page("test_collection", {"status": "active"}, page_size=2, sort_order="asc")
+        second = store.query_page(
+            "test_collection", {"status": "active"}, page_size=2, sort_order="asc", cursor=first.next_cursor
+        )
+
+        assert [doc["_id"] for doc in first.documents + second.documents] == ["d0", "d1", "d2"]
+        assert second.next_cursor is None
+        assert [doc["_id"] for doc in store.iter_documents("test_collection", page_size=1, sort_order="asc")] == [
+            "d0",
+            "d1",
+            "d2",
+        ]
+
     def test_delete_document(self):
         """Test deleting a document."""
         base = _create_base_inmemory_store()
@@ -9,10 +9,12 @@ and simplify testing.
 """
 
 from .factory import create_vector_store
+from .filters import MetadataFilter
 from .interface import SearchResult, VectorStore
 
 __all__ = [
     "VectorStore",
     "SearchResult",
+    "MetadataFilter",
     "create_vector_store",
 ]
@@ -9,6 +9,7 @@ from typing import Any, cast
 
 from copilot_config.generated.adapters.vector_store import DriverConfig_VectorStore_AzureAiSearch
 
+from .filters import FILTERABLE_METADATA_FIELDS, MetadataFilter, parse_filter
 from .interface import SearchResult, VectorStore
 
 # Try to import Azure SDK exception types at module level
@@ -28,6 +29,53 @@ HNSW_EF_CONSTRUCTION = 400
 # Size of dynamic candidate list during search (higher = better recall, slower search)
 HNSW_EF_SEARCH = 500
 
+# OData comparison operators for metadata filter range conditions
+_ODATA_RANGE_OPERATORS = {"$gt": "gt", "$gte": "ge", "$lt": "lt", "$lte": "le"}
+
+
+def _odata_string(value: Any) -> str:
+    """Format a value as an OData string literal, escaping single quotes."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _build_odata_filter(filter: MetadataFilter | None) -> str | None:
+    """Translate a metadata filter into an Azure AI Search OData $filter expression.
+
+    Only the promoted metadata fields (FILTERABLE_METADATA_FIELDS) exist as
+    filterable index fields; all of them are stored as strings.
+
+    Args:
+        filter: Metadata filter, or None
+
+    Returns:
+        OData filter expression, or None when no filter is given
+
+    Raises:
+        ValueError: If the filter is invalid or uses a field that is not filterable
+    """
+    clauses = []
+    for field, operator, value in parse_filter(filter):
+        if field not in FILTERABLE_METADATA_FIELDS:
+            raise ValueError(
+                f"Azure AI Search cannot filter on metadata field '{field}'. "
+                f"Filterable fields: {', '.join(FILTERABLE_METADATA_FIELDS)}"
+            )
+        if operator == "$eq":
+            clauses.append(f"{field} eq {_odata_string(value)}")
+        elif operator == "$in":
+            if not value:
+                clauses.append("false")
+            else:
+                clauses.append("(" + " or ".join(f"{field} eq {_odata_string(v)}" for v in value) + ")")
+        else:
+            clauses.append(f"{field} {_ODATA_RANGE_OPERATORS[operator]} {_odata_string(value)}")
+    return " and ".join(clauses) or None
+
+
+def _filterable_fields(metadata: dict[str, Any]) -> dict[str, str]:
+    """Copy the promoted metadata fields into top-level document fields."""
+    return {field: str(metadata[field]) for field in FILTERABLE_METADATA_FIELDS if metadata.get(field) is not None}
+
 
 class AzureAISearchVectorStore(VectorStore):
     """Azure AI Search-based vector store implementation.
@@ -203,6 +251,8 @@ class AzureAISearchVectorStore(VectorStore):
                         f"Index '{self._index_name}' exists with different vector size: "
                         f"expected {self._vector_size}, found {vector_field.vector_search_dimensions}"
                     )
+
+            self._add_missing_filterable_fields(existing_index)
         except Exception as e:
             # Check for ResourceNotFoundError first (requires azure-search-documents >= 11.0),
             # then fall back to string matching for older SDK versions or other clients
@@ -218,6 +268,78 @@ class AzureAISearchVectorStore(VectorStore):
             else:
                 raise
 
+    def _filterable_field_definitions(self, exclude: set[str] | None = None) -> list[Any]:
+        """Build index fields for the promoted metadata fields used by query filters."""
+        return [
+            self._SimpleField(name=field, type=self._SearchFieldDataType.String, filterable=True)
+            for field in FILTERABLE_METADATA_FIELDS
+            if field not in (exclude or set())
+        ]
+
+    def _add_missing_filterable_fields(self, existing_index: Any) -> None:
+        """Add promoted metadata fields to an index created before they existed.
+
+        Documents indexed before the fields were added have no values for
+        them and will not match metadata filters until re-indexed or
+        backfilled with backfill_filterable_fields().
+        """
+        existing_names = {getattr(f, "name", None) for f in existing_index.fields}
+        missing = self._filterable_field_definitions(exclude=existing_names)
+        if not missing:
+            return
+        try:
+            existing_index.fields = [*existing_index.fields, *missing]
+            self._index_client.create_or_update_index(existing_index)
+            logger.info(f"Added filterable metadata fields to index '{self._index_name}'")
+        except Exception as e:
+            logger.warning(f"Failed to add filterable metadata fields to index '{self._index_name}': {e}")
+
+    def backfill_filterable_fields(self, batch_size: int = 1000) -> int:
+        """Populate the promoted metadata fields on documents indexed before they existed.
+
+        Finds documents with none of the promoted fields set, copies the
+        values from their stored metadata JSON and merges them in place, so
+        existing embeddings become filterable without being re-embedded.
+        Safe to run repeatedly; documents that already have the fields are
+        not touched.
+
+        Args:
+            batch_size: Number of documents read and merged per request
+
+        Returns:
+            Number of documents updated
+        """
+        self._ensure_index_ready()
+
+        missing_filter = " and ".join(f"{field} eq null" for field in FILTERABLE_METADATA_FIELDS)
+        updated = 0
+        while True:
+            results = self._search_client.search(
+                search_text="*",
+                filter=missing_filter,
+                select=["id", "metadata"],
+                top=batch_size,
+            )
+            documents = []
+            for result in results:
+                try:
+                    metadata = json.loads(result.get("metadata") or "{}")
+                except json.JSONDecodeError:
+                    continue
+                fields = _filterable_fields(metadata)
+                if fields:
+                    documents.append({"id": result["id"], **fields})
+
+            # Documents whose metadata has nothing to promote stay unmatched by
+            # the filter, so stop once a page contains nothing left to merge
+            if not documents:
+                break
+            self._search_client.merge_documents(documents=documents)
+            updated += len(documents)
+            logger.info(f"Backfilled filterable metadata fields on {updated} documents in '{self._index_name}'")
+
+        return updated
+
     def _create_index(self) -> None:
         """Create a new search index with vector search configuration."""
         fields = [
@@ -239,6 +361,7 @@ class AzureAISearchVectorStore(VectorStore):
                 type=self._SearchFieldDataType.String,
                 filterable=True,
             ),
+            *self._filterable_field_definitions(),
         ]
 
         # Configure vector search with HNSW algorithm
@@ -337,6 +460,7 @@ class AzureAISearchVectorStore(VectorStore):
             "id": id,
             "embedding": vector,
             "metadata": json.dumps(metadata),
+            **_filterable_fields(metadata),
         }
 
         # Upload document (upsert semantics)
@@ -377,6 +501,7 @@ class AzureAISearchVectorStore(VectorStore):
                 "id": id_val,
                 "embedding": vector,
                 "metadata": json.dumps(metadata),
+                **_filterable_fields(metadata),
             }
             for id_val, vector, metadata in zip(ids, vectors, metadatas)
         ]
@@ -385,19 +510,27 @@ class AzureAISearchVectorStore(VectorStore):
         self._search_client.upload_documents(documents=documents)
         logger.debug(f"Upserted {len(documents)} embeddings")
 
-    def query(self, query_vector: list[float], top_k: int = 10) -> list[SearchResult]:
+    def query(
+        self, query_vector: list[float], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[SearchResult]:
         """Query the vector store for similar embeddings.
 
         Args:
             query_vector: The query embedding vector
             top_k: Number of top results to return
+            filter: Optional metadata filter, applied as an OData $filter before
+                the vector search. Only the fields in FILTERABLE_METADATA_FIELDS
+                can be filtered on.
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
 
         Raises:
             ValueError: If query_vector dimension doesn't match stored vectors
+                or the filter is invalid
         """
+        odata_filter = _build_odata_filter(filter)
+
         self._ensure_index_ready()
 
         if len(query_vector) != self._vector_size:
@@ -406,6 +539,11 @@ class AzureAISearchVectorStore(VectorStore):
                 f"expected dimension ({self._vector_size})"
             )
 
+        # Pre-filtering restricts the vector search itself, so top_k matching results come back
+        filter_kwargs: dict[str, Any] = {}
+        if odata_filter:
+            filter_kwargs = {"filter": odata_filter, "vector_filter_mode": "preFilter"}
+
         from azure.search.documents.models import VectorizedQuery
 
         # Create vector query
@@ -419,6 +557,7 @@ class AzureAISearchVectorStore(VectorStore):
             vector_queries=[vector_query],
             select=["id", "embedding", "metadata"],
             top=top_k,
+            **filter_kwargs,
         )
 
         # Convert to SearchResult objects
@@ -4,16 +4,150 @@
 """FAISS-based vector store implementation."""
 
 import importlib
+import json
 import logging
+import mmap
+import os
+import struct
+import time
 from typing import Any
 
 import numpy as np
 from copilot_config.generated.adapters.vector_store import DriverConfig_VectorStore_Faiss
 
+from .filters import FILTERABLE_METADATA_FIELDS, MetadataFilter, matches_filter, parse_filter
 from .interface import SearchResult, VectorStore
 
 logger = logging.getLogger(__name__)
 
+INDEX_TYPES = ("flat", "ivf", "ivfpq", "hnsw")
+
+# Index types that must be trained on representative data before vectors can be added
+_TRAINED_INDEX_TYPES = ("ivf", "ivfpq")
+
+# FAISS clustering wants at least this many training points per centroid
+_MIN_POINTS_PER_CENTROID = 39
+
+# Bits per PQ sub-quantizer code; each sub-quantizer has 2**_PQ_NBITS centroids
+_PQ_NBITS = 8
+
+# Suffix of the metadata sidecar written next to the index file
+METADATA_SUFFIX = ".meta"
+
+# Prefix of saved index files: magic followed by the save generation (uint64),
+# which must match the generation in the sidecar header
+_INDEX_MAGIC = b"CFCFIDX1"
+
+
+class _MetadataSidecar:
+    """Memory-mapped, read-only view of a saved metadata sidecar.
+
+    File layout (all integers little-endian)::
+
+        magic (8 bytes) | header length (uint64) | header JSON (padded to 8 bytes)
+        labels (int64 x count) | offsets (int64 x count + 1)
+        ids (JSON array) | metadata records (concatenated JSON objects)
+
+    Labels and offsets are viewed directly from the mapping, and metadata
+    records are only decoded when accessed, so opening a large sidecar costs
+    little more than decoding the list of IDs.
+    """
+
+    MAGIC = b"CFCFAISS"
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str):
+        """Open and map a sidecar file.
+
+        Args:
+            path: Path of the sidecar file
+
+        Raises:
+            ValueError: If the file is not a valid sidecar
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mmap[:8] != self.MAGIC:
+                raise ValueError(f"'{path}' is not a FAISS metadata sidecar")
+            (header_length,) = struct.unpack_from("<Q", self._mmap, 8)
+            self.header: dict[str, Any] = json.loads(self._mmap[16 : 16 + header_length])
+            if self.header.get("format_version") != self.FORMAT_VERSION:
+                raise ValueError(f"Unsupported sidecar format version: {self.header.get('format_version')}")
+
+            count = self.header["count"]
+            position = 16 + _padded(header_length)
+            self.labels = np.frombuffer(self._mmap, dtype="<i8", count=count, offset=position)
+            position += 8 * count
+            self._offsets = np.frombuffer(self._mmap, dtype="<i8", count=count + 1, offset=position)
+            position += 8 * (count + 1)
+            ids_end = position + self.header["ids_bytes"]
+            self.ids: list[str] = json.loads(self._mmap[position:ids_end])
+            self._payload_start = ids_end
+        except Exception:
+            self.close()
+            raise
+
+    def metadata(self, row: int) -> dict[str, Any]:
+        """Decode the metadata record stored at the given row."""
+        start = self._payload_start + int(self._offsets[row])
+        end = self._payload_start + int(self._offsets[row + 1])
+        return json.loads(self._mmap[start:end])
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        # Drop numpy views first; mmap refuses to close while buffers are exported
+        self.labels = np.empty(0, dtype=np.int64)
+        self._offsets = np.empty(0, dtype=np.int64)
+        self._mmap.close()
+
+    @classmethod
+    def write(
+        cls,
+        path: str,
+        header: dict[str, Any],
+        ids: list[str],
+        labels: list[int],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Write a sidecar file.
+
+        Args:
+            path: Destination path
+            header: Store-level settings to record in the header
+            ids: Vector IDs, aligned with labels and metadatas
+            labels: FAISS labels for each ID
+            metadatas: Metadata dictionaries for each ID
+        """
+        records = [json.dumps(metadata, separators=(",", ":")).encode("utf-8") for metadata in metadatas]
+        offsets = np.zeros(len(records) + 1, dtype="<i8")
+        np.cumsum([len(record) for record in records], out=offsets[1:])
+        ids_bytes = json.dumps(ids, separators=(",", ":")).encode("utf-8")
+
+        header = {
+            **header,
+            "format_version": cls.FORMAT_VERSION,
+            "count": len(ids),
+            "ids_bytes": len(ids_bytes),
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(cls.MAGIC)
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes.ljust(_padded(len(header_bytes)), b" "))
+            f.write(np.asarray(labels, dtype="<i8").tobytes())
+            f.write(offsets.tobytes())
+            f.write(ids_bytes)
+            for record in records:
+                f.write(record)
+
+
+def _padded(length: int) -> int:
+    """Round a byte length up to a multiple of 8 so the arrays that follow stay aligned."""
+    return (length + 7) // 8 * 8
+
 
 class FAISSVectorStore(VectorStore):
     """FAISS-based vector store implementation.
@@ -22,24 +156,60 @@ class FAISSVectorStore(VectorStore):
     efficient similarity search on large-scale embeddings. It's the
     default backend for production use.
 
+    Vectors are stored under integer labels inside the FAISS index
+    (``IndexIDMap2`` for flat and HNSW indexes, native IDs for IVF indexes),
+    so vectors can be reconstructed and removed without a separate copy.
+    IVF indexes start out as an exact flat index and are trained
+    automatically once enough vectors have been added.
+
+    When ``persist_path`` is set, the index is written to that path and the
+    ID mapping and metadata to a memory-mapped sidecar file next to it
+    (``<persist_path>.meta``). An existing index is loaded on startup, and
+    writes are saved automatically at most every ``save_interval_seconds``;
+    call ``flush()`` before shutdown to save the writes since the last save.
+
     Args:
         dimension: Dimension of the embedding vectors
-        index_type: Type of FAISS index to use ("flat" or "ivf")
+        index_type: Type of FAISS index to use ("flat", "ivf", "ivfpq" or "hnsw")
         persist_path: Optional path to persist the index to disk
     """
 
-    def __init__(self, dimension: int, index_type: str = "flat", persist_path: str | None = None):
+    def __init__(
+        self,
+        dimension: int,
+        index_type: str = "flat",
+        persist_path: str | None = None,
+        nlist: int = 100,
+        nprobe: int = 10,
+        pq_m: int = 8,
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 64,
+        train_size: int | None = None,
+        save_interval_seconds: float = 60.0,
+    ):
         """Initialize a FAISS vector store.
 
         Args:
             dimension: Dimension of the embedding vectors
             index_type: Type of FAISS index ("flat" for exact search,
-                       "ivf" for approximate search on large datasets)
+                       "ivf"/"ivfpq" for approximate inverted-file search on
+                       large datasets, "hnsw" for graph-based approximate search)
             persist_path: Optional path to save/load the index
+            nlist: Number of IVF clusters
+            nprobe: Number of IVF clusters searched per query
+            pq_m: Number of product-quantizer sub-vectors for "ivfpq";
+                  must divide the dimension
+            hnsw_m: Number of neighbors per HNSW graph node
+            hnsw_ef_search: HNSW search-time candidate list size
+            train_size: Number of vectors to collect before training an IVF
+                        index. Defaults to 39 * nlist (FAISS's recommended minimum)
+                        and must be at least nlist.
+            save_interval_seconds: Minimum time between automatic saves when
+                                   persist_path is set (0 saves after every write)
 
         Raises:
             ImportError: If FAISS is not installed
-            ValueError: If dimension <= 0 or index_type is invalid
+            ValueError: If dimension <= 0, index_type is invalid or train_size < nlist
         """
         try:
             faiss = importlib.import_module("faiss")
@@ -49,26 +219,61 @@ class FAISSVectorStore(VectorStore):
         if dimension <= 0:
             raise ValueError(f"Dimension must be positive, got {dimension}")
 
-        if index_type not in ["flat", "ivf"]:
-            raise ValueError(f"Invalid index_type '{index_type}'. Must be 'flat' or 'ivf'")
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Invalid index_type '{index_type}'. Must be one of: {', '.join(INDEX_TYPES)}")
+
+        if index_type == "ivfpq" and dimension % pq_m != 0:
+            raise ValueError(f"pq_m ({pq_m}) must divide the dimension ({dimension})")
+
+        if index_type in _TRAINED_INDEX_TYPES and train_size and train_size < nlist:
+            # FAISS clustering cannot train nlist centroids on fewer points
+            raise ValueError(f"train_size ({train_size}) must be at least nlist ({nlist})")
 
         self._dimension = dimension
         self._index_type = index_type
         self._persist_path = persist_path
+        self._nlist = nlist
+        self._nprobe = nprobe
+        self._pq_m = pq_m
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_search = hnsw_ef_search
+        self._train_size = train_size or _MIN_POINTS_PER_CENTROID * nlist
+        if index_type == "ivfpq":
+            self._train_size = max(self._train_size, 2**_PQ_NBITS)
+        self._save_interval_seconds = save_interval_seconds
         # The FAISS Python bindings have inconsistent/partial type stubs across
         # distributions. Treat the module and index objects as dynamic to avoid
         # false-positive type errors while still validating our typed config.
         self._faiss: Any = faiss
 
-        # Maintain mapping from FAISS index to our IDs and metadata
+        # Maintain mapping from FAISS labels to our IDs. Metadata for vectors
+        # added since the last save lives in _metadata; everything else is read
+        # on demand from the memory-mapped sidecar.
         self._id_to_idx: dict[str, int] = {}
         self._idx_to_id: dict[int, str] = {}
         self._metadata: dict[str, dict[str, Any]] = {}
-        self._vectors: dict[str, np.ndarray] = {}
+        self._sidecar: _MetadataSidecar | None = None
+        self._sidecar_rows: dict[int, int] = {}
+        # Inverted index of filterable metadata (field -> value -> labels) used
+        # to build filtered-search ID selectors. Built on the first filtered
+        # query so loading a large sidecar does not decode every record.
+        self._field_index: dict[str, dict[Any, set[int]]] | None = None
+        # Labels whose value for a filterable field is unhashable; these are
+        # checked against the filter individually
+        self._unindexed_labels: dict[str, set[int]] = {}
         self._next_idx = 0
+        self._last_save = time.monotonic()
+        # Writes since the last save, and the number of saves (recorded in
+        # both saved files so load() can detect a pair from different saves)
+        self._dirty = False
+        self._generation = 0
 
         # Initialize FAISS index
         self._index: Any = self._create_index()
+        self._trained = index_type not in _TRAINED_INDEX_TYPES
+
+        if persist_path and os.path.exists(persist_path + METADATA_SUFFIX):
+            self.load()
 
         logger.info(f"Initialized FAISS vector store with dimension={dimension}, type={index_type}")
 
@@ -77,7 +282,8 @@ class FAISSVectorStore(VectorStore):
         """Create a FAISSVectorStore from configuration.
 
         Args:
-            config: Configuration object with dimension, index_type, and persist_path attributes.
+            config: Configuration object with dimension, index_type, persist_path
+                and index tuning attributes.
 
         Returns:
             Configured FAISSVectorStore instance
@@ -88,28 +294,75 @@ class FAISSVectorStore(VectorStore):
             dimension=config.dimension,
             index_type=config.index_type,
             persist_path=persist_path,
+            nlist=config.nlist,
+            nprobe=config.nprobe,
+            pq_m=config.pq_m,
+            hnsw_m=config.hnsw_m,
+            hnsw_ef_search=config.hnsw_ef_search,
+            train_size=config.train_size,
+            save_interval_seconds=config.save_interval_seconds,
         )
 
     def _create_index(self) -> Any:
-        """Create a new FAISS index based on the configured type.
+        """Create a new, empty FAISS index based on the configured type.
+
+        IVF types start as an exact flat index that buffers vectors until
+        there are enough to train on (see _train_index).
 
         Returns:
             A new FAISS index instance
         """
-        if self._index_type == "flat":
-            # Flat index for exact search (using L2 distance)
-            return self._faiss.IndexFlatL2(self._dimension)
+        if self._index_type == "hnsw":
+            hnsw: Any = self._faiss.IndexHNSWFlat(self._dimension, self._hnsw_m)
+            hnsw.hnsw.efSearch = self._hnsw_ef_search
+            return self._faiss.IndexIDMap2(hnsw)
+
+        # Flat index for exact search (using L2 distance)
+        return self._faiss.IndexIDMap2(self._faiss.IndexFlatL2(self._dimension))
+
+    def _train_index(self) -> None:
+        """Train an IVF index on the buffered vectors and move them into it."""
+        labels = np.array(list(self._idx_to_id), dtype=np.int64)
+        vectors = self._index.reconstruct_batch(labels)
+
+        quantizer: Any = self._faiss.IndexFlatL2(self._dimension)
+        if self._index_type == "ivfpq":
+            index: Any = self._faiss.IndexIVFPQ(quantizer, self._dimension, self._nlist, self._pq_m, _PQ_NBITS)
+        else:
+            index = self._faiss.IndexIVFFlat(quantizer, self._dimension, self._nlist)
+        index.train(vectors)
+        # A hashtable direct map lets IVF indexes reconstruct and remove by label
+        index.set_direct_map_type(self._faiss.DirectMap.Hashtable)
+        index.nprobe = self._nprobe
+        index.add_with_ids(vectors, labels)
+
+        self._index = index
+        self._trained = True
+        logger.info(f"Trained FAISS {self._index_type} index with nlist={self._nlist} on {len(labels)} vectors")
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the index from live vectors, dropping tombstoned ones.
+
+        Only needed for HNSW, which cannot remove vectors in place.
+        """
+        labels = np.array(list(self._idx_to_id), dtype=np.int64)
+        vectors = self._index.reconstruct_batch(labels) if len(labels) else None
+        self._index = self._create_index()
+        if vectors is not None:
+            self._index.add_with_ids(vectors, labels)
+        logger.info(f"Rebuilt FAISS {self._index_type} index with {len(labels)} live vectors")
+
+    def _configure_loaded_index(self) -> None:
+        """Apply search-time settings, which are not part of the saved index."""
+        ivf = self._faiss.try_extract_index_ivf(self._index)
+        if ivf is not None:
+            ivf.nprobe = self._nprobe
+            self._trained = True
+        elif self._index_type == "hnsw":
+            self._faiss.downcast_index(self._index.index).hnsw.efSearch = self._hnsw_ef_search
+            self._trained = True
         else:
-            # IVF index for approximate search
-            quantizer: Any = self._faiss.IndexFlatL2(self._dimension)
-            index: Any = self._faiss.IndexIVFFlat(quantizer, self._dimension, 100)
-            # Train with deterministic random data for initialization
-            # In production, this will be replaced by actual data during first batch add
-            np.random.seed(42)
-            training_data = np.random.rand(1000, self._dimension).astype("float32")
-            train = getattr(index, "train")
-            train(training_data)
-            return index
+            self._trained = self._index_type not in _TRAINED_INDEX_TYPES
 
     def add_embedding(self, id: str, vector: list[float], metadata: dict[str, Any]) -> None:
         """Add a single embedding to the vector store.
@@ -122,26 +375,7 @@ class FAISSVectorStore(VectorStore):
         Raises:
             ValueError: If id already exists or vector dimension doesn't match
         """
-        if id in self._id_to_idx:
-            raise ValueError(f"ID '{id}' already exists in the vector store")
-
-        vec_array = np.array(vector, dtype=np.float32).reshape(1, -1)
-
-        if vec_array.shape[1] != self._dimension:
-            raise ValueError(
-                f"Vector dimension ({vec_array.shape[1]}) doesn't match " f"index dimension ({self._dimension})"
-            )
-
-        # Add to FAISS index
-        self._index.add(vec_array)
-
-        # Update mappings
-        idx = self._next_idx
-        self._id_to_idx[id] = idx
-        self._idx_to_id[idx] = id
-        self._metadata[id] = metadata.copy()
-        self._vectors[id] = vec_array.flatten()
-        self._next_idx += 1
+        self.add_embeddings([id], [vector], [metadata])
 
     def add_embeddings(self, ids: list[str], vectors: list[list[float]], metadatas: list[dict[str, Any]]) -> None:
         """Add multiple embeddings to the vector store in batch.
@@ -156,34 +390,46 @@ class FAISSVectorStore(VectorStore):
         """
         if not (len(ids) == len(vectors) == len(metadatas)):
             raise ValueError("ids, vectors, and metadatas must have the same length")
+        if not ids:
+            return
 
         # Check for duplicates before adding any
+        seen: set[str] = set()
         for id in ids:
-            if id in self._id_to_idx:
+            if id in self._id_to_idx or id in seen:
                 raise ValueError(f"ID '{id}' already exists in the vector store")
+            seen.add(id)
 
         # Convert to numpy array for batch addition
         vec_array = np.array(vectors, dtype=np.float32)
 
-        if vec_array.shape[1] != self._dimension:
-            raise ValueError(
-                f"Vector dimension ({vec_array.shape[1]}) doesn't match " f"index dimension ({self._dimension})"
-            )
+        if vec_array.ndim != 2 or vec_array.shape[1] != self._dimension:
+            actual = vec_array.shape[1] if vec_array.ndim == 2 else len(vectors[0])
+            raise ValueError(f"Vector dimension ({actual}) doesn't match " f"index dimension ({self._dimension})")
 
         # Add to FAISS index in batch
-        self._index.add(vec_array)
+        labels = np.arange(self._next_idx, self._next_idx + len(ids), dtype=np.int64)
+        self._index.add_with_ids(vec_array, labels)
 
         # Update mappings
-        for i, (id, vector, metadata) in enumerate(zip(ids, vectors, metadatas)):
-            idx = self._next_idx + i
-            self._id_to_idx[id] = idx
-            self._idx_to_id[idx] = id
+        for label, id, metadata in zip(labels.tolist(), ids, metadatas):
+            self._id_to_idx[id] = label
+            self._idx_to_id[label] = id
             self._metadata[id] = metadata.copy()
-            self._vectors[id] = np.array(vector, dtype=np.float32)
+            if self._field_index is not None:
+                self._index_fields(label, metadata)
 
         self._next_idx += len(ids)
 
-    def query(self, query_vector: list[float], top_k: int = 10) -> list[SearchResult]:
+        if not self._trained and self._index.ntotal >= self._train_size:
+            self._train_index()
+
+        self._dirty = True
+        self._maybe_autosave()
+
+    def query(
+        self, query_vector: list[float], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[SearchResult]:
         """Query the vector store for similar embeddings.
 
         Uses L2 distance for similarity (lower distance = more similar).
@@ -192,49 +438,187 @@ class FAISSVectorStore(VectorStore):
         Args:
             query_vector: The query embedding vector
             top_k: Number of top results to return
+            filter: Optional metadata filter; the search is restricted to
+                matching embeddings with a FAISS ID selector
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
 
         Raises:
             ValueError: If query_vector dimension doesn't match stored vectors
+                or the filter is invalid
         """
-        if self._index.ntotal == 0:
-            return []
+        return self.query_batch([query_vector], top_k, filter=filter)[0]
 
-        query_array = np.array(query_vector, dtype=np.float32).reshape(1, -1)
+    def query_batch(
+        self, query_vectors: list[list[float]], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Query the vector store with several query vectors in one FAISS search.
 
-        if query_array.shape[1] != self._dimension:
-            raise ValueError(
-                f"Query vector dimension ({query_array.shape[1]}) doesn't match " f"index dimension ({self._dimension})"
-            )
+        Args:
+            query_vectors: The query embedding vectors
+            top_k: Number of top results to return per query
+            filter: Optional metadata filter applied to every query
 
-        # Search in FAISS (returns distances and indices)
-        k = min(top_k, self._index.ntotal)
-        distances, indices = self._index.search(query_array, k)
+        Returns:
+            One list of SearchResult objects per query, each ordered by
+            similarity (highest first)
+
+        Raises:
+            ValueError: If any query vector dimension doesn't match stored vectors
+                or the filter is invalid
+        """
+        conditions = parse_filter(filter)
+        if not query_vectors:
+            return []
+        if self.count() == 0 or top_k <= 0:
+            return [[] for _ in query_vectors]
+
+        for query_vector in query_vectors:
+            if len(query_vector) != self._dimension:
+                raise ValueError(
+                    f"Query vector dimension ({len(query_vector)}) doesn't match "
+                    f"index dimension ({self._dimension})"
+                )
+        query_array = np.array(query_vectors, dtype=np.float32)
+
+        if conditions:
+            labels = sorted(self._labels_matching(conditions))
+            if not labels:
+                return [[] for _ in query_vectors]
+            # Matching labels are all live, so no tombstone over-fetch is needed
+            k = min(top_k, len(labels))
+            params = self._search_parameters(self._faiss.IDSelectorBatch(np.array(labels, dtype=np.int64)))
+            distances, indices = self._index.search(query_array, k, params=params)
+        else:
+            # Over-fetch by the number of tombstoned vectors (HNSW only) so that
+            # filtering them out still leaves top_k results
+            tombstones = self._index.ntotal - self.count()
+            k = min(top_k + tombstones, self._index.ntotal)
+            distances, indices = self._index.search(query_array, k)
 
         # Build SearchResult objects
         # Convert L2 distance to similarity score: score = 1 / (1 + distance)
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx == -1:  # FAISS returns -1 for missing results
-                continue
+        for row_distances, row_indices in zip(distances, indices):
+            row_results = []
+            for dist, idx in zip(row_distances, row_indices):
+                # FAISS returns -1 for missing results
+                id = self._idx_to_id.get(int(idx))
+                if id is None:
+                    continue
+
+                score = 1.0 / (1.0 + float(dist))  # Convert distance to similarity
+                row_results.append(self._result(id, score))
+                if len(row_results) == top_k:
+                    break
+            results.append(row_results)
 
-            id = self._idx_to_id[idx]
-            score = 1.0 / (1.0 + float(dist))  # Convert distance to similarity
+        return results
 
-            results.append(
-                SearchResult(id=id, score=score, vector=self._vectors[id].tolist(), metadata=self._metadata[id].copy())
-            )
+    def _ensure_field_index(self) -> dict[str, dict[Any, set[int]]]:
+        """Return the inverted index of filterable metadata, building it if needed."""
+        if self._field_index is None:
+            self._field_index = {field: {} for field in FILTERABLE_METADATA_FIELDS}
+            self._unindexed_labels = {field: set() for field in FILTERABLE_METADATA_FIELDS}
+            for id, label in self._id_to_idx.items():
+                self._index_fields(label, self._get_metadata(id))
+        return self._field_index
+
+    def _index_fields(self, label: int, metadata: dict[str, Any]) -> None:
+        """Add a vector's filterable metadata values to the inverted index."""
+        assert self._field_index is not None
+        for field, values in self._field_index.items():
+            if field not in metadata:
+                continue
+            value = metadata[field]
+            try:
+                values.setdefault(value, set()).add(label)
+            except TypeError:
+                self._unindexed_labels[field].add(label)
+
+    def _unindex_fields(self, label: int, metadata: dict[str, Any]) -> None:
+        """Remove a vector's filterable metadata values from the inverted index."""
+        assert self._field_index is not None
+        for field, values in self._field_index.items():
+            if field not in metadata:
+                continue
+            value = metadata[field]
+            try:
+                labels = values.get(value)
+            except TypeError:
+                self._unindexed_labels[field].discard(label)
+                continue
+            if labels is not None:
+                labels.discard(label)
+                if not labels:
+                    del values[value]
+
+    def _labels_matching(self, conditions: list[tuple[str, str, Any]]) -> set[int]:
+        """Find the labels of live vectors whose metadata satisfies the filter.
+
+        Conditions on filterable fields are answered from the inverted index:
+        equality and membership by lookup, ranges by testing each distinct
+        value once. Conditions on other fields are checked against the
+        metadata of the remaining candidates only.
+        """
+        field_index = self._ensure_field_index()
+        candidates: set[int] | None = None
+        residual: list[tuple[str, str, Any]] = []
+
+        for condition in conditions:
+            field, operator, expected = condition
+            values = field_index.get(field)
+            if values is None:
+                residual.append(condition)
+                continue
 
-        return results
+            matched: set[int] = set()
+            if operator in ("$eq", "$in"):
+                for value in [expected] if operator == "$eq" else expected:
+                    try:
+                        matched |= values.get(value, set())
+                    except TypeError:
+                        pass
+            else:
+                for value, labels in values.items():
+                    if matches_filter({field: value}, [condition]):
+                        matched |= labels
+            for label in self._unindexed_labels[field]:
+                if matches_filter(self._get_metadata(self._idx_to_id[label]), [condition]):
+                    matched.add(label)
+
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return set()
+
+        if candidates is None:
+            candidates = set(self._idx_to_id)
+        if residual:
+            candidates = {
+                label for label in candidates if matches_filter(self._get_metadata(self._idx_to_id[label]), residual)
+            }
+        return candidates
+
+    def _search_parameters(self, selector: Any) -> Any:
+        """Build search parameters restricting a search to the selected labels.
+
+        Index-specific settings are repeated because FAISS applies the
+        parameter object's defaults (e.g. nprobe=1) instead of the index's.
+        """
+        if self._faiss.try_extract_index_ivf(self._index) is not None:
+            return self._faiss.SearchParametersIVF(sel=selector, nprobe=self._nprobe)
+        if self._index_type == "hnsw":
+            return self._faiss.SearchParametersHNSW(sel=selector, efSearch=self._hnsw_ef_search)
+        return self._faiss.SearchParameters(sel=selector)
 
     def delete(self, id: str) -> None:
         """Delete an embedding from the vector store.
 
-        Note: FAISS doesn't support efficient deletion, so we mark the
-        ID as deleted but keep the vector in the index. A rebuild would
-        be needed to reclaim space.
+        The vector is removed from the FAISS index. HNSW indexes cannot
+        remove vectors in place, so for them the vector is filtered out of
+        results and the index is rebuilt once deleted vectors outnumber
+        live ones.
 
         Args:
             id: Unique identifier of the embedding to delete
@@ -245,31 +629,39 @@ class FAISSVectorStore(VectorStore):
         if id not in self._id_to_idx:
             raise KeyError(f"ID '{id}' not found in vector store")
 
-        idx = self._id_to_idx[id]
-
-        # Remove from mappings
-        del self._id_to_idx[id]
+        if self._field_index is not None:
+            self._unindex_fields(self._id_to_idx[id], self._get_metadata(id))
+        idx = self._id_to_idx.pop(id)
         del self._idx_to_id[idx]
-        del self._metadata[id]
-        del self._vectors[id]
+        self._metadata.pop(id, None)
+        self._sidecar_rows.pop(idx, None)
 
-        logger.warning(
-            f"Deleted ID '{id}' from mappings. Note: FAISS index still contains "
-            "the vector. Consider rebuilding the index to reclaim space."
-        )
+        if self._index_type == "hnsw":
+            if self._index.ntotal - self.count() > self.count():
+                self._rebuild_index()
+        else:
+            self._index.remove_ids(np.array([idx], dtype=np.int64))
+
+        self._dirty = True
+        self._maybe_autosave()
 
     def clear(self) -> None:
         """Remove all embeddings from the vector store."""
         # Recreate the index using the helper method
         self._index = self._create_index()
+        self._trained = self._index_type not in _TRAINED_INDEX_TYPES
 
         # Clear all mappings
         self._id_to_idx.clear()
         self._idx_to_id.clear()
         self._metadata.clear()
-        self._vectors.clear()
+        self._close_sidecar()
+        self._field_index = None
         self._next_idx = 0
 
+        self._dirty = True
+        self._maybe_autosave()
+
     def count(self) -> int:
         """Get the number of embeddings in the vector store.
 
@@ -293,21 +685,49 @@ class FAISSVectorStore(VectorStore):
         if id not in self._id_to_idx:
             raise KeyError(f"ID '{id}' not found in vector store")
 
-        return SearchResult(
-            id=id,
-            score=1.0,  # Perfect match with itself
-            vector=self._vectors[id].tolist(),
-            metadata=self._metadata[id].copy(),
-        )
+        return self._result(id, 1.0)  # Perfect match with itself
+
+    def _result(self, id: str, score: float) -> SearchResult:
+        """Build a SearchResult, reconstructing the vector from the index.
+
+        Vectors in an "ivfpq" index are product-quantized, so the returned
+        vector is an approximation of the one that was added.
+        """
+        vector = self._index.reconstruct(self._id_to_idx[id])
+        return SearchResult(id=id, score=score, vector=vector.tolist(), metadata=self._get_metadata(id))
+
+    def _get_metadata(self, id: str) -> dict[str, Any]:
+        """Return a copy of the metadata for an ID, reading the sidecar if needed."""
+        if id in self._metadata:
+            return self._metadata[id].copy()
+        assert self._sidecar is not None
+        return self._sidecar.metadata(self._sidecar_rows[self._id_to_idx[id]])
+
+    def _close_sidecar(self) -> None:
+        """Release the current metadata sidecar, if any."""
+        if self._sidecar is not None:
+            self._sidecar.close()
+        self._sidecar = None
+        self._sidecar_rows = {}
+
+    def _maybe_autosave(self) -> None:
+        """Save after a write if persist_path is set and the autosave interval has elapsed."""
+        if self._persist_path and time.monotonic() - self._last_save >= self._save_interval_seconds:
+            self.save()
+
+    def flush(self) -> None:
+        """Save to persist_path if anything was written since the last save."""
+        if self._persist_path and self._dirty:
+            self.save()
 
     def save(self, path: str | None = None) -> None:
-        """Save the FAISS index to disk.
+        """Save the FAISS index, ID mapping and metadata to disk.
 
-        WARNING: This method only saves the FAISS index itself. The metadata
-        mappings (_id_to_idx, _idx_to_id, _metadata, _vectors) are NOT persisted.
-        After loading an index, you will need to rebuild these mappings or the
-        store will not function correctly. For full persistence, consider using
-        a database backend or implementing custom serialization.
+        The index is written to ``path`` and the ID mapping and metadata to
+        ``path + ".meta"``. Both files are written to a temporary name and
+        then renamed, so a crash mid-save leaves the previous copy intact.
+        Both carry the same save generation; a crash between the two renames
+        leaves a pair that load() rejects.
 
         Args:
             path: Path to save the index. Uses persist_path if not provided.
@@ -319,31 +739,94 @@ class FAISSVectorStore(VectorStore):
         if not save_path:
             raise ValueError("No path provided for saving the index")
 
-        self._faiss.write_index(self._index, save_path)
-        logger.warning(
-            f"Saved FAISS index to {save_path}. Note: Metadata mappings are NOT saved. "
-            "Loading this index without rebuilding metadata will cause errors."
-        )
+        ids = list(self._id_to_idx)
+        labels = [self._id_to_idx[id] for id in ids]
+        metadatas = [self._get_metadata(id) for id in ids]
+        generation = self._generation + 1
+        header = {
+            "dimension": self._dimension,
+            "index_type": self._index_type,
+            "next_idx": self._next_idx,
+            "generation": generation,
+        }
+
+        sidecar_path = save_path + METADATA_SUFFIX
+        with open(save_path + ".tmp", "wb") as f:
+            f.write(_INDEX_MAGIC + struct.pack("<Q", generation))
+            self._faiss.write_index(self._index, self._faiss.PyCallbackIOWriter(f.write))
+        _MetadataSidecar.write(sidecar_path + ".tmp", header, ids, labels, metadatas)
+        os.replace(save_path + ".tmp", save_path)
+        os.replace(sidecar_path + ".tmp", sidecar_path)
+
+        # Serve metadata from the new sidecar so unsaved entries can be released
+        self._open_sidecar(sidecar_path)
+        self._metadata.clear()
+
+        self._generation = generation
+        if save_path == self._persist_path:
+            self._dirty = False
+        self._last_save = time.monotonic()
+        logger.info(f"Saved FAISS index with {len(ids)} vectors to {save_path}")
 
     def load(self, path: str | None = None) -> None:
-        """Load a FAISS index from disk.
+        """Load a FAISS index, ID mapping and metadata from disk.
 
-        WARNING: This method only loads the FAISS index. Metadata mappings are NOT
-        restored. The store will not work correctly without metadata. This method
-        is primarily useful for inspection or when you plan to rebuild metadata.
+        Replaces the current contents of the store. Metadata is memory-mapped
+        and decoded on access, so loading does not parse every record.
 
         Args:
             path: Path to load the index from. Uses persist_path if not provided.
 
         Raises:
-            ValueError: If no path is provided and persist_path is not set
+            ValueError: If no path is provided and persist_path is not set, if
+                the saved index does not match this store's dimension or index type,
+                or if the index and sidecar were written by different saves
         """
         load_path = path or self._persist_path
         if not load_path:
             raise ValueError("No path provided for loading the index")
 
-        self._index = self._faiss.read_index(load_path)
-        logger.warning(
-            f"Loaded FAISS index from {load_path}. Note: Metadata mappings were NOT loaded. "
-            "You must rebuild metadata mappings for the store to function correctly."
-        )
+        sidecar = _MetadataSidecar(load_path + METADATA_SUFFIX)
+        header = sidecar.header
+        sidecar.close()
+        if header["dimension"] != self._dimension or header["index_type"] != self._index_type:
+            raise ValueError(
+                f"Saved index at {load_path} has dimension={header['dimension']}, "
+                f"type={header['index_type']}; expected dimension={self._dimension}, type={self._index_type}"
+            )
+
+        index, generation = self._read_index_file(load_path)
+        if generation != header.get("generation"):
+            raise ValueError(
+                f"Saved index at {load_path} (generation {generation}) and its metadata sidecar "
+                f"(generation {header.get('generation')}) come from different saves"
+            )
+        self._index = index
+        self._configure_loaded_index()
+
+        self._metadata.clear()
+        self._open_sidecar(load_path + METADATA_SUFFIX)
+        assert self._sidecar is not None
+        self._id_to_idx = dict(zip(self._sidecar.ids, self._sidecar.labels.tolist()))
+        self._idx_to_id = {idx: id for id, idx in self._id_to_idx.items()}
+        self._field_index = None
+        self._next_idx = header["next_idx"]
+        self._generation = generation or 0
+        self._dirty = False
+
+        logger.info(f"Loaded FAISS index with {self.count()} vectors from {load_path}")
+
+    def _read_index_file(self, path: str) -> tuple[Any, int | None]:
+        """Read a saved index and its save generation (None for files saved before generations)."""
+        with open(path, "rb") as f:
+            prefix = f.read(len(_INDEX_MAGIC) + 8)
+            if not prefix.startswith(_INDEX_MAGIC):
+                return self._faiss.read_index(path), None
+            (generation,) = struct.unpack_from("<Q", prefix, len(_INDEX_MAGIC))
+            return self._faiss.read_index(self._faiss.PyCallbackIOReader(f.read)), generation
+
+    def _open_sidecar(self, sidecar_path: str) -> None:
+        """Map a sidecar file and index its rows by label."""
+        self._close_sidecar()
+        self._sidecar = _MetadataSidecar(sidecar_path)
+        self._sidecar_rows = {label: row for row, label in enumerate(self._sidecar.labels.tolist())}
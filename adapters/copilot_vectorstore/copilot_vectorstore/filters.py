@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Metadata filters for vector store queries.
+
+A filter is a dictionary mapping metadata field names to conditions, using
+the same shape as document store ``filter_dict`` queries. All conditions
+must hold for a vector to match:
+
+    {"thread_id": "t1"}                                   # equality
+    {"archive_id": {"$in": ["a1", "a2"]}}                 # membership
+    {"date": {"$gte": "2024-01-01", "$lt": "2024-02-01"}} # range
+
+Range bounds on ISO 8601 strings compare chronologically. A date-only
+bound covers the whole day: ``{"$lte": "2024-01-31"}`` means "on or before
+January 31st" and also matches ``"2024-01-31T10:00:00Z"``. parse_filter()
+rewrites such ``$lte``/``$gt`` bounds to ``$lt``/``$gte`` the following day,
+so every backend applies the same meaning.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, TypeAlias
+
+MetadataFilter: TypeAlias = dict[str, Any]
+
+RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+FILTER_OPERATORS = ("$eq", "$in") + RANGE_OPERATORS
+
+# Metadata fields that backends index for filtering, with the kind of values
+# they hold. Chunk embeddings carry these (see the embedding service), and
+# Azure AI Search can only filter on these fields.
+FILTERABLE_METADATA_FIELDS: dict[str, str] = {
+    "thread_id": "keyword",
+    "archive_id": "keyword",
+    "message_id": "keyword",
+    "date": "datetime",
+}
+
+_DATE_ONLY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Date-only bounds that exclude the whole day are rewritten to the next day
+_WIDENED_DATE_OPERATORS = {"$lte": "$lt", "$gt": "$gte"}
+
+
+def _next_day(value: Any) -> str | None:
+    """Return the day after a date-only ISO 8601 string, or None for any other value."""
+    if not isinstance(value, str) or not _DATE_ONLY.fullmatch(value):
+        return None
+    try:
+        return (date.fromisoformat(value) + timedelta(days=1)).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime | None:
+    """Parse an ISO 8601 date or datetime string as an aware datetime (naive values are UTC)."""
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _comparable(actual: Any, expected: Any) -> tuple[Any, Any]:
+    """Return the pair of values a range condition compares.
+
+    Two ISO 8601 strings are compared as datetimes so differing precision or
+    UTC offsets do not affect the result; anything else is compared as is.
+    """
+    if isinstance(actual, str) and isinstance(expected, str):
+        actual_dt = _parse_datetime(actual)
+        expected_dt = _parse_datetime(expected)
+        if actual_dt is not None and expected_dt is not None:
+            return actual_dt, expected_dt
+    return actual, expected
+
+
+def parse_filter(filter: MetadataFilter | None) -> list[tuple[str, str, Any]]:
+    """Validate a metadata filter and flatten it into conditions.
+
+    Args:
+        filter: Metadata filter, or None for no filtering
+
+    Returns:
+        List of (field, operator, value) tuples; plain values become "$eq"
+        conditions, and date-only "$lte"/"$gt" bounds become "$lt"/"$gte"
+        bounds on the following day
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator or an invalid value
+    """
+    if not filter:
+        return []
+
+    conditions = []
+    for field, condition in filter.items():
+        if not isinstance(condition, dict):
+            conditions.append((field, "$eq", condition))
+            continue
+        if not condition:
+            raise ValueError(f"Empty condition for metadata field '{field}'")
+        for operator, value in condition.items():
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Unsupported filter operator '{operator}' for field '{field}'. "
+                    f"Supported operators: {', '.join(FILTER_OPERATORS)}"
+                )
+            if operator == "$in" and not isinstance(value, list | tuple | set):
+                raise ValueError(f"'$in' condition for field '{field}' must be a list")
+            if operator == "$in":
+                value = list(value)
+            elif operator in _WIDENED_DATE_OPERATORS and (next_day := _next_day(value)) is not None:
+                operator, value = _WIDENED_DATE_OPERATORS[operator], next_day
+            conditions.append((field, operator, value))
+    return conditions
+
+
+def matches_filter(metadata: dict[str, Any], conditions: list[tuple[str, str, Any]]) -> bool:
+    """Check whether metadata satisfies all parsed filter conditions.
+
+    Missing fields and values that cannot be compared with a range bound
+    do not match.
+
+    Args:
+        metadata: Metadata stored with a vector
+        conditions: Conditions returned by parse_filter()
+
+    Returns:
+        True if every condition holds
+    """
+    for field, operator, expected in conditions:
+        if field not in metadata:
+            return False
+        actual = metadata[field]
+        try:
+            if operator in RANGE_OPERATORS:
+                actual, expected = _comparable(actual, expected)
+            if operator == "$eq":
+                matched = actual == expected
+            elif operator == "$in":
+                matched = actual in expected
+            elif operator == "$gt":
+                matched = actual > expected
+            elif operator == "$gte":
+                matched = actual >= expected
+            elif operator == "$lt":
+                matched = actual < expected
+            else:
+                matched = actual <= expected
+        except TypeError:
+            matched = False
+        if not matched:
+            return False
+    return True
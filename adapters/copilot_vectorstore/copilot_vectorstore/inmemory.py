@@ -8,14 +8,21 @@ from typing import Any
 import numpy as np
 from copilot_config.generated.adapters.vector_store import DriverConfig_VectorStore_Inmemory
 
+from .filters import MetadataFilter, matches_filter, parse_filter
 from .interface import SearchResult, VectorStore
 
+# Rows allocated on first insert; capacity doubles from here as the store grows
+_INITIAL_CAPACITY = 1024
+
 
 class InMemoryVectorStore(VectorStore):
     """Simple in-memory vector store implementation.
 
-    This implementation stores vectors in memory and uses numpy for
-    similarity calculations. Ideal for testing and development.
+    Vectors are kept L2-normalized in a single contiguous float32 matrix
+    (one row per embedding) alongside their original norms, so cosine
+    similarity for a query is one matrix-vector product and top-k selection
+    uses ``np.argpartition`` instead of a full sort. Deleted rows are
+    tombstoned and compacted away once they make up half of the matrix.
 
     Note: This implementation is not persistent and all data is lost
     when the process terminates.
@@ -23,7 +30,13 @@ class InMemoryVectorStore(VectorStore):
 
     def __init__(self):
         """Initialize an empty in-memory vector store."""
-        self._vectors: dict[str, np.ndarray] = {}
+        self._matrix: np.ndarray | None = None  # (capacity, dimension) normalized rows
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0  # Rows in use, including tombstones
+        self._deleted = 0
+        self._row_ids: list[str | None] = []
+        self._id_to_row: dict[str, int] = {}
         self._metadata: dict[str, dict[str, Any]] = {}
 
     @classmethod
@@ -43,14 +56,7 @@ class InMemoryVectorStore(VectorStore):
         Raises:
             ValueError: If id already exists or vector is invalid
         """
-        if id in self._vectors:
-            raise ValueError(f"ID '{id}' already exists in the vector store")
-
-        if not vector:
-            raise ValueError("Vector cannot be empty")
-
-        self._vectors[id] = np.array(vector, dtype=np.float32)
-        self._metadata[id] = metadata.copy()
+        self.add_embeddings([id], [vector], [metadata])
 
     def add_embeddings(self, ids: list[str], vectors: list[list[float]], metadatas: list[dict[str, Any]]) -> None:
         """Add multiple embeddings to the vector store in batch.
@@ -61,21 +67,53 @@ class InMemoryVectorStore(VectorStore):
             metadatas: List of metadata dictionaries
 
         Raises:
-            ValueError: If lengths don't match or any id already exists
+            ValueError: If lengths don't match, vectors are invalid, or any id already exists
         """
         if not (len(ids) == len(vectors) == len(metadatas)):
             raise ValueError("ids, vectors, and metadatas must have the same length")
+        if not ids:
+            return
 
         # Check for duplicates before adding any
+        seen: set[str] = set()
         for id in ids:
-            if id in self._vectors:
+            if id in self._id_to_row or id in seen:
                 raise ValueError(f"ID '{id}' already exists in the vector store")
+            seen.add(id)
 
-        # Add all embeddings
-        for id, vector, metadata in zip(ids, vectors, metadatas):
-            self.add_embedding(id, vector, metadata)
+        if any(len(vector) == 0 for vector in vectors):
+            raise ValueError("Vector cannot be empty")
 
-    def query(self, query_vector: list[float], top_k: int = 10) -> list[SearchResult]:
+        dimension = len(vectors[0])
+        if self._matrix is not None:
+            dimension = self._matrix.shape[1]
+        for vector in vectors:
+            if len(vector) != dimension:
+                raise ValueError(
+                    f"Vector dimension ({len(vector)}) doesn't match stored vectors dimension ({dimension})"
+                )
+
+        batch = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(batch, axis=1)
+        # Zero vectors stay zero rows and therefore score 0 against any query
+        normalized = batch / np.where(norms > 0, norms, 1.0)[:, np.newaxis]
+
+        self._ensure_capacity(self._size + len(ids), dimension)
+        assert self._matrix is not None
+
+        start, end = self._size, self._size + len(ids)
+        self._matrix[start:end] = normalized
+        self._norms[start:end] = norms
+        self._live[start:end] = True
+        for offset, (id, metadata) in enumerate(zip(ids, metadatas)):
+            self._row_ids.append(id)
+            self._id_to_row[id] = start + offset
+            self._metadata[id] = metadata.copy()
+        self._size = end
+
+    def query(
+        self, query_vector: list[float], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[SearchResult]:
         """Query the vector store for similar embeddings.
 
         Uses cosine similarity for ranking results.
@@ -83,48 +121,86 @@ class InMemoryVectorStore(VectorStore):
         Args:
             query_vector: The query embedding vector
             top_k: Number of top results to return
+            filter: Optional metadata filter; only matching embeddings are scored
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
 
         Raises:
             ValueError: If query_vector dimension doesn't match stored vectors
+                or the filter is invalid
         """
-        if not self._vectors:
-            return []
+        return self.query_batch([query_vector], top_k, filter=filter)[0]
 
-        query_array = np.array(query_vector, dtype=np.float32)
+    def query_batch(
+        self, query_vectors: list[list[float]], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Query the vector store with several query vectors at once.
 
-        # Check dimension compatibility
-        first_vector = next(iter(self._vectors.values()))
-        if len(query_array) != len(first_vector):
-            raise ValueError(
-                f"Query vector dimension ({len(query_array)}) doesn't match "
-                f"stored vectors dimension ({len(first_vector)})"
-            )
+        Scores every query against every stored vector with a single
+        matrix-matrix product. With a filter, only the rows whose metadata
+        matches are gathered and scored.
 
-        # Calculate cosine similarity for all vectors
-        # Precompute normalized query vector for better performance
-        query_norm = query_array / (np.linalg.norm(query_array) + 1e-8)
+        Args:
+            query_vectors: The query embedding vectors
+            top_k: Number of top results to return per query
+            filter: Optional metadata filter applied to every query
 
-        similarities = []
-        for embedding_id, vector in self._vectors.items():
-            # Normalize stored vector for cosine similarity
-            vector_norm = vector / (np.linalg.norm(vector) + 1e-8)
-            similarity = np.dot(query_norm, vector_norm)
-            similarities.append((embedding_id, float(similarity)))
+        Returns:
+            One list of SearchResult objects per query, each ordered by
+            similarity (highest first)
 
-        # Sort by similarity (descending) and take top_k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_results = similarities[:top_k]
+        Raises:
+            ValueError: If any query vector dimension doesn't match stored vectors
+                or the filter is invalid
+        """
+        conditions = parse_filter(filter)
+        if not query_vectors:
+            return []
+        if self.count() == 0 or top_k <= 0:
+            return [[] for _ in query_vectors]
+
+        assert self._matrix is not None
+        dimension = self._matrix.shape[1]
+        for query_vector in query_vectors:
+            if len(query_vector) != dimension:
+                raise ValueError(
+                    f"Query vector dimension ({len(query_vector)}) doesn't match "
+                    f"stored vectors dimension ({dimension})"
+                )
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True) + 1e-8
+
+        if conditions:
+            # Candidate mask: score only the rows whose metadata matches
+            rows = np.fromiter(
+                (
+                    row
+                    for row, id in enumerate(self._row_ids)
+                    if id is not None and matches_filter(self._metadata[id], conditions)
+                ),
+                dtype=np.intp,
+            )
+            if len(rows) == 0:
+                return [[] for _ in query_vectors]
+            scores = queries @ self._matrix[rows].T
+        else:
+            rows = np.arange(self._size)
+            scores = queries @ self._matrix[: self._size].T
+            if self._deleted:
+                scores[:, ~self._live[: self._size]] = -np.inf
+
+        k = min(top_k, self.count(), len(rows))
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
 
-        # Build SearchResult objects
         results = []
-        for id, score in top_results:
+        for row_scores, row_candidates in zip(scores, candidates):
+            # Order by score descending, breaking ties by insertion order
+            order = np.lexsort((row_candidates, -row_scores[row_candidates]))
             results.append(
-                SearchResult(id=id, score=score, vector=self._vectors[id].tolist(), metadata=self._metadata[id].copy())
+                [self._result_for_row(int(rows[column]), float(row_scores[column])) for column in row_candidates[order]]
             )
-
         return results
 
     def delete(self, id: str) -> None:
@@ -136,16 +212,21 @@ class InMemoryVectorStore(VectorStore):
         Raises:
             KeyError: If id doesn't exist
         """
-        if id not in self._vectors:
+        if id not in self._id_to_row:
             raise KeyError(f"ID '{id}' not found in vector store")
 
-        del self._vectors[id]
+        row = self._id_to_row.pop(id)
         del self._metadata[id]
+        self._row_ids[row] = None
+        self._live[row] = False
+        self._deleted += 1
+
+        if self._deleted * 2 > self._size:
+            self._compact()
 
     def clear(self) -> None:
         """Remove all embeddings from the vector store."""
-        self._vectors.clear()
-        self._metadata.clear()
+        self.__init__()
 
     def count(self) -> int:
         """Get the number of embeddings in the vector store.
@@ -153,7 +234,7 @@ class InMemoryVectorStore(VectorStore):
         Returns:
             Number of embeddings currently stored
         """
-        return len(self._vectors)
+        return len(self._id_to_row)
 
     def get(self, id: str) -> SearchResult:
         """Retrieve a specific embedding by ID.
@@ -167,12 +248,48 @@ class InMemoryVectorStore(VectorStore):
         Raises:
             KeyError: If id doesn't exist
         """
-        if id not in self._vectors:
+        if id not in self._id_to_row:
             raise KeyError(f"ID '{id}' not found in vector store")
 
-        return SearchResult(
-            id=id,
-            score=1.0,  # Perfect match with itself
-            vector=self._vectors[id].tolist(),
-            metadata=self._metadata[id].copy(),
-        )
+        # Perfect match with itself
+        return self._result_for_row(self._id_to_row[id], 1.0)
+
+    def _result_for_row(self, row: int, score: float) -> SearchResult:
+        """Build a SearchResult for a matrix row, restoring the original vector."""
+        assert self._matrix is not None
+        id = self._row_ids[row]
+        assert id is not None
+        vector = self._matrix[row] * self._norms[row]
+        return SearchResult(id=id, score=score, vector=vector.tolist(), metadata=self._metadata[id].copy())
+
+    def _ensure_capacity(self, rows: int, dimension: int) -> None:
+        """Grow the backing arrays (amortized doubling) to hold at least ``rows`` rows."""
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2, _INITIAL_CAPACITY)
+        matrix = np.zeros((new_capacity, dimension), dtype=np.float32)
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        live = np.zeros(new_capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+            norms[: self._size] = self._norms[: self._size]
+            live[: self._size] = self._live[: self._size]
+        self._matrix, self._norms, self._live = matrix, norms, live
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows, preserving the insertion order of live rows."""
+        assert self._matrix is not None
+        keep = np.flatnonzero(self._live[: self._size])
+        count = len(keep)
+
+        self._matrix[:count] = self._matrix[keep]
+        self._norms[:count] = self._norms[keep]
+        self._live[:count] = True
+        self._live[count : self._size] = False
+
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._id_to_row = {id: row for row, id in enumerate(self._row_ids) if id is not None}
+        self._size = count
+        self._deleted = 0
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from .filters import MetadataFilter
+
 
 @dataclass
 class SearchResult:
@@ -69,21 +71,51 @@ class VectorStore(ABC):
         pass
 
     @abstractmethod
-    def query(self, query_vector: list[float], top_k: int = 10) -> list[SearchResult]:
+    def query(
+        self, query_vector: list[float], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[SearchResult]:
         """Query the vector store for similar embeddings.
 
         Args:
             query_vector: The query embedding vector
             top_k: Number of top results to return
+            filter: Optional metadata filter (equality, ``$in`` and range
+                conditions, see copilot_vectorstore.filters). Only embeddings
+                whose metadata matches are considered, so up to top_k matching
+                results are returned.
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
 
         Raises:
             ValueError: If query_vector dimension doesn't match stored vectors
+                or the filter is invalid
         """
         pass
 
+    def query_batch(
+        self, query_vectors: list[list[float]], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Query the vector store with several query vectors at once.
+
+        The default implementation calls query() for each vector. Backends
+        that can score many queries in one pass should override this.
+
+        Args:
+            query_vectors: The query embedding vectors
+            top_k: Number of top results to return per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One list of SearchResult objects per query vector, in input order,
+            each ordered by similarity (highest first)
+
+        Raises:
+            ValueError: If any query vector dimension doesn't match stored vectors
+                or the filter is invalid
+        """
+        return [self.query(query_vector, top_k, filter=filter) for query_vector in query_vectors]
+
     @abstractmethod
     def delete(self, id: str) -> None:
         """Delete an embedding from the vector store.
@@ -124,3 +156,10 @@ class VectorStore(ABC):
             KeyError: If id doesn't exist
         """
         pass
+
+    def flush(self) -> None:
+        """Persist writes that the store buffers in memory.
+
+        Call before shutdown. Stores that write through to their backend
+        have nothing to flush; the default does nothing.
+        """
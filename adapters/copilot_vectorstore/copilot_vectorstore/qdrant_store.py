@@ -10,6 +10,7 @@ from typing import Any
 
 from copilot_config.generated.adapters.vector_store import DriverConfig_VectorStore_Qdrant
 
+from .filters import FILTERABLE_METADATA_FIELDS, MetadataFilter, parse_filter
 from .interface import SearchResult, VectorStore
 
 logger = logging.getLogger(__name__)
@@ -123,9 +124,15 @@ class QdrantVectorStore(VectorStore):
             qdrant_exceptions_module = importlib.import_module("qdrant_client.http.exceptions")
 
             QdrantClient = getattr(qdrant_client_module, "QdrantClient")
+            DatetimeRange = getattr(qdrant_models_module, "DatetimeRange")
             Distance = getattr(qdrant_models_module, "Distance")
+            FieldCondition = getattr(qdrant_models_module, "FieldCondition")
+            Filter = getattr(qdrant_models_module, "Filter")
+            MatchAny = getattr(qdrant_models_module, "MatchAny")
+            MatchValue = getattr(qdrant_models_module, "MatchValue")
             PointIdsList = getattr(qdrant_models_module, "PointIdsList")
             PointStruct = getattr(qdrant_models_module, "PointStruct")
+            Range = getattr(qdrant_models_module, "Range")
             VectorParams = getattr(qdrant_models_module, "VectorParams")
             UnexpectedResponse = getattr(qdrant_exceptions_module, "UnexpectedResponse")
         except ImportError as e:
@@ -151,6 +158,12 @@ class QdrantVectorStore(VectorStore):
         self._PointStruct: Any = PointStruct
         self._PointIdsList: Any = PointIdsList
         self._UnexpectedResponse: Any = UnexpectedResponse
+        self._Filter: Any = Filter
+        self._FieldCondition: Any = FieldCondition
+        self._MatchValue: Any = MatchValue
+        self._MatchAny: Any = MatchAny
+        self._Range: Any = Range
+        self._DatetimeRange: Any = DatetimeRange
 
         # Initialize Qdrant client
         try:
@@ -263,6 +276,63 @@ class QdrantVectorStore(VectorStore):
                 else:
                     raise
 
+        self._ensure_payload_indexes()
+
+    def _ensure_payload_indexes(self) -> None:
+        """Index the commonly filtered metadata fields so filtered queries avoid payload scans.
+
+        Creating an index that already exists is a no-op in Qdrant. Failures are
+        logged rather than raised, since filters still work without indexes.
+        """
+        for field_name, field_schema in FILTERABLE_METADATA_FIELDS.items():
+            try:
+                self._client.create_payload_index(
+                    collection_name=self._collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create payload index for '{field_name}': {e}")
+
+    def _build_filter(self, filter: MetadataFilter | None) -> Any:
+        """Translate a metadata filter into a Qdrant payload filter.
+
+        Args:
+            filter: Metadata filter, or None
+
+        Returns:
+            Qdrant Filter, or None when no filter is given
+
+        Raises:
+            ValueError: If the filter is invalid
+        """
+        conditions = parse_filter(filter)
+        if not conditions:
+            return None
+
+        must = []
+        ranges: dict[str, list[dict[str, Any]]] = {}
+        for field, operator, value in conditions:
+            if operator == "$eq":
+                must.append(self._FieldCondition(key=field, match=self._MatchValue(value=value)))
+            elif operator == "$in":
+                must.append(self._FieldCondition(key=field, match=self._MatchAny(any=value)))
+            else:
+                # A bound can repeat once date-only bounds are widened (e.g. "$lte"
+                # becomes "$lt"); repeated bounds go into a separate range condition
+                field_ranges = ranges.setdefault(field, [{}])
+                if operator.lstrip("$") in field_ranges[-1]:
+                    field_ranges.append({})
+                field_ranges[-1][operator.lstrip("$")] = value
+
+        for field, field_ranges in ranges.items():
+            for bounds in field_ranges:
+                # String bounds are dates (e.g. ISO 8601); numeric bounds use a plain range
+                range_type = self._DatetimeRange if any(isinstance(v, str) for v in bounds.values()) else self._Range
+                must.append(self._FieldCondition(key=field, range=range_type(**bounds)))
+
+        return self._Filter(must=must)
+
     def add_embedding(self, id: str, vector: list[float], metadata: dict[str, Any]) -> None:
         """Add a single embedding to the vector store.
 
@@ -346,18 +416,22 @@ class QdrantVectorStore(VectorStore):
                 points=batch,
             )
 
-    def query(self, query_vector: list[float], top_k: int = 10) -> list[SearchResult]:
+    def query(
+        self, query_vector: list[float], top_k: int = 10, filter: MetadataFilter | None = None
+    ) -> list[SearchResult]:
         """Query the vector store for similar embeddings.
 
         Args:
             query_vector: The query embedding vector
             top_k: Number of top results to return
+            filter: Optional metadata filter, applied as a Qdrant payload filter
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
 
         Raises:
             ValueError: If query_vector dimension doesn't match stored vectors
+                or the filter is invalid
         """
         if len(query_vector) != self._vector_size:
             raise ValueError(
@@ -365,12 +439,15 @@ class QdrantVectorStore(VectorStore):
                 f"expected dimension ({self._vector_size})"
             )
 
+        query_filter = self._build_filter(filter)
+
         self._ensure_collection_ready()
 
         # Search in Qdrant
         points_result: Any = self._client.query_points(
             collection_name=self._collection_name,
             query=query_vector,
+            query_filter=query_filter,
             limit=top_k,
             with_payload=True,
             with_vectors=True,
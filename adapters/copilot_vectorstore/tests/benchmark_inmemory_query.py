@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Manual benchmark for InMemoryVectorStore query throughput.
+
+Fills the store with random embeddings and measures insert time, per-query
+latency for query(), and per-query latency when the same queries are sent
+through query_batch().
+
+Usage:
+    python tests/benchmark_inmemory_query.py --vectors 500000 --dimension 384 --queries 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from copilot_vectorstore.inmemory import InMemoryVectorStore
+
+
+def main():
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=500000, help="Number of stored vectors")
+    parser.add_argument("--dimension", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=50, help="Number of query vectors")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Vectors per add_embeddings call")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    store = InMemoryVectorStore()
+
+    start = time.perf_counter()
+    for offset in range(0, args.vectors, args.batch_size):
+        count = min(args.batch_size, args.vectors - offset)
+        vectors = rng.standard_normal((count, args.dimension), dtype=np.float32).tolist()
+        ids = [f"chunk-{offset + i}" for i in range(count)]
+        store.add_embeddings(ids, vectors, [{"chunk_index": offset + i} for i in range(count)])
+    elapsed = time.perf_counter() - start
+    print(f"insert: {args.vectors} x {args.dimension} in {elapsed:.2f}s ({args.vectors / elapsed:,.0f} vectors/s)")
+
+    queries = rng.standard_normal((args.queries, args.dimension), dtype=np.float32).tolist()
+
+    start = time.perf_counter()
+    for query_vector in queries:
+        store.query(query_vector, top_k=args.top_k)
+    elapsed = time.perf_counter() - start
+    print(f"query:       {elapsed / args.queries * 1000:8.2f} ms/query")
+
+    start = time.perf_counter()
+    store.query_batch(queries, top_k=args.top_k)
+    elapsed = time.perf_counter() - start
+    print(f"query_batch: {elapsed / args.queries * 1000:8.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
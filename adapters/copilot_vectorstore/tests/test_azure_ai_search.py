@@ -3,6 +3,7 @@
 
 """Unit tests for AzureAISearchVectorStore implementation."""
 
+import json
 import os
 from unittest.mock import Mock, patch
 
@@ -338,6 +339,106 @@ class TestAzureAISearchVectorStore:
         assert results[0].score == 0.95
         assert results[0].metadata["text"] == "hello"
 
+    @patch("azure.search.documents.SearchClient")
+    @patch("azure.search.documents.indexes.SearchIndexClient")
+    def test_query_with_filter_uses_odata_prefilter(self, mock_index_client_class, mock_search_client_class):
+        """Test that metadata filters are pushed down as an OData pre-filter."""
+        mock_index_client = Mock()
+        mock_search_client = Mock()
+        mock_index_client_class.return_value = mock_index_client
+        mock_search_client_class.return_value = mock_search_client
+        mock_index = Mock()
+        mock_index.fields = [Mock(name="embedding", vector_search_dimensions=3)]
+        mock_index_client.get_index.return_value = mock_index
+        mock_search_client.search.return_value = []
+
+        store = AzureAISearchVectorStore(
+            endpoint="https://test.search.windows.net",
+            api_key="test-key",
+            vector_size=3,
+        )
+        store.query(
+            [1.0, 0.0, 0.0],
+            top_k=5,
+            filter={"thread_id": "o'brien", "archive_id": {"$in": ["a1", "a2"]}, "date": {"$gte": "2024-01-01"}},
+        )
+
+        call_args = mock_search_client.search.call_args[1]
+        assert call_args["filter"] == (
+            "thread_id eq 'o''brien' and (archive_id eq 'a1' or archive_id eq 'a2') and date ge '2024-01-01'"
+        )
+        assert call_args["vector_filter_mode"] == "preFilter"
+
+    @patch("azure.search.documents.SearchClient")
+    @patch("azure.search.documents.indexes.SearchIndexClient")
+    def test_query_with_unfilterable_field_raises_error(self, mock_index_client_class, mock_search_client_class):
+        """Test that filtering on a field without a filterable index field fails."""
+        mock_index_client_class.return_value = Mock()
+        mock_search_client_class.return_value = Mock()
+
+        store = AzureAISearchVectorStore(
+            endpoint="https://test.search.windows.net",
+            api_key="test-key",
+            vector_size=3,
+        )
+
+        with pytest.raises(ValueError, match="cannot filter on metadata field 'subject'"):
+            store.query([1.0, 0.0, 0.0], filter={"subject": "hello"})
+
+    @patch("azure.search.documents.SearchClient")
+    @patch("azure.search.documents.indexes.SearchIndexClient")
+    def test_add_embedding_promotes_filterable_fields(self, mock_index_client_class, mock_search_client_class):
+        """Test that filterable metadata fields are copied to top-level document fields."""
+        mock_index_client = Mock()
+        mock_search_client = Mock()
+        mock_index_client_class.return_value = mock_index_client
+        mock_search_client_class.return_value = mock_search_client
+        mock_index = Mock()
+        mock_index.fields = [Mock(name="embedding", vector_search_dimensions=3)]
+        mock_index_client.get_index.return_value = mock_index
+
+        store = AzureAISearchVectorStore(
+            endpoint="https://test.search.windows.net",
+            api_key="test-key",
+            vector_size=3,
+        )
+        store.add_embedding("doc1", [1.0, 0.0, 0.0], {"thread_id": "t1", "text": "hello"})
+
+        document = mock_search_client.upload_documents.call_args[1]["documents"][0]
+        assert document["thread_id"] == "t1"
+        assert "text" not in document
+
+    @patch("azure.search.documents.SearchClient")
+    @patch("azure.search.documents.indexes.SearchIndexClient")
+    def test_backfill_filterable_fields_merges_promoted_fields(self, mock_index_client_class, mock_search_client_class):
+        """Test that documents indexed without promoted fields are backfilled from their metadata."""
+        mock_index_client = Mock()
+        mock_search_client = Mock()
+        mock_index_client_class.return_value = mock_index_client
+        mock_search_client_class.return_value = mock_search_client
+        mock_index = Mock()
+        mock_index.fields = [Mock(name="embedding", vector_search_dimensions=3)]
+        mock_index_client.get_index.return_value = mock_index
+        mock_search_client.search.side_effect = [
+            [
+                {"id": "doc1", "metadata": json.dumps({"thread_id": "t1", "date": "2024-01-01", "text": "hi"})},
+                {"id": "doc2", "metadata": json.dumps({"text": "nothing to promote"})},
+            ],
+            [{"id": "doc2", "metadata": json.dumps({"text": "nothing to promote"})}],
+        ]
+
+        store = AzureAISearchVectorStore(
+            endpoint="https://test.search.windows.net",
+            api_key="test-key",
+            vector_size=3,
+        )
+
+        assert store.backfill_filterable_fields(batch_size=2) == 1
+        mock_search_client.merge_documents.assert_called_once_with(
+            documents=[{"id": "doc1", "thread_id": "t1", "date": "2024-01-01"}]
+        )
+        assert "thread_id eq null" in mock_search_client.search.call_args[1]["filter"]
+
     @patch("azure.search.documents.SearchClient")
     @patch("azure.search.documents.indexes.SearchIndexClient")
     def test_delete_success(self, mock_index_client_class, mock_search_client_class):
@@ -3,6 +3,7 @@
 
 """Tests for FAISSVectorStore implementation."""
 
+import os
 import random
 
 import pytest
@@ -228,40 +229,274 @@ class TestFAISSVectorStore:
         assert len(results) >= 1  # At least one result
         assert results[0].id == "doc0"  # Should find the exact match
 
-    def test_save_and_load(self):
-        """Test saving and loading FAISS index."""
-        import os
-        import tempfile
+    def test_save_and_load(self, tmp_path):
+        """Test that saving and loading restores vectors, IDs and metadata."""
+        index_path = str(tmp_path / "index.faiss")
+
+        # Create a store and add some data
+        store = FAISSVectorStore(dimension=128, index_type="flat", persist_path=index_path)
+        store.add_embedding("id1", [1.0] * 128, {"key": "value1"})
+        store.add_embedding("id2", [2.0] * 128, {"key": "value2"})
+
+        # Save the index
+        store.save()
+
+        # Verify the index and metadata sidecar were created
+        assert os.path.exists(index_path)
+        assert os.path.exists(index_path + ".meta")
+
+        # A new store with the same persist_path loads the saved data on startup
+        new_store = FAISSVectorStore(dimension=128, index_type="flat", persist_path=index_path)
+
+        assert new_store.count() == 2
+        assert new_store.get("id2").metadata == {"key": "value2"}
+        assert new_store.get("id2").vector == [2.0] * 128
+        results = new_store.query([1.0] * 128, top_k=1)
+        assert results[0].id == "id1"
+        assert results[0].metadata == {"key": "value1"}
+
+    def test_load_then_add_and_save_again(self, tmp_path):
+        """Test that a loaded store keeps working and saves merged contents."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path)
+        store.add_embeddings(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], [{"n": 1}, {"n": 2}])
+        store.save()
+
+        reloaded = FAISSVectorStore(dimension=2, persist_path=index_path)
+        reloaded.delete("a")
+        reloaded.add_embedding("c", [1.0, 1.0], {"n": 3})
+        reloaded.save()
+
+        final = FAISSVectorStore(dimension=2, persist_path=index_path)
+        assert final.count() == 2
+        assert {r.id: r.metadata for r in final.query([0.5, 0.5], top_k=10)} == {"b": {"n": 2}, "c": {"n": 3}}
+        with pytest.raises(ValueError, match="already exists"):
+            final.add_embedding("b", [0.0, 0.0], {})
+        final.add_embedding("d", [0.0, 0.0], {})
+        assert final.get("d").metadata == {}
+
+    def test_load_mismatched_dimension_raises_error(self, tmp_path):
+        """Test that loading an index saved with a different dimension fails."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path)
+        store.add_embedding("a", [1.0, 0.0], {})
+        store.save()
+
+        with pytest.raises(ValueError, match="dimension"):
+            FAISSVectorStore(dimension=3, persist_path=index_path)
+
+    def test_autosave_after_write(self, tmp_path):
+        """Test that writes are saved automatically when the interval has elapsed."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path, save_interval_seconds=0)
+
+        store.add_embedding("a", [1.0, 0.0], {"n": 1})
+
+        reloaded = FAISSVectorStore(dimension=2, persist_path=index_path)
+        assert reloaded.get("a").metadata == {"n": 1}
+
+    def test_flush_saves_pending_writes(self, tmp_path):
+        """Test that flush() saves writes made since the last save, and only then."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path, save_interval_seconds=3600)
+        store.add_embedding("a", [1.0, 0.0], {"n": 1})
+        assert not os.path.exists(index_path)
+
+        store.flush()
+        modified = os.path.getmtime(index_path + ".meta")
+        store.flush()
+
+        assert os.path.getmtime(index_path + ".meta") == modified
+        assert FAISSVectorStore(dimension=2, persist_path=index_path).get("a").metadata == {"n": 1}
+
+    def test_load_rejects_index_and_sidecar_from_different_saves(self, tmp_path):
+        """Test that a crash between the two renames of a save is detected on load."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path)
+        store.add_embedding("a", [1.0, 0.0], {})
+        store.save()
+        with open(index_path + ".meta", "rb") as f:
+            first_sidecar = f.read()
+        store.add_embedding("b", [0.0, 1.0], {})
+        store.save()
+
+        # New index renamed into place, old sidecar still there
+        with open(index_path + ".meta", "wb") as f:
+            f.write(first_sidecar)
+
+        with pytest.raises(ValueError, match="different saves"):
+            FAISSVectorStore(dimension=2, persist_path=index_path)
+
+    def test_delete_removes_vector_from_index(self):
+        """Test that delete removes the vector from the FAISS index itself."""
+        store = FAISSVectorStore(dimension=2)
+        store.add_embeddings(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], [{}, {}])
+
+        store.delete("a")
+
+        assert store._index.ntotal == 1
+        assert [r.id for r in store.query([1.0, 0.0], top_k=10)] == ["b"]
+
+    def test_ivf_trains_once_enough_vectors_arrive(self):
+        """Test that an IVF index is searched exactly until it is trained."""
+        store = FAISSVectorStore(dimension=8, index_type="ivf", nlist=2, nprobe=2, train_size=50)
+        rng = random.Random(0)
+        vectors = [[rng.random() for _ in range(8)] for _ in range(60)]
+
+        store.add_embeddings([f"doc{i}" for i in range(40)], vectors[:40], [{}] * 40)
+        assert store._trained is False
+        assert store.query(vectors[5], top_k=1)[0].id == "doc5"
+
+        store.add_embeddings([f"doc{i}" for i in range(40, 60)], vectors[40:], [{}] * 20)
+        assert store._trained is True
+        assert store.count() == 60
+        assert store.query(vectors[45], top_k=1)[0].id == "doc45"
+        assert store.get("doc7").vector == pytest.approx(vectors[7], abs=1e-6)
+
+        store.delete("doc45")
+        assert store._index.ntotal == 59
+        assert all(r.id != "doc45" for r in store.query(vectors[45], top_k=5))
+
+    def test_trained_ivf_index_persists(self, tmp_path):
+        """Test that a trained IVF index is restored without retraining."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=8, index_type="ivf", nlist=2, train_size=20, persist_path=index_path)
+        rng = random.Random(1)
+        vectors = [[rng.random() for _ in range(8)] for _ in range(30)]
+        store.add_embeddings([f"doc{i}" for i in range(30)], vectors, [{"i": i} for i in range(30)])
+        store.save()
+
+        reloaded = FAISSVectorStore(dimension=8, index_type="ivf", nlist=2, nprobe=2, persist_path=index_path)
+
+        assert reloaded._trained is True
+        assert reloaded.query(vectors[3], top_k=1)[0].metadata == {"i": 3}
+
+    def test_ivfpq_index_type(self):
+        """Test that an IVF-PQ index trains and returns approximate results."""
+        store = FAISSVectorStore(dimension=16, index_type="ivfpq", nlist=2, nprobe=2, pq_m=4)
+        rng = random.Random(2)
+        vectors = [[rng.random() for _ in range(16)] for _ in range(300)]
+
+        store.add_embeddings([f"doc{i}" for i in range(300)], vectors, [{}] * 300)
+
+        assert store._trained is True
+        results = store.query(vectors[0], top_k=5)
+        assert "doc0" in [r.id for r in results]
+
+    def test_ivfpq_requires_divisible_dimension(self):
+        """Test that pq_m must divide the dimension."""
+        with pytest.raises(ValueError, match="pq_m"):
+            FAISSVectorStore(dimension=10, index_type="ivfpq", pq_m=4)
+
+    def test_hnsw_index_type_with_deletes(self):
+        """Test that HNSW filters deleted vectors and rebuilds once most are deleted."""
+        store = FAISSVectorStore(dimension=4, index_type="hnsw", hnsw_m=8)
+        rng = random.Random(3)
+        vectors = [[rng.random() for _ in range(4)] for _ in range(20)]
+        store.add_embeddings([f"doc{i}" for i in range(20)], vectors, [{}] * 20)
+
+        store.delete("doc0")
+        assert all(r.id != "doc0" for r in store.query(vectors[0], top_k=20))
+        assert len(store.query(vectors[0], top_k=20)) == 19
+
+        for i in range(1, 11):
+            store.delete(f"doc{i}")
+        assert store._index.ntotal == store.count() == 9
+        assert store.query(vectors[15], top_k=1)[0].id == "doc15"
+
+    def test_query_batch(self):
+        """Test that query_batch returns one result list per query."""
+        store = FAISSVectorStore(dimension=2)
+        store.add_embeddings(["a", "b"], [[1.0, 0.0], [0.0, 1.0]], [{}, {}])
+
+        results = store.query_batch([[1.0, 0.0], [0.0, 1.0]], top_k=1)
+
+        assert [[r.id for r in row] for row in results] == [["a"], ["b"]]
+
+    @pytest.mark.parametrize(
+        "index_kwargs",
+        [
+            {"index_type": "flat"},
+            {"index_type": "hnsw", "hnsw_m": 8},
+            {"index_type": "ivf", "nlist": 2, "nprobe": 2, "train_size": 20},
+        ],
+    )
+    def test_query_with_filter(self, index_kwargs):
+        """Test that a metadata filter restricts results for each index type."""
+        store = FAISSVectorStore(dimension=4, **index_kwargs)
+        rng = random.Random(4)
+        vectors = [[rng.random() for _ in range(4)] for _ in range(40)]
+        metadatas = [{"thread_id": f"t{i % 4}", "date": f"2024-01-{i + 1:02d}"} for i in range(40)]
+        store.add_embeddings([f"doc{i}" for i in range(40)], vectors, metadatas)
+
+        results = store.query(vectors[0], top_k=20, filter={"thread_id": "t1"})
+        assert sorted(r.id for r in results) == sorted(f"doc{i}" for i in range(1, 40, 4))
+
+        results = store.query(vectors[0], top_k=3, filter={"thread_id": {"$in": ["t0", "t2"]}})
+        assert results[0].id == "doc0"
+        assert len(results) == 3
+
+        results = store.query(vectors[0], top_k=40, filter={"date": {"$gte": "2024-01-05", "$lte": "2024-01-06"}})
+        assert sorted(r.id for r in results) == ["doc4", "doc5"]
+
+        assert store.query(vectors[0], filter={"thread_id": "missing"}) == []
+
+    def test_query_with_filter_after_load(self, tmp_path):
+        """Test that filters use metadata read back from the sidecar."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path)
+        store.add_embeddings(["a", "b"], [[1.0, 0.0], [0.9, 0.1]], [{"thread_id": "t1"}, {"thread_id": "t2"}])
+        store.save()
+
+        reloaded = FAISSVectorStore(dimension=2, persist_path=index_path)
+
+        assert [r.id for r in reloaded.query([1.0, 0.0], filter={"thread_id": "t2"})] == ["b"]
+
+    def test_filtered_queries_use_inverted_index(self, tmp_path, monkeypatch):
+        """Test that filtered queries do not decode sidecar metadata once the index is built."""
+        index_path = str(tmp_path / "index.faiss")
+        store = FAISSVectorStore(dimension=2, persist_path=index_path)
+        store.add_embeddings(
+            ["a", "b", "c"],
+            [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+            [{"thread_id": "t1"}, {"thread_id": "t2"}, {"thread_id": "t2"}],
+        )
+        store.save()
+        reloaded = FAISSVectorStore(dimension=2, persist_path=index_path)
+        reloaded.query([1.0, 0.0], filter={"thread_id": "t1"})
 
-        # Create a temporary file for the index
-        with tempfile.NamedTemporaryFile(suffix=".faiss", delete=False) as tmp:
-            tmp_path = tmp.name
+        decoded = []
+        original_metadata = type(reloaded._sidecar).metadata
 
-        try:
-            # Create a store and add some data
-            store = FAISSVectorStore(dimension=128, index_type="flat", persist_path=tmp_path)
-            store.add_embedding("id1", [1.0] * 128, {"key": "value1"})
-            store.add_embedding("id2", [2.0] * 128, {"key": "value2"})
+        def counting_metadata(sidecar, row):
+            decoded.append(row)
+            return original_metadata(sidecar, row)
 
-            # Save the index
-            store.save()
+        monkeypatch.setattr(type(reloaded._sidecar), "metadata", counting_metadata)
 
-            # Verify file was created
-            assert os.path.exists(tmp_path)
+        results = reloaded.query([0.0, 1.0], top_k=1, filter={"thread_id": "t2"})
+
+        assert [r.id for r in results] == ["c"]
+        # Only the returned result's metadata is decoded
+        assert len(decoded) == 1
+
+    def test_filter_index_tracks_adds_and_deletes(self):
+        """Test that the inverted index follows writes made after it was built."""
+        store = FAISSVectorStore(dimension=2)
+        store.add_embeddings(["a", "b"], [[1.0, 0.0], [0.9, 0.1]], [{"thread_id": "t1"}, {"thread_id": "t1"}])
+        assert len(store.query([1.0, 0.0], filter={"thread_id": "t1"})) == 2
 
-            # Create a new store and load the index
-            new_store = FAISSVectorStore(dimension=128, index_type="flat", persist_path=tmp_path)
-            new_store.load()
+        store.delete("a")
+        store.add_embedding("c", [0.8, 0.2], {"thread_id": "t1", "kind": "reply"})
 
-            # The index should be loaded, but metadata is not persisted
-            # So count should show the FAISS index size, but queries won't work
-            # without metadata
-            assert new_store._index.ntotal == 2
+        assert sorted(r.id for r in store.query([1.0, 0.0], filter={"thread_id": "t1"})) == ["b", "c"]
+        # Fields outside the inverted index are checked against stored metadata
+        assert [r.id for r in store.query([1.0, 0.0], filter={"thread_id": "t1", "kind": "reply"})] == ["c"]
 
-        finally:
-            # Clean up
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+    def test_train_size_below_nlist_raises_error(self):
+        """Test that an IVF train_size smaller than nlist is rejected."""
+        with pytest.raises(ValueError, match="train_size"):
+            FAISSVectorStore(dimension=4, index_type="ivf", nlist=10, train_size=5)
 
     def test_save_without_path_raises_error(self):
         """Test that save without path raises ValueError."""
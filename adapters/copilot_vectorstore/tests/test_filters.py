@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Tests for metadata filter parsing and matching."""
+
+import pytest
+from copilot_vectorstore.filters import matches_filter, parse_filter
+
+
+class TestParseFilter:
+    """Tests for parse_filter."""
+
+    def test_empty_filter(self):
+        """Test that None and empty filters produce no conditions."""
+        assert parse_filter(None) == []
+        assert parse_filter({}) == []
+
+    def test_equality_and_operators(self):
+        """Test that plain values become equality conditions and operators are flattened."""
+        conditions = parse_filter({"thread_id": "t1", "date": {"$gte": "2024-01-01", "$lt": "2024-02-01"}})
+
+        assert conditions == [
+            ("thread_id", "$eq", "t1"),
+            ("date", "$gte", "2024-01-01"),
+            ("date", "$lt", "2024-02-01"),
+        ]
+
+    def test_date_only_upper_bounds_cover_the_whole_day(self):
+        """Test that date-only $lte/$gt bounds are rewritten to the following day."""
+        conditions = parse_filter({"date": {"$lte": "2024-01-31", "$gt": "2024-02-29"}})
+
+        assert conditions == [("date", "$lt", "2024-02-01"), ("date", "$gte", "2024-03-01")]
+        # Datetime bounds and non-date strings are left alone
+        assert parse_filter({"date": {"$lte": "2024-01-31T12:00:00Z"}}) == [("date", "$lte", "2024-01-31T12:00:00Z")]
+        assert parse_filter({"thread_id": {"$gt": "2024-13-01"}}) == [("thread_id", "$gt", "2024-13-01")]
+
+    def test_unsupported_operator_raises_error(self):
+        """Test that unknown operators are rejected."""
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            parse_filter({"thread_id": {"$regex": "t.*"}})
+
+    def test_in_requires_list(self):
+        """Test that $in requires a list of values."""
+        with pytest.raises(ValueError, match="must be a list"):
+            parse_filter({"thread_id": {"$in": "t1"}})
+
+
+class TestMatchesFilter:
+    """Tests for matches_filter."""
+
+    metadata = {"thread_id": "t1", "archive_id": "a1", "date": "2024-01-15T10:00:00Z", "chunk_index": 3}
+
+    @pytest.mark.parametrize(
+        "filter,expected",
+        [
+            ({"thread_id": "t1"}, True),
+            ({"thread_id": "t2"}, False),
+            ({"archive_id": {"$in": ["a0", "a1"]}}, True),
+            ({"archive_id": {"$in": []}}, False),
+            ({"date": {"$gte": "2024-01-01", "$lte": "2024-01-31"}}, True),
+            ({"date": {"$gt": "2024-01-16"}}, False),
+            ({"date": {"$lte": "2024-01-15"}}, True),
+            ({"date": {"$lt": "2024-01-15"}}, False),
+            ({"date": {"$gte": "2024-01-15"}}, True),
+            ({"date": {"$gt": "2024-01-15"}}, False),
+            ({"date": {"$lt": "2024-01-15T12:00:00+01:00"}}, True),
+            ({"date": {"$gt": "2024-01-15T10:00:00.000001Z"}}, False),
+            ({"chunk_index": {"$lt": 3}}, False),
+            ({"thread_id": "t1", "archive_id": "a2"}, False),
+            ({"source": "ietf"}, False),
+            ({"chunk_index": {"$gte": "2024"}}, False),
+        ],
+    )
+    def test_matches(self, filter, expected):
+        """Test equality, membership, range, missing-field and type-mismatch conditions."""
+        assert matches_filter(self.metadata, parse_filter(filter)) is expected
@@ -190,3 +190,176 @@ class TestInMemoryVectorStore:
         assert results[0].id == "doc1"
         assert abs(results[0].score - 1.0) < 0.001  # Should be very close to 1.0
         assert results[1].score < 0.1  # Orthogonal vectors should have low similarity
+
+    def test_add_embedding_dimension_mismatch_raises_error(self):
+        """Test that adding a vector of a different dimension fails."""
+        store = InMemoryVectorStore()
+        store.add_embedding("doc1", [1.0, 0.0], {})
+
+        with pytest.raises(ValueError, match="dimension"):
+            store.add_embedding("doc2", [1.0, 0.0, 0.0], {})
+        assert store.count() == 1
+
+    def test_add_embeddings_duplicate_within_batch_raises_error(self):
+        """Test that duplicate IDs inside one batch are rejected before adding any."""
+        store = InMemoryVectorStore()
+
+        with pytest.raises(ValueError, match="already exists"):
+            store.add_embeddings(ids=["doc1", "doc1"], vectors=[[1.0, 0.0], [0.0, 1.0]], metadatas=[{}, {}])
+        assert store.count() == 0
+
+    def test_query_ties_keep_insertion_order(self):
+        """Test that equal scores are returned in insertion order."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3"], vectors=[[1.0, 0.0], [2.0, 0.0], [0.0, 1.0]], metadatas=[{}, {}, {}]
+        )
+
+        results = store.query([1.0, 0.0], top_k=3)
+
+        assert [r.id for r in results] == ["doc1", "doc2", "doc3"]
+
+    def test_query_returns_original_vectors(self):
+        """Test that results carry the stored vector, not its normalized form."""
+        store = InMemoryVectorStore()
+        store.add_embedding("doc1", [3.0, 4.0], {})
+
+        result = store.query([1.0, 0.0], top_k=1)[0]
+
+        assert result.vector == pytest.approx([3.0, 4.0])
+        assert result.score == pytest.approx(0.6, abs=1e-4)
+
+    def test_growth_beyond_initial_capacity(self):
+        """Test that the store keeps all vectors when the backing matrix grows."""
+        store = InMemoryVectorStore()
+        for i in range(3000):
+            store.add_embedding(f"doc{i}", [float(i), 1.0], {"i": i})
+
+        assert store.count() == 3000
+        assert store.get("doc2999").metadata == {"i": 2999}
+        assert store.get("doc0").vector == pytest.approx([0.0, 1.0])
+
+    def test_deleted_vectors_are_not_returned(self):
+        """Test that deleted rows never appear in query results."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3", "doc4"],
+            vectors=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [0.1, 0.9]],
+            metadatas=[{}, {}, {}, {}],
+        )
+
+        store.delete("doc1")
+        results = store.query([1.0, 0.0], top_k=10)
+
+        assert [r.id for r in results] == ["doc2", "doc4", "doc3"]
+
+    def test_delete_compacts_and_allows_re_adding(self):
+        """Test that compaction after many deletes keeps the remaining data intact."""
+        store = InMemoryVectorStore()
+        ids = [f"doc{i}" for i in range(10)]
+        store.add_embeddings(
+            ids=ids, vectors=[[float(i), 1.0] for i in range(10)], metadatas=[{"i": i} for i in range(10)]
+        )
+
+        for i in range(8):
+            store.delete(f"doc{i}")
+        store.add_embedding("doc0", [1.0, 0.0], {"i": "new"})
+
+        assert store.count() == 3
+        assert store.get("doc9").metadata == {"i": 9}
+        assert store.get("doc9").vector == pytest.approx([9.0, 1.0])
+        assert store.query([1.0, 0.0], top_k=1)[0].id == "doc0"
+
+    def test_clear_allows_new_dimension(self):
+        """Test that clearing the store resets its vector dimension."""
+        store = InMemoryVectorStore()
+        store.add_embedding("doc1", [1.0, 0.0], {})
+
+        store.clear()
+        store.add_embedding("doc1", [1.0, 0.0, 0.0], {})
+
+        assert store.get("doc1").vector == [1.0, 0.0, 0.0]
+
+    def test_query_batch_matches_query(self):
+        """Test that batch queries return the same results as individual queries."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3"],
+            vectors=[[1.0, 0.0, 0.0], [0.7, 0.7, 0.0], [0.0, 0.0, 1.0]],
+            metadatas=[{"n": 1}, {"n": 2}, {"n": 3}],
+        )
+        queries = [[1.0, 0.0, 0.0], [0.0, 0.1, 1.0]]
+
+        batch = store.query_batch(queries, top_k=2)
+
+        assert len(batch) == 2
+        for query_vector, results in zip(queries, batch):
+            expected = store.query(query_vector, top_k=2)
+            assert [r.id for r in results] == [r.id for r in expected]
+            assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+    def test_query_batch_empty_store(self):
+        """Test that batch queries against an empty store return empty lists."""
+        store = InMemoryVectorStore()
+
+        assert store.query_batch([[1.0, 0.0], [0.0, 1.0]]) == [[], []]
+        assert store.query_batch([]) == []
+
+    def test_query_batch_dimension_mismatch_raises_error(self):
+        """Test that a batch containing a mismatched query vector fails."""
+        store = InMemoryVectorStore()
+        store.add_embedding("doc1", [1.0, 0.0], {})
+
+        with pytest.raises(ValueError, match="dimension"):
+            store.query_batch([[1.0, 0.0], [1.0, 0.0, 0.0]])
+
+    def test_query_with_filter(self):
+        """Test that a metadata filter restricts results to matching embeddings."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3", "doc4"],
+            vectors=[[1.0, 0.0], [0.9, 0.1], [0.5, 0.5], [0.0, 1.0]],
+            metadatas=[
+                {"thread_id": "t1", "date": "2024-01-01"},
+                {"thread_id": "t2", "date": "2024-02-01"},
+                {"thread_id": "t1", "date": "2024-03-01"},
+                {"thread_id": "t2", "date": "2024-04-01"},
+            ],
+        )
+
+        results = store.query([1.0, 0.0], top_k=10, filter={"thread_id": "t2"})
+        assert [r.id for r in results] == ["doc2", "doc4"]
+
+        results = store.query([1.0, 0.0], top_k=1, filter={"thread_id": {"$in": ["t1"]}})
+        assert [r.id for r in results] == ["doc1"]
+
+        results = store.query([1.0, 0.0], top_k=10, filter={"date": {"$gte": "2024-02-01", "$lt": "2024-04-01"}})
+        assert [r.id for r in results] == ["doc2", "doc3"]
+
+        assert store.query([1.0, 0.0], filter={"thread_id": "missing"}) == []
+
+    def test_query_with_filter_skips_deleted(self):
+        """Test that filtered queries never return deleted embeddings."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3"],
+            vectors=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+            metadatas=[{"thread_id": "t1"}, {"thread_id": "t1"}, {"thread_id": "t2"}],
+        )
+
+        store.delete("doc1")
+
+        assert [r.id for r in store.query([1.0, 0.0], filter={"thread_id": "t1"})] == ["doc2"]
+
+    def test_query_batch_with_filter(self):
+        """Test that the filter applies to every query in a batch."""
+        store = InMemoryVectorStore()
+        store.add_embeddings(
+            ids=["doc1", "doc2", "doc3"],
+            vectors=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+            metadatas=[{"thread_id": "t1"}, {"thread_id": "t1"}, {"thread_id": "t2"}],
+        )
+
+        results = store.query_batch([[1.0, 0.0], [0.0, 1.0]], top_k=1, filter={"thread_id": "t1"})
+
+        assert [[r.id for r in row] for row in results] == [["doc1"], ["doc2"]]
@@ -182,6 +182,81 @@ class TestQdrantVectorStore:
         assert results[0].score == 0.95
         assert results[0].metadata == {"text": "hello"}
 
+    @patch("qdrant_client.QdrantClient")
+    def test_query_with_filter_builds_payload_filter(self, mock_client_class):
+        """Test that metadata filters are pushed down as a Qdrant payload filter."""
+        from qdrant_client import models
+
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_collections.return_value = Mock(collections=[])
+        mock_client.query_points.return_value = Mock(points=[])
+
+        store = QdrantVectorStore(vector_size=3)
+        store.query(
+            [1.0, 0.0, 0.0],
+            top_k=5,
+            filter={
+                "thread_id": "t1",
+                "archive_id": {"$in": ["a1", "a2"]},
+                "date": {"$gte": "2024-01-01T00:00:00Z", "$lt": "2024-02-01T00:00:00Z"},
+                "chunk_index": {"$gte": 2},
+            },
+        )
+
+        query_filter = mock_client.query_points.call_args[1]["query_filter"]
+        assert isinstance(query_filter, models.Filter)
+        conditions = {condition.key: condition for condition in query_filter.must}
+        assert conditions["thread_id"].match == models.MatchValue(value="t1")
+        assert conditions["archive_id"].match == models.MatchAny(any=["a1", "a2"])
+        assert isinstance(conditions["date"].range, models.DatetimeRange)
+        assert conditions["chunk_index"].range == models.Range(gte=2)
+
+    @patch("qdrant_client.QdrantClient")
+    def test_query_with_widened_date_bound_keeps_both_bounds(self, mock_client_class):
+        """Test that a widened date-only bound does not overwrite another bound on the field."""
+        from qdrant_client import models
+
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_collections.return_value = Mock(collections=[])
+        mock_client.query_points.return_value = Mock(points=[])
+
+        store = QdrantVectorStore(vector_size=3)
+        store.query([1.0, 0.0, 0.0], filter={"date": {"$lt": "2024-01-20", "$lte": "2024-01-31"}})
+
+        query_filter = mock_client.query_points.call_args[1]["query_filter"]
+        ranges = [condition.range for condition in query_filter.must]
+        assert len(ranges) == 2
+        assert all(isinstance(r, models.DatetimeRange) for r in ranges)
+
+    @patch("qdrant_client.QdrantClient")
+    def test_query_without_filter_passes_none(self, mock_client_class):
+        """Test that unfiltered queries send no payload filter."""
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_collections.return_value = Mock(collections=[])
+        mock_client.query_points.return_value = Mock(points=[])
+
+        store = QdrantVectorStore(vector_size=3)
+        store.query([1.0, 0.0, 0.0], top_k=5)
+
+        assert mock_client.query_points.call_args[1]["query_filter"] is None
+
+    @patch("qdrant_client.QdrantClient")
+    def test_collection_creation_indexes_filterable_fields(self, mock_client_class):
+        """Test that payload indexes are created for the filterable metadata fields."""
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_collections.return_value = Mock(collections=[])
+        mock_client.query_points.return_value = Mock(points=[])
+
+        store = QdrantVectorStore(vector_size=3)
+        store.query([1.0, 0.0, 0.0])
+
+        indexed = {call[1]["field_name"] for call in mock_client.create_payload_index.call_args_list}
+        assert {"thread_id", "archive_id", "date"} <= indexed
+
     @patch("qdrant_client.QdrantClient")
     def test_delete_nonexistent_raises_error(self, mock_client_class):
         """Test that deleting nonexistent ID raises KeyError."""
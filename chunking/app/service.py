@@ -20,6 +20,7 @@ from copilot_event_retry import (
     RetryConfig,
     handle_event_with_retry,
 )
+from copilot_event_retry.event_handler import RetryExhaustedError
 from copilot_logging import get_logger
 from copilot_message_bus import (
     ChunkingFailedEvent,
@@ -31,7 +32,7 @@ from copilot_message_bus import (
     SourceDeletionRequestedEvent,
 )
 from copilot_metrics import MetricsCollector
-from copilot_storage import DocumentStore, DocumentStoreError
+from copilot_storage import DocumentAlreadyExistsError, DocumentStore, DocumentStoreError
 
 logger = get_logger(__name__)
 
@@ -48,6 +49,8 @@ class ChunkingService:
         metrics_collector: MetricsCollector | None = None,
         error_reporter: ErrorReporter | None = None,
         retry_config: RetryConfig | None = None,
+        event_batch_size: int = 1,
+        event_batch_max_wait_ms: int = 250,
     ):
         """Initialize chunking service.
 
@@ -59,6 +62,8 @@ class ChunkingService:
             metrics_collector: Metrics collector (optional)
             error_reporter: Error reporter (optional)
             retry_config: Retry configuration for race condition handling (optional)
+            event_batch_size: JSONParsed events merged into one chunking pass (1 disables batching)
+            event_batch_max_wait_ms: Maximum time an event waits for its batch to fill
         """
         self.document_store = document_store
         self.publisher = publisher
@@ -67,6 +72,8 @@ class ChunkingService:
         self.metrics_collector = metrics_collector
         self.error_reporter = error_reporter
         self.retry_config = retry_config or RetryConfig()
+        self.event_batch_size = event_batch_size
+        self.event_batch_max_wait_ms = event_batch_max_wait_ms
 
         # Stats
         self.messages_processed = 0
@@ -86,12 +93,24 @@ class ChunkingService:
             self._requeue_incomplete_messages()
 
         # Subscribe to JSONParsed events
-        self.subscriber.subscribe(
-            event_type="JSONParsed",
-            exchange="copilot.events",
-            routing_key="json.parsed",
-            callback=self._handle_json_parsed,
-        )
+        if self.event_batch_size > 1:
+            # Parsing publishes one event per batch of messages; merge them so each
+            # chunking pass (and the ChunksPrepared event it emits) covers more messages
+            self.subscriber.subscribe_batch(
+                event_type="JSONParsed",
+                batch_callback=self._handle_json_parsed_batch,
+                max_batch_size=self.event_batch_size,
+                max_wait_ms=self.event_batch_max_wait_ms,
+                exchange="copilot.events",
+                routing_key="json.parsed",
+            )
+        else:
+            self.subscriber.subscribe(
+                event_type="JSONParsed",
+                exchange="copilot.events",
+                routing_key="json.parsed",
+                callback=self._handle_json_parsed,
+            )
 
         # Subscribe to SourceDeletionRequested events for cascade cleanup
         self.subscriber.subscribe(
@@ -267,6 +286,65 @@ class ChunkingService:
                 self.error_reporter.report(e, context={"event": event})
             raise  # Re-raise to trigger message requeue for transient failures
 
+    def _handle_json_parsed_batch(self, events: list[dict[str, Any]]):
+        """Handle a micro-batch of JSONParsed events as one chunking pass.
+
+        The message_doc_ids of the events are merged, so the batch costs one
+        message query, one chunk insert and one ChunksPrepared event. A failure
+        of the merged pass is re-raised so that every event of the batch is
+        requeued.
+
+        Events carrying retry headers or malformed data are handled on their
+        own once the merged pass has succeeded, and settled on their own: a
+        failed event is republished for redelivery (or dropped when it can
+        never succeed) instead of failing the batch, so the merged events are
+        not requeued and chunked again.
+
+        Args:
+            events: JSONParsed events in delivery order
+        """
+        mergeable = []
+        individual = []
+        for event in events:
+            data = event.get("data") or {}
+            if event.get("headers") or not isinstance(data.get("message_doc_ids"), list):
+                individual.append(event)
+            else:
+                mergeable.append(event)
+
+        if len(mergeable) == 1:
+            self._handle_json_parsed(mergeable[0])
+        elif mergeable:
+            message_doc_ids = list(
+                dict.fromkeys(doc_id for event in mergeable for doc_id in event["data"]["message_doc_ids"])
+            )
+            logger.info(f"Merged {len(mergeable)} JSONParsed events covering {len(message_doc_ids)} messages")
+            self._handle_json_parsed({"event_type": "JSONParsed", "data": {"message_doc_ids": message_doc_ids}})
+
+        for event in individual:
+            self._handle_batched_event_alone(event)
+
+    def _handle_batched_event_alone(self, event: dict[str, Any]):
+        """Handle a JSONParsed event of a batch without letting it fail the batch.
+
+        Exhausted retries and malformed data cannot succeed on redelivery, so
+        such events are dropped (both are already logged and reported). Any
+        other failure republishes the event so that it alone is redelivered.
+
+        Args:
+            event: JSONParsed event that was not merged
+
+        Raises:
+            Exception: If the failed event cannot be republished
+        """
+        try:
+            self._handle_json_parsed(event)
+        except (RetryExhaustedError, ValueError, TypeError) as e:
+            logger.error(f"Dropping JSONParsed event that cannot be processed: {e}")
+        except Exception as e:
+            logger.warning(f"Republishing failed JSONParsed event for redelivery: {e}")
+            self.publisher.publish(exchange="copilot.events", routing_key="json.parsed", event=event)
+
     def process_messages(self, event_data: dict[str, Any]):
         """Process messages and create chunks.
 
@@ -359,23 +437,26 @@ class ChunkingService:
 
                     return False
 
-                for chunk in all_chunks:
-                    try:
-                        self.document_store.insert_document("chunks", chunk)
+                result = self.document_store.insert_documents("chunks", all_chunks)
+
+                for index, chunk in enumerate(all_chunks):
+                    error = result.errors.get(index)
+                    if error is None:
                         chunk_ids.append(chunk["_id"])
                         new_chunks_created += 1
-                    except Exception as e:
-                        # Chunk already exists (idempotent retry).
-                        # Do not depend on pymongo at import-time; detect duplicates by name/message.
-                        if _is_duplicate_key_error(e):
-                            logger.debug(f"Chunk {chunk.get('_id', 'unknown')} already exists, skipping")
-                            chunk_ids.append(chunk.get("_id", "unknown"))  # Still include in output
-                            skipped_duplicates += 1
-                            continue
-
-                        # Other errors (transient) should fail the processing
-                        logger.error(f"Error storing chunk {chunk.get('_id')}: {e}")
-                        raise
+                        continue
+
+                    # Chunk already exists (idempotent retry).
+                    # Do not depend on pymongo at import-time; detect duplicates by name/message.
+                    if isinstance(error, DocumentAlreadyExistsError) or _is_duplicate_key_error(error):
+                        logger.debug(f"Chunk {chunk.get('_id', 'unknown')} already exists, skipping")
+                        chunk_ids.append(chunk.get("_id", "unknown"))  # Still include in output
+                        skipped_duplicates += 1
+                        continue
+
+                    # Other errors (transient) should fail the processing
+                    logger.error(f"Error storing chunk {chunk.get('_id')}: {error}")
+                    raise error
 
                 if skipped_duplicates > 0:
                     logger.info(
@@ -640,18 +721,24 @@ class ChunkingService:
             # Delete chunks for the source
             try:
                 # Try querying by source first
-                chunks = self.document_store.query_documents(
-                    "chunks",
-                    {"source": source_name}
-                ) or []
+                chunks = list(
+                    self.document_store.iter_documents(
+                        "chunks",
+                        {"source": source_name},
+                        projection={"_id": 1},
+                    )
+                )
 
                 # If no chunks found by source and we have archive_ids, try by archive_id
                 if not chunks and archive_ids:
                     for archive_id in archive_ids:
-                        archive_chunks = self.document_store.query_documents(
-                            "chunks",
-                            {"archive_id": archive_id}
-                        ) or []
+                        archive_chunks = list(
+                            self.document_store.iter_documents(
+                                "chunks",
+                                {"archive_id": archive_id},
+                                projection={"_id": 1},
+                            )
+                        )
                         chunks.extend(archive_chunks)
 
                 for chunk in chunks:
@@ -289,6 +289,16 @@ def main():
             metrics_collector=metrics_collector,
             error_reporter=error_reporter,
             retry_config=retry_config,
+            event_batch_size=(
+                config.service_settings.event_batch_size
+                if config.service_settings.event_batch_size is not None
+                else 16
+            ),
+            event_batch_max_wait_ms=(
+                config.service_settings.event_batch_max_wait_ms
+                if config.service_settings.event_batch_max_wait_ms is not None
+                else 250
+            ),
         )
 
         # Start subscriber in a separate thread (non-daemon to fail fast)
@@ -14,6 +14,7 @@ from copilot_config.generated.adapters.chunker import (
     AdapterConfig_Chunker,
     DriverConfig_Chunker_TokenWindow,
 )
+from copilot_storage import BulkWriteResult
 
 # Add project root to path to import test fixtures
 # NOTE: This is necessary because tests run from individual service directories
@@ -47,11 +48,16 @@ except ModuleNotFoundError:
 from .test_helpers import assert_valid_document_schema, assert_valid_event_schema  # noqa: E402
 
 
+def _insert_all(collection, documents):
+    """Bulk insert side effect that stores every document successfully."""
+    return BulkWriteResult(succeeded=[doc["_id"] for doc in documents])
+
+
 @pytest.fixture
 def mock_document_store():
     """Create a mock document store."""
     store = Mock()
-    store.insert_document = Mock(return_value="chunk_123")
+    store.insert_documents = Mock(side_effect=_insert_all)
     store.query_documents = Mock(return_value=[])
     return store
 
@@ -134,6 +140,88 @@ def test_service_start(chunking_service, mock_subscriber):
     )
 
 
+def test_service_start_with_event_batching(chunking_service, mock_subscriber):
+    """Test that JSONParsed uses a batched subscription when event batching is enabled."""
+    chunking_service.event_batch_size = 8
+    chunking_service.event_batch_max_wait_ms = 100
+
+    chunking_service.start(enable_startup_requeue=False)
+
+    mock_subscriber.subscribe_batch.assert_called_once_with(
+        event_type="JSONParsed",
+        batch_callback=chunking_service._handle_json_parsed_batch,
+        max_batch_size=8,
+        max_wait_ms=100,
+        exchange="copilot.events",
+        routing_key="json.parsed",
+    )
+    assert mock_subscriber.subscribe.call_count == 1
+
+
+def test_handle_json_parsed_batch_merges_message_doc_ids(chunking_service):
+    """Test that a batch of JSONParsed events is chunked in one pass over the merged messages."""
+    chunking_service._handle_json_parsed = Mock()
+    retried = {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m9"]}, "headers": {"retry_attempt": 2}}
+
+    chunking_service._handle_json_parsed_batch(
+        [
+            {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m1", "m2"]}},
+            retried,
+            {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m2", "m3"]}},
+        ]
+    )
+
+    assert chunking_service._handle_json_parsed.call_count == 2
+    merged = chunking_service._handle_json_parsed.call_args_list[0].args[0]
+    assert merged["data"]["message_doc_ids"] == ["m1", "m2", "m3"]
+    assert chunking_service._handle_json_parsed.call_args_list[1].args[0] is retried
+
+
+def test_handle_json_parsed_batch_propagates_errors(chunking_service):
+    """Test that a failure in the merged pass is re-raised so the whole batch is requeued."""
+    chunking_service._handle_json_parsed = Mock(side_effect=RuntimeError("database unavailable"))
+
+    with pytest.raises(RuntimeError):
+        chunking_service._handle_json_parsed_batch(
+            [
+                {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m1"]}},
+                {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m2"]}},
+            ]
+        )
+
+
+def test_handle_json_parsed_batch_failed_retry_event_does_not_fail_batch(chunking_service, mock_publisher):
+    """Test that a failing individually handled event is republished alone instead of failing the batch."""
+    retried = {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m9"]}, "headers": {"retry_attempt": 2}}
+
+    def handle(event):
+        if event is retried:
+            raise RuntimeError("database unavailable")
+
+    chunking_service._handle_json_parsed = Mock(side_effect=handle)
+
+    chunking_service._handle_json_parsed_batch(
+        [
+            {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m1"]}},
+            retried,
+            {"event_type": "JSONParsed", "data": {"message_doc_ids": ["m2"]}},
+        ]
+    )
+
+    assert chunking_service._handle_json_parsed.call_count == 2
+    mock_publisher.publish.assert_called_once_with(exchange="copilot.events", routing_key="json.parsed", event=retried)
+
+
+def test_handle_json_parsed_batch_drops_malformed_event(chunking_service, mock_publisher):
+    """Test that a malformed event of a batch is dropped rather than republished."""
+    malformed = {"event_type": "JSONParsed", "data": {"message_doc_ids": "m1"}}
+    chunking_service._handle_json_parsed = Mock(side_effect=TypeError("message_doc_ids must be a list"))
+
+    chunking_service._handle_json_parsed_batch([malformed])
+
+    mock_publisher.publish.assert_not_called()
+
+
 def test_chunk_message_success(chunking_service, mock_document_store):
     """Test chunking a message successfully."""
     # Use schema-compliant message data
@@ -399,8 +487,9 @@ def test_process_messages_success(chunking_service, mock_document_store, mock_pu
     # Verify messages were queried
     mock_document_store.query_documents.assert_called_once()
 
-    # Verify chunks were stored
-    assert mock_document_store.insert_document.call_count > 0
+    # Verify chunks were stored with a single bulk insert
+    mock_document_store.insert_documents.assert_called_once()
+    assert mock_document_store.insert_documents.call_args[0][0] == "chunks"
 
     # Verify ChunksPrepared event was published
     mock_publisher.publish.assert_called_once()
@@ -515,7 +604,7 @@ def test_publish_chunking_failed(chunking_service, mock_publisher):
 def test_schema_validation_chunks_prepared():
     """Test that ChunksPrepared events validate against schema."""
     mock_store = Mock()
-    mock_store.insert_document = Mock(return_value="chunk_123")
+    mock_store.insert_documents = Mock(side_effect=_insert_all)
     mock_publisher = Mock()
     mock_subscriber = Mock()
     mock_chunker = create_chunker(
@@ -587,7 +676,7 @@ def test_schema_validation_chunking_failed():
 def test_consume_json_parsed_event():
     """Test consuming a JSONParsed event."""
     mock_store = Mock()
-    mock_store.insert_document = Mock(return_value="chunk_123")
+    mock_store.insert_documents = Mock(side_effect=_insert_all)
     mock_store.query_documents = Mock(return_value=[])
 
     # Simulate receiving a JSONParsed event
@@ -815,16 +904,14 @@ def test_idempotent_chunk_insertion(chunking_service, mock_document_store, mock_
 
     mock_document_store.query_documents.return_value = messages
 
-    # First insert succeeds, second raises DuplicateKeyError
-    insert_count = [0]
-
-    def insert_side_effect(collection, document):
-        insert_count[0] += 1
-        if insert_count[0] == 2:
-            raise DuplicateKeyError("E11000 duplicate key error")
-        return f"chunk_{insert_count[0]}"
+    # The last chunk already exists and is reported as a DuplicateKeyError
+    def insert_side_effect(collection, documents):
+        return BulkWriteResult(
+            succeeded=[doc["_id"] for doc in documents[:-1]],
+            errors={len(documents) - 1: DuplicateKeyError("E11000 duplicate key error")},
+        )
 
-    mock_document_store.insert_document.side_effect = insert_side_effect
+    mock_document_store.insert_documents.side_effect = insert_side_effect
 
     event_data = {
         "archive_id": "a1b2c3d4e5f67890",
@@ -865,19 +952,19 @@ def test_idempotent_chunk_insertion_cosmosdb(chunking_service, mock_document_sto
 
     mock_document_store.query_documents.return_value = messages
 
-    # First insert succeeds, second raises CosmosDB-style DocumentStoreError
-    insert_count = [0]
-
-    def insert_side_effect(collection, document):
-        insert_count[0] += 1
-        if insert_count[0] == 2:
-            # Simulate the CosmosDB error from azure_cosmos_document_store.py
-            raise DocumentStoreError(
-                f"Document with id {document.get('_id', 'unknown')} already exists in collection {collection}"
-            )
-        return f"chunk_{insert_count[0]}"
+    # The last chunk already exists and is reported as a CosmosDB-style DocumentStoreError
+    def insert_side_effect(collection, documents):
+        # Simulate the CosmosDB error from azure_cosmos_document_store.py
+        return BulkWriteResult(
+            succeeded=[doc["_id"] for doc in documents[:-1]],
+            errors={
+                len(documents) - 1: DocumentStoreError(
+                    f"Document with id {documents[-1].get('_id', 'unknown')} already exists in collection {collection}"
+                )
+            },
+        )
 
-    mock_document_store.insert_document.side_effect = insert_side_effect
+    mock_document_store.insert_documents.side_effect = insert_side_effect
 
     event_data = {
         "archive_id": "a1b2c3d4e5f67890",
@@ -919,10 +1006,10 @@ def test_non_duplicate_errors_trigger_failure_event(chunking_service, mock_docum
     mock_document_store.query_documents.return_value = messages
 
     # Simulate a non-duplicate error
-    def insert_side_effect(collection, document):
-        raise DocumentStoreError("Connection timeout while writing to collection")
+    def insert_side_effect(collection, documents):
+        return BulkWriteResult(errors={0: DocumentStoreError("Connection timeout while writing to collection")})
 
-    mock_document_store.insert_document.side_effect = insert_side_effect
+    mock_document_store.insert_documents.side_effect = insert_side_effect
 
     event_data = {
         "archive_id": "a1b2c3d4e5f67890",
@@ -941,7 +1028,7 @@ def test_non_duplicate_errors_trigger_failure_event(chunking_service, mock_docum
 def test_metrics_collector_uses_observe_for_histograms():
     """Test that metrics collector uses observe() method for duration and size metrics."""
     mock_store = Mock()
-    mock_store.insert_document = Mock(return_value="chunk_123")
+    mock_store.insert_documents = Mock(side_effect=_insert_all)
     mock_store.query_documents = Mock(
         return_value=[
             {
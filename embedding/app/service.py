@@ -11,6 +11,7 @@ from typing import Any
 from copilot_embedding import EmbeddingProvider
 from copilot_error_reporting import ErrorReporter
 from copilot_event_retry import (
+    DelayedRedelivery,
     DocumentNotFoundError,
     RetryConfig,
     handle_event_with_retry,
@@ -52,6 +53,8 @@ class EmbeddingService:
         retry_backoff_seconds: int = 5,
         vector_store_collection: str = "message_embeddings",
         event_retry_config: RetryConfig | None = None,
+        event_batch_size: int = 1,
+        event_batch_max_wait_ms: int = 250,
     ):
         """Initialize embedding service.
 
@@ -71,6 +74,8 @@ class EmbeddingService:
             retry_backoff_seconds: Base backoff time for retries
             vector_store_collection: Vector store collection name
             event_retry_config: Retry configuration for event race condition handling (optional)
+            event_batch_size: ChunksPrepared events merged into one embedding pass (1 disables batching)
+            event_batch_max_wait_ms: Maximum time an event waits for its batch to fill
         """
         self.document_store = document_store
         self.vector_store = vector_store
@@ -87,6 +92,8 @@ class EmbeddingService:
         self.retry_backoff_seconds = retry_backoff_seconds
         self.vector_store_collection = vector_store_collection
         self.event_retry_config = event_retry_config or RetryConfig()
+        self.event_batch_size = event_batch_size
+        self.event_batch_max_wait_ms = event_batch_max_wait_ms
 
         # Stats
         self.chunks_processed = 0
@@ -107,12 +114,24 @@ class EmbeddingService:
             self._requeue_incomplete_chunks()
 
         # Subscribe to ChunksPrepared events
-        self.subscriber.subscribe(
-            event_type="ChunksPrepared",
-            exchange="copilot.events",
-            routing_key="chunks.prepared",
-            callback=self._handle_chunks_prepared,
-        )
+        if self.event_batch_size > 1:
+            # Merge small ChunksPrepared events (e.g., one per requeued chunk) so that
+            # the embedding provider sees full batches
+            self.subscriber.subscribe_batch(
+                event_type="ChunksPrepared",
+                batch_callback=self._handle_chunks_prepared_batch,
+                max_batch_size=self.event_batch_size,
+                max_wait_ms=self.event_batch_max_wait_ms,
+                exchange="copilot.events",
+                routing_key="chunks.prepared",
+            )
+        else:
+            self.subscriber.subscribe(
+                event_type="ChunksPrepared",
+                exchange="copilot.events",
+                routing_key="chunks.prepared",
+                callback=self._handle_chunks_prepared,
+            )
 
         # Subscribe to SourceDeletionRequested events for cascade cleanup
         self.subscriber.subscribe(
@@ -154,6 +173,8 @@ class EmbeddingService:
                     "avg_chunk_size_tokens": doc.get("token_count", 0),  # Use actual token count from chunk
                 },
                 limit=1000,
+                # Skip chunk text and metadata; only the fields above are read
+                projection={"message_doc_id": 1, "token_count": 1},
             )
 
             logger.info(f"Startup requeue: {count} chunks without embeddings requeued")
@@ -202,6 +223,11 @@ class EmbeddingService:
                 metrics_collector=self.metrics_collector,
                 error_reporter=self.error_reporter,
                 service_name="embedding",
+                redelivery=(
+                    DelayedRedelivery(self.publisher, "copilot.events", "chunks.prepared")
+                    if self.event_retry_config.delayed_redelivery
+                    else None
+                ),
             )
 
         except Exception as e:
@@ -210,6 +236,54 @@ class EmbeddingService:
                 self.error_reporter.report(e, context={"event": event})
             raise  # Re-raise to trigger message requeue for transient failures
 
+    def _handle_chunks_prepared_batch(self, events: list[dict[str, Any]]):
+        """Handle a micro-batch of ChunksPrepared events as one embedding pass.
+
+        The chunk_ids of the events are merged into a single ChunksPrepared
+        event, so chunks are queried and embedded together in batches of
+        batch_size. Events carrying retry headers or malformed data are handled
+        on their own. Any failure is re-raised so that every event of the batch
+        is requeued.
+
+        Args:
+            events: ChunksPrepared events in delivery order
+        """
+        mergeable = []
+        for event in events:
+            data = event.get("data") or {}
+            if (
+                event.get("headers")
+                or not isinstance(data.get("chunk_ids"), list)
+                or not isinstance(data.get("message_doc_ids"), list)
+            ):
+                self._handle_chunks_prepared(event)
+            else:
+                mergeable.append(event)
+
+        if len(mergeable) == 1:
+            self._handle_chunks_prepared(mergeable[0])
+        elif mergeable:
+            chunk_ids = list(dict.fromkeys(cid for event in mergeable for cid in event["data"]["chunk_ids"]))
+            message_doc_ids = list(
+                dict.fromkeys(doc_id for event in mergeable for doc_id in event["data"]["message_doc_ids"])
+            )
+            total_tokens = sum(
+                event["data"].get("avg_chunk_size_tokens", 0) * len(event["data"]["chunk_ids"]) for event in mergeable
+            )
+            # A complete event, so that a delayed redelivery republishes a valid ChunksPrepared
+            merged = ChunksPreparedEvent(
+                data={
+                    "message_doc_ids": message_doc_ids,
+                    "chunk_count": len(chunk_ids),
+                    "chunk_ids": chunk_ids,
+                    "chunks_ready": all(event["data"].get("chunks_ready", True) for event in mergeable),
+                    "chunking_strategy": mergeable[0]["data"].get("chunking_strategy", "unknown"),
+                    "avg_chunk_size_tokens": round(total_tokens / len(chunk_ids)) if chunk_ids else 0,
+                }
+            ).to_dict()
+            logger.info(f"Merged {len(mergeable)} ChunksPrepared events covering {len(chunk_ids)} chunks")
+            self._handle_chunks_prepared(merged)
+
     def process_chunks(self, event_data: dict[str, Any]):
         """Process chunks and generate embeddings.
 
@@ -381,16 +455,21 @@ class EmbeddingService:
         """
         embeddings = []
 
+        chunks_with_text = []
         for chunk in chunks:
-            # Extract text content
-            text = chunk.get("text", "")
-
-            if not text:
+            if not chunk.get("text", ""):
                 logger.warning(f"Chunk {chunk.get('_id')} has no text, skipping")
                 continue
+            chunks_with_text.append(chunk)
+
+        if not chunks_with_text:
+            return embeddings
 
-            # Generate embedding
-            vector = self.embedding_provider.embed(text)
+        # Generate all vectors in one provider call so the backend can batch inference
+        vectors = self.embedding_provider.embed_batch([chunk["text"] for chunk in chunks_with_text])
+
+        for chunk, vector in zip(chunks_with_text, vectors):
+            text = chunk["text"]
 
             # Create embedding object with metadata
             embedding = {
@@ -450,32 +529,36 @@ class EmbeddingService:
         Args:
             doc_ids: List of Mongo document IDs to update
         """
-        for doc_id in doc_ids:
-            try:
-                # Update is idempotent - setting embedding_generated=True multiple times is safe
-                self.document_store.update_document(
-                    collection="chunks",
-                    doc_id=doc_id,
-                    patch={
-                        "embedding_generated": True,
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-            except (ConnectionError, OSError, TimeoutError) as e:
-                # Database connectivity issues - log but don't fail
-                # The embedding itself has already been stored in vectorstore
-                logger.warning(f"Failed to update status for chunk {doc_id} (connectivity): {e}")
-            except Exception as e:
-                # Other errors (e.g., chunk not found, validation errors) - log with full context
-                logger.error(f"Unexpected error updating status for chunk {doc_id}: {e}", exc_info=True)
+        # Update is idempotent - setting embedding_generated=True multiple times is safe
+        patch = {
+            "embedding_generated": True,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            result = self.document_store.update_documents(
+                collection="chunks",
+                updates=[(doc_id, patch) for doc_id in doc_ids],
+            )
+        except (ConnectionError, OSError, TimeoutError) as e:
+            # Database connectivity issues - log but don't fail
+            # The embedding itself has already been stored in vectorstore
+            logger.warning(f"Failed to update status for {len(doc_ids)} chunks (connectivity): {e}")
+            return
+        except Exception as e:
+            logger.error(f"Unexpected error updating status for {len(doc_ids)} chunks: {e}", exc_info=True)
+            return
 
-        logger.debug(f"Updated {len(doc_ids)} chunks with embedding_generated=True")
+        for index, error in result.errors.items():
+            # Per-chunk errors (e.g., chunk not found, validation errors) - log with full context
+            logger.error(f"Unexpected error updating status for chunk {doc_ids[index]}: {error}")
+
+        logger.debug(f"Updated {len(result.succeeded)} chunks with embedding_generated=True")
 
         # Emit metric for embedding status transitions
         if self.metrics_collector:
             self.metrics_collector.increment(
                 "embedding_chunk_status_transitions_total",
-                value=len(doc_ids),
+                value=len(result.succeeded),
                 tags={"embedding_generated": "true", "collection": "chunks"},
             )
 
@@ -594,17 +677,23 @@ class EmbeddingService:
             
             # First, try to query chunks (may be empty if chunking service already deleted them)
             try:
-                chunks = self.document_store.query_documents(
-                    "chunks",
-                    {"source": source_name}
-                ) or []
+                chunks = list(
+                    self.document_store.iter_documents(
+                        "chunks",
+                        {"source": source_name},
+                        projection={"_id": 1},
+                    )
+                )
 
                 if not chunks and archive_ids:
                     for archive_id in archive_ids:
-                        archive_chunks = self.document_store.query_documents(
-                            "chunks",
-                            {"archive_id": archive_id}
-                        ) or []
+                        archive_chunks = list(
+                            self.document_store.iter_documents(
+                                "chunks",
+                                {"archive_id": archive_id},
+                                projection={"_id": 1},
+                            )
+                        )
                         chunks.extend(archive_chunks)
 
 
@@ -777,6 +866,19 @@ class EmbeddingService:
                     }
                 )
 
+    def close(self) -> None:
+        """Flush vector store writes buffered in memory (e.g., FAISS between autosaves).
+
+        Chunks are marked embedding_generated as soon as their vectors are
+        added, so writes lost at shutdown would never be re-embedded.
+        """
+        try:
+            self.vector_store.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush vector store: {e}", exc_info=True)
+            if self.error_reporter:
+                self.error_reporter.report(e, context={"operation": "flush_vector_store", "service": "embedding"})
+
     def get_stats(self) -> dict[str, Any]:
         """Get service statistics.
 
@@ -36,7 +36,13 @@ from copilot_config.generated.adapters.vector_store import (
 )
 from copilot_config.generated.services.embedding import ServiceConfig_Embedding
 from copilot_config.runtime_loader import get_config
-from copilot_embedding import create_embedding_provider
+from copilot_embedding import (
+    CachedEmbeddingProvider,
+    DocumentStoreEmbeddingCacheStore,
+    EmbeddingCacheStore,
+    SQLiteEmbeddingCacheStore,
+    create_embedding_provider,
+)
 from copilot_error_reporting import create_error_reporter
 from copilot_event_retry import RetryConfig
 from copilot_logging import (
@@ -330,6 +336,24 @@ def main():
         logger.info("Creating metrics collector...")
         metrics_collector = create_metrics_collector(config.metrics)
 
+        if config.service_settings.enable_cache:
+            cache_ttl_seconds = int(config.service_settings.cache_ttl_seconds or 0)
+            if config.service_settings.cache_backend == "sqlite":
+                cache_path = config.service_settings.cache_path or "/tmp/embedding_cache.sqlite3"
+                logger.info(f"Enabling embedding cache (sqlite: {cache_path})")
+                cache_store: EmbeddingCacheStore = SQLiteEmbeddingCacheStore(cache_path, ttl_seconds=cache_ttl_seconds)
+            else:
+                logger.info("Enabling embedding cache (document store)")
+                cache_store = DocumentStoreEmbeddingCacheStore(document_store, ttl_seconds=cache_ttl_seconds)
+            embedding_provider = CachedEmbeddingProvider(
+                embedding_provider,
+                cache_store,
+                backend=backend_name,
+                model=embedding_model,
+                dimension=embedding_dimension,
+                metrics_collector=metrics_collector,
+            )
+
         # Create error reporter - fail fast on errors
         logger.info("Creating error reporter...")
         error_reporter = create_error_reporter(config.error_reporter)
@@ -346,10 +370,12 @@ def main():
             backoff_factor=float(retry_driver.backoff_factor),
             max_delay_ms=int(retry_driver.max_delay_ms),
             ttl_seconds=int(retry_driver.ttl_seconds),
+            delayed_redelivery=bool(retry_driver.delayed_redelivery),
         )
         logger.info(
             f"Retry configuration: max_attempts={event_retry_config.max_attempts}, "
-            f"base_delay_ms={event_retry_config.base_delay_ms}, ttl_seconds={event_retry_config.ttl_seconds}"
+            f"base_delay_ms={event_retry_config.base_delay_ms}, ttl_seconds={event_retry_config.ttl_seconds}, "
+            f"delayed_redelivery={event_retry_config.delayed_redelivery}"
         )
 
         # Create embedding service
@@ -381,6 +407,16 @@ def main():
                 )
             ),
             event_retry_config=event_retry_config,
+            event_batch_size=(
+                config.service_settings.event_batch_size
+                if config.service_settings.event_batch_size is not None
+                else 16
+            ),
+            event_batch_max_wait_ms=(
+                config.service_settings.event_batch_max_wait_ms
+                if config.service_settings.event_batch_max_wait_ms is not None
+                else 250
+            ),
         )
 
         # Start subscriber in a separate thread (non-daemon to fail fast)
@@ -404,6 +440,13 @@ def main():
     except Exception as e:
         logger.error(f"Failed to start embedding service: {e}")
         raise SystemExit(1)
+    finally:
+        # Stop consuming before flushing so no vectors are added after the final save
+        if embedding_service:
+            embedding_service.subscriber.stop_consuming()
+            if subscriber_thread is not None:
+                subscriber_thread.join(timeout=30)
+            embedding_service.close()
 
 
 if __name__ == "__main__":
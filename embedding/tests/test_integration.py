@@ -33,15 +33,27 @@ def _add_in_operator_support(store):
         limit: int = 100,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        projection: dict[str, object] | None = None,
     ):
         if isinstance(filter_dict, dict):
             if "_id" in filter_dict and isinstance(filter_dict["_id"], dict):
                 doc_ids = filter_dict["_id"].get("$in", [])
                 results = []
                 for doc_id in doc_ids:
-                    results.extend(original_query(collection, {"_id": doc_id}, limit, sort_by=sort_by, sort_order=sort_order))
+                    results.extend(
+                        original_query(
+                            collection,
+                            {"_id": doc_id},
+                            limit,
+                            sort_by=sort_by,
+                            sort_order=sort_order,
+                            projection=projection,
+                        )
+                    )
                 return results[:limit]
-        return original_query(collection, filter_dict, limit, sort_by=sort_by, sort_order=sort_order)
+        return original_query(
+            collection, filter_dict, limit, sort_by=sort_by, sort_order=sort_order, projection=projection
+        )
 
     return query_with_in_support
 
@@ -9,8 +9,10 @@ from unittest.mock import Mock
 
 import pytest
 from app.service import EmbeddingService
+from copilot_event_retry import RetryConfig
 from copilot_event_retry.event_handler import DocumentNotFoundError
 from copilot_metrics import create_metrics_collector
+from copilot_storage import BulkWriteResult
 
 # Add project root to path to import test fixtures
 # NOTE: This is necessary because tests run from individual service directories
@@ -46,7 +48,9 @@ def mock_document_store():
     """Create a mock document store."""
     store = Mock()
     store.query_documents = Mock(return_value=[])
-    store.update_document = Mock()  # No return value - raises exception on error
+    store.update_documents = Mock(
+        side_effect=lambda collection, updates: BulkWriteResult(succeeded=[doc_id for doc_id, _ in updates])
+    )
     return store
 
 
@@ -64,6 +68,7 @@ def mock_embedding_provider():
     provider = Mock()
     # Return a fixed-dimension embedding
     provider.embed = Mock(return_value=[0.1] * 384)
+    provider.embed_batch = Mock(side_effect=lambda texts: [[0.1] * 384 for _ in texts])
     return provider
 
 
@@ -156,6 +161,77 @@ def test_service_start(embedding_service, mock_subscriber):
     )
 
 
+def test_service_start_with_event_batching(embedding_service, mock_subscriber):
+    """Test that ChunksPrepared uses a batched subscription when event batching is enabled."""
+    embedding_service.event_batch_size = 8
+    embedding_service.event_batch_max_wait_ms = 100
+
+    embedding_service.start(enable_startup_requeue=False)
+
+    mock_subscriber.subscribe_batch.assert_called_once_with(
+        event_type="ChunksPrepared",
+        batch_callback=embedding_service._handle_chunks_prepared_batch,
+        max_batch_size=8,
+        max_wait_ms=100,
+        exchange="copilot.events",
+        routing_key="chunks.prepared",
+    )
+    assert mock_subscriber.subscribe.call_count == 1
+
+
+def _chunks_prepared_event(chunk_ids, message_doc_id, avg_tokens):
+    return {
+        "event_type": "ChunksPrepared",
+        "data": {
+            "message_doc_ids": [message_doc_id],
+            "chunk_count": len(chunk_ids),
+            "chunk_ids": chunk_ids,
+            "chunks_ready": True,
+            "chunking_strategy": "token_window",
+            "avg_chunk_size_tokens": avg_tokens,
+        },
+    }
+
+
+def test_handle_chunks_prepared_batch_merges_events(embedding_service):
+    """Test that a batch of ChunksPrepared events is processed as one merged, schema-valid event."""
+    embedding_service._handle_chunks_prepared = Mock()
+    retried = _chunks_prepared_event(["c9"], "m3", 10)
+    retried["headers"] = {"retry_attempt": 2}
+
+    embedding_service._handle_chunks_prepared_batch(
+        [
+            _chunks_prepared_event(["c1", "c2"], "m1", 100),
+            retried,
+            _chunks_prepared_event(["c2", "c3"], "m1", 40),
+        ]
+    )
+
+    assert embedding_service._handle_chunks_prepared.call_count == 2
+    assert embedding_service._handle_chunks_prepared.call_args_list[0].args[0] is retried
+    merged = embedding_service._handle_chunks_prepared.call_args_list[1].args[0]
+    assert merged["event_type"] == "ChunksPrepared"
+    assert "event_id" in merged and "timestamp" in merged
+    assert merged["data"] == {
+        "message_doc_ids": ["m1"],
+        "chunk_count": 3,
+        "chunk_ids": ["c1", "c2", "c3"],
+        "chunks_ready": True,
+        "chunking_strategy": "token_window",
+        "avg_chunk_size_tokens": 93,
+    }
+
+
+def test_handle_chunks_prepared_batch_single_event(embedding_service):
+    """Test that a batch of one event is handled unchanged."""
+    embedding_service._handle_chunks_prepared = Mock()
+    event = _chunks_prepared_event(["c1"], "m1", 100)
+
+    embedding_service._handle_chunks_prepared_batch([event])
+
+    embedding_service._handle_chunks_prepared.assert_called_once_with(event)
+
+
 def test_process_chunks_success(
     embedding_service, mock_document_store, mock_vector_store, mock_embedding_provider, mock_publisher
 ):
@@ -223,8 +299,9 @@ def test_process_chunks_success(
         },
     )
 
-    # Verify embeddings were generated for each chunk
-    assert mock_embedding_provider.embed.call_count == 3
+    # Verify embeddings were generated for all chunks in a single batched call
+    mock_embedding_provider.embed_batch.assert_called_once()
+    assert len(mock_embedding_provider.embed_batch.call_args.args[0]) == 3
 
     # Verify embeddings were stored
     mock_vector_store.add_embeddings.assert_called_once()
@@ -246,10 +323,11 @@ def test_process_chunks_success(
     assert stored_metadata[0]["embedding_backend"] == "sentencetransformers"
 
     # Verify chunk status was updated using MongoDB _id (not chunk_id)
-    assert mock_document_store.update_document.call_count == 3
-    # Verify the update calls were made using MongoDB _id for each chunk
-    update_calls = mock_document_store.update_document.call_args_list
-    updated_doc_ids = [call[1]["doc_id"] for call in update_calls]
+    mock_document_store.update_documents.assert_called_once()
+    # Verify the bulk update was made using MongoDB _id for each chunk
+    updates = mock_document_store.update_documents.call_args[1]["updates"]
+    updated_doc_ids = [doc_id for doc_id, _ in updates]
+    assert all(patch["embedding_generated"] is True for _, patch in updates)
     # Expected _id values from test chunks (16-char hex strings from create_valid_chunk)
     expected_mongo_ids = chunk_ids  # Use the same IDs we created the chunks with
     assert set(updated_doc_ids) == set(expected_mongo_ids)
@@ -335,7 +413,7 @@ def test_process_chunks_updates_status_by_canonical_id(
 
     embedding_service.process_chunks({"chunk_ids": chunk_ids})
 
-    updated_doc_ids = [call.kwargs["doc_id"] for call in mock_document_store.update_document.call_args_list]
+    updated_doc_ids = [doc_id for doc_id, _ in mock_document_store.update_documents.call_args.kwargs["updates"]]
     assert set(updated_doc_ids) == set(chunk_ids)
 
 
@@ -505,6 +583,13 @@ def test_process_chunks_max_retries_exceeded(embedding_service, mock_document_st
     assert event["data"]["retry_count"] == 2
 
 
+def test_close_flushes_vector_store(embedding_service, mock_vector_store):
+    """Test that closing the service saves buffered vector store writes."""
+    embedding_service.close()
+
+    mock_vector_store.flush.assert_called_once_with()
+
+
 def test_get_stats(embedding_service):
     """Test getting service statistics."""
     embedding_service.chunks_processed = 10
@@ -557,14 +642,33 @@ def test_batch_processing(embedding_service, mock_document_store, mock_vector_st
 
     embedding_service.process_chunks(event_data)
 
-    # Verify all chunks were processed
-    assert mock_embedding_provider.embed.call_count == 100
+    # Verify all chunks were embedded with one provider call per batch
+    assert mock_embedding_provider.embed_batch.call_count == 4
+    assert sum(len(call.args[0]) for call in mock_embedding_provider.embed_batch.call_args_list) == 100
 
     # Verify vector store was called multiple times (once per batch)
     # 100 chunks / 32 batch_size = 4 batches (32, 32, 32, 4)
     assert mock_vector_store.add_embeddings.call_count == 4
 
 
+def test_generate_batch_embeddings_skips_chunks_without_text(embedding_service, mock_embedding_provider):
+    """Test that chunks without text are skipped and the rest are embedded in one call."""
+    chunks = [
+        {"_id": "chunk-0", "text": "First chunk"},
+        {"_id": "chunk-1", "text": ""},
+        {"_id": "chunk-2", "text": "Third chunk"},
+    ]
+    mock_embedding_provider.embed_batch = Mock(return_value=[[0.1] * 384, [0.2] * 384])
+
+    embeddings = embedding_service._generate_batch_embeddings(chunks)
+
+    mock_embedding_provider.embed_batch.assert_called_once_with(["First chunk", "Third chunk"])
+    mock_embedding_provider.embed.assert_not_called()
+    assert [emb["id"] for emb in embeddings] == ["chunk-0", "chunk-2"]
+    assert embeddings[1]["vector"] == [0.2] * 384
+    assert embeddings[1]["metadata"]["text"] == "Third chunk"
+
+
 def test_handle_chunks_prepared_raises_on_missing_chunk_ids(embedding_service):
     """Test that event handler raises exception when chunk_ids field is missing."""
     event = {
@@ -583,6 +687,27 @@ def test_handle_chunks_prepared_raises_on_missing_chunk_ids(embedding_service):
         embedding_service._handle_chunks_prepared(event)
 
 
+def test_handle_chunks_prepared_delayed_redelivery(embedding_service, mock_document_store, mock_publisher):
+    """Test that a missing chunk is republished with a delay instead of retried in-process."""
+    embedding_service.event_retry_config = RetryConfig(base_delay_ms=100, use_jitter=False, delayed_redelivery=True)
+    embedding_service.max_retries = 1
+    mock_document_store.query_documents.return_value = []
+    event = {
+        "event_type": "ChunksPrepared",
+        "event_id": "test-123",
+        "timestamp": "2023-10-15T12:00:00Z",
+        "version": "1.0",
+        "data": {"chunk_ids": ["chunk-1"]},
+    }
+
+    embedding_service._handle_chunks_prepared(event)
+
+    exchange, routing_key, redelivered, delay_ms = mock_publisher.publish_delayed.call_args.args
+    assert (exchange, routing_key, delay_ms) == ("copilot.events", "chunks.prepared", 200)
+    assert redelivered["headers"]["retry_attempt"] == 2
+    mock_publisher.publish.assert_not_called()
+
+
 def test_handle_chunks_prepared_raises_on_invalid_chunk_ids_type(embedding_service):
     """Test that event handler raises exception when chunk_ids is not a list."""
     event = {
@@ -730,24 +855,24 @@ def test_idempotent_embedding_generation(
     embedding_service.process_chunks(event_data)
 
     # Verify embeddings were generated and stored
-    assert mock_embedding_provider.embed.call_count == 3
+    assert mock_embedding_provider.embed_batch.call_count == 1
     assert mock_vector_store.add_embeddings.call_count == 1
-    assert mock_document_store.update_document.call_count == 3
+    assert len(mock_document_store.update_documents.call_args.kwargs["updates"]) == 3
 
     # Reset mocks to track second call
-    mock_embedding_provider.embed.reset_mock()
+    mock_embedding_provider.embed_batch.reset_mock()
     mock_vector_store.add_embeddings.reset_mock()
-    mock_document_store.update_document.reset_mock()
+    mock_document_store.update_documents.reset_mock()
     mock_publisher.publish.reset_mock()
 
     # Second processing (retry scenario) - should also succeed due to upsert
     embedding_service.process_chunks(event_data)
 
     # Verify the retry succeeded (idempotent behavior)
-    assert mock_embedding_provider.embed.call_count == 3
+    assert mock_embedding_provider.embed_batch.call_count == 1
     assert mock_vector_store.add_embeddings.call_count == 1
     # Status updates are safe to retry (idempotent)
-    assert mock_document_store.update_document.call_count == 3
+    assert len(mock_document_store.update_documents.call_args.kwargs["updates"]) == 3
 
     # Both attempts should publish success events
     assert mock_publisher.publish.call_count == 1
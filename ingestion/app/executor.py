@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Concurrent executor for multi-source ingestion."""
+
+import heapq
+import itertools
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from copilot_archive_fetcher import SourceConfig
+
+
+def source_host(source: SourceConfig) -> str:
+    """Determine the remote host a source is fetched from.
+
+    Args:
+        source: Source configuration
+
+    Returns:
+        Lower-cased host name; "localhost" for local sources
+    """
+    url = source.url.strip()
+    if "://" in url:
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            return "localhost"
+        return (parsed.hostname or url).lower()
+    if source.source_type == "imap":
+        return url.lower()
+    if source.source_type == "rsync" and ":" in url:
+        # rsync shell syntax: [user@]host:path
+        return url.split(":", 1)[0].rsplit("@", 1)[-1].lower()
+    return "localhost"
+
+
+@dataclass
+class IngestionJob:
+    """One source to ingest.
+
+    Attributes:
+        name: Key of the job's result (the source name)
+        host: Host the source is fetched from; jobs on the same host share its concurrency limit
+        attempt: Runs one ingestion attempt. Returns None when the job is done, or the number
+            of seconds to wait before the next attempt. Raises when the job failed for good.
+    """
+
+    name: str
+    host: str
+    attempt: Callable[[], float | None]
+
+
+class IngestionExecutor:
+    """Runs ingestion jobs concurrently with global and per-host limits.
+
+    A job whose attempt asks for a retry gives its worker back while it waits
+    for the backoff delay, so a flaky source does not hold up the others.
+    """
+
+    def __init__(self, max_workers: int, max_per_host: int):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of attempts running at once
+            max_per_host: Maximum number of attempts running at once against one host
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_workers <= 0 or max_per_host <= 0:
+            raise ValueError("max_workers and max_per_host must be positive")
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+
+    def run(self, jobs: Iterable[IngestionJob]) -> dict[str, Exception | None]:
+        """Run jobs until each has succeeded or failed.
+
+        Args:
+            jobs: Jobs to run, started in order as limits allow
+
+        Returns:
+            Dictionary mapping job name to the exception it failed with (None if successful),
+            in job order
+        """
+        jobs = list(jobs)
+        results: dict[str, Exception | None] = {}
+        ready: deque[IngestionJob] = deque(jobs)
+        # Jobs waiting out a retry delay: (ready_at, sequence, job)
+        delayed: list[tuple[float, int, IngestionJob]] = []
+        sequence = itertools.count()
+        running: dict[Future, IngestionJob] = {}
+        active_per_host: Counter[str] = Counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingestion") as pool:
+            while ready or delayed or running:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    ready.append(heapq.heappop(delayed)[2])
+
+                # Start ready jobs whose host has capacity; the others keep their place in line
+                blocked: deque[IngestionJob] = deque()
+                while ready and len(running) < self.max_workers:
+                    job = ready.popleft()
+                    if active_per_host[job.host] >= self.max_per_host:
+                        blocked.append(job)
+                        continue
+                    active_per_host[job.host] += 1
+                    running[pool.submit(job.attempt)] = job
+                blocked.extend(ready)
+                ready = blocked
+
+                timeout = max(0.0, delayed[0][0] - time.monotonic()) if delayed else None
+                if not running:
+                    # Nothing running means every host has capacity, so only delayed jobs remain
+                    time.sleep(timeout or 0.0)
+                    continue
+
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    active_per_host[job.host] -= 1
+                    try:
+                        retry_delay = future.result()
+                    except Exception as e:
+                        results[job.name] = e
+                        continue
+                    if retry_delay is None:
+                        results[job.name] = None
+                    else:
+                        heapq.heappush(delayed, (time.monotonic() + retry_delay, next(sequence), job))
+
+        return {job.name: results[job.name] for job in jobs}
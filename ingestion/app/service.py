@@ -4,9 +4,10 @@
 import hashlib
 import json
 import os
+import threading
 import time
-from collections.abc import Iterable
-from dataclasses import asdict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -33,6 +34,7 @@ from .exceptions import (
     IngestionError,
     SourceConfigurationError,
 )
+from .executor import IngestionExecutor, IngestionJob, source_host
 
 logger: Logger = get_logger(__name__)
 
@@ -162,6 +164,20 @@ def _enabled_sources(raw_sources: Iterable[SourceConfig | dict[str, Any]]) -> li
     return enabled_sources
 
 
+@dataclass
+class _IngestionRun:
+    """State of one source ingestion across its retry attempts."""
+
+    source_cfg: SourceConfig
+    max_retries: int
+    ingestion_started_at: str
+    started_monotonic: float
+    metric_tags: dict[str, str]
+    attempt: int = 0
+    retry_count: int = 0
+    last_error: str | None = None
+
+
 class IngestionService:
     """Main ingestion service for fetching and ingesting archives."""
 
@@ -229,6 +245,19 @@ class IngestionService:
         # Initialize archive metadata cache for performance optimization
         self._archive_metadata_cache: dict[str, dict[str, dict[str, Any]]] = {}
 
+        # Sources are ingested concurrently (see ingest_all_enabled_sources); these
+        # locks guard the state shared between ingestion threads
+        self._publish_lock = threading.Lock()
+        self._state_lock = threading.RLock()
+        # Archive and document store adapters are not all thread-safe (the
+        # in-memory document store, the Azure blob metadata index); fetching
+        # runs in parallel, but store calls for ingested files are serialized
+        self._store_lock = threading.Lock()
+
+        # Per-source, per-file append watermarks for delta ingestion (loaded lazily)
+        self._watermarks_path = os.path.join(self.storage_path, "metadata", "ingestion_watermarks.json")
+        self._watermarks: dict[str, dict[str, dict[str, Any]]] | None = None
+
         # Sources cache for dynamic source management from document store
         self._sources_cache: list[dict[str, Any]] | None = None
 
@@ -282,10 +311,13 @@ class IngestionService:
         """
         deleted_count = 0
 
+        # Re-ingestion must start from full files, not from the last watermark
+        self._clear_watermarks(source_name)
+
         if self.document_store is not None:
             try:
                 # Query all archives for this source
-                archives = self.document_store.query_documents("archives", {"source": source_name})
+                archives = list(self.document_store.iter_documents("archives", {"source": source_name}))
 
                 # Delete each archive
                 for archive in archives:
@@ -400,7 +432,9 @@ class IngestionService:
 
         try:
             # Step 0: Query all archives for this source (needed for event and cleanup)
-            archives = self.document_store.query_documents("archives", {"source": source_name}) or []
+            archives = list(
+                self.document_store.iter_documents("archives", {"source": source_name}, projection={"_id": 1})
+            )
             archive_ids = self._extract_doc_ids(archives)
 
             self.logger.info(
@@ -446,7 +480,9 @@ class IngestionService:
 
             # Step 1: Delete threads (query by source)
             try:
-                threads = self.document_store.query_documents("threads", {"source": source_name}) or []
+                threads = list(
+                    self.document_store.iter_documents("threads", {"source": source_name}, projection={"_id": 1})
+                )
                 thread_ids = self._extract_doc_ids(threads)
                 for thread_id in thread_ids:
                     try:
@@ -475,12 +511,18 @@ class IngestionService:
             message_ids = []
             try:
                 # Try querying by source first
-                messages = self.document_store.query_documents("messages", {"source": source_name}) or []
+                messages = list(
+                    self.document_store.iter_documents("messages", {"source": source_name}, projection={"_id": 1})
+                )
                 # If no messages found by source, try by archive_id
                 if not messages and archive_ids:
                     for archive_id in archive_ids:
-                        archive_messages = (
-                            self.document_store.query_documents("messages", {"archive_id": archive_id}) or []
+                        archive_messages = list(
+                            self.document_store.iter_documents(
+                                "messages",
+                                {"archive_id": archive_id},
+                                projection={"_id": 1},
+                            )
                         )
                         messages.extend(archive_messages)
 
@@ -512,11 +554,19 @@ class IngestionService:
             chunk_ids = []
             try:
                 # Try querying by source first
-                chunks = self.document_store.query_documents("chunks", {"source": source_name}) or []
+                chunks = list(
+                    self.document_store.iter_documents("chunks", {"source": source_name}, projection={"_id": 1})
+                )
                 # If no chunks found by source, try by message_id
                 if not chunks and message_ids:
                     for message_id in message_ids:
-                        message_chunks = self.document_store.query_documents("chunks", {"message_id": message_id}) or []
+                        message_chunks = list(
+                            self.document_store.iter_documents(
+                                "chunks",
+                                {"message_id": message_id},
+                                projection={"_id": 1},
+                            )
+                        )
                         chunks.extend(message_chunks)
 
                 chunk_ids = self._extract_doc_ids(chunks)
@@ -558,12 +608,18 @@ class IngestionService:
             # Step 5: Delete summaries/reports (query by source or archive_id)
             try:
                 # Try querying by source first; if not found, try by archive_id
-                summaries = self.document_store.query_documents("summaries", {"source": source_name}) or []
+                summaries = list(
+                    self.document_store.iter_documents("summaries", {"source": source_name}, projection={"_id": 1})
+                )
                 # If no summaries found by source, try by archive_id
                 if not summaries and archive_ids:
                     for archive_id in archive_ids:
-                        archive_summaries = (
-                            self.document_store.query_documents("summaries", {"archive_id": archive_id}) or []
+                        archive_summaries = list(
+                            self.document_store.iter_documents(
+                                "summaries",
+                                {"archive_id": archive_id},
+                                projection={"_id": 1},
+                            )
                         )
                         summaries.extend(archive_summaries)
 
@@ -627,6 +683,7 @@ class IngestionService:
                 source_name=source_name,
                 count=deletion_counts["archives_docstore"],
             )
+            self._clear_watermarks(source_name)
 
             # Emit metrics for cascade delete
             self.metrics.increment("ingestion_cascade_delete_total", tags={"source_name": source_name})
@@ -741,6 +798,30 @@ class IngestionService:
             ChecksumPersistenceError: If saving checksums fails
             ArchivePublishError: If publishing archive events fails
         """
+        run = self._start_ingestion_run(source, max_retries)
+        while True:
+            wait_time = self._ingest_attempt(run)
+            if wait_time is None:
+                return
+            time.sleep(wait_time)
+
+    def _start_ingestion_run(
+        self,
+        source: SourceConfig | dict[str, Any],
+        max_retries: int | None = None,
+    ) -> _IngestionRun:
+        """Prepare the state for ingesting a source.
+
+        Args:
+            source: Source configuration
+            max_retries: Maximum number of retries (uses config default if None)
+
+        Returns:
+            Ingestion run state to pass to _ingest_attempt()
+
+        Raises:
+            SourceConfigurationError: If source configuration is invalid
+        """
         # Normalize source into fetcher SourceConfig
         source_cfg = source if isinstance(source, SourceConfig) else _source_from_mapping(source)
 
@@ -749,170 +830,230 @@ class IngestionService:
                 self.config.service_settings.max_retries if self.config.service_settings.max_retries is not None else 3
             )
 
-        ingestion_started_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        started_monotonic = time.monotonic()
-        metric_tags = self._metric_tags(source_cfg)
+        return _IngestionRun(
+            source_cfg=source_cfg,
+            max_retries=max_retries,
+            ingestion_started_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            started_monotonic=time.monotonic(),
+            metric_tags=self._metric_tags(source_cfg),
+        )
 
-        retry_count = 0
-        last_error = None
+    def _ingest_attempt(self, run: _IngestionRun) -> float | None:
+        """Run the next ingestion attempt for a source.
 
-        for attempt in range(max_retries + 1):
-            try:
-                self.logger.info(
-                    "Ingesting from source",
-                    source_name=source_cfg.name,
-                    source_type=source_cfg.source_type,
-                    attempt=attempt + 1,
-                    max_attempts=max_retries + 1,
-                )
+        Does not wait between attempts: a failed attempt with retries left
+        returns the backoff delay, and the caller decides how to wait for it.
 
-                # Create fetcher
-                fetcher = create_fetcher(source_cfg)
+        Args:
+            run: Ingestion run state, updated in place
 
-                # Create output directory
-                output_dir = os.path.join(self.storage_path, source_cfg.name)
+        Returns:
+            None if ingestion succeeded, otherwise the number of seconds to
+            wait before the next attempt
 
-                # Fetch archives
-                success, file_paths, error_message = fetcher.fetch(output_dir)
+        Raises:
+            FetchError: If fetching archives fails and no retries are left
+            IngestionError: If ingestion fails and no retries are left
+        """
+        source_cfg = run.source_cfg
+        max_retries = run.max_retries
+        ingestion_started_at = run.ingestion_started_at
+        started_monotonic = run.started_monotonic
+        metric_tags = run.metric_tags
+        attempt = run.attempt
+        run.attempt += 1
 
-                if file_paths is None:
-                    file_paths = []
+        try:
+            self.logger.info(
+                "Ingesting from source",
+                source_name=source_cfg.name,
+                source_type=source_cfg.source_type,
+                attempt=attempt + 1,
+                max_attempts=max_retries + 1,
+            )
 
-                if not success:
-                    last_error = error_message or "Unknown error"
-                    retry_count += 1
+            # Create fetcher
+            fetcher = create_fetcher(source_cfg)
 
-                    if attempt < max_retries:
-                        request_timeout = (
-                            self.config.service_settings.request_timeout_seconds
-                            if self.config.service_settings.request_timeout_seconds is not None
-                            else 60
-                        )
-                        wait_time = request_timeout * (2**attempt)
-                        self.logger.warning(
-                            "Fetch attempt failed",
-                            source_name=source_cfg.name,
-                            attempt=attempt + 1,
-                            wait_time_seconds=wait_time,
-                            error=last_error,
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        # All retries exhausted - raise exception
-                        try:
-                            self._publish_failure_event(
-                                source_cfg,
-                                last_error,
-                                "FetchError",
-                                retry_count,
-                                ingestion_started_at,
-                            )
-                        except Exception as publish_error:
-                            # Event publishing failed but fetch definitely failed too
-                            # Log both errors to ensure visibility
-                            self.logger.error(
-                                "Failed to publish ingestion failure event",
-                                source_name=source_cfg.name,
-                                original_error=last_error,
-                                publish_error=str(publish_error),
-                            )
-                            # Wrap both errors in FetchError
-                            raise FetchError(
-                                f"Fetch failed: {last_error}. Event publish also failed: {publish_error}",
-                                source_name=source_cfg.name,
-                                retry_count=retry_count,
-                            )
-                        self._record_failure_metrics(metric_tags, started_monotonic)
-                        # Update source status tracking
-                        self._update_source_status(
-                            source_cfg.name,
-                            status="failed",
-                            error=last_error,
-                        )
-                        raise FetchError(last_error, source_name=source_cfg.name, retry_count=retry_count)
-
-                # Process each file individually
-                files_processed = 0
-                files_skipped = 0
-
-                for file_path in file_paths:
-                    # Read file content once
-                    with open(file_path, "rb") as f:
-                        file_content = f.read()
-
-                    # Calculate hash from content (avoids re-reading file)
-                    file_hash = hashlib.sha256(file_content).hexdigest()
-                    file_size = len(file_content)
-
-                    # Check if already ingested using document store
-                    if self._is_archive_already_stored(file_hash):
-                        self.logger.debug(
-                            "File already ingested",
-                            file_path=file_path,
-                            file_hash=file_hash,
-                            source_name=source_cfg.name,
-                        )
-                        files_skipped += 1
-                        self.metrics.increment(
-                            "ingestion_files_total",
-                            tags={**metric_tags, "status": "skipped"},
-                        )
-                        continue
+            # Create output directory
+            output_dir = os.path.join(self.storage_path, source_cfg.name)
+
+            # Fetch archives
+            success, file_paths, error_message = fetcher.fetch(output_dir)
+
+            if file_paths is None:
+                file_paths = []
 
-                    # Store archive via ArchiveStore
+            if not success:
+                run.last_error = error_message or "Unknown error"
+                run.retry_count += 1
+
+                if attempt < max_retries:
+                    request_timeout = (
+                        self.config.service_settings.request_timeout_seconds
+                        if self.config.service_settings.request_timeout_seconds is not None
+                        else 60
+                    )
+                    wait_time = request_timeout * (2**attempt)
+                    self.logger.warning(
+                        "Fetch attempt failed",
+                        source_name=source_cfg.name,
+                        attempt=attempt + 1,
+                        wait_time_seconds=wait_time,
+                        error=run.last_error,
+                    )
+                    return wait_time
+                else:
+                    # All retries exhausted - raise exception
                     try:
-                        archive_id = self.archive_store.store_archive(
-                            source_name=source_cfg.name,
-                            file_path=file_path,
-                            content=file_content,
-                        )
-                        self.logger.info(
-                            "Stored archive via ArchiveStore",
-                            archive_id=archive_id,
-                            source_name=source_cfg.name,
-                            file_path=file_path,
-                            file_size=file_size,
+                        self._publish_failure_event(
+                            source_cfg,
+                            run.last_error,
+                            "FetchError",
+                            run.retry_count,
+                            ingestion_started_at,
                         )
-                    except Exception as e:
+                    except Exception as publish_error:
+                        # Event publishing failed but fetch definitely failed too
+                        # Log both errors to ensure visibility
                         self.logger.error(
-                            "Failed to store archive via ArchiveStore",
-                            error=str(e),
-                            file_path=file_path,
+                            "Failed to publish ingestion failure event",
                             source_name=source_cfg.name,
-                            exc_info=True,
+                            original_error=run.last_error,
+                            publish_error=str(publish_error),
                         )
-                        self.error_reporter.report(
-                            e,
-                            context={
-                                "operation": "store_archive",
-                                "file_path": file_path,
-                                "source_name": source_cfg.name,
-                            },
+                        # Wrap both errors in FetchError
+                        raise FetchError(
+                            f"Fetch failed: {run.last_error}. Event publish also failed: {publish_error}",
+                            source_name=source_cfg.name,
+                            retry_count=run.retry_count,
                         )
-                        # Skip this file and continue with others
-                        continue
+                    self._record_failure_metrics(metric_tags, started_monotonic)
+                    # Update source status tracking
+                    self._update_source_status(
+                        source_cfg.name,
+                        status="failed",
+                        error=run.last_error,
+                    )
+                    raise FetchError(run.last_error, source_name=source_cfg.name, retry_count=run.retry_count)
+
+            # Process each file individually
+            files_processed = 0
+            files_skipped = 0
+
+            for file_path in file_paths:
+                # Read file content once
+                with open(file_path, "rb") as f:
+                    file_content = f.read()
+
+                # An mbox that only grew since the last run is ingested as a
+                # delta archive holding just the appended messages
+                watermark_key = os.path.relpath(file_path, output_dir)
+                delta_offset = self._find_delta_offset(source_cfg.name, watermark_key, file_path, file_content)
+                if delta_offset is not None and delta_offset == len(file_content):
+                    self.logger.debug(
+                        "File unchanged since last ingestion",
+                        file_path=file_path,
+                        source_name=source_cfg.name,
+                    )
+                    files_skipped += 1
+                    self.metrics.increment(
+                        "ingestion_files_total",
+                        tags={**metric_tags, "status": "skipped"},
+                    )
+                    continue
 
-                    # Create metadata
-                    ingestion_completed_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                if delta_offset:
+                    archive_content = file_content[delta_offset:]
+                    archive_path = self._delta_archive_path(file_path, delta_offset)
+                    self.logger.info(
+                        "Detected appended data; ingesting delta archive",
+                        file_path=file_path,
+                        source_name=source_cfg.name,
+                        offset=delta_offset,
+                        delta_bytes=len(archive_content),
+                    )
+                else:
+                    archive_content = file_content
+                    archive_path = file_path
+
+                # Calculate hash from content (avoids re-reading file)
+                file_hash = hashlib.sha256(archive_content).hexdigest()
+                file_size = len(archive_content)
+
+                # Check if already ingested using document store
+                with self._store_lock:
+                    already_stored = self._is_archive_already_stored(file_hash)
+                if already_stored:
+                    self.logger.debug(
+                        "File already ingested",
+                        file_path=archive_path,
+                        file_hash=file_hash,
+                        source_name=source_cfg.name,
+                    )
+                    self._save_watermark(source_cfg.name, watermark_key, file_path, file_content)
+                    files_skipped += 1
+                    self.metrics.increment(
+                        "ingestion_files_total",
+                        tags={**metric_tags, "status": "skipped"},
+                    )
+                    continue
 
-                    metadata = ArchiveMetadata(
+                # Store archive via ArchiveStore
+                try:
+                    with self._store_lock:
+                        archive_id = self.archive_store.store_archive(
+                            source_name=source_cfg.name,
+                            file_path=archive_path,
+                            content=archive_content,
+                        )
+                    self.logger.info(
+                        "Stored archive via ArchiveStore",
                         archive_id=archive_id,
                         source_name=source_cfg.name,
-                        source_type=source_cfg.source_type,
-                        source_url=source_cfg.url,
+                        file_path=archive_path,
+                        file_size=file_size,
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "Failed to store archive via ArchiveStore",
+                        error=str(e),
                         file_path=file_path,
-                        file_size_bytes=file_size,
-                        file_hash_sha256=file_hash,
-                        ingestion_started_at=ingestion_started_at,
-                        ingestion_completed_at=ingestion_completed_at,
-                        status="success",
+                        source_name=source_cfg.name,
+                        exc_info=True,
+                    )
+                    self.error_reporter.report(
+                        e,
+                        context={
+                            "operation": "store_archive",
+                            "file_path": file_path,
+                            "source_name": source_cfg.name,
+                        },
                     )
+                    # Skip this file and continue with others
+                    continue
+
+                # Create metadata
+                ingestion_completed_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+                metadata = ArchiveMetadata(
+                    archive_id=archive_id,
+                    source_name=source_cfg.name,
+                    source_type=source_cfg.source_type,
+                    source_url=source_cfg.url,
+                    file_path=archive_path,
+                    file_size_bytes=file_size,
+                    file_hash_sha256=file_hash,
+                    ingestion_started_at=ingestion_started_at,
+                    ingestion_completed_at=ingestion_completed_at,
+                    status="success",
+                )
 
-                    # Save metadata to log
-                    self._save_ingestion_log(metadata)
+                # Save metadata to log
+                self._save_ingestion_log(metadata)
 
-                    # Write to archives collection in document store
+                # Write to archives collection in document store
+                with self._store_lock:
                     self._write_archive_record(
                         archive_id,
                         source_cfg,
@@ -920,152 +1061,171 @@ class IngestionService:
                         ingestion_completed_at,
                     )
 
-                    # Publish success event
-                    self._publish_success_event(metadata)
+                # Publish success event
+                self._publish_success_event(metadata)
 
-                    self.metrics.increment(
-                        "ingestion_files_total",
-                        tags={**metric_tags, "status": "success"},
-                    )
-                    self.metrics.increment(
-                        "ingestion_documents_total",
-                        tags={**metric_tags, "status": "success"},
-                    )
-                    self.metrics.observe(
-                        "ingestion_file_size_bytes",
-                        file_size,
-                        tags=metric_tags,
-                    )
-
-                    files_processed += 1
+                # Advance the watermark only once the archive is announced, so a
+                # failed publish re-ingests the same range on retry
+                self._save_watermark(source_cfg.name, watermark_key, file_path, file_content)
+                if delta_offset:
+                    self.metrics.increment("ingestion_delta_archives_total", tags=metric_tags)
 
-                duration_seconds = time.monotonic() - started_monotonic
-                self.logger.info(
-                    "Ingestion completed",
-                    source_name=source_cfg.name,
-                    files_processed=files_processed,
-                    files_skipped=files_skipped,
-                    duration_seconds=duration_seconds,
+                self.metrics.increment(
+                    "ingestion_files_total",
+                    tags={**metric_tags, "status": "success"},
                 )
-                self._record_success_metrics(
-                    metric_tags,
-                    duration_seconds,
-                    files_processed,
-                    files_skipped,
+                self.metrics.increment(
+                    "ingestion_documents_total",
+                    tags={**metric_tags, "status": "success"},
                 )
-
-                # Update source status tracking
-                self._update_source_status(
-                    source_cfg.name,
-                    status="success",
-                    files_processed=files_processed,
-                    files_skipped=files_skipped,
+                self.metrics.observe(
+                    "ingestion_file_size_bytes",
+                    file_size,
+                    tags=metric_tags,
                 )
 
-                # Success - method returns normally without exception
-                return
+                files_processed += 1
 
-            except (FetchError, SourceConfigurationError):
-                # Don't retry configuration or already-handled fetch errors
-                raise
-            except Exception as e:
-                last_error = f"Unexpected error: {str(e)}"
-                retry_count += 1
-                self.logger.error(
-                    "Ingestion error",
-                    error=last_error,
+            duration_seconds = time.monotonic() - started_monotonic
+            self.logger.info(
+                "Ingestion completed",
+                source_name=source_cfg.name,
+                files_processed=files_processed,
+                files_skipped=files_skipped,
+                duration_seconds=duration_seconds,
+            )
+            self._record_success_metrics(
+                metric_tags,
+                duration_seconds,
+                files_processed,
+                files_skipped,
+            )
+
+            # Update source status tracking
+            self._update_source_status(
+                source_cfg.name,
+                status="success",
+                files_processed=files_processed,
+                files_skipped=files_skipped,
+            )
+
+            # Success - no retry needed
+            return None
+
+        except (FetchError, SourceConfigurationError):
+            # Don't retry configuration or already-handled fetch errors
+            raise
+        except Exception as e:
+            run.last_error = f"Unexpected error: {str(e)}"
+            run.retry_count += 1
+            self.logger.error(
+                "Ingestion error",
+                error=run.last_error,
+                attempt=attempt + 1,
+                source_name=source_cfg.name,
+            )
+
+            # Report error with context
+            self.error_reporter.report(
+                e,
+                context={
+                    "operation": "ingest_archive",
+                    "source_name": source_cfg.name,
+                    "source_type": source_cfg.source_type,
+                    "attempt": attempt + 1,
+                    "max_retries": max_retries,
+                },
+            )
+
+            if attempt < max_retries:
+                request_timeout = (
+                    self.config.service_settings.request_timeout_seconds
+                    if self.config.service_settings.request_timeout_seconds is not None
+                    else 60
+                )
+                wait_time = request_timeout * (2**attempt)
+                self.logger.warning(
+                    "Retrying after error",
+                    wait_time_seconds=wait_time,
                     attempt=attempt + 1,
                     source_name=source_cfg.name,
                 )
-
-                # Report error with context
-                self.error_reporter.report(
-                    e,
-                    context={
-                        "operation": "ingest_archive",
-                        "source_name": source_cfg.name,
-                        "source_type": source_cfg.source_type,
-                        "attempt": attempt + 1,
-                        "max_retries": max_retries,
-                    },
-                )
-
-                if attempt < max_retries:
-                    request_timeout = (
-                        self.config.service_settings.request_timeout_seconds
-                        if self.config.service_settings.request_timeout_seconds is not None
-                        else 60
+                return wait_time
+            else:
+                # All retries exhausted - raise IngestionError
+                try:
+                    self._publish_failure_event(
+                        source_cfg,
+                        run.last_error,
+                        "UnexpectedError",
+                        run.retry_count,
+                        ingestion_started_at,
                     )
-                    wait_time = request_timeout * (2**attempt)
-                    self.logger.warning(
-                        "Retrying after error",
-                        wait_time_seconds=wait_time,
-                        attempt=attempt + 1,
+                except Exception as publish_error:
+                    # Event publishing failed but ingestion definitely failed too
+                    # Log both errors to ensure visibility
+                    self.logger.error(
+                        "Failed to publish ingestion failure event",
                         source_name=source_cfg.name,
+                        original_error=run.last_error,
+                        publish_error=str(publish_error),
                     )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # All retries exhausted - raise IngestionError
-                    try:
-                        self._publish_failure_event(
-                            source_cfg,
-                            last_error,
-                            "UnexpectedError",
-                            retry_count,
-                            ingestion_started_at,
-                        )
-                    except Exception as publish_error:
-                        # Event publishing failed but ingestion definitely failed too
-                        # Log both errors to ensure visibility
-                        self.logger.error(
-                            "Failed to publish ingestion failure event",
-                            source_name=source_cfg.name,
-                            original_error=last_error,
-                            publish_error=str(publish_error),
-                        )
-                        # Wrap both errors in IngestionError
-                        self._record_failure_metrics(metric_tags, started_monotonic)
-                        raise IngestionError(
-                            f"Ingestion failed: {last_error}. Event publish also failed: {publish_error}"
-                        ) from e
+                    # Wrap both errors in IngestionError
                     self._record_failure_metrics(metric_tags, started_monotonic)
-                    # Update source status tracking
-                    self._update_source_status(
-                        source_cfg.name,
-                        status="failed",
-                        error=last_error,
-                    )
-                    raise IngestionError(last_error) from e
-
-        # Should never reach here due to loop structure, but add safety
-        raise IngestionError(f"Ingestion failed for unknown reason (source: {source_cfg.name})")
+                    raise IngestionError(
+                        f"Ingestion failed: {run.last_error}. Event publish also failed: {publish_error}"
+                    ) from e
+                self._record_failure_metrics(metric_tags, started_monotonic)
+                # Update source status tracking
+                self._update_source_status(
+                    source_cfg.name,
+                    status="failed",
+                    error=run.last_error,
+                )
+                raise IngestionError(run.last_error) from e
 
     def ingest_all_enabled_sources(self) -> dict[str, Exception | None]:
         """Ingest from all enabled sources.
 
-        Attempts ingestion for each enabled source, catching exceptions to allow
-        other sources to be processed even if one fails.
+        Sources are ingested concurrently, at most ``concurrent_sources`` at a
+        time and ``max_concurrent_per_host`` per remote host. A source waiting
+        to retry does not occupy a worker. Exceptions are caught per source
+        so that one failing source does not affect the others.
 
         Returns:
             Dictionary mapping source name to exception (None if successful).
             - None value indicates success
             - Exception object indicates failure with details
         """
-        results: dict[str, Exception | None] = {}
+        settings = self.config.service_settings
+        max_workers = max(1, settings.concurrent_sources or 1)
+        max_per_host = max(1, settings.max_concurrent_per_host or max_workers)
+
+        jobs = [
+            IngestionJob(name=source.name, host=source_host(source), attempt=self._source_attempt_runner(source))
+            for source in self._get_enabled_sources_for_ingestion()
+        ]
+        return IngestionExecutor(max_workers=max_workers, max_per_host=max_per_host).run(jobs)
+
+    def _source_attempt_runner(self, source: SourceConfig) -> Callable[[], float | None]:
+        """Build the callable that runs the next ingestion attempt for a source.
 
-        for source in self._get_enabled_sources_for_ingestion():
-            self.logger.info("Starting source ingestion", source_name=source.name)
+        Args:
+            source: Source configuration
+
+        Returns:
+            Callable returning None when the source is done, or the delay before its next attempt
+        """
+        run: _IngestionRun | None = None
+
+        def attempt() -> float | None:
+            nonlocal run
+            if run is None:
+                self.logger.info("Starting source ingestion", source_name=source.name)
+                run = self._start_ingestion_run(source)
             try:
-                self.ingest_archive(source)
-                results[source.name] = None  # Success
-                self.logger.info(
-                    "Source ingestion finished",
-                    source_name=source.name,
-                    status="success",
-                )
+                wait_time = self._ingest_attempt(run)
             except Exception as e:
-                results[source.name] = e  # Store exception
                 self.logger.error(
                     "Source ingestion failed",
                     source_name=source.name,
@@ -1073,8 +1233,16 @@ class IngestionService:
                     error=str(e),
                     error_type=type(e).__name__,
                 )
+                raise
+            if wait_time is None:
+                self.logger.info(
+                    "Source ingestion finished",
+                    source_name=source.name,
+                    status="success",
+                )
+            return wait_time
 
-        return results
+        return attempt
 
     def _calculate_directory_hash(self, dir_path: str) -> str:
         """Calculate hash of all files in a directory.
@@ -1128,7 +1296,7 @@ class IngestionService:
 
         try:
             os.makedirs(os.path.dirname(log_path), exist_ok=True)
-            with open(log_path, "a") as f:
+            with self._state_lock, open(log_path, "a") as f:
                 f.write(json.dumps(metadata.to_dict()) + "\n")
             self.logger.debug(
                 "Saved ingestion log entry",
@@ -1191,6 +1359,160 @@ class IngestionService:
                 )
             return False
 
+    def _load_watermarks(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Load delta ingestion watermarks from the metadata directory.
+
+        A missing or unreadable watermark file is treated as empty, which makes
+        the next run ingest every file in full.
+
+        Returns:
+            Mapping of source name to per-file watermarks
+        """
+        if self._watermarks is None:
+            try:
+                with open(self._watermarks_path) as f:
+                    loaded = json.load(f)
+                self._watermarks = loaded if isinstance(loaded, dict) else {}
+            except FileNotFoundError:
+                self._watermarks = {}
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to load ingestion watermarks; falling back to full ingestion",
+                    error=str(e),
+                    path=self._watermarks_path,
+                )
+                self._watermarks = {}
+        return self._watermarks
+
+    def _persist_watermarks(self) -> None:
+        """Atomically write the watermark file.
+
+        Best-effort like the ingestion log: a lost update only means the next
+        run ingests the affected file in full.
+        """
+        tmp_path = f"{self._watermarks_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._watermarks or {}, f)
+            os.replace(tmp_path, self._watermarks_path)
+        except Exception as e:
+            self.logger.error("Failed to save ingestion watermarks", error=str(e), exc_info=True)
+            self.error_reporter.report(
+                e,
+                context={"operation": "save_ingestion_watermarks", "path": self._watermarks_path},
+            )
+
+    def _find_delta_offset(self, source_name: str, watermark_key: str, file_path: str, content: bytes) -> int | None:
+        """Determine whether a fetched file is a pure append to what was last ingested.
+
+        Args:
+            source_name: Name of the source
+            watermark_key: File path relative to the source's fetch directory
+            file_path: Path of the fetched file
+            content: Current file content
+
+        Returns:
+            Byte offset where the new data starts (equal to len(content) when the
+            file is unchanged), or None if the file must be ingested in full
+        """
+        if not self.config.service_settings.enable_incremental:
+            return None
+
+        with self._state_lock:
+            watermark = self._load_watermarks().get(source_name, {}).get(watermark_key)
+        if not watermark:
+            return None
+
+        offset = watermark.get("offset")
+        if not isinstance(offset, int) or offset <= 0 or offset > len(content):
+            return None
+
+        # Same size and modification time as when last ingested: unchanged, no need to hash
+        mtime_ns = watermark.get("mtime_ns")
+        if offset == len(content) and mtime_ns is not None and mtime_ns == self._file_mtime_ns(file_path):
+            return offset
+
+        # Only mbox files can be split by byte range into self-contained archives
+        if not content.startswith(b"From "):
+            return None
+
+        if hashlib.sha256(memoryview(content)[:offset]).hexdigest() != watermark.get("prefix_sha256"):
+            self.logger.info(
+                "Previously ingested content changed; falling back to full ingestion",
+                source_name=source_name,
+                file=watermark_key,
+                offset=offset,
+            )
+            return None
+
+        # The tail must start on a message boundary to parse as an mbox of its own
+        at_boundary = content[offset - 1 : offset] == b"\n" and content.startswith(b"From ", offset)
+        if offset < len(content) and not at_boundary:
+            self.logger.info(
+                "Appended data does not start at an mbox message boundary; falling back to full ingestion",
+                source_name=source_name,
+                file=watermark_key,
+                offset=offset,
+            )
+            return None
+
+        return offset
+
+    def _save_watermark(self, source_name: str, watermark_key: str, file_path: str, content: bytes) -> None:
+        """Record that a file has been ingested up to its current length.
+
+        Args:
+            source_name: Name of the source
+            watermark_key: File path relative to the source's fetch directory
+            file_path: Path of the fetched file
+            content: File content that is now fully ingested
+        """
+        watermark = {
+            "offset": len(content),
+            "prefix_sha256": hashlib.sha256(content).hexdigest(),
+            "mtime_ns": self._file_mtime_ns(file_path),
+            "updated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        }
+        with self._state_lock:
+            self._load_watermarks().setdefault(source_name, {})[watermark_key] = watermark
+            self._persist_watermarks()
+
+    @staticmethod
+    def _file_mtime_ns(file_path: str) -> int | None:
+        """Return the modification time of a file in nanoseconds, or None if it cannot be read."""
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _clear_watermarks(self, source_name: str) -> None:
+        """Forget the watermarks of a source so its files are next ingested in full.
+
+        Args:
+            source_name: Name of the source
+        """
+        with self._state_lock:
+            if self._load_watermarks().pop(source_name, None) is not None:
+                self._persist_watermarks()
+
+    @staticmethod
+    def _delta_archive_path(file_path: str, offset: int) -> str:
+        """Name a delta archive after its file and start offset.
+
+        Keeps the original extension so the archive format is still detected, and
+        gives each delta a distinct name so archive stores keyed by file name do
+        not overwrite earlier archives of the same file.
+
+        Args:
+            file_path: Path of the fetched file
+            offset: Byte offset where the delta starts
+
+        Returns:
+            Path to record for the delta archive
+        """
+        root, ext = os.path.splitext(file_path)
+        return f"{root}.delta-{offset}{ext}"
+
     def _write_archive_record(
         self,
         archive_id: str,
@@ -1342,11 +1664,12 @@ class IngestionService:
         try:
             event = ArchiveIngestedEvent(data=event_data)
 
-            self.publisher.publish(
-                exchange="copilot.events",
-                routing_key="archive.ingested",
-                event=event.to_dict(),
-            )
+            with self._publish_lock:
+                self.publisher.publish(
+                    exchange="copilot.events",
+                    routing_key="archive.ingested",
+                    event=event.to_dict(),
+                )
         except Exception as e:
             self.logger.error(
                 "Failed to publish success event",
@@ -1400,11 +1723,12 @@ class IngestionService:
                 }
             )
 
-            self.publisher.publish(
-                exchange="copilot.events",
-                routing_key="archive.ingestion.failed",
-                event=event.to_dict(),
-            )
+            with self._publish_lock:
+                self.publisher.publish(
+                    exchange="copilot.events",
+                    routing_key="archive.ingestion.failed",
+                    event=event.to_dict(),
+                )
         except Exception as e:
             self.logger.error(
                 "Failed to publish failure event",
@@ -1891,25 +2215,26 @@ class IngestionService:
         """
         now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
-        if source_name not in self._source_status:
-            self._source_status[source_name] = {}
-
-        self._source_status[source_name].update(
-            {
-                "last_run_at": now,
-                "last_run_status": status,
-                "last_error": error,
-                "files_processed": files_processed,
-                "files_skipped": files_skipped,
-            }
-        )
+        with self._state_lock:
+            if source_name not in self._source_status:
+                self._source_status[source_name] = {}
+
+            self._source_status[source_name].update(
+                {
+                    "last_run_at": now,
+                    "last_run_status": status,
+                    "last_error": error,
+                    "files_processed": files_processed,
+                    "files_skipped": files_skipped,
+                }
+            )
 
-        # Update global stats
-        if status == "success":
-            total_ingested_raw = self._stats.get("total_files_ingested")
-            try:
-                total_ingested = int(total_ingested_raw) if total_ingested_raw is not None else 0
-            except (TypeError, ValueError):
-                total_ingested = 0
-            self._stats["total_files_ingested"] = total_ingested + files_processed
-            self._stats["last_ingestion_at"] = now
+            # Update global stats
+            if status == "success":
+                total_ingested_raw = self._stats.get("total_files_ingested")
+                try:
+                    total_ingested = int(total_ingested_raw) if total_ingested_raw is not None else 0
+                except (TypeError, ValueError):
+                    total_ingested = 0
+                self._stats["total_files_ingested"] = total_ingested + files_processed
+                self._stats["last_ingestion_at"] = now
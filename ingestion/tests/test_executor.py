@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Unit tests for the concurrent ingestion executor."""
+
+import threading
+import time
+
+import pytest
+from app.executor import IngestionExecutor, IngestionJob, source_host
+from copilot_archive_fetcher import SourceConfig
+
+
+class _ConcurrencyTracker:
+    """Records how many jobs run at once, overall and per host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.events: list[str] = []
+
+    def job(self, name, host, duration, retry_delays=()):
+        delays = list(retry_delays)
+
+        def attempt():
+            with self._lock:
+                self.active[host] = self.active.get(host, 0) + 1
+                self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+                self.events.append(f"start:{name}")
+            time.sleep(duration)
+            with self._lock:
+                self.active[host] -= 1
+            return delays.pop(0) if delays else None
+
+        return IngestionJob(name=name, host=host, attempt=attempt)
+
+
+def test_sources_on_different_hosts_run_concurrently():
+    """Test that a run takes about as long as the slowest source, not the sum."""
+    tracker = _ConcurrencyTracker()
+    jobs = [tracker.job(f"s{i}", f"host{i}", 0.2) for i in range(4)]
+
+    started = time.monotonic()
+    results = IngestionExecutor(max_workers=4, max_per_host=1).run(jobs)
+
+    assert time.monotonic() - started < 0.6
+    assert results == {"s0": None, "s1": None, "s2": None, "s3": None}
+
+
+def test_per_host_limit():
+    """Test that sources on the same host respect the per-host limit."""
+    tracker = _ConcurrencyTracker()
+    jobs = [tracker.job(f"a{i}", "shared", 0.05) for i in range(4)] + [tracker.job("b", "other", 0.05)]
+
+    IngestionExecutor(max_workers=4, max_per_host=2).run(jobs)
+
+    assert tracker.peak["shared"] == 2
+    assert tracker.peak["other"] == 1
+
+
+def test_retry_wait_does_not_hold_worker():
+    """Test that a source waiting to retry lets other sources use its worker."""
+    tracker = _ConcurrencyTracker()
+    flaky = tracker.job("flaky", "h1", 0.01, retry_delays=[0.3])
+    steady = tracker.job("steady", "h2", 0.01)
+
+    results = IngestionExecutor(max_workers=1, max_per_host=1).run([flaky, steady])
+
+    assert tracker.events == ["start:flaky", "start:steady", "start:flaky"]
+    assert results == {"flaky": None, "steady": None}
+
+
+def test_failures_are_returned_per_source():
+    """Test that an exception from one source is returned without affecting others."""
+    error = RuntimeError("boom")
+
+    def failing():
+        raise error
+
+    jobs = [
+        IngestionJob(name="bad", host="h", attempt=failing),
+        IngestionJob(name="good", host="h", attempt=lambda: None),
+    ]
+    results = IngestionExecutor(max_workers=2, max_per_host=1).run(jobs)
+
+    assert results == {"bad": error, "good": None}
+
+
+def test_rejects_non_positive_limits():
+    """Test that limits must be positive."""
+    with pytest.raises(ValueError):
+        IngestionExecutor(max_workers=0, max_per_host=1)
+
+
+@pytest.mark.parametrize(
+    "source_type,url,expected",
+    [
+        ("http", "https://Lists.Example.org/archive/2024.mbox", "lists.example.org"),
+        ("rsync", "rsync://rsync.ietf.org/mailman-archive/quic/", "rsync.ietf.org"),
+        ("rsync", "user@mirror.example.org:archives/", "mirror.example.org"),
+        ("imap", "imap.example.com", "imap.example.com"),
+        ("local", "/data/archives/test.mbox", "localhost"),
+        ("local", "file:///data/archives/test.mbox", "localhost"),
+    ],
+)
+def test_source_host(source_type, url, expected):
+    """Test host extraction for each source type."""
+    assert source_host(SourceConfig(name="s", source_type=source_type, url=url)) == expected
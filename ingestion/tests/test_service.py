@@ -6,6 +6,8 @@
 import json
 import os
 import tempfile
+import threading
+import time
 
 import pytest
 from app.service import IngestionService
@@ -1256,3 +1258,163 @@ def test_delete_source_cascade_publishes_events(tmp_path):
 
     # Verify correlation_id matches between events
     assert deletion_requested["event"]["data"]["correlation_id"] == cleanup_progress["event"]["data"]["correlation_id"]
+
+
+def _make_delta_test_service(tmp_path, enable_incremental=True):
+    config = make_config(storage_path=str(tmp_path / "storage"))
+    config.service_settings.enable_incremental = enable_incremental
+    return IngestionService(
+        config=config,
+        publisher=_make_noop_publisher(),
+        document_store=_make_inmemory_store(),
+        logger=_make_silent_logger(),
+        metrics=_make_noop_metrics(),
+        error_reporter=_make_silent_error_reporter(),
+        # Keep archives apart from the fetch directory, as in deployments
+        archive_store=make_archive_store(str(tmp_path / "archives")),
+    )
+
+
+_MBOX_MESSAGE_1 = b"From alice@example.com Mon Jan  1 00:00:00 2024\nSubject: One\n\nFirst\n"
+_MBOX_MESSAGE_2 = b"From bob@example.com Tue Jan  2 00:00:00 2024\nSubject: Two\n\nSecond\n"
+
+
+def test_appended_mbox_ingested_as_delta_archive(tmp_path):
+    """Test that data appended to an mbox is ingested as a delta archive of only the new messages."""
+    service = _make_delta_test_service(tmp_path)
+    mbox_path = tmp_path / "2024-01.mbox"
+    mbox_path.write_bytes(_MBOX_MESSAGE_1)
+    source = make_source(name="test-source", url=str(mbox_path))
+
+    service.ingest_archive(source, max_retries=0)
+    mbox_path.write_bytes(_MBOX_MESSAGE_1 + _MBOX_MESSAGE_2)
+    service.ingest_archive(source, max_retries=0)
+
+    archives = service.document_store.query_documents("archives", {})
+    assert len(archives) == 2
+    delta = [a for a in archives if a["file_size_bytes"] == len(_MBOX_MESSAGE_2)]
+    assert len(delta) == 1
+    assert service.archive_store.get_archive(delta[0]["_id"]) == _MBOX_MESSAGE_2
+    # The first archive is untouched by the delta
+    first = [a for a in archives if a is not delta[0]][0]
+    assert service.archive_store.get_archive(first["_id"]) == _MBOX_MESSAGE_1
+
+    # Unchanged file is skipped without storing anything
+    service.ingest_archive(source, max_retries=0)
+    assert len(service.document_store.query_documents("archives", {})) == 2
+
+
+def test_unchanged_file_skipped_without_hashing(tmp_path, monkeypatch):
+    """Test that a file with the watermarked size and mtime is skipped before any hashing."""
+    service = _make_delta_test_service(tmp_path)
+    mbox_path = tmp_path / "2024-01.mbox"
+    mbox_path.write_bytes(_MBOX_MESSAGE_1)
+    source = make_source(name="test-source", url=str(mbox_path))
+    service.ingest_archive(source, max_retries=0)
+
+    def fail_sha256(*_args, **_kwargs):
+        raise AssertionError("unchanged file must not be hashed")
+
+    monkeypatch.setattr("app.service.hashlib.sha256", fail_sha256)
+    service.ingest_archive(source, max_retries=0)
+
+    assert len(service.document_store.query_documents("archives", {})) == 1
+
+
+def test_incremental_disabled_by_default(tmp_path):
+    """Test that grown files are ingested in full unless delta ingestion is enabled."""
+    service = _make_delta_test_service(tmp_path, enable_incremental=make_config().service_settings.enable_incremental)
+    mbox_path = tmp_path / "2024-01.mbox"
+    mbox_path.write_bytes(_MBOX_MESSAGE_1)
+    source = make_source(name="test-source", url=str(mbox_path))
+
+    service.ingest_archive(source, max_retries=0)
+    mbox_path.write_bytes(_MBOX_MESSAGE_1 + _MBOX_MESSAGE_2)
+    service.ingest_archive(source, max_retries=0)
+
+    sizes = sorted(a["file_size_bytes"] for a in service.document_store.query_documents("archives", {}))
+    assert sizes == [len(_MBOX_MESSAGE_1), len(_MBOX_MESSAGE_1) + len(_MBOX_MESSAGE_2)]
+
+
+def test_changed_prefix_falls_back_to_full_ingestion(tmp_path):
+    """Test that a rewritten mbox is ingested in full rather than as a delta."""
+    service = _make_delta_test_service(tmp_path)
+    mbox_path = tmp_path / "2024-01.mbox"
+    mbox_path.write_bytes(_MBOX_MESSAGE_1)
+    source = make_source(name="test-source", url=str(mbox_path))
+
+    service.ingest_archive(source, max_retries=0)
+    rewritten = _MBOX_MESSAGE_1.replace(b"First", b"Edited") + _MBOX_MESSAGE_2
+    mbox_path.write_bytes(rewritten)
+    service.ingest_archive(source, max_retries=0)
+
+    sizes = sorted(a["file_size_bytes"] for a in service.document_store.query_documents("archives", {}))
+    assert sizes == [len(_MBOX_MESSAGE_1), len(rewritten)]
+
+
+def test_delete_archives_for_source_clears_watermarks(tmp_path):
+    """Test that deleting a source's archives forces full re-ingestion of grown files."""
+    service = _make_delta_test_service(tmp_path)
+    mbox_path = tmp_path / "2024-01.mbox"
+    mbox_path.write_bytes(_MBOX_MESSAGE_1)
+    source = make_source(name="test-source", url=str(mbox_path))
+    service.ingest_archive(source, max_retries=0)
+
+    service.delete_archives_for_source("test-source")
+    mbox_path.write_bytes(_MBOX_MESSAGE_1 + _MBOX_MESSAGE_2)
+    service.ingest_archive(source, max_retries=0)
+
+    archives = service.document_store.query_documents("archives", {})
+    assert [a["file_size_bytes"] for a in archives] == [len(_MBOX_MESSAGE_1) + len(_MBOX_MESSAGE_2)]
+    with open(service._watermarks_path) as f:
+        assert json.load(f)["test-source"]["2024-01.mbox"]["offset"] == len(_MBOX_MESSAGE_1) + len(_MBOX_MESSAGE_2)
+
+
+def test_concurrent_sources_serialize_store_calls(tmp_path):
+    """Test that two sources ingested at once never call the shared stores concurrently."""
+    sources = []
+    for name, content in (("source-a", _MBOX_MESSAGE_1), ("source-b", _MBOX_MESSAGE_2)):
+        mbox_path = tmp_path / f"{name}.mbox"
+        mbox_path.write_bytes(content)
+        sources.append(make_source(name=name, url=str(mbox_path)))
+    config = make_config(storage_path=str(tmp_path / "storage"))
+    config.service_settings.sources_store_type = "file"
+    config.service_settings.concurrent_sources = 2
+    service = IngestionService(
+        config=config,
+        publisher=_make_noop_publisher(),
+        sources=sources,
+        document_store=_make_inmemory_store(),
+        logger=_make_silent_logger(),
+        metrics=_make_noop_metrics(),
+        error_reporter=_make_silent_error_reporter(),
+        archive_store=make_archive_store(str(tmp_path / "archives")),
+    )
+
+    active = 0
+    max_active = 0
+    counter_lock = threading.Lock()
+    store_archive = service.archive_store.store_archive
+
+    def tracking_store_archive(**kwargs):
+        nonlocal active, max_active
+        with counter_lock:
+            active += 1
+            max_active = max(max_active, active)
+        try:
+            # Widen the window in which the other source could enter
+            time.sleep(0.05)
+            return store_archive(**kwargs)
+        finally:
+            with counter_lock:
+                active -= 1
+
+    service.archive_store.store_archive = tracking_store_archive
+    results = service.ingest_all_enabled_sources()
+
+    assert results == {"source-a": None, "source-b": None}
+    assert max_active == 1
+    archives = service.document_store.query_documents("archives", {})
+    assert sorted(a["source"] for a in archives) == ["source-a", "source-b"]
+    for archive in archives:
+        assert service.archive_store.archive_exists(archive["_id"])
@@ -206,11 +206,11 @@ class TestSourceBackends:
         # Add a source via API
         service.create_source(make_source(name="api-source", enabled=True))
 
-        # Mock ingest_archive to avoid actual ingestion
-        with patch.object(service, "ingest_archive") as mock_ingest:
+        # Mock the ingestion attempt to avoid actual ingestion
+        with patch.object(service, "_ingest_attempt", return_value=None) as mock_ingest:
             results = service.ingest_all_enabled_sources()
 
-            # Should have called ingest_archive for the API-created source
+            # Should have run one ingestion attempt for the API-created source
             assert len(results) == 1
             assert "api-source" in results
             assert results["api-source"] is None  # None means success
@@ -41,8 +41,8 @@ class ThreadChunksSource(ContextSource):
         """Retrieve candidate chunks for a thread.
 
         Queries the vector store for chunks with high similarity to the thread's
-        mean embedding or a specific query embedding. Returns chunks with their
-        similarity scores.
+        mean embedding or a specific query embedding, filtered to the thread's
+        chunks by metadata. Returns chunks with their similarity scores.
 
         Args:
             thread_id: Thread identifier
@@ -99,7 +99,8 @@ class ThreadChunksSource(ContextSource):
             return chunks
 
         try:
-            results = self.vector_store.query(query_vector=query_vector, top_k=top_k)
+            # Restrict the search to this thread so top_k counts only its chunks
+            results = self.vector_store.query(query_vector=query_vector, top_k=top_k, filter={"thread_id": thread_id})
 
             # Normalize results into (chunk_id, score, metadata)
             normalized: list[tuple[str, float, dict[str, Any]]] = []
@@ -122,7 +123,7 @@ class ThreadChunksSource(ContextSource):
 
                 normalized.append((str(result_chunk_id), float(result_score), result_metadata))
 
-            # Filter by min_score (thread filtering happens after doc fetch if metadata missing)
+            # Filter by min_score (thread_id is re-checked after doc fetch as a safeguard)
             normalized = [(cid, score, meta) for (cid, score, meta) in normalized if score >= min_score]
 
             if not normalized:
@@ -11,6 +11,7 @@ from typing import Any
 
 from copilot_error_reporting import ErrorReporter
 from copilot_event_retry import (
+    DelayedRedelivery,
     DocumentNotFoundError,
     RetryConfig,
     handle_event_with_retry,
@@ -41,6 +42,9 @@ logger = get_logger(__name__)
 # This can be increased for higher quality selection at the cost of performance.
 CANDIDATE_POOL_SIZE_MULTIPLIER = 2
 
+# Message metadata in the retrieved context; the chunks already carry the text
+MESSAGE_METADATA_PROJECTION = {"body_raw": 0, "body_normalized": 0, "body_html": 0}
+
 
 class OrchestrationService:
     """Main orchestration service for coordinating summarization workflows."""
@@ -190,6 +194,7 @@ class OrchestrationService:
                     collection="threads",
                     filter_dict={"summary_id": None},
                     limit=500,
+                    projection={"thread_id": 1},
                 )
 
                 if not threads:
@@ -209,6 +214,7 @@ class OrchestrationService:
                     collection="chunks",
                     filter_dict={"thread_id": {"$in": thread_ids}},
                     limit=len(thread_ids) * 1000,
+                    projection={"thread_id": 1, "embedding_generated": 1},
                 )
 
                 # Group chunks by thread_id for efficient per-thread checks
@@ -306,7 +312,7 @@ class OrchestrationService:
                 idempotency_key = f"orchestrator-{chunk_ids_str}"
 
             # Wrap processing with retry logic
-            handle_event_with_retry(
+            handled = handle_event_with_retry(
                 handler=lambda e: self.process_embeddings(e.get("data", {})),
                 event=event,
                 config=self.retry_config,
@@ -314,9 +320,15 @@ class OrchestrationService:
                 metrics_collector=self.metrics_collector,
                 error_reporter=self.error_reporter,
                 service_name="orchestrator",
+                redelivery=(
+                    DelayedRedelivery(self.publisher, "copilot.events", "embeddings.generated")
+                    if self.retry_config.delayed_redelivery
+                    else None
+                ),
             )
 
-            self.events_processed += 1
+            if handled:
+                self.events_processed += 1
 
         except Exception as e:
             logger.error(f"Error handling EmbeddingsGenerated event: {e}", exc_info=True)
@@ -392,7 +404,9 @@ class OrchestrationService:
         thread_ids: set[str] = set()
 
         # Query document store for chunks by _id
-        chunks = self.document_store.query_documents("chunks", {"_id": {"$in": chunk_ids}}, limit=len(chunk_ids))
+        chunks = self.document_store.query_documents(
+            "chunks", {"_id": {"$in": chunk_ids}}, limit=len(chunk_ids), projection={"thread_id": 1}
+        )
 
         if not chunks:
             message = f"No chunks found in database for {len(chunk_ids)} IDs"
@@ -635,7 +649,10 @@ class OrchestrationService:
 
             if message_doc_ids:
                 messages = self.document_store.query_documents(
-                    "messages", {"_id": {"$in": message_doc_ids}}, limit=len(message_doc_ids)
+                    "messages",
+                    {"_id": {"$in": message_doc_ids}},
+                    limit=len(message_doc_ids),
+                    projection=MESSAGE_METADATA_PROJECTION,
                 )
 
             context = {
@@ -253,7 +253,9 @@ class TestThreadChunksSource:
         )
 
         # Verify vector store was queried
-        mock_vector_store.query.assert_called_once_with(query_vector=query_vector, top_k=3)
+        mock_vector_store.query.assert_called_once_with(
+            query_vector=query_vector, top_k=3, filter={"thread_id": "thread1"}
+        )
         
         # Verify document store was queried for chunks with _id: {$in: ...} filter
         mock_doc_store.query_documents.assert_called_once()
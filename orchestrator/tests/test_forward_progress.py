@@ -119,7 +119,7 @@ class TestOrchestratorForwardProgress:
         ]
 
         # Mock query responses
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads_without_summaries
             elif collection == "chunks":
@@ -138,10 +138,12 @@ class TestOrchestratorForwardProgress:
         thread_query_call = [c for c in calls if get_collection_from_call(c) == "threads"][0]
         assert thread_query_call[1].get("filter_dict") == {"summary_id": None}
         assert thread_query_call[1].get("limit") == 500
+        assert thread_query_call[1].get("projection") == {"thread_id": 1}
 
-        # Verify chunks were queried in batch
+        # Verify chunks were queried in batch, fetching only the fields the check reads
         chunk_query_call = [c for c in calls if get_collection_from_call(c) == "chunks"][0]
         assert chunk_query_call[1].get("filter_dict") == {"thread_id": {"$in": ["thread-001", "thread-002"]}}
+        assert chunk_query_call[1].get("projection") == {"thread_id": 1, "embedding_generated": 1}
 
         # Verify both threads were published (2 SummarizationRequested events)
         publish_calls = [
@@ -166,7 +168,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-002", "embedding_generated": False, "_id": "chunk-004"},  # Missing embedding
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads_without_summaries
             elif collection == "chunks":
@@ -200,7 +202,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-001", "embedding_generated": True, "_id": "chunk-001"},
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads_without_summaries
             elif collection == "chunks":
@@ -230,7 +232,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-001", "embedding_generated": True, "_id": "chunk-001"},
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads
             elif collection == "chunks":
@@ -354,7 +356,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-001", "embedding_generated": True, "_id": "chunk-001"},
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads
             elif collection == "chunks":
@@ -385,7 +387,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": f"thread-{i:03d}", "embedding_generated": True, "_id": f"chunk-{i:03d}"} for i in range(10)
         ]
 
-        def query_side_effect(collection, filter_dict, limit=None):
+        def query_side_effect(collection, filter_dict, limit=None, projection=None):
             if collection == "threads":
                 return threads
             elif collection == "chunks":
@@ -439,7 +441,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-002", "embedding_generated": True, "_id": "chunk-002"},
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads
             elif collection == "chunks":
@@ -474,7 +476,7 @@ class TestOrchestratorForwardProgress:
             {"thread_id": "thread-003", "embedding_generated": True, "_id": "chunk-003"},
         ]
 
-        def query_side_effect(collection, filter_dict=None, limit=None):
+        def query_side_effect(collection, filter_dict=None, limit=None, projection=None):
             if collection == "threads":
                 return threads
             elif collection == "chunks":
@@ -5,11 +5,13 @@
 
 import logging
 import mailbox
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from email.header import decode_header
 from email.message import Message
+from email.parser import BytesHeaderParser
 from email.utils import parseaddr, parsedate_to_datetime
-from typing import Any
+from typing import Any, BinaryIO
 
 from .draft_detector import DraftDetector
 from .exceptions import (
@@ -21,6 +23,44 @@ from .normalizer import TextNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Parser instance used by parse_raw_messages_in_worker() inside pool worker processes
+_worker_parser: "MessageParser | None" = None
+
+
+def init_parser_worker(parser: "MessageParser") -> None:
+    """Install the parser used by this worker process.
+
+    Intended as a ProcessPoolExecutor initializer so the parser (and its
+    normalizer/draft detector configuration) is pickled once per worker
+    rather than once per task.
+
+    Args:
+        parser: Parser instance to use in this process
+    """
+    global _worker_parser
+    _worker_parser = parser
+
+
+def parse_raw_messages_in_worker(
+    raw_messages: list[bytes],
+    archive_id: str,
+    start_index: int = 0,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Parse a batch of raw mbox messages in a pool worker process.
+
+    Args:
+        raw_messages: Raw message bytes, each starting with its ``From `` line
+        archive_id: Archive identifier for tracking
+        start_index: Position of the first message in the archive (for error messages)
+
+    Returns:
+        Tuple of (parsed messages in input order, per-message error descriptions)
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = MessageParser()
+    return _worker_parser.parse_raw_messages(raw_messages, archive_id, start_index)
+
 
 class MessageParser:
     """Parses email messages from mbox format."""
@@ -53,28 +93,11 @@ class MessageParser:
             MboxFileError: If the mbox file cannot be opened or read
             MessageParsingError: If critical parsing errors occur (aggregated)
         """
-        parsed_messages = []
-        errors = []
+        errors: list[str] = []
 
         try:
-            mbox = mailbox.mbox(mbox_path)
-
-            for idx, message in enumerate(mbox):
-                try:
-                    parsed = self.parse_message(message, archive_id)
-                    parsed_messages.append(parsed)
-                except RequiredFieldMissingError as e:
-                    # Required field missing - skip message but collect error
-                    error_msg = f"Message {idx}: {str(e)}"
-                    logger.warning(error_msg)
-                    errors.append(error_msg)
-                    continue
-                except Exception as e:
-                    # Unexpected parsing error - skip message but collect error
-                    error_msg = f"Failed to parse message {idx}: {str(e)}"
-                    logger.warning(error_msg)
-                    errors.append(error_msg)
-                    continue
+            with open(mbox_path, "rb") as stream:
+                parsed_messages = list(self.iter_mbox(stream, archive_id, errors))
 
             logger.info(f"Parsed {len(parsed_messages)} messages from {mbox_path}")
 
@@ -97,6 +120,194 @@ class MessageParser:
 
         return parsed_messages
 
+    def iter_mbox(
+        self,
+        stream: BinaryIO,
+        archive_id: str,
+        errors: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Parse messages from an mbox byte stream one at a time.
+
+        Unlike parse_mbox(), this never holds more than one raw message in
+        memory and does not require the archive to exist on disk, so peak
+        memory stays flat regardless of archive size.
+
+        Messages that fail to parse are skipped and described in ``errors``
+        (if provided), mirroring parse_mbox(). Callers decide how to treat
+        an archive where every message failed.
+
+        Args:
+            stream: Readable binary stream positioned at the start of an mbox
+            archive_id: Archive identifier for tracking
+            errors: Optional list that receives per-message error descriptions
+
+        Yields:
+            Parsed message dictionaries, in archive order
+
+        Raises:
+            MboxFileError: If the stream cannot be read
+        """
+        yield from self._parse_raw_messages(self.iter_raw_messages(stream), archive_id, errors=errors)
+
+    def iter_mbox_headers(self, stream: BinaryIO) -> Iterator[dict[str, Any]]:
+        """Extract the threading-relevant headers of each message in an mbox stream.
+
+        Only message headers are parsed (no MIME walking, body decoding,
+        normalization or draft detection), which makes this a cheap
+        pre-pass for resolving thread structure before full parsing.
+        Messages without a Message-ID are skipped, as in parse_message().
+
+        Args:
+            stream: Readable binary stream positioned at the start of an mbox
+
+        Yields:
+            Dictionaries with message_id, in_reply_to, references, subject, from and date
+
+        Raises:
+            MboxFileError: If the stream cannot be read
+        """
+        header_parser = BytesHeaderParser()
+        for raw in self._iter_raw_message_bytes(stream):
+            message = header_parser.parsebytes(raw)
+            message_id = self._extract_message_id(message)
+            if not message_id:
+                continue
+            yield {
+                "message_id": message_id,
+                "in_reply_to": self._extract_in_reply_to(message),
+                "references": self._parse_references(message.get("References", "")),
+                "subject": self._decode_header(message.get("Subject", "")),
+                "from": self._parse_address(message.get("From", "")),
+                "date": self._parse_date(message.get("Date")),
+            }
+
+    def iter_raw_messages(self, stream: BinaryIO) -> Iterator[bytes]:
+        """Split an mbox byte stream into raw messages without parsing them.
+
+        Each item includes its ``From `` separator line and can be handed to
+        parse_raw_messages(), possibly in another process.
+
+        Args:
+            stream: Readable binary stream positioned at the start of an mbox
+
+        Yields:
+            Raw bytes of each message, in archive order
+
+        Raises:
+            MboxFileError: If the stream cannot be read
+        """
+        return self._iter_raw_message_bytes(stream, keep_from_line=True)
+
+    def parse_raw_messages(
+        self,
+        raw_messages: list[bytes],
+        archive_id: str,
+        start_index: int = 0,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Parse a batch of raw mbox messages produced by iter_raw_messages().
+
+        Args:
+            raw_messages: Raw message bytes, each starting with its ``From `` line
+            archive_id: Archive identifier for tracking
+            start_index: Position of the first message in the archive (for error messages)
+
+        Returns:
+            Tuple of (parsed messages in input order, per-message error descriptions)
+        """
+        errors: list[str] = []
+        messages = list(self._parse_raw_messages(raw_messages, archive_id, start_index=start_index, errors=errors))
+        return messages, errors
+
+    def _parse_raw_messages(
+        self,
+        raw_messages: Iterable[bytes],
+        archive_id: str,
+        start_index: int = 0,
+        errors: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily parse raw mbox messages, skipping (and reporting) failures.
+
+        Args:
+            raw_messages: Raw message bytes, each starting with its ``From `` line
+            archive_id: Archive identifier for tracking
+            start_index: Position of the first message in the archive (for error messages)
+            errors: Optional list that receives per-message error descriptions
+
+        Yields:
+            Parsed message dictionaries, in input order
+        """
+        for idx, raw in enumerate(raw_messages, start=start_index):
+            try:
+                yield self.parse_message(self._message_from_bytes(raw), archive_id)
+            except RequiredFieldMissingError as e:
+                # Required field missing - skip message but collect error
+                error_msg = f"Message {idx}: {str(e)}"
+                logger.warning(error_msg)
+                if errors is not None:
+                    errors.append(error_msg)
+            except Exception as e:
+                # Unexpected parsing error - skip message but collect error
+                error_msg = f"Failed to parse message {idx}: {str(e)}"
+                logger.warning(error_msg)
+                if errors is not None:
+                    errors.append(error_msg)
+
+    def _message_from_bytes(self, raw: bytes) -> mailbox.mboxMessage:
+        """Build an mbox message from raw bytes that start with the ``From `` line.
+
+        Args:
+            raw: Raw message bytes as produced by iter_raw_messages()
+
+        Returns:
+            mboxMessage equivalent to the one produced by mailbox.mbox
+        """
+        from_line, _, body = raw.partition(b"\n")
+        message = mailbox.mboxMessage(body)
+        message.set_from(from_line[5:].decode("ascii", errors="replace").rstrip("\r"))
+        return message
+
+    def _iter_raw_message_bytes(self, stream: BinaryIO, keep_from_line: bool = False) -> Iterator[bytes]:
+        """Split an mbox byte stream on ``From `` separator lines.
+
+        Boundary handling matches mailbox.mbox: a message starts at each line
+        beginning with ``From `` and the single blank line preceding the next
+        separator is not part of the message.
+
+        Args:
+            stream: Readable binary stream positioned at the start of an mbox
+            keep_from_line: Include the ``From `` separator line in each item
+
+        Yields:
+            Raw bytes of each message
+
+        Raises:
+            MboxFileError: If the stream cannot be read
+        """
+        lines: list[bytes] = []
+        in_message = False
+
+        def finish() -> bytes:
+            if lines and lines[-1] in (b"\n", b"\r\n"):
+                lines.pop()
+            return b"".join(lines if keep_from_line else lines[1:])
+
+        try:
+            for line in stream:
+                if line.startswith(b"From "):
+                    if in_message:
+                        yield finish()
+                    lines = [line]
+                    in_message = True
+                elif in_message:
+                    lines.append(line)
+        except OSError as e:
+            error_msg = f"Failed to read mbox stream: {str(e)}"
+            logger.error(error_msg)
+            raise MboxFileError(error_msg) from e
+
+        if in_message:
+            yield finish()
+
     def parse_message(self, message: Message, archive_id: str) -> dict[str, Any]:
         """Parse a single email message.
 
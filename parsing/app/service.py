@@ -3,15 +3,19 @@
 
 """Main parsing service implementation."""
 
-import os
-import tempfile
+import multiprocessing
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO
 
 from copilot_archive_store import ArchiveStore
 from copilot_error_reporting import ErrorReporter
 from copilot_event_retry import (
+    DelayedRedelivery,
     DocumentNotFoundError,
     RetryConfig,
     handle_event_with_retry,
@@ -29,16 +33,23 @@ from copilot_message_bus import (
 from copilot_metrics import MetricsCollector
 from copilot_schema_validation import generate_message_doc_id
 from copilot_storage import DocumentAlreadyExistsError, DocumentStore
+from copilot_storage import DocumentNotFoundError as StoredDocumentNotFoundError
 from copilot_storage.validating_document_store import DocumentValidationError
 
-from .parser import MessageParser
+from .exceptions import MessageParsingError
+from .parser import MessageParser, init_parser_worker, parse_raw_messages_in_worker
 from .thread_builder import ThreadBuilder
+from .thread_index import ThreadIndex
 
 logger = get_logger(__name__)
 
 # Valid source types for ArchiveIngested events (must match schema enum)
 VALID_SOURCE_TYPES = ["rsync", "imap", "http", "local"]
 
+# Raw messages sent to a parse worker process per task. Small enough to keep
+# workers evenly loaded, large enough to amortize pickling/IPC overhead.
+PARSE_TASK_MESSAGES = 64
+
 
 class ParsingService:
     """Main parsing service for converting mbox archives to structured JSON."""
@@ -52,6 +63,9 @@ class ParsingService:
         error_reporter: ErrorReporter | None = None,
         archive_store: ArchiveStore | None = None,
         retry_config: RetryConfig | None = None,
+        message_batch_size: int = 500,
+        parse_workers: int = 1,
+        thread_index: ThreadIndex | None = None,
     ):
         """Initialize parsing service.
 
@@ -63,6 +77,14 @@ class ParsingService:
             error_reporter: Error reporter (optional)
             archive_store: Archive store for retrieving raw archives (required)
             retry_config: Retry configuration for race condition handling (optional)
+            message_batch_size: Number of parsed messages held in memory and stored
+                per batch while streaming an archive (default: 500)
+            parse_workers: Number of worker processes used to parse messages.
+                1 parses in-process (default); larger values fan message parsing
+                out to a process pool while preserving archive order
+            thread_index: Persistent message_id -> thread index used to attach
+                replies to threads from earlier archives (optional). Without it,
+                threads are resolved within each archive only
         """
         self.document_store = document_store
         self.publisher = publisher
@@ -73,6 +95,14 @@ class ParsingService:
             raise ValueError("archive_store is required and must be provided by the caller")
         self.archive_store = archive_store
         self.retry_config = retry_config or RetryConfig()
+        if message_batch_size < 1:
+            raise ValueError("message_batch_size must be at least 1")
+        self.message_batch_size = message_batch_size
+        if parse_workers < 1:
+            raise ValueError("parse_workers must be at least 1")
+        self.parse_workers = parse_workers
+        self._parse_executor: ProcessPoolExecutor | None = None
+        self.thread_index = thread_index
 
         # Create parser and thread builder
         self.parser = MessageParser()
@@ -246,6 +276,11 @@ class ParsingService:
                 metrics_collector=self.metrics_collector,
                 error_reporter=self.error_reporter,
                 service_name="parsing",
+                redelivery=(
+                    DelayedRedelivery(self.publisher, "copilot.events", "archive.ingested")
+                    if self.retry_config.delayed_redelivery
+                    else None
+                ),
             )
 
         except Exception as e:
@@ -279,16 +314,10 @@ class ParsingService:
         try:
             logger.info(f"Parsing archive {archive_id}")
 
-            # Retrieve archive content from ArchiveStore
+            # Open archive content from ArchiveStore as a stream so that the
+            # archive is never materialized in memory or copied to a temp file
             try:
-                archive_content = self.archive_store.get_archive(archive_id)
-                if archive_content is None:
-                    error_msg = f"Archive {archive_id} not found in ArchiveStore"
-                    logger.warning(error_msg)
-
-                    # Raise retryable error to trigger retry logic for race conditions
-                    # This handles cases where events arrive before archives are stored
-                    raise DocumentNotFoundError(error_msg)
+                archive_stream = self._open_archive_stream(archive_id)
             except DocumentNotFoundError:
                 # Re-raise so the handle_event_with_retry wrapper can retry.
                 raise
@@ -308,24 +337,55 @@ class ParsingService:
                 )
                 return
 
-            # Write archive content to temporary file for parsing
-            # The parser expects a file path, so we create a temporary file
-            # Use try-finally to ensure cleanup
-            temp_file_path = None
             try:
-                # Create temp file with prefix for easier identification
-                with tempfile.NamedTemporaryFile(
-                    mode="wb", delete=False, suffix=".mbox", prefix="parsing_"
-                ) as temp_file:
-                    temp_file_path = temp_file.name
-                    temp_file.write(archive_content)
-
-                logger.debug(f"Wrote archive {archive_id} to temporary file {temp_file_path}")
+                # First pass: resolve thread structure from headers only. Thread
+                # ids must be known before messages are stored, and resolving
+                # them needs every message in the archive, so only the few
+                # header fields required for threading are kept for all messages.
+                with archive_stream:
+                    thread_assignments, known_threads = self._resolve_thread_assignments(archive_stream, archive_id)
+
+                # Second pass: fully parse, store and aggregate in fixed-size batches.
+                # Messages joining threads from earlier archives are aggregated
+                # separately and merged into the stored thread documents.
+                parse_errors: list[str] = []
+                thread_accumulator: dict[str, dict[str, Any]] = {}
+                thread_updates: dict[str, dict[str, Any]] = {}
+                existing_thread_ids = set(known_threads.values())
+                message_refs: list[dict[str, Any]] = []
+
+                with self._open_archive_stream(archive_id) as archive_stream:
+                    batch: list[dict[str, Any]] = []
+                    for message in self._iter_parsed_messages(archive_stream, archive_id, parse_errors):
+                        batch.append(message)
+                        if len(batch) >= self.message_batch_size:
+                            self._process_message_batch(
+                                batch,
+                                thread_assignments,
+                                thread_accumulator,
+                                message_refs,
+                                existing_thread_ids,
+                                thread_updates,
+                            )
+                            batch = []
+                    if batch:
+                        self._process_message_batch(
+                            batch,
+                            thread_assignments,
+                            thread_accumulator,
+                            message_refs,
+                            existing_thread_ids,
+                            thread_updates,
+                        )
 
-                # Parse mbox file - raises exceptions on failure
-                parsed_messages = self.parser.parse_mbox(temp_file_path, archive_id)
+                if not message_refs and parse_errors:
+                    # All messages failed to parse
+                    raise MessageParsingError(
+                        f"Failed to parse any messages from archive {archive_id}. "
+                        f"Errors: {'; '.join(parse_errors[:5])}"
+                    )
 
-                if not parsed_messages:
+                if not message_refs:
                     # No messages parsed (empty archive)
                     error_msg = "No messages found in archive"
                     logger.warning(error_msg)
@@ -335,32 +395,30 @@ class ParsingService:
                     self._update_archive_status(archive_id, "completed", 0)
                     return
 
-                # Generate canonical _id for each message (needed for thread building)
-                for message in parsed_messages:
-                    if "_id" not in message:
-                        message["_id"] = generate_message_doc_id(
-                            archive_id=archive_id,
-                            message_id=message.get("message_id", ""),
-                            date=message.get("date"),
-                            sender_email=(message.get("from") or {}).get("email"),
-                            subject=message.get("subject"),
-                        )
-
-                # Build threads
-                threads = self.thread_builder.build_threads(parsed_messages)
-
-                # Store messages in document store
-                if parsed_messages:
-                    self._store_messages(parsed_messages)
-                    logger.info(f"Stored {len(parsed_messages)} messages")
+                logger.info(f"Stored {len(message_refs)} messages")
 
                 # Store threads
+                threads = self.thread_builder.finalize_threads(thread_accumulator)
                 if threads:
                     self._store_threads(threads)
                     logger.info(f"Created {len(threads)} threads")
+                updated_threads = self.thread_builder.finalize_threads(thread_updates)
+                if updated_threads:
+                    self._merge_thread_updates(updated_threads)
+                    logger.info(f"Updated {len(updated_threads)} existing threads")
+
+                # Index new assignments only once their threads are stored
+                if self.thread_index is not None:
+                    self.thread_index.record(
+                        {
+                            message_id: thread_id
+                            for message_id, thread_id in thread_assignments.items()
+                            if message_id not in known_threads
+                        }
+                    )
 
                 # Update archive status to 'completed'
-                self._update_archive_status(archive_id, "completed", len(parsed_messages))
+                self._update_archive_status(archive_id, "completed", len(message_refs))
 
                 # Calculate duration
                 duration = time.monotonic() - start_time
@@ -368,7 +426,7 @@ class ParsingService:
 
                 # Update stats
                 self.archives_processed += 1
-                self.messages_parsed += len(parsed_messages)
+                self.messages_parsed += len(message_refs)
                 self.threads_created += len(threads)
 
                 # Collect metrics
@@ -379,7 +437,7 @@ class ParsingService:
                     )
                     self.metrics_collector.increment(
                         "parsing_messages_parsed_total",
-                        value=len(parsed_messages),
+                        value=len(message_refs),
                     )
                     self.metrics_collector.increment(
                         "parsing_threads_created_total",
@@ -392,17 +450,19 @@ class ParsingService:
                     # Push metrics to Pushgateway
                     self.metrics_collector.safe_push()
 
-                # Publish JSONParsed events (one per message for fine-grained retry)
+                # Publish JSONParsed events (one per message for fine-grained retry).
+                # Published only after threads are stored so consumers never see a
+                # message whose thread document does not exist yet.
                 self._publish_json_parsed_per_message(
                     archive_id,
-                    parsed_messages,
-                    threads,
+                    message_refs,
+                    threads + updated_threads,
                     duration,
                 )
 
                 logger.info(
                     f"Successfully parsed archive {archive_id}: "
-                    f"{len(parsed_messages)} messages, {len(threads)} threads, "
+                    f"{len(message_refs)} messages, {len(threads)} threads, "
                     f"{duration:.2f}s"
                 )
 
@@ -416,7 +476,7 @@ class ParsingService:
 
                 self._publish_parsing_failed(
                     archive_id,
-                    None,  # Storage-agnostic mode - temp file path is internal detail
+                    None,  # Storage-agnostic mode - no file path available
                     error_msg,
                     type(parse_error).__name__,
                     0,
@@ -425,27 +485,6 @@ class ParsingService:
                 # Don't re-raise - let event processing continue gracefully
                 # The error has been recorded in the archive status and event
                 return
-            finally:
-                # Always clean up temporary file
-                if temp_file_path and os.path.exists(temp_file_path):
-                    try:
-                        os.unlink(temp_file_path)
-                        logger.debug(f"Cleaned up temporary file {temp_file_path}")
-                    except Exception as cleanup_error:
-                        # Make cleanup failures clearly visible in logs and error reporting
-                        logger.error(
-                            f"Failed to clean up temporary file {temp_file_path}: {cleanup_error}",
-                            exc_info=True,
-                        )
-                        if self.error_reporter:
-                            self.error_reporter.report(
-                                cleanup_error,
-                                context={
-                                    "archive_id": archive_id,
-                                    "operation": "cleanup_temp_file",
-                                    "temp_file_path": temp_file_path,
-                                },
-                            )
 
         except DocumentNotFoundError:
             # Treat missing documents/archives as a retryable race condition handled by
@@ -506,47 +545,255 @@ class ParsingService:
             # Re-raise to trigger message requeue for transient failures
             raise e
 
-    def _store_messages(self, messages: list):
+    def _open_archive_stream(self, archive_id: str) -> BinaryIO:
+        """Open the archive content stream from ArchiveStore.
+
+        Args:
+            archive_id: Archive identifier
+
+        Returns:
+            Readable binary stream over the archive content
+
+        Raises:
+            DocumentNotFoundError: If the archive is not (yet) in the ArchiveStore
+        """
+        archive_stream = self.archive_store.open_archive_stream(archive_id)
+        if archive_stream is None:
+            error_msg = f"Archive {archive_id} not found in ArchiveStore"
+            logger.warning(error_msg)
+
+            # Raise retryable error to trigger retry logic for race conditions
+            # This handles cases where events arrive before archives are stored
+            raise DocumentNotFoundError(error_msg)
+        return archive_stream
+
+    def _iter_parsed_messages(
+        self,
+        archive_stream: BinaryIO,
+        archive_id: str,
+        errors: list[str],
+    ) -> Iterator[dict[str, Any]]:
+        """Parse messages from an archive stream, in archive order.
+
+        With a single parse worker, messages are parsed in-process. Otherwise
+        the stream is split on ``From `` boundaries and batches of raw messages
+        are parsed in a process pool. At most ``2 * parse_workers`` batches are
+        in flight, so memory stays bounded, and results are yielded in
+        submission order so output is identical to serial parsing.
+
+        If a pool worker dies (e.g. OOM kill), the broken pool is discarded so
+        the next archive gets a fresh one, and the error propagates so only
+        this archive is marked as failed.
+
+        Args:
+            archive_stream: Readable binary stream over the archive content
+            archive_id: Archive identifier
+            errors: Receives per-message parse error descriptions
+
+        Yields:
+            Parsed message dictionaries
+        """
+        if self.parse_workers == 1:
+            yield from self.parser.iter_mbox(archive_stream, archive_id, errors)
+            return
+
+        executor = self._get_parse_executor()
+        pending: deque[Future] = deque()
+        max_pending = 2 * self.parse_workers
+
+        def drain_one() -> Iterator[dict[str, Any]]:
+            messages, batch_errors = pending.popleft().result()
+            errors.extend(batch_errors)
+            yield from messages
+
+        try:
+            raw_batch: list[bytes] = []
+            start_index = 0
+            for raw in self.parser.iter_raw_messages(archive_stream):
+                raw_batch.append(raw)
+                if len(raw_batch) < PARSE_TASK_MESSAGES:
+                    continue
+                pending.append(executor.submit(parse_raw_messages_in_worker, raw_batch, archive_id, start_index))
+                start_index += len(raw_batch)
+                raw_batch = []
+                if len(pending) >= max_pending:
+                    yield from drain_one()
+            if raw_batch:
+                pending.append(executor.submit(parse_raw_messages_in_worker, raw_batch, archive_id, start_index))
+            while pending:
+                yield from drain_one()
+        except BrokenProcessPool:
+            logger.error(f"Parse worker pool broke while parsing archive {archive_id}; discarding pool")
+            self._discard_parse_executor()
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_parse_executor(self) -> ProcessPoolExecutor:
+        """Return the parse worker pool, creating it on first use.
+
+        Workers are started with ``forkserver`` (``spawn`` where unavailable)
+        rather than ``fork``: the pool is created lazily from a process that
+        already runs message bus threads, and forking would copy their locks.
+        """
+        if self._parse_executor is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._parse_executor = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=init_parser_worker,
+                initargs=(self.parser,),
+            )
+            logger.info(f"Started parse worker pool with {self.parse_workers} processes ({start_method})")
+        return self._parse_executor
+
+    def _discard_parse_executor(self):
+        """Drop a broken parse worker pool so the next call creates a new one."""
+        executor = self._parse_executor
+        self._parse_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Release resources held by the service (parse worker pool)."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=True, cancel_futures=True)
+            self._parse_executor = None
+
+    def _resolve_thread_assignments(
+        self, archive_stream: BinaryIO, archive_id: str
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Resolve message_id -> thread _id for every message in an archive.
+
+        When a thread index is configured, messages that are (or are linked
+        to) messages threaded from earlier archives resolve to those threads.
+
+        Args:
+            archive_stream: Readable binary stream over the archive content
+            archive_id: Archive identifier
+
+        Returns:
+            Tuple of (assignments, known_threads): the mapping of message_id
+            (including referenced message ids) to thread _id, and the subset
+            of it that was already in the thread index
+        """
+        thread_refs = []
+        for headers in self.parser.iter_mbox_headers(archive_stream):
+            thread_refs.append(
+                {
+                    "message_id": headers["message_id"],
+                    "in_reply_to": headers["in_reply_to"],
+                    "references": headers["references"],
+                    "_id": generate_message_doc_id(
+                        archive_id=archive_id,
+                        message_id=headers["message_id"],
+                        date=headers["date"],
+                        sender_email=(headers["from"] or {}).get("email"),
+                        subject=headers["subject"],
+                    ),
+                }
+            )
+
+        known_threads: dict[str, str] = {}
+        if self.thread_index is not None:
+            message_ids = set()
+            for ref in thread_refs:
+                message_ids.add(ref["message_id"])
+                message_ids.update(self.thread_builder.linked_message_ids(ref))
+            known_threads = self.thread_index.lookup(message_ids)
+
+        return self.thread_builder.assign_thread_ids(thread_refs, known_threads), known_threads
+
+    def _process_message_batch(
+        self,
+        batch: list[dict[str, Any]],
+        thread_assignments: dict[str, str],
+        thread_accumulator: dict[str, dict[str, Any]],
+        message_refs: list[dict[str, Any]],
+        existing_thread_ids: set[str],
+        thread_updates: dict[str, dict[str, Any]],
+    ):
+        """Assign ids, store a batch of parsed messages and fold it into thread aggregates.
+
+        Messages of threads created by earlier archives are folded into
+        ``thread_updates`` instead, and only if they were newly stored, so
+        reprocessing an archive does not count its messages twice.
+
+        Args:
+            batch: Parsed message dictionaries
+            thread_assignments: Mapping of message_id to thread _id from the header pass
+            thread_accumulator: Thread aggregates being built for the archive
+            message_refs: Receives a lightweight {_id, thread_id} record per message
+            existing_thread_ids: Thread _ids that already have a stored thread document
+            thread_updates: Aggregates of messages added to existing threads
+        """
+        for message in batch:
+            if "_id" not in message:
+                message["_id"] = generate_message_doc_id(
+                    archive_id=message.get("archive_id", ""),
+                    message_id=message.get("message_id", ""),
+                    date=message.get("date"),
+                    sender_email=(message.get("from") or {}).get("email"),
+                    subject=message.get("subject"),
+                )
+            message["thread_id"] = thread_assignments.get(message["message_id"], message["_id"])
+
+        self.thread_builder.aggregate_threads(
+            [m for m in batch if m["thread_id"] not in existing_thread_ids], thread_accumulator
+        )
+        stored = self._store_messages(batch)
+        if existing_thread_ids:
+            self.thread_builder.aggregate_threads(
+                [batch[i] for i in stored if batch[i]["thread_id"] in existing_thread_ids], thread_updates
+            )
+        message_refs.extend({"_id": m["_id"], "thread_id": m["thread_id"]} for m in batch)
+
+    def _store_messages(self, messages: list) -> list[int]:
         """Store messages in document store.
 
         Args:
             messages: List of message dictionaries
 
+        Returns:
+            Indexes of the messages that were inserted
+
         Note:
             - Computes canonical _id for each message before storing
-            - Inserts documents one at a time
+            - Inserts the whole batch with a single bulk write
             - Skips duplicate and validation errors and logs them
             - Re-raises other errors (transient failures)
         """
-        skipped_count = 0
-        stored_count = 0
-
         for message in messages:
-            try:
-                # Compute canonical _id if not already present
-                if "_id" not in message:
-                    message["_id"] = generate_message_doc_id(
-                        archive_id=message.get("archive_id", ""),
-                        message_id=message.get("message_id", ""),
-                        date=message.get("date"),
-                        sender_email=(message.get("from") or {}).get("email"),
-                        subject=message.get("subject"),
-                    )
+            # Compute canonical _id if not already present
+            if "_id" not in message:
+                message["_id"] = generate_message_doc_id(
+                    archive_id=message.get("archive_id", ""),
+                    message_id=message.get("message_id", ""),
+                    date=message.get("date"),
+                    sender_email=(message.get("from") or {}).get("email"),
+                    subject=message.get("subject"),
+                )
 
-                self.document_store.insert_document("messages", message)
-                stored_count += 1
-            except DocumentValidationError as e:
+        result = self.document_store.insert_documents("messages", messages)
+
+        skipped_count = 0
+        transient_error = None
+        for index, error in sorted(result.errors.items()):
+            message = messages[index]
+            message_id = message.get("message_id", "unknown")
+
+            if isinstance(error, DocumentValidationError):
                 # Permanent errors - skip but log it
-                message_id = message.get("message_id", "unknown")
-                logger.info(f"Skipping message {message_id} (DocumentValidationError): {e}")
+                logger.info(f"Skipping message {message_id} (DocumentValidationError): {error}")
                 skipped_count += 1
 
                 # Collect metrics for skipped messages
                 if self.metrics_collector:
                     # Check if it's an empty body validation error by examining the errors list
                     is_empty_body = any(
-                        "body_normalized" in error and ("non-empty" in error or "minLength" in error)
-                        for error in e.errors
+                        "body_normalized" in err and ("non-empty" in err or "minLength" in err)
+                        for err in error.errors
                     )
                     if is_empty_body:
                         skip_reason = "empty_body"
@@ -564,10 +811,9 @@ class ParsingService:
                         "parsing_messages_skipped_total",
                         tags={"reason": skip_reason},
                     )
-            except DocumentAlreadyExistsError as e:
+            elif isinstance(error, DocumentAlreadyExistsError):
                 # Document already exists - skip but log it (idempotent operation)
-                message_id = message.get("message_id", "unknown")
-                logger.info(f"Skipping message {message_id} (DocumentAlreadyExistsError): {e}")
+                logger.info(f"Skipping message {message_id} (DocumentAlreadyExistsError): {error}")
                 skipped_count += 1
 
                 if self.metrics_collector:
@@ -575,13 +821,18 @@ class ParsingService:
                         "parsing_messages_skipped_total",
                         tags={"reason": "duplicate"},
                     )
-            except Exception as e:
-                # Other errors are transient failures - re-raise
-                logger.error(f"Error storing message: {e}")
-                raise
+            else:
+                # Other errors are transient failures - re-raise after the batch is accounted for
+                logger.error(f"Error storing message {message_id}: {error}")
+                transient_error = transient_error or error
+
+        if transient_error is not None:
+            raise transient_error
 
         if skipped_count > 0:
-            logger.info(f"Stored {stored_count} messages, skipped {skipped_count} (duplicates/validation)")
+            logger.info(f"Stored {len(result.succeeded)} messages, skipped {skipped_count} (duplicates/validation)")
+
+        return [index for index in range(len(messages)) if index not in result.errors]
 
     def _store_threads(self, threads: list):
         """Store threads in document store.
@@ -590,21 +841,20 @@ class ParsingService:
             threads: List of thread dictionaries
 
         Note:
-            - Inserts documents one at a time
+            - Inserts all threads with a single bulk write
             - Skips duplicate and validation errors and logs them
             - Re-raises other errors (transient failures)
         """
+        result = self.document_store.insert_documents("threads", threads)
+
         skipped_count = 0
-        stored_count = 0
+        transient_error = None
+        for index, error in sorted(result.errors.items()):
+            thread_id = threads[index].get("thread_id", "unknown")
 
-        for thread in threads:
-            try:
-                self.document_store.insert_document("threads", thread)
-                stored_count += 1
-            except DocumentValidationError as e:
+            if isinstance(error, DocumentValidationError):
                 # Permanent errors - skip but log it
-                thread_id = thread.get("thread_id", "unknown")
-                logger.info(f"Skipping thread {thread_id} (DocumentValidationError): {e}")
+                logger.info(f"Skipping thread {thread_id} (DocumentValidationError): {error}")
                 skipped_count += 1
 
                 if self.metrics_collector:
@@ -612,10 +862,9 @@ class ParsingService:
                         "parsing_threads_skipped_total",
                         tags={"reason": "validation_error"},
                     )
-            except DocumentAlreadyExistsError as e:
+            elif isinstance(error, DocumentAlreadyExistsError):
                 # Document already exists - skip but log it (idempotent operation)
-                thread_id = thread.get("thread_id", "unknown")
-                logger.info(f"Skipping thread {thread_id} (DocumentAlreadyExistsError): {e}")
+                logger.info(f"Skipping thread {thread_id} (DocumentAlreadyExistsError): {error}")
                 skipped_count += 1
 
                 if self.metrics_collector:
@@ -623,13 +872,59 @@ class ParsingService:
                         "parsing_threads_skipped_total",
                         tags={"reason": "duplicate"},
                     )
-            except Exception as e:
-                # Other errors are transient failures - re-raise
-                logger.error(f"Error storing thread: {e}")
-                raise
+            else:
+                # Other errors are transient failures - re-raise after the batch is accounted for
+                logger.error(f"Error storing thread {thread_id}: {error}")
+                transient_error = transient_error or error
+
+        if transient_error is not None:
+            raise transient_error
 
         if skipped_count > 0:
-            logger.info(f"Stored {stored_count} threads, skipped {skipped_count} (duplicates/validation)")
+            logger.info(f"Stored {len(result.succeeded)} threads, skipped {skipped_count} (duplicates/validation)")
+
+    def _merge_thread_updates(self, threads: list):
+        """Merge aggregates of newly attached messages into existing thread documents.
+
+        Each thread is updated with atomic operators ($inc, $addToSet, $min,
+        $max), so concurrent archives adding to the same thread do not lose
+        updates. A thread whose document is missing (e.g. skipped or deleted)
+        is inserted instead.
+
+        Args:
+            threads: Finalized thread aggregates of the newly attached messages
+        """
+        missing = []
+        for thread in threads:
+            operators: dict[str, dict[str, Any]] = {"$inc": {"message_count": thread["message_count"]}}
+            add_to_set = {}
+            if thread["participants"]:
+                add_to_set["participants"] = {"$each": thread["participants"]}
+            if thread["draft_mentions"]:
+                add_to_set["draft_mentions"] = {"$each": thread["draft_mentions"]}
+            if add_to_set:
+                operators["$addToSet"] = add_to_set
+            if thread["first_message_date"]:
+                operators["$min"] = {"first_message_date": thread["first_message_date"]}
+            if thread["last_message_date"]:
+                operators["$max"] = {"last_message_date": thread["last_message_date"]}
+
+            try:
+                self.document_store.apply_update_operators("threads", thread["_id"], operators)
+            except StoredDocumentNotFoundError:
+                missing.append(thread)
+            except DocumentValidationError as error:
+                # Permanent errors - skip but log it
+                logger.info(f"Skipping update of thread {thread['_id']} (DocumentValidationError): {error}")
+                if self.metrics_collector:
+                    self.metrics_collector.increment(
+                        "parsing_threads_skipped_total",
+                        tags={"reason": "validation_error"},
+                    )
+
+        if missing:
+            logger.info(f"Creating {len(missing)} indexed threads that have no thread document")
+            self._store_threads(missing)
 
     def _update_archive_status(self, archive_id: str, status: str, message_count: int):
         """Update archive status in document store.
@@ -689,11 +984,12 @@ class ParsingService:
 
         This implements per-message event publishing to enable fine-grained
         retry granularity. If chunking fails on a single message, only that
-        message is retried, not the entire archive batch.
+        message is retried, not the entire archive batch. The events are sent
+        with a single publish_batch() call.
 
         Args:
             archive_id: Archive identifier
-            parsed_messages: List of parsed message dictionaries
+            parsed_messages: Message dictionaries (only '_id' and 'thread_id' are read)
             threads: List of thread dictionaries
             duration: Total parsing duration in seconds
 
@@ -706,6 +1002,8 @@ class ParsingService:
         # Track failed publications for error reporting
         failed_publishes: list[tuple[str, Exception]] = []
 
+        events: list[dict[str, Any]] = []
+        event_message_ids: list[str] = []
         for message in parsed_messages:
             # Validate required fields exist
             message_doc_id = message.get("_id")
@@ -731,26 +1029,26 @@ class ParsingService:
                     "parsing_duration_seconds": duration,
                 }
             )
+            events.append(event.to_dict())
+            event_message_ids.append(message_doc_id)
 
-            try:
-                self.publisher.publish(
-                    exchange="copilot.events",
-                    routing_key="json.parsed",
-                    event=event.to_dict(),
+        # Publish all events as one batch so broker round-trips are amortized
+        # across the archive; failures are still reported per message
+        result = self.publisher.publish_batch(exchange="copilot.events", routing_key="json.parsed", events=events)
+
+        for index, e in result.errors.items():
+            message_doc_id = event_message_ids[index]
+            logger.error(f"Failed to publish JSONParsed event for message {message_doc_id}: {e}")
+            failed_publishes.append((message_doc_id, e))
+            if self.error_reporter:
+                self.error_reporter.report(
+                    e,
+                    context={
+                        "operation": "publish_json_parsed",
+                        "archive_id": archive_id,
+                        "message_doc_id": message_doc_id,
+                    },
                 )
-                logger.debug(f"Published JSONParsed event for message {message_doc_id}")
-            except Exception as e:
-                logger.error(f"Failed to publish JSONParsed event for message {message_doc_id}: {e}", exc_info=True)
-                failed_publishes.append((message_doc_id, e))
-                if self.error_reporter:
-                    self.error_reporter.report(
-                        e,
-                        context={
-                            "operation": "publish_json_parsed",
-                            "archive_id": archive_id,
-                            "message_doc_id": message_doc_id,
-                        },
-                    )
 
         # If any publishes failed, raise an exception to fail the archive processing
         if failed_publishes:
@@ -759,7 +1057,7 @@ class ParsingService:
             # Raise the first exception to trigger archive processing failure
             raise failed_publishes[0][1]
 
-        logger.info(f"Published {len(parsed_messages)} JSONParsed events for archive {archive_id}")
+        logger.info(f"Published {result.published} JSONParsed events for archive {archive_id}")
 
     def _publish_parsing_failed(
         self,
@@ -17,7 +17,7 @@ class ThreadBuilder:
         """Build thread documents from parsed messages.
 
         This method:
-        1. Identifies root messages (messages with no in_reply_to)
+        1. Resolves thread_ids by following In-Reply-To/References links
         2. Groups messages by thread_id
         3. Aggregates thread metadata
 
@@ -30,43 +30,122 @@ class ThreadBuilder:
         if not messages:
             return []
 
-        # First pass: build message lookup and identify roots
-        message_map = {}
-        roots = set()
+        self.assign_thread_ids(messages)
 
-        for message in messages:
-            message_id = message["message_id"]
-            message_map[message_id] = message
+        threads: dict[str, dict[str, Any]] = {}
+        self.aggregate_threads(messages, threads)
+        return self.finalize_threads(threads)
 
-            # If no in_reply_to, this is a root message
-            if not message.get("in_reply_to"):
-                roots.add(message_id)
+    def assign_thread_ids(
+        self, messages: list[dict[str, Any]], known_threads: dict[str, str] | None = None
+    ) -> dict[str, str]:
+        """Resolve each message's thread to a canonical thread _id.
 
-        # Second pass: assign thread_ids by tracing back to roots
-        thread_assignments = {}
+        Messages linked through In-Reply-To or References are grouped with a
+        union-find, so a thread stays connected even when an intermediate
+        message is missing from the archive. Each group is assigned:
+
+        1. the thread of the first group member (or referenced message id)
+           found in ``known_threads``, so replies to messages threaded in
+           earlier archives join the existing thread;
+        2. otherwise the _id of the group's first root message (a message
+           with neither In-Reply-To nor References);
+        3. otherwise the _id of the group's first message.
+
+        Messages in ``known_threads`` keep their thread. Existing threads are
+        never merged with each other after the fact: if a message links two
+        threads that are already known, it joins the first one.
+
+        Only message_id, in_reply_to, references and _id are read, so this
+        can run on lightweight header-only records when the full messages are
+        streamed separately. Each message's ``thread_id`` is updated in place.
+
+        Args:
+            messages: Message dictionaries with message_id, in_reply_to, references and _id
+            known_threads: Mapping of message_id to thread _id for messages
+                threaded previously (optional)
+
+        Returns:
+            Mapping of message_id to thread _id for every message and every
+            message id they reference
+
+        Raises:
+            KeyError: If a message needed for threading has no '_id'
+        """
+        known_threads = known_threads or {}
+        parents: dict[str, str] = {}
+
+        def find(message_id: str) -> str:
+            parents.setdefault(message_id, message_id)
+            while parents[message_id] != message_id:
+                # Path halving keeps the trees flat
+                parents[message_id] = parents[parents[message_id]]
+                message_id = parents[message_id]
+            return message_id
 
         for message in messages:
-            message_id = message["message_id"]
-            root = self._find_thread_root(message_id, message_map, roots)
-            # If the root isn't present in the parsed set (e.g., missing parent), fall back to this message's _id
-            if root not in message_map:
-                logger.warning("Root message %s not found in parsed set; using current message's _id", root)
-                if "_id" not in message:
-                    raise KeyError("Message missing '_id' field; all messages must have an '_id' before threading.")
-                root_doc_id = message["_id"]
-            else:
-                if "_id" not in message_map[root]:
-                    raise KeyError(
-                        "Root message missing '_id' field; all messages must have an '_id' before threading."
-                    )
-                root_doc_id = message_map[root]["_id"]
-            thread_assignments[message_id] = root_doc_id
-            # Update the message's thread_id to root message's canonical _id
-            message["thread_id"] = root_doc_id
-
-        # Third pass: aggregate threads
-        threads = {}
+            root = find(message["message_id"])
+            for linked_id in self.linked_message_ids(message):
+                linked_root = find(linked_id)
+                if linked_root != root:
+                    parents[linked_root] = root
+
+        # Pick each group's thread in order of precedence
+        group_threads: dict[str, str] = {}
+        for message_id in parents:
+            if message_id in known_threads:
+                group_threads.setdefault(find(message_id), known_threads[message_id])
+        for message in messages:
+            group = find(message["message_id"])
+            if group not in group_threads and not message.get("in_reply_to") and not message.get("references"):
+                group_threads[group] = self._doc_id(message)
+        for message in messages:
+            group = find(message["message_id"])
+            if group not in group_threads:
+                group_threads[group] = self._doc_id(message)
 
+        # Previously threaded messages keep their thread
+        thread_assignments = {}
+        for message_id in parents:
+            thread_assignments[message_id] = known_threads.get(message_id, group_threads[find(message_id)])
+        for message in messages:
+            message["thread_id"] = thread_assignments[message["message_id"]]
+
+        return thread_assignments
+
+    @staticmethod
+    def linked_message_ids(message: dict[str, Any]) -> list[str]:
+        """List the message ids a message points to through References and In-Reply-To.
+
+        Args:
+            message: Message dictionary with in_reply_to and references
+
+        Returns:
+            Referenced message ids
+        """
+        linked = list(message.get("references") or [])
+        if message.get("in_reply_to"):
+            linked.append(message["in_reply_to"])
+        return linked
+
+    @staticmethod
+    def _doc_id(message: dict[str, Any]) -> str:
+        """Canonical _id of a message, required for it to root a thread."""
+        if "_id" not in message:
+            raise KeyError("Message missing '_id' field; all messages must have an '_id' before threading.")
+        return message["_id"]
+
+    def aggregate_threads(self, messages: list[dict[str, Any]], threads: dict[str, dict[str, Any]]) -> None:
+        """Fold messages with resolved thread_ids into thread aggregates.
+
+        Can be called repeatedly with successive batches of messages (in
+        archive order) to build threads without holding every message in
+        memory. Call finalize_threads() once all batches are folded in.
+
+        Args:
+            messages: Message dictionaries whose thread_id is already resolved
+            threads: Accumulator mapping thread _id to in-progress thread dict
+        """
         for message in messages:
             thread_doc_id = message["thread_id"]  # Now this is the root message's _id
 
@@ -109,6 +188,15 @@ class ThreadBuilder:
             for draft in message.get("draft_mentions", []):
                 thread["draft_mentions"].add(draft)
 
+    def finalize_threads(self, threads: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Convert thread aggregates into storable thread documents.
+
+        Args:
+            threads: Accumulator populated by aggregate_threads()
+
+        Returns:
+            List of thread dictionaries
+        """
         # Clean up threads for storage
         for thread in threads.values():
             # Remove temporary participant_emails set
@@ -122,61 +210,6 @@ class ThreadBuilder:
 
         return list(threads.values())
 
-    def _find_thread_root(
-        self,
-        message_id: str,
-        message_map: dict[str, dict[str, Any]],
-        known_roots: set[str],
-        max_depth: int = 100,
-    ) -> str:
-        """Find the root message ID for a thread by following in_reply_to chain.
-
-        Args:
-            message_id: Message ID to find root for
-            message_map: Map of message_id to message dict
-            known_roots: Set of known root message IDs
-            max_depth: Maximum depth to traverse (prevents infinite loops)
-
-        Returns:
-            Root message ID for the thread
-        """
-        # If this is a known root, return it
-        if message_id in known_roots:
-            return message_id
-
-        visited = set()
-        current_id = message_id
-        depth = 0
-
-        while depth < max_depth:
-            # Check if we've seen this ID before (circular reference)
-            if current_id in visited:
-                logger.warning(f"Circular reference detected in thread starting at {message_id}")
-                return message_id
-
-            visited.add(current_id)
-
-            # Get the message
-            message = message_map.get(current_id)
-            if not message:
-                # Message not in our set, use current_id as root
-                return current_id
-
-            # Check if this is a root (no in_reply_to)
-            in_reply_to = message.get("in_reply_to")
-            if not in_reply_to:
-                # This is a root
-                known_roots.add(current_id)
-                return current_id
-
-            # Move up the chain
-            current_id = in_reply_to
-            depth += 1
-
-        # Hit max depth, return the current position
-        logger.warning(f"Max depth reached while finding root for {message_id}")
-        return current_id
-
     def _clean_subject(self, subject: str) -> str:
         """Clean subject line by removing Re:, Fwd:, etc.
 
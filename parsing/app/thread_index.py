@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Persistent message_id -> thread index shared across archives.
+
+Each parsed archive records which thread every message it contained (and
+every message those messages referenced) was assigned to. Later archives look
+up the message ids they reference, so a reply whose parent was parsed from an
+earlier archive joins the existing thread instead of starting a new one.
+Documents follow docs/schemas/documents/thread_index.schema.json.
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from copilot_logging import get_logger
+from copilot_storage import DocumentStore
+
+logger = get_logger(__name__)
+
+THREAD_INDEX_COLLECTION = "thread_index"
+
+# Message ids per lookup query, to keep $in filters to a reasonable size
+LOOKUP_BATCH_SIZE = 500
+
+
+def thread_index_key(message_id: str) -> str:
+    """Derive the thread index document _id for a message_id.
+
+    Args:
+        message_id: RFC 5322 Message-ID (without angle brackets)
+
+    Returns:
+        First 16 hex characters of the SHA256 hash of the message_id
+    """
+    return hashlib.sha256(message_id.encode("utf-8")).hexdigest()[:16]
+
+
+class ThreadIndex:
+    """Document store backed mapping of message_id to thread _id."""
+
+    def __init__(self, document_store: DocumentStore, collection: str = THREAD_INDEX_COLLECTION):
+        """Initialize the thread index.
+
+        Args:
+            document_store: Connected document store
+            collection: Collection holding index entries
+        """
+        self.document_store = document_store
+        self.collection = collection
+
+    def lookup(self, message_ids: Iterable[str]) -> dict[str, str]:
+        """Look up the threads of previously indexed messages.
+
+        Args:
+            message_ids: Message ids to look up
+
+        Returns:
+            Mapping of the message ids that are indexed to their thread _id
+        """
+        keys: dict[str, str] = {}
+        for message_id in message_ids:
+            keys.setdefault(thread_index_key(message_id), message_id)
+
+        key_list = list(keys)
+        found: dict[str, str] = {}
+        for start in range(0, len(key_list), LOOKUP_BATCH_SIZE):
+            batch = key_list[start : start + LOOKUP_BATCH_SIZE]
+            docs = self.document_store.query_documents(
+                self.collection, filter_dict={"_id": {"$in": batch}}, limit=len(batch)
+            )
+            for doc in docs:
+                message_id = keys.get(doc["_id"])
+                # Guard against key collisions by checking the stored message_id
+                if message_id is not None and doc.get("message_id") == message_id:
+                    found[message_id] = doc["thread_id"]
+        return found
+
+    def record(self, assignments: dict[str, str]) -> None:
+        """Store message thread assignments, replacing existing entries.
+
+        Args:
+            assignments: Mapping of message_id to thread _id
+        """
+        if not assignments:
+            return
+        docs = [
+            {"_id": thread_index_key(message_id), "message_id": message_id, "thread_id": thread_id}
+            for message_id, thread_id in assignments.items()
+        ]
+        result = self.document_store.upsert_documents(self.collection, docs)
+        if result.errors:
+            # Index entries are only needed for later archives, so a failure is not fatal
+            logger.warning(f"Failed to record {len(result.errors)} of {len(docs)} thread index entries")
@@ -10,6 +10,7 @@ from typing import cast
 import uvicorn
 from app import __version__
 from app.service import ParsingService
+from app.thread_index import ThreadIndex
 from copilot_archive_store import create_archive_store
 from copilot_config.generated.adapters.message_bus import (
     DriverConfig_MessageBus_AzureServiceBus,
@@ -297,6 +298,9 @@ def main():
             metrics_collector=metrics_collector,
             error_reporter=error_reporter,
             archive_store=archive_store,
+            message_batch_size=int(config.service_settings.message_batch_size or 500),
+            parse_workers=int(config.service_settings.parse_workers or 1),
+            thread_index=ThreadIndex(document_store) if config.service_settings.enable_thread_index else None,
         )
 
         # Start subscriber in a separate thread (non-daemon to fail fast)
@@ -325,6 +329,7 @@ def main():
     finally:
         # Cleanup
         if parsing_service:
+            parsing_service.close()
             if parsing_service.subscriber:
                 parsing_service.subscriber.disconnect()
             if parsing_service.publisher:
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Copilot-for-Consensus contributors
+
+"""Manual benchmark for multi-process archive parsing.
+
+Generates a synthetic mbox archive and measures how long the parsing
+pipeline (split on From_ lines, parse, normalize, detect drafts) takes
+with different parse worker counts. Storage and publishing are excluded
+so the numbers reflect CPU-bound parsing only.
+
+Usage:
+    python tests/benchmark_parallel_parsing.py --messages 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+# Add app to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.service import ParsingService
+
+
+def build_mbox(message_count: int) -> bytes:
+    """Build a synthetic mbox archive with threaded, HTML and plain-text messages."""
+    parts = []
+    for i in range(message_count):
+        reply = f"In-Reply-To: <msg{i - 1}@example.com>\n" if i % 10 else ""
+        if i % 3 == 0:
+            content_type = "text/html"
+            body = "<html><body>" + "".join(
+                f"<p>Paragraph {j} discussing draft-ietf-quic-transport-{j % 40:02d} and RFC {9000 + j}.</p>"
+                for j in range(20)
+            ) + "</body></html>"
+        else:
+            content_type = "text/plain"
+            body = "\n".join(
+                f"> quoted line {j}\nLine {j} about draft-ietf-tls-esni-{j % 20:02d} and RFC {8446 + j}."
+                for j in range(20)
+            ) + "\n-- \nSignature"
+        parts.append(
+            f"From user{i % 50}@example.com Mon Jan 01 00:00:00 2024\n"
+            f"From: User {i % 50} <user{i % 50}@example.com>\n"
+            f"To: list@example.com\n"
+            f"Subject: Re: Topic {i // 10}\n"
+            f"Message-ID: <msg{i}@example.com>\n"
+            f"{reply}"
+            f"Date: Mon, 01 Jan 2024 {i % 24:02d}:{i % 60:02d}:00 +0000\n"
+            f"Content-Type: {content_type}; charset=utf-8\n"
+            f"\n{body}\n\n"
+        )
+    return "".join(parts).encode("utf-8")
+
+
+def run(content: bytes, workers: int) -> tuple[float, int]:
+    """Parse the archive with the given worker count; return (seconds, message count)."""
+    service = ParsingService(
+        document_store=Mock(),
+        publisher=Mock(),
+        subscriber=Mock(),
+        archive_store=Mock(),
+        parse_workers=workers,
+    )
+    try:
+        # Warm up the worker pool so process start-up is not measured
+        list(service._iter_parsed_messages(io.BytesIO(content[:4096]), "warmup", []))
+
+        start = time.perf_counter()
+        count = sum(1 for _ in service._iter_parsed_messages(io.BytesIO(content), "benchmark", []))
+        return time.perf_counter() - start, count
+    finally:
+        service.close()
+
+
+def main():
+    """Run the benchmark and print a speedup table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000, help="Number of synthetic messages")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to compare")
+    args = parser.parse_args()
+
+    content = build_mbox(args.messages)
+    print(f"Archive: {args.messages} messages, {len(content) / 1e6:.1f} MB, {os.cpu_count()} CPUs available")
+
+    baseline = None
+    for workers in args.workers:
+        elapsed, count = run(content, workers)
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3} {elapsed:8.2f}s  {count / elapsed:9.0f} msg/s  "
+            f"speedup={baseline / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 """Unit tests for message parser."""
 
+import io
 import os
 
 import pytest
@@ -149,3 +150,97 @@ Body text
         msg2 = messages[1]
         assert len(msg2["references"]) == 1
         assert "msg1@example.com" in msg2["references"]
+
+    def test_iter_mbox_matches_parse_mbox(self, sample_mbox_file):
+        """Test that streaming parsing yields the same messages as parse_mbox."""
+        parser = MessageParser()
+
+        expected = parser.parse_mbox(sample_mbox_file, "test-archive-10")
+        with open(sample_mbox_file, "rb") as stream:
+            streamed = list(parser.iter_mbox(stream, "test-archive-10"))
+
+        assert len(streamed) == len(expected)
+        for got, want in zip(streamed, expected):
+            got.pop("created_at")
+            want.pop("created_at")
+            assert got == want
+
+    def test_iter_mbox_is_lazy(self, sample_mbox_content):
+        """Test that iter_mbox yields messages before the stream is exhausted."""
+        parser = MessageParser()
+        stream = io.BytesIO(sample_mbox_content.encode("utf-8"))
+
+        messages = parser.iter_mbox(stream, "test-archive-11")
+        first = next(messages)
+
+        assert first["message_id"] == "msg1@example.com"
+        assert stream.tell() < len(sample_mbox_content)
+
+    def test_iter_mbox_collects_errors(self):
+        """Test that messages without Message-ID are skipped and reported."""
+        parser = MessageParser()
+        content = b"""From a@example.com Mon Jan 01 00:00:00 2024
+From: a@example.com
+Subject: No ID
+
+Body.
+
+From b@example.com Mon Jan 01 00:01:00 2024
+From: b@example.com
+Subject: Has ID
+Message-ID: <ok@example.com>
+
+Body.
+"""
+        errors: list[str] = []
+
+        messages = list(parser.iter_mbox(io.BytesIO(content), "test-archive-12", errors))
+
+        assert [m["message_id"] for m in messages] == ["ok@example.com"]
+        assert len(errors) == 1
+        assert "Message-ID" in errors[0]
+
+    def test_iter_mbox_headers(self, sample_mbox_file):
+        """Test header-only pass extracts threading fields."""
+        parser = MessageParser()
+
+        with open(sample_mbox_file, "rb") as stream:
+            headers = list(parser.iter_mbox_headers(stream))
+
+        assert [h["message_id"] for h in headers] == ["msg1@example.com", "msg2@example.com"]
+        assert headers[0]["in_reply_to"] is None
+        assert headers[1]["in_reply_to"] == "msg1@example.com"
+        assert headers[1]["references"] == ["msg1@example.com"]
+        assert headers[1]["from"]["email"] == "bob@example.com"
+        assert headers[0]["date"] == "2024-01-01T12:00:00Z"
+
+    def test_parse_raw_messages_matches_iter_mbox(self, sample_mbox_file):
+        """Test that parsing split raw messages matches streaming parsing."""
+        parser = MessageParser()
+
+        with open(sample_mbox_file, "rb") as stream:
+            raw_messages = list(parser.iter_raw_messages(stream))
+        with open(sample_mbox_file, "rb") as stream:
+            expected = list(parser.iter_mbox(stream, "test-archive-13"))
+
+        assert len(raw_messages) == 2
+        assert all(raw.startswith(b"From ") for raw in raw_messages)
+
+        messages, errors = parser.parse_raw_messages(raw_messages, "test-archive-13")
+
+        assert errors == []
+        assert len(messages) == len(expected)
+        for got, want in zip(messages, expected):
+            got.pop("created_at")
+            want.pop("created_at")
+            assert got == want
+
+    def test_parse_raw_messages_error_index(self):
+        """Test that error messages use the archive-wide message index."""
+        parser = MessageParser()
+        raw = b"From a@example.com Mon Jan 01 00:00:00 2024\nFrom: a@example.com\n\nNo ID.\n"
+
+        messages, errors = parser.parse_raw_messages([raw], "test-archive-14", start_index=42)
+
+        assert messages == []
+        assert errors == ["Message 42: Required field 'Message-ID' is missing"]
@@ -10,12 +10,19 @@ from unittest.mock import Mock
 
 import pytest
 from app.service import ParsingService
+from app.thread_index import ThreadIndex
 from copilot_archive_store import create_archive_store
 from copilot_event_retry.event_handler import DocumentNotFoundError, RetryExhaustedError
 from copilot_event_retry.retry_policy import RetryConfig
-from copilot_message_bus import EventPublisher, EventSubscriber, create_publisher, create_subscriber
+from copilot_message_bus import (
+    EventPublisher,
+    EventSubscriber,
+    PublishBatchResult,
+    create_publisher,
+    create_subscriber,
+)
 from copilot_schema_validation import create_schema_provider
-from copilot_storage import DocumentAlreadyExistsError, DocumentStore, create_document_store
+from copilot_storage import BulkWriteResult, DocumentAlreadyExistsError, DocumentStore, create_document_store
 from copilot_storage.validating_document_store import DocumentValidationError
 
 from .test_helpers import assert_valid_event_schema
@@ -139,7 +146,7 @@ def prepare_archive_for_processing(archive_store, file_path, archive_id=None):
     }
 
 
-class MockPublisher:
+class MockPublisher(EventPublisher):
     """Mock publisher that tracks published events."""
 
     def __init__(self):
@@ -387,6 +394,200 @@ class TestParsingService:
         root_msg = [m for m in messages if not m.get("in_reply_to")][0]
         assert all(tid == root_msg["_id"] for tid in thread_ids)
 
+    def test_process_archive_streams_in_batches(self, document_store, publisher, subscriber, sample_mbox_file):
+        """Test that messages are stored in fixed-size batches from a stream."""
+        service = ParsingService(
+            document_store=document_store,
+            publisher=publisher,
+            subscriber=subscriber,
+            archive_store=create_test_archive_store(),
+            message_batch_size=1,
+        )
+        archive_data = prepare_archive_for_processing(service.archive_store, sample_mbox_file)
+        service.archive_store.get_archive = Mock(side_effect=AssertionError("archive must be streamed"))
+        stored_batches = []
+        original_store_messages = service._store_messages
+
+        def tracking_store_messages(messages):
+            stored_batches.append(len(messages))
+            original_store_messages(messages)
+
+        service._store_messages = tracking_store_messages
+
+        service.process_archive(archive_data)
+
+        assert stored_batches == [1, 1]
+        messages = service.document_store.query_documents("messages", {})
+        assert len(messages) == 2
+        root_msg = [m for m in messages if not m.get("in_reply_to")][0]
+        assert all(m["thread_id"] == root_msg["_id"] for m in messages)
+        threads = service.document_store.query_documents("threads", {})
+        assert len(threads) == 1
+        assert threads[0]["message_count"] == 2
+
+    def test_process_archive_attaches_replies_to_earlier_archive(self, document_store, publisher, subscriber, temp_dir):
+        """Test that replies to messages from an earlier archive join the existing thread."""
+        service = ParsingService(
+            document_store=document_store,
+            publisher=publisher,
+            subscriber=subscriber,
+            archive_store=create_test_archive_store(),
+            thread_index=ThreadIndex(document_store),
+        )
+        first_path = Path(temp_dir) / "2024-01.mbox"
+        first_path.write_text(
+            "From alice@example.com Mon Jan 01 00:00:00 2024\n"
+            "From: Alice <alice@example.com>\n"
+            "Subject: QUIC connection migration\n"
+            "Message-ID: <msg1@example.com>\n"
+            "Date: Mon, 01 Jan 2024 12:00:00 +0000\n"
+            "\n"
+            "See draft-ietf-quic-transport-34.\n"
+            "\n"
+        )
+        second_path = Path(temp_dir) / "2024-02.mbox"
+        second_path.write_text(
+            "From bob@example.com Thu Feb 01 00:00:00 2024\n"
+            "From: Bob <bob@example.com>\n"
+            "Subject: Re: QUIC connection migration\n"
+            "Message-ID: <msg2@example.com>\n"
+            "In-Reply-To: <msg1@example.com>\n"
+            "Date: Thu, 01 Feb 2024 12:00:00 +0000\n"
+            "\n"
+            "Agreed, see RFC 9000.\n"
+            "\n"
+            "From carol@example.com Fri Feb 02 00:00:00 2024\n"
+            "From: Carol <carol@example.com>\n"
+            "Subject: Re: QUIC connection migration\n"
+            "Message-ID: <msg3@example.com>\n"
+            "References: <msg1@example.com> <msg2@example.com>\n"
+            "Date: Fri, 02 Feb 2024 12:00:00 +0000\n"
+            "\n"
+            "Me too.\n"
+            "\n"
+        )
+
+        service.process_archive(prepare_archive_for_processing(service.archive_store, str(first_path)))
+        second_archive = prepare_archive_for_processing(service.archive_store, str(second_path))
+        service.process_archive(second_archive)
+        # Reprocessing must not count the messages twice
+        service.process_archive(second_archive)
+
+        messages = document_store.query_documents("messages", {})
+        assert len(messages) == 3
+        root = next(m for m in messages if m["message_id"] == "msg1@example.com")
+        assert all(m["thread_id"] == root["_id"] for m in messages)
+
+        threads = document_store.query_documents("threads", {})
+        assert len(threads) == 1
+        thread = threads[0]
+        assert thread["_id"] == root["_id"]
+        assert thread["message_count"] == 3
+        assert sorted(p["email"] for p in thread["participants"]) == [
+            "alice@example.com",
+            "bob@example.com",
+            "carol@example.com",
+        ]
+        assert thread["first_message_date"] == "2024-01-01T12:00:00Z"
+        assert thread["last_message_date"] == "2024-02-02T12:00:00Z"
+        assert "RFC 9000" in thread["draft_mentions"]
+        assert service.threads_created == 1
+
+    def test_process_archive_parallel_matches_serial(self, publisher, subscriber, sample_mbox_file):
+        """Test that multi-process parsing stores the same documents as serial parsing."""
+        results = []
+        for workers in (1, 2):
+            service = ParsingService(
+                document_store=create_validating_document_store(),
+                publisher=publisher,
+                subscriber=subscriber,
+                archive_store=create_test_archive_store(),
+                parse_workers=workers,
+            )
+            try:
+                archive_data = prepare_archive_for_processing(service.archive_store, sample_mbox_file)
+                service.process_archive(archive_data)
+            finally:
+                service.close()
+
+            messages = service.document_store.query_documents("messages", {})
+            threads = service.document_store.query_documents("threads", {})
+            results.append(
+                (
+                    [(m["_id"], m["thread_id"], m["body_normalized"]) for m in messages],
+                    [(t["_id"], t["message_count"], sorted(t["draft_mentions"])) for t in threads],
+                )
+            )
+
+        assert results[0] == results[1]
+        assert len(results[0][0]) == 2
+
+    def test_broken_parse_pool_fails_archive_and_is_replaced(self, publisher, subscriber, sample_mbox_file):
+        """Test that a dead pool worker fails only the current archive and the pool is recreated."""
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        class BrokenExecutor:
+            def __init__(self):
+                self.shutdown_called = False
+
+            def submit(self, *args, **kwargs):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shutdown_called = True
+
+        service = ParsingService(
+            document_store=create_validating_document_store(),
+            publisher=publisher,
+            subscriber=subscriber,
+            archive_store=create_test_archive_store(),
+            parse_workers=2,
+        )
+        broken = BrokenExecutor()
+        service._parse_executor = broken
+        try:
+            first = prepare_archive_for_processing(service.archive_store, sample_mbox_file)
+            service.process_archive(first)
+
+            assert broken.shutdown_called
+            assert service._parse_executor is None
+            failures = [e for e in publisher.published_events if e["event"]["event_type"] == "ParsingFailed"]
+            assert len(failures) == 1
+            assert failures[0]["event"]["data"]["error_type"] == "BrokenProcessPool"
+
+            # The next archive gets a fresh pool and parses normally
+            service.process_archive(first)
+            assert service._parse_executor is not None
+            assert service._parse_executor is not broken
+            assert len(service.document_store.query_documents("messages", {})) == 2
+        finally:
+            service.close()
+
+    def test_invalid_parse_workers(self, document_store, publisher, subscriber):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            ParsingService(
+                document_store=document_store,
+                publisher=publisher,
+                subscriber=subscriber,
+                archive_store=create_test_archive_store(),
+                parse_workers=0,
+            )
+
+    def test_invalid_message_batch_size(self, document_store, publisher, subscriber):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError):
+            ParsingService(
+                document_store=document_store,
+                publisher=publisher,
+                subscriber=subscriber,
+                archive_store=create_test_archive_store(),
+                message_batch_size=0,
+            )
+
     def test_get_stats(self, service, sample_mbox_file):
         """Test statistics reporting."""
         # Initial stats
@@ -456,12 +657,14 @@ class TestParsingService:
             {"message_id": "m1"},
             {"message_id": "m2"},
         ]
-        store.insert_document = Mock(side_effect=[DocumentAlreadyExistsError("dup"), None])
+        store.insert_documents = Mock(
+            return_value=BulkWriteResult(succeeded=["id-m2"], errors={0: DocumentAlreadyExistsError("dup")})
+        )
 
         with caplog.at_level(logging.DEBUG):
             service._store_messages(messages)
 
-        assert store.insert_document.call_count == 2
+        store.insert_documents.assert_called_once_with("messages", messages)
         assert "Skipping message m1 (DocumentAlreadyExistsError)" in caplog.text
         assert "Stored 1 messages, skipped 1 (duplicates/validation)" in caplog.text
 
@@ -473,12 +676,12 @@ class TestParsingService:
             {"message_id": "m2"},
         ]
         validation_error = DocumentValidationError("messages", ["bad doc"])
-        store.insert_document = Mock(side_effect=[validation_error, None])
+        store.insert_documents = Mock(return_value=BulkWriteResult(succeeded=["id-m2"], errors={0: validation_error}))
 
         with caplog.at_level(logging.DEBUG):
             service._store_messages(messages)
 
-        assert store.insert_document.call_count == 2
+        store.insert_documents.assert_called_once_with("messages", messages)
         assert "Skipping message m1 (DocumentValidationError)" in caplog.text
         assert "Stored 1 messages, skipped 1 (duplicates/validation)" in caplog.text
 
@@ -509,13 +712,11 @@ class TestParsingService:
         empty_body_error = DocumentValidationError("messages", ["'' should be non-empty at 'body_normalized'"])
         other_validation_error = DocumentValidationError("messages", ["missing required field"])
 
-        store.insert_document = Mock(
-            side_effect=[
-                duplicate_error,
-                empty_body_error,
-                other_validation_error,
-                None,
-            ]
+        store.insert_documents = Mock(
+            return_value=BulkWriteResult(
+                succeeded=["id-m4"],
+                errors={0: duplicate_error, 1: empty_body_error, 2: other_validation_error},
+            )
         )
 
         service._store_messages(messages)
@@ -535,7 +736,7 @@ class TestParsingService:
     def test_store_messages_raises_on_transient_errors(self, mock_service):
         """Non-permanent errors are re-raised for retry handling."""
         service, store = mock_service
-        store.insert_document = Mock(side_effect=Exception("boom"))
+        store.insert_documents = Mock(return_value=BulkWriteResult(errors={0: Exception("boom")}))
 
         with pytest.raises(Exception, match="boom"):
             service._store_messages([{"message_id": "m1"}])
@@ -547,12 +748,14 @@ class TestParsingService:
             {"thread_id": "t1"},
             {"thread_id": "t2"},
         ]
-        store.insert_document = Mock(side_effect=[DocumentAlreadyExistsError("dup"), None])
+        store.insert_documents = Mock(
+            return_value=BulkWriteResult(succeeded=["t2"], errors={0: DocumentAlreadyExistsError("dup")})
+        )
 
         with caplog.at_level(logging.DEBUG):
             service._store_threads(threads)
 
-        assert store.insert_document.call_count == 2
+        store.insert_documents.assert_called_once_with("threads", threads)
         assert "Skipping thread t1 (DocumentAlreadyExistsError)" in caplog.text
         assert "Stored 1 threads, skipped 1 (duplicates/validation)" in caplog.text
 
@@ -564,19 +767,19 @@ class TestParsingService:
             {"thread_id": "t2"},
         ]
         validation_error = DocumentValidationError("threads", ["bad thread"])
-        store.insert_document = Mock(side_effect=[validation_error, None])
+        store.insert_documents = Mock(return_value=BulkWriteResult(succeeded=["t2"], errors={0: validation_error}))
 
         with caplog.at_level(logging.DEBUG):
             service._store_threads(threads)
 
-        assert store.insert_document.call_count == 2
+        store.insert_documents.assert_called_once_with("threads", threads)
         assert "Skipping thread t1 (DocumentValidationError)" in caplog.text
         assert "Stored 1 threads, skipped 1 (duplicates/validation)" in caplog.text
 
     def test_store_threads_raises_on_transient_errors(self, mock_service):
         """Non-permanent thread errors are re-raised for retries."""
         service, store = mock_service
-        store.insert_document = Mock(side_effect=Exception("boom"))
+        store.insert_documents = Mock(return_value=BulkWriteResult(errors={0: Exception("boom")}))
 
         with pytest.raises(Exception, match="boom"):
             service._store_threads([{"thread_id": "t1"}])
@@ -606,12 +809,8 @@ class TestParsingService:
         duplicate_error = DocumentAlreadyExistsError("duplicate key")
         validation_error = DocumentValidationError("threads", ["missing required field"])
 
-        store.insert_document = Mock(
-            side_effect=[
-                duplicate_error,
-                validation_error,
-                None,
-            ]
+        store.insert_documents = Mock(
+            return_value=BulkWriteResult(succeeded=["t3"], errors={0: duplicate_error, 1: validation_error})
         )
 
         service._store_threads(threads)
@@ -688,7 +887,7 @@ class TestParsingService:
 
         # Store a file so retrieval succeeds, then force a parsing failure.
         archive_data = prepare_archive_for_processing(service.archive_store, __file__)
-        service.parser.parse_mbox = Mock(side_effect=Exception("Parse failed"))
+        service.parser.iter_mbox = Mock(side_effect=Exception("Parse failed"))
 
         service.process_archive(archive_data)
 
@@ -837,7 +1036,7 @@ def test_parsing_failed_event_schema_validation(document_store):
 
     # Store a file so retrieval succeeds, then force a parsing failure.
     archive_data = prepare_archive_for_processing(service.archive_store, __file__)
-    service.parser.parse_mbox = Mock(side_effect=Exception("Parse failed"))
+    service.parser.iter_mbox = Mock(side_effect=Exception("Parse failed"))
 
     service.process_archive(archive_data)
 
@@ -1033,6 +1232,39 @@ def test_publish_json_parsed_with_publisher_failure(document_store):
     assert "Publish failed" in str(exc_info.value)
 
 
+def test_publish_json_parsed_uses_one_batch_and_reports_failed_messages(document_store):
+    """Test that JSONParsed events go out in one batch and failures name their message."""
+    publisher = Mock(spec=EventPublisher)
+    publisher.publish_batch.return_value = PublishBatchResult(published=1, errors={1: Exception("Publish failed")})
+    error_reporter = Mock()
+
+    service = ParsingService(
+        document_store=document_store,
+        publisher=publisher,
+        subscriber=create_noop_subscriber(),
+        archive_store=create_test_archive_store(),
+        error_reporter=error_reporter,
+    )
+
+    parsed_messages = [
+        {"message_id": "msg-1", "_id": "mk-1", "thread_id": "thread-1"},
+        {"message_id": "msg-2", "_id": "mk-2", "thread_id": "thread-1"},
+    ]
+
+    threads = [{"thread_id": "thread-1"}]
+
+    with pytest.raises(Exception, match="Publish failed"):
+        service._publish_json_parsed_per_message(
+            archive_id="test-archive", parsed_messages=parsed_messages, threads=threads, duration=1.5
+        )
+
+    publisher.publish_batch.assert_called_once()
+    events = publisher.publish_batch.call_args.kwargs["events"]
+    assert [e["data"]["message_doc_ids"] for e in events] == [["mk-1"], ["mk-2"]]
+    publisher.publish.assert_not_called()
+    assert error_reporter.report.call_args.kwargs["context"]["message_doc_id"] == "mk-2"
+
+
 def test_publish_parsing_failed_with_publisher_failure(document_store):
     """Test that _publish_parsing_failed raises exception when publisher fails."""
 
@@ -7,6 +7,7 @@ import logging
 
 import pytest
 from app.service import ParsingService
+from copilot_storage import BulkWriteResult
 from copilot_storage.validating_document_store import DocumentValidationError
 
 
@@ -56,6 +57,16 @@ class FakeDocumentStore:
         # default: succeed
         return
 
+    def insert_documents(self, collection, docs):
+        result = BulkWriteResult()
+        for index, doc in enumerate(docs):
+            try:
+                self.insert_document(collection, doc)
+                result.succeeded.append(doc.get("_id", doc.get("thread_id")))
+            except Exception as e:
+                result.errors[index] = e
+        return result
+
 
 def make_service_with_store(store):
     import tempfile
@@ -299,3 +299,46 @@ class TestThreadBuilder:
         assert "FWD:" not in thread["subject"]
         assert "[QUIC]" not in thread["subject"]
         assert "Test Subject" in thread["subject"]
+
+    def test_references_link_thread_across_missing_message(self):
+        """Test that References keep a thread together when an intermediate message is missing."""
+        builder = ThreadBuilder()
+
+        messages = [
+            {"_id": _generate_test_id("msg1"), "message_id": "msg1", "in_reply_to": None, "references": []},
+            # msg2 is not in the parsed set; msg3 replies to it and references msg1
+            {
+                "_id": _generate_test_id("msg3"),
+                "message_id": "msg3",
+                "in_reply_to": "msg2",
+                "references": ["msg1", "msg2"],
+            },
+        ]
+
+        assignments = builder.assign_thread_ids(messages)
+
+        assert assignments == {
+            "msg1": _generate_test_id("msg1"),
+            "msg2": _generate_test_id("msg1"),
+            "msg3": _generate_test_id("msg1"),
+        }
+        assert messages[1]["thread_id"] == _generate_test_id("msg1")
+
+    def test_known_threads_attach_replies(self):
+        """Test that replies to previously threaded messages join the known thread."""
+        builder = ThreadBuilder()
+        old_thread = _generate_test_id("old-root")
+        other_thread = _generate_test_id("other-root")
+
+        messages = [
+            {"_id": _generate_test_id("msg5"), "message_id": "msg5", "in_reply_to": "msg4", "references": []},
+            {"_id": _generate_test_id("msg6"), "message_id": "msg6", "in_reply_to": None, "references": []},
+            # Links the new root msg6 to msg4, so msg6's group joins msg4's known thread
+            {"_id": _generate_test_id("msg7"), "message_id": "msg7", "in_reply_to": "msg6", "references": ["msg4"]},
+            {"_id": _generate_test_id("msg8"), "message_id": "msg8", "in_reply_to": "msg9", "references": []},
+        ]
+
+        assignments = builder.assign_thread_ids(messages, known_threads={"msg4": old_thread, "msg9": other_thread})
+
+        assert [m["thread_id"] for m in messages] == [old_thread, old_thread, old_thread, other_thread]
+        assert assignments["msg9"] == other_thread
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Optional
 import requests
 from copilot_error_reporting import ErrorReporter
 from copilot_event_retry import (
+    DelayedRedelivery,
     DocumentNotFoundError as RetryDocumentNotFoundError,
     RetryConfig,
     handle_event_with_retry,
@@ -42,6 +43,12 @@ logger = get_logger(__name__)
 # after filtering by thread/archive metadata.
 METADATA_FILTER_BUFFER_SIZE = 100
 
+# Archive fields read when enriching summaries and threads with archive metadata
+ARCHIVE_METADATA_PROJECTION = {"source": 1, "source_url": 1, "ingestion_date": 1}
+
+# Message listings leave out the raw and HTML bodies; get_message_by_id returns the full document
+MESSAGE_LIST_PROJECTION = {"body_raw": 0, "body_html": 0}
+
 
 class ReportingService:
     """Main reporting service for storing and serving summaries."""
@@ -156,13 +163,21 @@ class ReportingService:
             idempotency_key = f"reporting-{thread_id}-{summary_id}"
 
             # Wrap processing with retry logic
-            handle_event_with_retry(
+            handled = handle_event_with_retry(
                 handler=lambda e: self.process_summary(e.get("data", {}), e),
                 event=event,
                 config=self.retry_config,
                 idempotency_key=idempotency_key,
                 service_name="reporting",
+                redelivery=(
+                    DelayedRedelivery(self.publisher, "copilot.events", "summary.complete")
+                    if self.retry_config.delayed_redelivery
+                    else None
+                ),
             )
+            if not handled:
+                # Republished for a later attempt; the redelivered event is counted when processed
+                return
 
             # Record processing time
             self.last_processing_time = time.time() - start_time
@@ -563,6 +578,81 @@ class ReportingService:
         Returns:
             List of report documents with enriched metadata
         """
+        reports, _ = self._get_reports(
+            thread_id=thread_id,
+            limit=limit,
+            skip=skip,
+            message_start_date=message_start_date,
+            message_end_date=message_end_date,
+            source=source,
+            min_participants=min_participants,
+            max_participants=max_participants,
+            min_messages=min_messages,
+            max_messages=max_messages,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        return reports
+
+    def get_reports_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 10,
+        **filters: Any,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get one cursor page of reports.
+
+        Pages are read from the document store with query_page(), so every
+        page costs the same however deep it is. Metadata filters are applied
+        to each page, which may then hold fewer than ``limit`` reports while
+        more pages follow.
+
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            **filters: Filters and sorting accepted by get_reports() (except skip)
+
+        Returns:
+            Tuple of (reports, next_cursor); next_cursor is None on the last page
+        """
+        return self._get_reports(limit=limit, cursor=cursor or "", **filters)
+
+    def _get_reports(
+        self,
+        thread_id: str | None = None,
+        limit: int = 10,
+        skip: int = 0,
+        message_start_date: str | None = None,
+        message_end_date: str | None = None,
+        source: str | None = None,
+        min_participants: int | None = None,
+        max_participants: int | None = None,
+        min_messages: int | None = None,
+        max_messages: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get reports by skip, or by cursor when ``cursor`` is not None.
+
+        Args:
+            thread_id: Filter by thread ID (optional)
+            limit: Maximum number of results
+            skip: Number of results to skip
+            message_start_date: Filter by thread message dates (inclusive overlap) - start of date range (ISO 8601)
+            message_end_date: Filter by thread message dates (inclusive overlap) - end of date range (ISO 8601)
+            source: Filter by archive source (optional)
+            min_participants: Filter by minimum participant count (optional)
+            max_participants: Filter by maximum participant count (optional)
+            min_messages: Filter by minimum message count (optional)
+            max_messages: Filter by maximum message count (optional)
+            sort_by: Field to sort by (e.g., 'thread_start_date', 'generated_at')
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            cursor: Page cursor ("" for the first page), or None to page by skip
+
+        Returns:
+            Tuple of (report documents with enriched metadata, next page cursor or None)
+        """
         # Build filter for summaries
         filter_dict = {}
         if thread_id:
@@ -580,14 +670,26 @@ class ReportingService:
         elif sort_by == "thread_start_date":
             db_sort_by = "first_message_date"
 
-        # Fetch summaries (fetch more for skip and filtering)
-        summaries = self.document_store.query_documents(
-            "summaries",
-            filter_dict=filter_dict,
-            limit=limit + skip + METADATA_FILTER_BUFFER_SIZE,
-            sort_by=db_sort_by,
-            sort_order=db_sort_order,
-        )
+        next_cursor = None
+        if cursor is None:
+            # Fetch summaries (fetch more for skip and filtering)
+            summaries = self.document_store.query_documents(
+                "summaries",
+                filter_dict=filter_dict,
+                limit=limit + skip + METADATA_FILTER_BUFFER_SIZE,
+                sort_by=db_sort_by,
+                sort_order=db_sort_order,
+            )
+        else:
+            page = self.document_store.query_page(
+                "summaries",
+                filter_dict,
+                page_size=limit,
+                sort_by=db_sort_by,
+                sort_order=db_sort_order,
+                cursor=cursor or None,
+            )
+            summaries, next_cursor = page.documents, page.next_cursor
 
         # Always enrich results with thread/archive data for UI display (thread start date, etc.)
         # This ensures thread_metadata.first_message_date is always available for sorting
@@ -636,6 +738,7 @@ class ReportingService:
                 "archives",
                 filter_dict={"_id": {"$in": list(archive_ids)}},
                 limit=len(archive_ids),
+                projection=ARCHIVE_METADATA_PROJECTION,
             )
             archives_map = {a.get("_id"): a for a in archives if a.get("_id")}
 
@@ -719,8 +822,8 @@ class ReportingService:
 
         summaries = enriched_summaries
 
-        # Apply sorting if requested
-        if sort_by:
+        # Apply sorting if requested (cursor pages keep the document store order)
+        if sort_by and cursor is None:
             reverse = sort_order == "desc"
 
             # Helper to parse dates with proper handling of missing values
@@ -751,8 +854,11 @@ class ReportingService:
                 # Sort by report generation date
                 summaries.sort(key=lambda s: sort_key_with_missing_last(s, ["generated_at"]), reverse=reverse)
 
+        if cursor is not None:
+            return summaries, next_cursor
+
         # Apply skip and limit
-        return summaries[skip : skip + limit]
+        return summaries[skip : skip + limit], None
 
     def _get_thread_by_id(self, thread_id: str) -> dict[str, Any] | None:
         """Get thread metadata by ID.
@@ -799,6 +905,8 @@ class ReportingService:
         topic: str,
         limit: int = 10,
         min_score: float = 0.5,
+        message_start_date: str | None = None,
+        message_end_date: str | None = None,
     ) -> list[dict[str, Any]]:
         """Search reports by topic using embedding-based similarity.
 
@@ -806,6 +914,8 @@ class ReportingService:
             topic: Topic or query text to search for
             limit: Maximum number of results
             min_score: Minimum similarity score (0.0 to 1.0)
+            message_start_date: Only match chunks of messages sent on or after this date (ISO 8601)
+            message_end_date: Only match chunks of messages sent on or before this date (ISO 8601)
 
         Returns:
             List of report documents with relevance scores
@@ -823,9 +933,18 @@ class ReportingService:
             logger.error(f"Failed to generate embedding for topic: {e}", exc_info=True)
             raise ValueError(f"Failed to generate topic embedding: {e}")
 
-        # Search vector store for similar chunks
+        # Push the date range down to the vector store so every candidate chunk is in range
+        date_range = {}
+        if message_start_date is not None:
+            date_range["$gte"] = message_start_date
+        if message_end_date is not None:
+            date_range["$lte"] = message_end_date
+        vector_filter = {"date": date_range} if date_range else None
+
+        # Search vector store for similar chunks. Several chunks usually come from
+        # the same thread, so fetch more chunks than the number of threads wanted.
         try:
-            search_results = self.vector_store.query(topic_embedding, top_k=limit * 3)
+            search_results = self.vector_store.query(topic_embedding, top_k=limit * 3, filter=vector_filter)
         except Exception as e:
             logger.error(f"Failed to query vector store: {e}", exc_info=True)
             raise ValueError(f"Vector store query failed: {e}")
@@ -913,6 +1032,7 @@ class ReportingService:
                 "archives",
                 filter_dict={},
                 limit=10000,
+                projection={"source": 1},
             )
 
             # Extract unique sources
@@ -1001,6 +1121,79 @@ class ReportingService:
         Returns:
             List of thread documents with enriched archive_source field
         """
+        threads, _ = self._get_threads(
+            limit=limit,
+            skip=skip,
+            archive_id=archive_id,
+            message_start_date=message_start_date,
+            message_end_date=message_end_date,
+            source=source,
+            min_participants=min_participants,
+            max_participants=max_participants,
+            min_messages=min_messages,
+            max_messages=max_messages,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        return threads
+
+    def get_threads_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 10,
+        **filters: Any,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get one cursor page of threads.
+
+        Metadata filters are applied to each page, which may then hold fewer
+        than ``limit`` threads while more pages follow.
+
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            **filters: Filters and sorting accepted by get_threads() (except skip)
+
+        Returns:
+            Tuple of (threads, next_cursor); next_cursor is None on the last page
+        """
+        return self._get_threads(limit=limit, cursor=cursor or "", **filters)
+
+    def _get_threads(
+        self,
+        limit: int = 10,
+        skip: int = 0,
+        archive_id: str | None = None,
+        message_start_date: str | None = None,
+        message_end_date: str | None = None,
+        source: str | None = None,
+        min_participants: int | None = None,
+        max_participants: int | None = None,
+        min_messages: int | None = None,
+        max_messages: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get threads by skip, or by cursor when ``cursor`` is not None.
+
+        Args:
+            limit: Maximum number of results
+            skip: Number of results to skip
+            archive_id: Filter by archive ID (optional)
+            message_start_date: Filter by thread message dates (inclusive overlap) - start of date range (ISO 8601)
+            message_end_date: Filter by thread message dates (inclusive overlap) - end of date range (ISO 8601)
+            source: Filter by archive source (optional)
+            min_participants: Filter by minimum participant count (optional)
+            max_participants: Filter by maximum participant count (optional)
+            min_messages: Filter by minimum message count (optional)
+            max_messages: Filter by maximum message count (optional)
+            sort_by: Field to sort by ('first_message_date' or 'last_message_date')
+            sort_order: Sort order ('asc' or 'desc', default 'desc')
+            cursor: Page cursor ("" for the first page), or None to page by skip
+
+        Returns:
+            Tuple of (thread documents with enriched archive_source field, next page cursor or None)
+        """
         filter_dict = {}
         if archive_id:
             filter_dict["archive_id"] = archive_id
@@ -1026,14 +1219,26 @@ class ReportingService:
             or message_end_date is not None
         )
 
-        # Fetch threads (fetch more for skip and filtering)
-        threads = self.document_store.query_documents(
-            "threads",
-            filter_dict=filter_dict,
-            limit=limit + skip + (METADATA_FILTER_BUFFER_SIZE if has_filtering else 0),
-            sort_by=db_sort_by,
-            sort_order=db_sort_order,
-        )
+        next_cursor = None
+        if cursor is None:
+            # Fetch threads (fetch more for skip and filtering)
+            threads = self.document_store.query_documents(
+                "threads",
+                filter_dict=filter_dict,
+                limit=limit + skip + (METADATA_FILTER_BUFFER_SIZE if has_filtering else 0),
+                sort_by=db_sort_by,
+                sort_order=db_sort_order,
+            )
+        else:
+            page = self.document_store.query_page(
+                "threads",
+                filter_dict,
+                page_size=limit,
+                sort_by=db_sort_by,
+                sort_order=db_sort_order,
+                cursor=cursor or None,
+            )
+            threads, next_cursor = page.documents, page.next_cursor
 
         # Collect unique archive IDs for batch fetching
         archive_ids = set()
@@ -1049,6 +1254,7 @@ class ReportingService:
                 "archives",
                 filter_dict={"_id": {"$in": list(archive_ids)}},
                 limit=len(archive_ids),
+                projection=ARCHIVE_METADATA_PROJECTION,
             )
             archives_map = {a.get("_id"): a for a in archives if a.get("_id")}
 
@@ -1110,8 +1316,11 @@ class ReportingService:
 
             enriched_threads.append(thread)
 
+        if cursor is not None:
+            return enriched_threads, next_cursor
+
         # Apply skip and limit
-        return enriched_threads[skip : skip + limit]
+        return enriched_threads[skip : skip + limit], None
 
     def get_thread_by_id(self, thread_id: str) -> dict[str, Any] | None:
         """Get a specific thread by ID.
@@ -1147,7 +1356,7 @@ class ReportingService:
             message_id: Filter by RFC 5322 Message-ID (optional)
 
         Returns:
-            List of message documents
+            List of message documents without body_raw and body_html
         """
         filter_dict = {}
         if thread_id:
@@ -1155,18 +1364,51 @@ class ReportingService:
         if message_id:
             filter_dict["message_id"] = message_id
 
-        # TODO: Optimize pagination to use native skip in document store query
-        # Currently fetches limit + skip records and discards skip records in memory
-        # This matches existing pattern in get_reports but should be improved for scalability
+        # Fetches limit + skip records and discards skip records in memory;
+        # get_messages_page() pages with a cursor instead
         messages = self.document_store.query_documents(
             "messages",
             filter_dict=filter_dict,
             limit=limit + skip,
+            projection=MESSAGE_LIST_PROJECTION,
         )
 
         # Apply skip and limit
         return messages[skip : skip + limit]
 
+    def get_messages_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 10,
+        thread_id: str | None = None,
+        message_id: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get one cursor page of messages.
+
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            thread_id: Filter by thread ID (optional)
+            message_id: Filter by RFC 5322 Message-ID (optional)
+
+        Returns:
+            Tuple of (messages without body_raw and body_html, next_cursor); next_cursor is None on the last page
+        """
+        filter_dict = {}
+        if thread_id:
+            filter_dict["thread_id"] = thread_id
+        if message_id:
+            filter_dict["message_id"] = message_id
+
+        page = self.document_store.query_page(
+            "messages",
+            filter_dict,
+            page_size=limit,
+            projection=MESSAGE_LIST_PROJECTION,
+            cursor=cursor or None,
+        )
+        return page.documents, page.next_cursor
+
     def get_message_by_id(self, message_doc_id: str) -> dict[str, Any] | None:
         """Get a specific message by its document ID.
 
@@ -1212,9 +1454,8 @@ class ReportingService:
         if message_doc_id:
             filter_dict["message_doc_id"] = message_doc_id
 
-        # TODO: Optimize pagination to use native skip in document store query
-        # Currently fetches limit + skip records and discards skip records in memory
-        # This matches existing pattern in get_reports but should be improved for scalability
+        # Fetches limit + skip records and discards skip records in memory;
+        # get_chunks_page() pages with a cursor instead
         chunks = self.document_store.query_documents(
             "chunks",
             filter_dict=filter_dict,
@@ -1224,6 +1465,37 @@ class ReportingService:
         # Apply skip and limit
         return chunks[skip : skip + limit]
 
+    def get_chunks_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 10,
+        message_id: str | None = None,
+        thread_id: str | None = None,
+        message_doc_id: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get one cursor page of chunks.
+
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            message_id: Filter by RFC 5322 Message-ID (optional)
+            thread_id: Filter by thread ID (optional)
+            message_doc_id: Filter by message document ID (optional)
+
+        Returns:
+            Tuple of (chunk documents, next_cursor); next_cursor is None on the last page
+        """
+        filter_dict = {}
+        if message_id:
+            filter_dict["message_id"] = message_id
+        if thread_id:
+            filter_dict["thread_id"] = thread_id
+        if message_doc_id:
+            filter_dict["message_doc_id"] = message_doc_id
+
+        page = self.document_store.query_page("chunks", filter_dict, page_size=limit, cursor=cursor or None)
+        return page.documents, page.next_cursor
+
     def get_chunk_by_id(self, chunk_id: str) -> dict[str, Any] | None:
         """Get a specific chunk by ID.
 
@@ -1275,18 +1547,14 @@ class ReportingService:
             # Delete summaries for the source
             try:
                 # Try querying by source first
-                summaries = self.document_store.query_documents(
-                    "summaries",
-                    {"source": source_name}
-                ) or []
+                summaries = list(self.document_store.iter_documents("summaries", {"source": source_name}))
 
                 # If no summaries found by source and we have archive_ids, try by archive_id
                 if not summaries and archive_ids:
                     for archive_id in archive_ids:
-                        archive_summaries = self.document_store.query_documents(
-                            "summaries",
-                            {"archive_id": archive_id}
-                        ) or []
+                        archive_summaries = list(
+                            self.document_store.iter_documents("summaries", {"archive_id": archive_id})
+                        )
                         summaries.extend(archive_summaries)
 
                 for summary in summaries:
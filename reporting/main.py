@@ -42,7 +42,7 @@ from copilot_logging import (
 from copilot_message_bus import create_publisher, create_subscriber
 from copilot_metrics import create_metrics_collector
 from copilot_schema_validation import create_schema_provider
-from copilot_storage import DocumentStoreConnectionError, create_document_store
+from copilot_storage import DocumentStoreConnectionError, InvalidCursorError, create_document_store
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
@@ -132,12 +132,21 @@ def get_stats():
     return reporting_service.get_stats()
 
 
+def _check_paging(skip: int, cursor: str | None) -> None:
+    """Reject requests that combine skip with cursor paging."""
+    if cursor is not None and skip:
+        raise HTTPException(status_code=400, detail="skip cannot be combined with cursor")
+
+
 @app.get("/api/reports")
 def get_reports(
     request: Request,
     thread_id: str = Query(None, description="Filter by thread ID"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
     skip: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str = Query(
+        None, description="Opaque cursor from next_cursor; pass an empty value to start cursor paging instead of skip"
+    ),
     message_start_date: str = Query(
         None, description="Filter by thread message dates (inclusive overlap) - start of date range (ISO 8601)"
     ),
@@ -161,29 +170,32 @@ def get_reports(
 
     if not reporting_service:
         raise HTTPException(status_code=503, detail="Service not initialized")
+    _check_paging(skip, cursor)
 
     try:
-        reports = reporting_service.get_reports(
-            thread_id=thread_id,
-            limit=limit,
-            skip=skip,
-            message_start_date=message_start_date,
-            message_end_date=message_end_date,
-            source=source,
-            min_participants=min_participants,
-            max_participants=max_participants,
-            min_messages=min_messages,
-            max_messages=max_messages,
-            sort_by=sort_by,
-            sort_order=sort_order,
-        )
-
-        payload = {
-            "reports": reports,
-            "count": len(reports),
-            "limit": limit,
-            "skip": skip,
+        filters = {
+            "thread_id": thread_id,
+            "message_start_date": message_start_date,
+            "message_end_date": message_end_date,
+            "source": source,
+            "min_participants": min_participants,
+            "max_participants": max_participants,
+            "min_messages": min_messages,
+            "max_messages": max_messages,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
         }
+        if cursor is not None:
+            reports, next_cursor = reporting_service.get_reports_page(cursor=cursor, limit=limit, **filters)
+            payload = {"reports": reports, "count": len(reports), "limit": limit, "next_cursor": next_cursor}
+        else:
+            reports = reporting_service.get_reports(limit=limit, skip=skip, **filters)
+            payload = {
+                "reports": reports,
+                "count": len(reports),
+                "limit": limit,
+                "skip": skip,
+            }
 
         response = JSONResponse(content=payload)
 
@@ -194,6 +206,8 @@ def get_reports(
 
         return response
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching reports: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -204,6 +218,8 @@ def search_reports_by_topic(
     topic: str = Query(..., description="Topic or query text to search for"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
     min_score: float = Query(0.5, ge=0.0, le=1.0, description="Minimum similarity score"),
+    message_start_date: str = Query(None, description="Only match messages sent on or after this date (ISO 8601)"),
+    message_end_date: str = Query(None, description="Only match messages sent on or before this date (ISO 8601)"),
 ):
     """Search reports by topic using embedding-based similarity."""
     global reporting_service
@@ -216,6 +232,8 @@ def search_reports_by_topic(
             topic=topic,
             limit=limit,
             min_score=min_score,
+            message_start_date=message_start_date,
+            message_end_date=message_end_date,
         )
 
         return {
@@ -304,6 +322,9 @@ def get_available_sources():
 def get_threads(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
     skip: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str = Query(
+        None, description="Opaque cursor from next_cursor; pass an empty value to start cursor paging instead of skip"
+    ),
     archive_id: str = Query(None, description="Filter by archive ID"),
     message_start_date: str = Query(
         None, description="Filter by thread message dates (inclusive overlap) - start of date range (ISO 8601)"
@@ -328,22 +349,26 @@ def get_threads(
 
     if not reporting_service:
         raise HTTPException(status_code=503, detail="Service not initialized")
+    _check_paging(skip, cursor)
 
     try:
-        threads = reporting_service.get_threads(
-            limit=limit,
-            skip=skip,
-            archive_id=archive_id,
-            message_start_date=message_start_date,
-            message_end_date=message_end_date,
-            source=source,
-            min_participants=min_participants,
-            max_participants=max_participants,
-            min_messages=min_messages,
-            max_messages=max_messages,
-            sort_by=sort_by,
-            sort_order=sort_order,
-        )
+        filters = {
+            "archive_id": archive_id,
+            "message_start_date": message_start_date,
+            "message_end_date": message_end_date,
+            "source": source,
+            "min_participants": min_participants,
+            "max_participants": max_participants,
+            "min_messages": min_messages,
+            "max_messages": max_messages,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        }
+        if cursor is not None:
+            threads, next_cursor = reporting_service.get_threads_page(cursor=cursor, limit=limit, **filters)
+            return {"threads": threads, "count": len(threads), "limit": limit, "next_cursor": next_cursor}
+
+        threads = reporting_service.get_threads(limit=limit, skip=skip, **filters)
 
         return {
             "threads": threads,
@@ -352,6 +377,8 @@ def get_threads(
             "skip": skip,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching threads: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -384,6 +411,9 @@ def get_thread(thread_id: str):
 def get_messages(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
     skip: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str = Query(
+        None, description="Opaque cursor from next_cursor; pass an empty value to start cursor paging instead of skip"
+    ),
     thread_id: str = Query(None, description="Filter by thread ID"),
     message_id: str = Query(None, description="Filter by RFC 5322 Message-ID"),
 ):
@@ -392,8 +422,18 @@ def get_messages(
 
     if not reporting_service:
         raise HTTPException(status_code=503, detail="Service not initialized")
+    _check_paging(skip, cursor)
 
     try:
+        if cursor is not None:
+            messages, next_cursor = reporting_service.get_messages_page(
+                cursor=cursor,
+                limit=limit,
+                thread_id=thread_id,
+                message_id=message_id,
+            )
+            return {"messages": messages, "count": len(messages), "limit": limit, "next_cursor": next_cursor}
+
         messages = reporting_service.get_messages(
             limit=limit,
             skip=skip,
@@ -408,6 +448,8 @@ def get_messages(
             "skip": skip,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching messages: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -440,6 +482,9 @@ def get_message(message_doc_id: str):
 def get_chunks(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
     skip: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str = Query(
+        None, description="Opaque cursor from next_cursor; pass an empty value to start cursor paging instead of skip"
+    ),
     message_id: str = Query(None, description="Filter by RFC 5322 Message-ID"),
     thread_id: str = Query(None, description="Filter by thread ID"),
     message_doc_id: str = Query(None, description="Filter by message document ID"),
@@ -449,8 +494,19 @@ def get_chunks(
 
     if not reporting_service:
         raise HTTPException(status_code=503, detail="Service not initialized")
+    _check_paging(skip, cursor)
 
     try:
+        if cursor is not None:
+            chunks, next_cursor = reporting_service.get_chunks_page(
+                cursor=cursor,
+                limit=limit,
+                message_id=message_id,
+                thread_id=thread_id,
+                message_doc_id=message_doc_id,
+            )
+            return {"chunks": chunks, "count": len(chunks), "limit": limit, "next_cursor": next_cursor}
+
         chunks = reporting_service.get_chunks(
             limit=limit,
             skip=skip,
@@ -466,6 +522,8 @@ def get_chunks(
             "skip": skip,
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching chunks: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
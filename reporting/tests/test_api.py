@@ -524,7 +524,7 @@ def test_get_reports_with_message_date_filters(client, test_service, mock_docume
     """Test the GET /api/reports endpoint with message date filters."""
 
     # Setup mocks to return thread data
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [{"summary_id": "rpt1", "thread_id": "thread1"}]
         elif collection == "threads":
@@ -555,7 +555,7 @@ def test_get_reports_with_message_date_filters_no_overlap(client, test_service,
     """Test the GET /api/reports endpoint excludes threads with no date overlap."""
 
     # Setup mocks to return thread data
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [{"summary_id": "rpt1", "thread_id": "thread1"}]
         elif collection == "threads":
@@ -587,7 +587,7 @@ def test_get_reports_with_source_filter(client, test_service, mock_document_stor
     """Test the GET /api/reports endpoint with source filter."""
 
     # Setup mocks to return thread and archive data
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [{"summary_id": "rpt1", "thread_id": "thread1"}]
         elif collection == "threads":
@@ -624,7 +624,7 @@ def test_get_reports_with_metadata_filters(client, test_service, mock_document_s
     """Test the GET /api/reports endpoint with metadata filters."""
 
     # Setup mocks
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [{"summary_id": "rpt1", "thread_id": "thread1"}]
         elif collection == "threads":
@@ -668,7 +668,7 @@ def test_search_reports_by_topic_endpoint(client, test_service):
     test_service.vector_store.query.return_value = [mock_result]
 
     # Mock document store
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {
@@ -759,11 +759,47 @@ def test_get_threads_with_pagination(client, test_service, mock_document_store):
     assert data["threads"][1]["_id"] == "thread2"
 
 
+@pytest.mark.integration
+def test_get_threads_with_cursor(client, test_service, mock_document_store):
+    """Test the GET /api/threads endpoint with cursor pagination."""
+    from copilot_storage import DocumentPage
+
+    mock_document_store.query_page.return_value = DocumentPage(
+        documents=[{"_id": "thread3", "subject": "Thread 3"}], next_cursor="next-page"
+    )
+
+    response = client.get("/api/threads?limit=1&cursor=abc")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["next_cursor"] == "next-page"
+    assert "skip" not in data
+    assert [t["_id"] for t in data["threads"]] == ["thread3"]
+    assert mock_document_store.query_page.call_args[1]["cursor"] == "abc"
+
+
+@pytest.mark.integration
+def test_get_messages_cursor_errors(client, test_service, mock_document_store):
+    """Test that cursor paging rejects skip and invalid cursors with 400."""
+    from copilot_storage import InvalidCursorError
+
+    mock_document_store.query_page.side_effect = InvalidCursorError("Invalid pagination cursor")
+
+    response = client.get("/api/messages?cursor=abc&skip=10")
+    assert response.status_code == 400
+    assert "skip" in response.json()["detail"]
+
+    response = client.get("/api/messages?cursor=abc")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
 @pytest.mark.integration
 def test_get_threads_with_archive_filter(client, test_service, mock_document_store):
     """Test the GET /api/threads endpoint with archive filter."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "archive_id": "archive1", "participants": [], "message_count": 1},
@@ -1034,7 +1070,7 @@ def test_new_endpoints_service_not_initialized(monkeypatch):
 def test_get_threads_with_source_query_param(client, test_service, mock_document_store):
     """Test GET /api/threads?source=X passes through correctly."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": [], "message_count": 5, "archive_id": "archive1"},
@@ -1056,7 +1092,7 @@ def test_get_threads_with_source_query_param(client, test_service, mock_document
 def test_get_threads_with_date_query_params(client, test_service, mock_document_store):
     """Test that date params are forwarded to service."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1084,7 +1120,7 @@ def test_get_threads_with_date_query_params(client, test_service, mock_document_
 def test_get_threads_with_sort_params(client, test_service, mock_document_store):
     """Test that sort_by and sort_order are forwarded."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1114,7 +1150,7 @@ def test_get_threads_with_sort_params(client, test_service, mock_document_store)
 def test_get_threads_with_metadata_query_params(client, test_service, mock_document_store):
     """Test that min/max participants/messages are forwarded."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -6,7 +6,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
-from app.service import ReportingService
+from app.service import ARCHIVE_METADATA_PROJECTION, MESSAGE_LIST_PROJECTION, ReportingService
 from copilot_event_retry import RetryConfig
 
 
@@ -566,7 +566,7 @@ def test_handle_summary_complete_error_handling(
     # Thread lookup must return a doc so the code proceeds to insert_document
     thread_id = sample_summary_complete_event["data"]["thread_id"]
 
-    def query_side_effect(collection, filter_dict, limit=100, sort_by=None, sort_order="desc"):
+    def query_side_effect(collection, filter_dict, limit=100, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [{"_id": thread_id, "first_message_date": "2025-01-01T00:00:00Z", "last_message_date": "2025-01-02T00:00:00Z"}]
         if collection == "summaries":
@@ -683,11 +683,38 @@ def test_get_reports_passes_sort_by_to_query_documents(reporting_service, mock_d
     assert call_args[1]["sort_by"] is None
 
 
+def test_get_reports_page_uses_query_page(reporting_service, mock_document_store):
+    """Test that get_reports_page pages summaries in document store order."""
+    from copilot_storage import DocumentPage
+
+    mock_document_store.query_page.return_value = DocumentPage(
+        documents=[
+            {"summary_id": "rpt2", "thread_id": "thread2", "generated_at": "2024-01-01"},
+            {"summary_id": "rpt1", "thread_id": "thread1"},
+        ],
+        next_cursor="next",
+    )
+    mock_document_store.query_documents.return_value = [{"thread_id": "thread1"}, {"thread_id": "thread2"}]
+
+    reports, next_cursor = reporting_service.get_reports_page(limit=2, sort_by="generated_at", sort_order="asc")
+
+    assert [r["summary_id"] for r in reports] == ["rpt2", "rpt1"]
+    assert next_cursor == "next"
+    mock_document_store.query_page.assert_called_once_with(
+        "summaries",
+        {},
+        page_size=2,
+        sort_by="generated_at",
+        sort_order="asc",
+        cursor=None,
+    )
+
+
 def test_get_reports_with_message_date_filters_inclusive_overlap(reporting_service, mock_document_store):
     """Test that get_reports supports message date filtering with inclusive overlap."""
 
     # Setup mocks - need to return thread data
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1"},
@@ -745,7 +772,7 @@ def test_get_reports_with_message_date_filters_no_overlap(reporting_service, moc
     """Test that get_reports correctly excludes threads with no date overlap."""
 
     # Setup mocks
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1"},
@@ -787,7 +814,7 @@ def test_get_reports_with_message_date_filters_thread_without_dates(reporting_se
     """Test that get_reports skips threads without date information when using message date filters."""
 
     # Setup mocks
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1"},
@@ -828,7 +855,7 @@ def test_get_reports_with_message_date_filters_start_only(reporting_service, moc
     """Test that get_reports supports message_start_date without message_end_date."""
 
     # Setup mocks
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1"},
@@ -870,7 +897,7 @@ def test_get_reports_with_message_date_filters_end_only(reporting_service, mock_
     """Test that get_reports supports message_end_date without message_start_date."""
 
     # Setup mocks
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1"},
@@ -912,7 +939,7 @@ def test_get_reports_with_metadata_filters(reporting_service, mock_document_stor
     """Test that get_reports supports metadata filtering."""
 
     # Setup mocks - need to return thread and archive data
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries":
             return [
                 {"summary_id": "rpt1", "thread_id": "thread1", "generated_at": "2025-01-15T12:00:00Z"},
@@ -998,7 +1025,7 @@ def test_search_reports_by_topic_with_vector_store():
     mock_vector_store.query.return_value = [mock_search_result]
 
     # Setup document store to return thread summary
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "summaries" and filter_dict.get("thread_id") == "thread1":
             return [
                 {
@@ -1057,10 +1084,35 @@ def test_search_reports_by_topic_with_vector_store():
     assert "archive_metadata" in reports[0]
 
 
+def test_search_reports_by_topic_pushes_date_range_to_vector_store():
+    """Test that topic search passes the message date range as a vector store filter."""
+    mock_vector_store = Mock()
+    mock_vector_store.query.return_value = []
+    mock_embedding_provider = Mock()
+    mock_embedding_provider.embed.return_value = [0.1] * 384
+
+    service = ReportingService(
+        document_store=Mock(),
+        publisher=Mock(),
+        subscriber=Mock(),
+        vector_store=mock_vector_store,
+        embedding_provider=mock_embedding_provider,
+    )
+
+    service.search_reports_by_topic(
+        "test topic", limit=5, message_start_date="2025-01-01", message_end_date="2025-01-31"
+    )
+    service.search_reports_by_topic("test topic", limit=5)
+
+    first, second = mock_vector_store.query.call_args_list
+    assert first.kwargs == {"top_k": 15, "filter": {"date": {"$gte": "2025-01-01", "$lte": "2025-01-31"}}}
+    assert second.kwargs == {"top_k": 15, "filter": None}
+
+
 def test_get_threads(reporting_service, mock_document_store):
     """Test that get_threads retrieves threads with pagination."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "subject": "Thread 1", "participants": [], "message_count": 1},
@@ -1089,7 +1141,7 @@ def test_get_threads(reporting_service, mock_document_store):
 def test_get_threads_with_archive_filter(reporting_service, mock_document_store):
     """Test that get_threads supports archive_id filtering."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "archive_id": "archive1", "participants": [], "message_count": 1},
@@ -1112,7 +1164,7 @@ def test_get_threads_with_archive_filter(reporting_service, mock_document_store)
 def test_get_threads_with_skip(reporting_service, mock_document_store):
     """Test that get_threads pagination with non-zero skip returns correct subset."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread0", "subject": "Thread 0", "participants": [], "message_count": 1},
@@ -1153,6 +1205,39 @@ def test_get_threads_skip_exceeds_results(reporting_service, mock_document_store
     assert threads == []
 
 
+def test_get_threads_page_walks_all_threads(reporting_service):
+    """Test that get_threads_page returns keyset pages with enriched and filtered threads."""
+    from copilot_storage.inmemory_document_store import InMemoryDocumentStore
+
+    store = InMemoryDocumentStore()
+    store.connect()
+    reporting_service.document_store = store
+    store.insert_document("archives", {"_id": "a1", "source": "ietf-quic"})
+    store.insert_document("archives", {"_id": "a2", "source": "ietf-tls"})
+    for i in range(5):
+        store.insert_document(
+            "threads",
+            {"_id": f"t{i}", "archive_id": "a1" if i != 2 else "a2", "first_message_date": f"2024-01-0{i + 1}"},
+        )
+
+    threads, cursor = reporting_service.get_threads_page(limit=2, sort_by="first_message_date")
+    assert [t["_id"] for t in threads] == ["t4", "t3"]
+    assert threads[0]["archive_source"] == "ietf-quic"
+
+    # The source filter drops t2 from the second page, which still links to the third
+    threads, cursor = reporting_service.get_threads_page(
+        cursor=cursor, limit=2, sort_by="first_message_date", source="ietf-quic"
+    )
+    assert [t["_id"] for t in threads] == ["t1"]
+    assert cursor is not None
+
+    threads, cursor = reporting_service.get_threads_page(
+        cursor=cursor, limit=2, sort_by="first_message_date", source="ietf-quic"
+    )
+    assert [t["_id"] for t in threads] == ["t0"]
+    assert cursor is None
+
+
 def test_get_thread_by_id(reporting_service, mock_document_store):
     """Test that get_thread_by_id retrieves a specific thread."""
     mock_document_store.query_documents.return_value = [
@@ -1194,6 +1279,7 @@ def test_get_messages(reporting_service, mock_document_store):
         "messages",
         filter_dict={},
         limit=10,  # limit + skip = 10 + 0
+        projection=MESSAGE_LIST_PROJECTION,
     )
 
 
@@ -1244,9 +1330,30 @@ def test_get_messages_with_skip(reporting_service, mock_document_store):
         "messages",
         filter_dict={},
         limit=3,  # limit + skip = 2 + 1
+        projection=MESSAGE_LIST_PROJECTION,
     )
 
 
+def test_get_messages_page(reporting_service, mock_document_store):
+    """Test that get_messages_page reads one keyset page instead of limit + skip documents."""
+    from copilot_storage import DocumentPage
+
+    mock_document_store.query_page.return_value = DocumentPage(documents=[{"_id": "msg2"}], next_cursor="next")
+
+    messages, next_cursor = reporting_service.get_messages_page(cursor="abc", limit=1, thread_id="thread1")
+
+    assert messages == [{"_id": "msg2"}]
+    assert next_cursor == "next"
+    mock_document_store.query_page.assert_called_once_with(
+        "messages",
+        {"thread_id": "thread1"},
+        page_size=1,
+        projection=MESSAGE_LIST_PROJECTION,
+        cursor="abc",
+    )
+    mock_document_store.query_documents.assert_not_called()
+
+
 def test_get_message_by_id(reporting_service, mock_document_store):
     """Test that get_message_by_id retrieves a specific message."""
     mock_document_store.query_documents.return_value = [
@@ -1502,7 +1609,7 @@ def test_cascade_cleanup_handler():
 def test_get_threads_with_date_filter_inclusive_overlap(reporting_service, mock_document_store):
     """Test that get_threads supports date filtering with inclusive overlap."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1557,7 +1664,7 @@ def test_get_threads_with_date_filter_inclusive_overlap(reporting_service, mock_
 def test_get_threads_with_start_date_only(reporting_service, mock_document_store):
     """Test that get_threads filters threads ending before start date."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1592,7 +1699,7 @@ def test_get_threads_with_start_date_only(reporting_service, mock_document_store
 def test_get_threads_with_end_date_only(reporting_service, mock_document_store):
     """Test that get_threads filters threads starting after end date."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1627,7 +1734,7 @@ def test_get_threads_with_end_date_only(reporting_service, mock_document_store):
 def test_get_threads_with_source_filter(reporting_service, mock_document_store):
     """Test that get_threads filters by archive source."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": [], "message_count": 5, "archive_id": "archive1"},
@@ -1656,7 +1763,7 @@ def test_get_threads_with_source_filter(reporting_service, mock_document_store):
 def test_get_threads_with_participant_filters(reporting_service, mock_document_store):
     """Test that get_threads filters by min/max participant count."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": ["a@example.com"], "message_count": 5},
@@ -1690,7 +1797,7 @@ def test_get_threads_with_participant_filters(reporting_service, mock_document_s
 def test_get_threads_with_message_count_filters(reporting_service, mock_document_store):
     """Test that get_threads filters by min/max message count."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": [], "message_count": 2},
@@ -1716,7 +1823,7 @@ def test_get_threads_with_message_count_filters(reporting_service, mock_document
 def test_get_threads_with_combined_filters(reporting_service, mock_document_store):
     """Test that get_threads applies multiple filters simultaneously."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1765,7 +1872,7 @@ def test_get_threads_with_combined_filters(reporting_service, mock_document_stor
 def test_get_threads_sort_by_first_message_date_asc(reporting_service, mock_document_store):
     """Test that get_threads sorts by first_message_date ascending."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             # Return threads in a specific order that we'll verify was sorted
             return [
@@ -1803,7 +1910,7 @@ def test_get_threads_sort_by_first_message_date_asc(reporting_service, mock_docu
 def test_get_threads_sort_by_first_message_date_desc(reporting_service, mock_document_store):
     """Test that get_threads sorts by first_message_date descending (default)."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {
@@ -1828,7 +1935,7 @@ def test_get_threads_sort_by_first_message_date_desc(reporting_service, mock_doc
 def test_get_threads_enriches_archive_source(reporting_service, mock_document_store):
     """Test that get_threads enriches threads with archive_source field."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": [], "message_count": 5, "archive_id": "archive1"},
@@ -1849,11 +1956,15 @@ def test_get_threads_enriches_archive_source(reporting_service, mock_document_st
     assert threads[0]["archive_source"] == "ietf-httpbis"
     assert threads[1]["archive_source"] == "w3c-public"
 
+    # Archives are fetched with only the metadata fields
+    archive_call = next(c for c in mock_document_store.query_documents.call_args_list if c[0][0] == "archives")
+    assert archive_call[1]["projection"] == ARCHIVE_METADATA_PROJECTION
+
 
 def test_get_threads_missing_archive_graceful(reporting_service, mock_document_store):
     """Test that threads with unknown archive_id still returned with null source."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {"_id": "thread1", "participants": [], "message_count": 5, "archive_id": "archive1"},
@@ -1876,7 +1987,7 @@ def test_get_threads_missing_archive_graceful(reporting_service, mock_document_s
 def test_get_threads_skips_threads_without_dates_on_date_filter(reporting_service, mock_document_store):
     """Test that threads missing date fields are excluded when date filter is active."""
 
-    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc"):
+    def mock_query(collection, filter_dict, limit, sort_by=None, sort_order="desc", projection=None):
         if collection == "threads":
             return [
                 {